@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Depends, Request
-from typing import Dict, Any, List
+from fastapi import APIRouter, Depends, HTTPException, Request, Query
+from typing import Dict, Any, List, Optional
 import logging
 
 from app.schemas.asset_schema import AssetListResponse
@@ -25,22 +25,26 @@ def get_asset_service(db_client=Depends(get_db_client)) -> AssetService:
 @router.get("/user/{wallet_address}", response_model=AssetListResponse)
 async def get_user_assets(
     wallet_address: str,
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of assets to return"),
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page"),
     asset_service: AssetService = Depends(get_asset_service),
     current_user: Dict[str, Any] = Depends(get_current_user),
     read_permission = Depends(check_permission("read"))
 ) -> AssetListResponse:
     """
-    Get all assets owned by a specific wallet address.
+    Get one page of the assets owned by a specific wallet address, most recently updated first.
     User must be authenticated with 'read' permission to use this endpoint.
     
     Args:
         wallet_address: The wallet address to get assets for
+        limit: Page size, capped at PAGINATION_MAX_LIMIT
+        cursor: nextCursor from the previous page, or None for the first page
         asset_service: The asset service
         current_user: The authenticated user data
         read_permission: Validates user has 'read' permission
         
     Returns:
-        AssetListResponse containing the list of assets owned by the wallet
+        AssetListResponse containing a page of the assets owned by the wallet
     """
     try:
         # Validate that authenticated user can access these assets
@@ -54,8 +58,10 @@ async def get_user_assets(
             return {"status": "success", "assets": []}
         
         # Get assets
-        assets = await asset_service.get_user_assets(wallet_address)
-        return {"status": "success", "assets": assets}
+        page = await asset_service.get_user_assets_page(wallet_address, limit=limit, cursor=cursor)
+        return {"status": "success", "assets": page["assets"], "next_cursor": page["next_cursor"]}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting user assets: {str(e)}")
         # Return empty list instead of error to match frontend expectations
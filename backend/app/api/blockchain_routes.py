@@ -2,16 +2,21 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from typing import Dict, Any, Optional
 from pydantic import BaseModel
 import logging
-from web3 import Web3
 
-from app.services.blockchain_service import BlockchainService
+from app.services.blockchain_service import BlockchainService, get_blockchain_service
 from app.services.transaction_state_service import TransactionStateService
 from app.services.asset_service import AssetService
-from app.services.ipfs_service import IPFSService
+from app.services.ipfs_service import IPFSService, get_ipfs_pool_stats
 from app.services.transaction_service import TransactionService
 from app.repositories.asset_repo import AssetRepository
 from app.repositories.transaction_repo import TransactionRepository
 from app.handlers.upload_handler import UploadHandler
+from app.utilities.cid_cache import cid_cache
+from app.utilities.delegation_cache import delegation_cache
+from app.utilities.gas_model import gas_model
+from app.utilities.tx_details_cache import tx_details_cache
+from app.utilities.event_loop_monitor import event_loop_monitor
+from app.utilities.gateway_scoreboard import gateway_scoreboard
 from app.utilities.auth_middleware import get_current_user, get_wallet_address
 from app.database import get_db_client
 
@@ -62,15 +67,15 @@ class GasEstimationResponse(BaseModel):
     success: bool
     gas_estimate: Optional[int] = None
     gas_price: Optional[int] = None
+    max_fee_per_gas: Optional[int] = None
+    max_priority_fee_per_gas: Optional[int] = None
+    base_fee_per_gas: Optional[int] = None
+    urgency: Optional[str] = None
     estimated_cost_wei: Optional[int] = None
     estimated_cost_eth: Optional[str] = None
     function_name: Optional[str] = None
     error: Optional[str] = None
 
-def get_blockchain_service() -> BlockchainService:
-    """Dependency to get the blockchain service."""
-    return BlockchainService()
-
 def get_transaction_state_service() -> TransactionStateService:
     """Dependency to get the transaction state service."""
     return TransactionStateService()
@@ -82,7 +87,7 @@ def get_upload_handler_for_blockchain(db_client=Depends(get_db_client)) -> Uploa
     
     asset_service = AssetService(asset_repo)
     ipfs_service = IPFSService()
-    blockchain_service = BlockchainService()
+    blockchain_service = get_blockchain_service()
     transaction_service = TransactionService(transaction_repo)
     transaction_state_service = TransactionStateService()
     
@@ -204,14 +209,22 @@ async def estimate_gas(
     asset_id: str,
     cid: Optional[str] = None,
     owner_address: Optional[str] = None,
+    urgency: Optional[str] = None,
     blockchain_service: BlockchainService = Depends(get_blockchain_service),
     wallet_address: str = Depends(get_wallet_address)
 ) -> GasEstimationResponse:
     """
     Estimate gas costs for a transaction before preparing it.
+    Fees come from the fee oracle at the requested urgency level.
     Available for wallet-authenticated users.
     """
     try:
+        if urgency and urgency not in blockchain_service.fee_oracle.levels:
+            raise HTTPException(
+                status_code=400,
+                detail=f"urgency must be one of: {', '.join(blockchain_service.fee_oracle.levels)}"
+            )
+        
         # Validate required parameters for each action
         if action in ["updateIPFS", "updateIPFSFor"] and not cid:
             raise HTTPException(status_code=400, detail="CID is required for updateIPFS actions")
@@ -230,6 +243,7 @@ async def estimate_gas(
         result = await blockchain_service.transaction_builder.estimate_gas(
             function_name=action,
             from_address=wallet_address,
+            urgency=urgency,
             **kwargs
         )
         
@@ -268,6 +282,37 @@ async def verify_transaction(
         logger.error(f"Error verifying transaction: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/connection-stats")
+async def get_connection_stats(
+    blockchain_service: BlockchainService = Depends(get_blockchain_service),
+    _current_user: Dict[str, Any] = Depends(get_current_user)
+) -> Dict[str, Any]:
+    """
+    Get blockchain provider connection statistics, including connection reuse,
+    IPFS HTTP pool saturation, IPFS content cache hits, IPFS source latency,
+    server-wallet nonce state, pending receipts, store_hash_for batching,
+    RPC provider routing, fee suggestions and event-loop lag.
+    """
+    stats = blockchain_service.get_connection_stats()
+    stats["ipfs_http_pool"] = get_ipfs_pool_stats()
+    stats["ipfs_cache"] = cid_cache.get_stats()
+    stats["ipfs_sources"] = gateway_scoreboard.get_stats()
+    stats["delegation_cache"] = delegation_cache.get_stats()
+    stats["tx_details_cache"] = tx_details_cache.get_stats()
+    stats["server_wallet_nonces"] = blockchain_service.nonce_manager.get_stats()
+    stats["receipt_watcher"] = blockchain_service.receipt_watcher.get_stats()
+    coalescer = blockchain_service.store_hash_coalescer
+    stats["store_hash_batching"] = coalescer.get_stats() if coalescer else {"enabled": False}
+    stats["multicall"] = blockchain_service.multicall.get_stats()
+    stats["fee_oracle"] = blockchain_service.fee_oracle.get_stats()
+    stats["gas_model"] = gas_model.get_stats()
+    rpc_router = blockchain_service.rpc_router
+    stats["rpc_router"] = rpc_router.get_stats() if rpc_router else {"enabled": False}
+    rpc_batch = blockchain_service.rpc_batch
+    stats["rpc_batching"] = rpc_batch.get_stats() if rpc_batch else {"enabled": False}
+    stats["event_loop_lag"] = event_loop_monitor.get_stats()
+    return stats
+
 @router.get("/transaction-status/{tx_hash}")
 async def get_transaction_status(
     tx_hash: str,
@@ -280,15 +325,10 @@ async def get_transaction_status(
     Get the current status of a transaction (pending, confirmed, failed).
     """
     try:
-        # Convert hex string to bytes if necessary
-        if isinstance(tx_hash, str) and tx_hash.startswith('0x'):
-            tx_hash_bytes = Web3.to_bytes(hexstr=tx_hash)
-        else:
-            tx_hash_bytes = Web3.to_bytes(hexstr=f"0x{tx_hash}")
-        
-        # Try to get transaction receipt (indicates transaction is mined)
+        # Try to get transaction receipt (indicates transaction is mined); repeated polls
+        # for a pending hash are answered by the shared receipt watcher without an RPC call
         try:
-            receipt = blockchain_service.web3.eth.get_transaction_receipt(tx_hash_bytes)
+            receipt = await blockchain_service.receipt_watcher.get_receipt(tx_hash)
             if receipt:
                 # Transaction is mined
                 success = receipt.status == 1
@@ -376,7 +416,7 @@ async def get_transaction_status(
             
         # Check if transaction exists in mempool (pending)
         try:
-            tx_data = blockchain_service.web3.eth.get_transaction(tx_hash_bytes)
+            tx_data = await blockchain_service.get_transaction(tx_hash)
             if tx_data:
                 return {
                     "status": "pending",
@@ -3,7 +3,8 @@ from typing import Dict, Any, Optional, List
 from pydantic import BaseModel
 import logging
 
-from app.services.blockchain_service import BlockchainService
+from app.services.blockchain_service import BlockchainService, get_blockchain_service
+from app.services.chain_indexer_service import get_chain_indexer
 from app.services.user_service import UserService
 from app.services.asset_service import AssetService
 from app.services.transaction_service import TransactionService
@@ -28,6 +29,7 @@ from app.schemas.delegation_schema import (
     DelegationSyncResponse
 )
 from app.utilities.auth_middleware import get_current_user, get_wallet_address, get_wallet_only_user
+from app.utilities.delegation_cache import delegation_cache
 from app.database import get_db_client
 from app.config import settings
 
@@ -35,11 +37,6 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/delegation", tags=["Delegation"])
 
 
-def get_blockchain_service() -> BlockchainService:
-    """Dependency to get the blockchain service."""
-    return BlockchainService()
-
-
 def get_user_service(db_client=Depends(get_db_client)) -> UserService:
     """Dependency to get the user service."""
     user_repo = UserRepository(db_client)
@@ -304,6 +301,9 @@ async def confirm_user_delegation(
             "blockNumber": block_number
         }
         
+        # The transaction is mined, so cached checks for this pair are stale
+        delegation_cache.invalidate(confirm_request.owner_address, confirm_request.delegate_address)
+        
         # Update database immediately
         delegation_id = await delegation_repo.upsert_delegation(delegation_data)
         
@@ -359,12 +359,6 @@ async def sync_delegation_from_blockchain(
         
         logger.info(f"Syncing delegation state: {sync_request.owner_address} -> {sync_request.delegate_address}")
         
-        # Check current blockchain state (source of truth)
-        blockchain_status = await blockchain_service.check_delegation(
-            owner_address=sync_request.owner_address,
-            delegate_address=sync_request.delegate_address
-        )
-        
         # Check current database state
         existing_delegation = await delegation_repo.get_delegation(
             sync_request.owner_address, 
@@ -373,6 +367,25 @@ async def sync_delegation_from_blockchain(
         
         database_status = existing_delegation and existing_delegation.get("isActive", False)
         
+        # Check blockchain state from the event index when it is up to date
+        chain_indexer = get_chain_indexer()
+        if chain_indexer is not None and chain_indexer.is_ready():
+            blockchain_status = await chain_indexer.get_delegation_status(
+                sync_request.owner_address,
+                sync_request.delegate_address
+            )
+        else:
+            blockchain_status = None
+        
+        # The contract stays the source of truth: read it when the index can't answer,
+        # and confirm before the database is changed in case the index lags a fresh transaction
+        if blockchain_status is None or blockchain_status != database_status:
+            delegation_cache.invalidate(sync_request.owner_address, sync_request.delegate_address)
+            blockchain_status = await blockchain_service.check_delegation(
+                owner_address=sync_request.owner_address,
+                delegate_address=sync_request.delegate_address
+            )
+        
         # Check if sync is needed (both directions)
         if blockchain_status == database_status:
             return DelegationSyncResponse(
@@ -925,19 +938,23 @@ def categorize_content_type(content_type: str) -> str:
 @router.get("/users/{owner_address}/assets", response_model=DelegatedAssetsResponse)
 async def get_delegated_assets(
     owner_address: str,
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of assets to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     wallet_address: str = Depends(get_wallet_address),
     blockchain_service: BlockchainService = Depends(get_blockchain_service),
     user_service: UserService = Depends(get_user_service),
     asset_service: AssetService = Depends(get_asset_service)
 ):
     """
-    Get assets of a user who has delegated to me.
+    Get one page of the assets of a user who has delegated to me.
     
     SECURITY: Always verifies delegation on blockchain regardless of database state.
     This ensures that even if database is inconsistent, access is properly controlled.
     
     Args:
         owner_address: The address of the user who delegated to me
+        limit: Page size, capped at PAGINATION_MAX_LIMIT
+        cursor: next_cursor from the previous page, or None for the first page
         
     Returns:
         DelegatedAssetsResponse with assets I can manage
@@ -980,8 +997,9 @@ async def get_delegated_assets(
             owner_bio = user_data.get("bio")
             owner_location = user_data.get("location")
         
-        # Get assets for the owner
-        assets = await asset_service.get_user_assets(owner_address)
+        # Get a page of assets for the owner
+        page = await asset_service.get_user_assets_page(owner_address, limit=limit, cursor=cursor)
+        assets = page["assets"]
         
         return DelegatedAssetsResponse(
             owner_address=owner_address,
@@ -993,11 +1011,14 @@ async def get_delegated_assets(
             owner_bio=owner_bio,
             owner_location=owner_location,
             assets=assets,
-            total_assets=len(assets)
+            total_assets=len(assets),
+            next_cursor=page["next_cursor"]
         )
         
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting delegated assets: {str(e)}")
         raise HTTPException(
@@ -1086,16 +1107,20 @@ async def get_system_status(
     try:
         # Check blockchain connectivity
         try:
-            current_block = blockchain_service.web3.eth.get_block('latest')['number']
+            current_block = await blockchain_service.get_latest_block_number()
             blockchain_status = "connected"
             blockchain_block = current_block
         except Exception as e:
             blockchain_status = f"error: {str(e)}"
             blockchain_block = None
         
+        chain_indexer = get_chain_indexer()
+        
         return {
             "blockchain_status": blockchain_status,
             "current_block": blockchain_block,
+            "chain_indexer": chain_indexer.get_stats() if chain_indexer else None,
+            "delegation_cache": delegation_cache.get_stats(),
             "contract_address": blockchain_service.contract_address,
             "approach": "hybrid_with_blockchain_verification",
             "note": "Database serves as UX cache only. All operations verified on-chain."
@@ -10,7 +10,7 @@ from app.schemas.delete_schema import (
 )
 from app.services.asset_service import AssetService
 from app.services.transaction_service import TransactionService
-from app.services.blockchain_service import BlockchainService
+from app.services.blockchain_service import get_blockchain_service
 from app.services.transaction_state_service import TransactionStateService
 from app.repositories.asset_repo import AssetRepository
 from app.repositories.transaction_repo import TransactionRepository
@@ -39,7 +39,7 @@ def get_delete_handler(db_client=Depends(get_db_client), request: Request = None
     
     asset_service = AssetService(asset_repo)
     transaction_service = TransactionService(transaction_repo)
-    blockchain_service = BlockchainService()
+    blockchain_service = get_blockchain_service()
     transaction_state_service = TransactionStateService()
     
     # Get auth context from request state if available
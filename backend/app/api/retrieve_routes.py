@@ -7,7 +7,7 @@ import asyncio
 from app.handlers.retrieve_handler import RetrieveHandler
 from app.schemas.retrieve_schema import MetadataRetrieveResponse, ProgressMessage
 from app.services.asset_service import AssetService
-from app.services.blockchain_service import BlockchainService
+from app.services.blockchain_service import get_blockchain_service
 from app.services.ipfs_service import IPFSService
 from app.services.transaction_service import TransactionService
 from app.repositories.asset_repo import AssetRepository
@@ -30,7 +30,7 @@ def get_retrieve_handler(db_client=Depends(get_db_client)) -> RetrieveHandler:
     transaction_repo = TransactionRepository(db_client)
     
     asset_service = AssetService(asset_repo)
-    blockchain_service = BlockchainService()
+    blockchain_service = get_blockchain_service()
     ipfs_service = IPFSService()
     transaction_service = TransactionService(transaction_repo)
     
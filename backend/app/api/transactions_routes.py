@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Dict, Any, Optional
 import logging
 
@@ -63,19 +63,23 @@ async def get_asset_history(
 async def get_wallet_history(
     wallet_address: str,
     include_all_versions: bool = False,
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of transactions to return"),
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page"),
     transaction_handler: TransactionHandler = Depends(get_transaction_handler)
 ) -> WalletHistoryResponse:
     """
-    Get transaction history for a specific wallet.
+    Get one page of transaction history for a specific wallet, newest first.
     
     Args:
         wallet_address: The wallet address to get history for
         include_all_versions: Whether to include all versions or just current ones
+        limit: Page size, capped at PAGINATION_MAX_LIMIT
+        cursor: nextCursor from the previous page, or None for the first page
         
     Returns:
-        WalletHistoryResponse containing transaction history for the wallet
+        WalletHistoryResponse containing a page of transaction history for the wallet
     """
-    result = await transaction_handler.get_wallet_history(wallet_address, include_all_versions)
+    result = await transaction_handler.get_wallet_history(wallet_address, include_all_versions, limit, cursor)
     return WalletHistoryResponse(**result)
 
 @router.get("/{transaction_id}", response_model=TransactionResponse)
@@ -192,23 +196,40 @@ async def get_recent_transactions(
 @router.get("/all/{wallet_address}", response_model=WalletHistoryResponse)
 async def get_all_transactions(
     wallet_address: str,
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of transactions to return"),
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page"),
     transaction_handler: TransactionHandler = Depends(get_transaction_handler)
 ) -> WalletHistoryResponse:
     """
-    Get all transactions for a specific wallet address.
+    Get transactions for a specific wallet address across all asset versions, one page at a time.
     
     Args:
         wallet_address: The wallet address to get all transactions for
+        limit: Page size, capped at PAGINATION_MAX_LIMIT
+        cursor: nextCursor from the previous page, or None for the first page
         
     Returns:
-        WalletHistoryResponse containing all transactions
+        WalletHistoryResponse containing a page of transactions
     """
     try:
         result = await transaction_handler.get_wallet_history(
             wallet_address=wallet_address, 
-            include_all_versions=True
+            include_all_versions=True,
+            limit=limit,
+            cursor=cursor
         )
         return WalletHistoryResponse(**result)
+    except HTTPException as e:
+        # An invalid cursor is the caller's mistake, not an empty history
+        if e.status_code == 400:
+            raise
+        logger.error(f"Error getting all transactions: {e.detail}")
+        return WalletHistoryResponse(
+            status="success", 
+            wallet_address=wallet_address,
+            transactions=[],
+            count=0
+        )
     except Exception as e:
         logger.error(f"Error getting all transactions: {str(e)}")
         # Return empty response instead of error
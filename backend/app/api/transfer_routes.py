@@ -10,7 +10,7 @@ from app.schemas.transfer_schema import (
     PendingTransfersResponse
 )
 from app.services.asset_service import AssetService
-from app.services.blockchain_service import BlockchainService
+from app.services.blockchain_service import get_blockchain_service
 from app.services.transaction_service import TransactionService
 from app.repositories.asset_repo import AssetRepository
 from app.repositories.transaction_repo import TransactionRepository
@@ -34,7 +34,7 @@ def get_transfer_handler(db_client=Depends(get_db_client)) -> TransferHandler:
     transaction_repo = TransactionRepository(db_client)
     
     asset_service = AssetService(asset_repo)
-    blockchain_service = BlockchainService()
+    blockchain_service = get_blockchain_service()
     transaction_service = TransactionService(transaction_repo)
     
     return TransferHandler(
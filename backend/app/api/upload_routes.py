@@ -10,7 +10,7 @@ from app.schemas.upload_schema import (
 )
 from app.services.asset_service import AssetService
 from app.services.ipfs_service import IPFSService
-from app.services.blockchain_service import BlockchainService
+from app.services.blockchain_service import get_blockchain_service
 from app.services.transaction_service import TransactionService
 from app.services.transaction_state_service import TransactionStateService
 from app.repositories.asset_repo import AssetRepository
@@ -49,7 +49,7 @@ def get_upload_handler(db_client=Depends(get_db_client), request: Request = None
     
     asset_service = AssetService(asset_repo)
     ipfs_service = IPFSService()
-    blockchain_service = BlockchainService()
+    blockchain_service = get_blockchain_service()
     transaction_service = TransactionService(transaction_repo)
     transaction_state_service = TransactionStateService()
     
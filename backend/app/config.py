@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Dict, Optional, List
 from pydantic_settings import BaseSettings
 from pydantic import Field, validator
 
@@ -15,9 +15,70 @@ class Settings(BaseSettings):
     private_key: str = Field(alias="PRIVATE_KEY")
     alchemy_sepolia_url: str = Field(alias="ALCHEMY_SEPOLIA_URL")
     contract_address: Optional[str] = Field(None, alias="CONTRACT_ADDRESS")
+    blockchain_async_web3: bool = Field(default=True, alias="BLOCKCHAIN_ASYNC_WEB3")
+    blockchain_rpc_pool_size: int = Field(default=20, alias="BLOCKCHAIN_RPC_POOL_SIZE")
+    blockchain_rpc_timeout: int = Field(default=30, alias="BLOCKCHAIN_RPC_TIMEOUT")  # seconds
+    blockchain_rpc_batching: bool = Field(default=True, alias="BLOCKCHAIN_RPC_BATCHING")  # JSON-RPC batch reads issued together
+    blockchain_rpc_batch_max: int = Field(default=50, alias="BLOCKCHAIN_RPC_BATCH_MAX")  # requests per HTTP batch
+    blockchain_rpc_fallback_urls: str = Field(default="", alias="BLOCKCHAIN_RPC_FALLBACK_URLS")  # comma-separated; reads are routed across these and ALCHEMY_SEPOLIA_URL
+    blockchain_rpc_rate_limits: str = Field(default="", alias="BLOCKCHAIN_RPC_RATE_LIMITS")  # requests/second per provider, primary first; 0 is unlimited
+    blockchain_rpc_breaker_failures: int = Field(default=5, alias="BLOCKCHAIN_RPC_BREAKER_FAILURES")  # consecutive failures before a provider is taken out
+    blockchain_rpc_breaker_cooldown: int = Field(default=30, alias="BLOCKCHAIN_RPC_BREAKER_COOLDOWN")  # seconds before it is probed again
+    blockchain_health_check_interval: int = Field(default=30, alias="BLOCKCHAIN_HEALTH_CHECK_INTERVAL")  # seconds
+    blockchain_receipt_poll_interval: float = Field(default=2, alias="BLOCKCHAIN_RECEIPT_POLL_INTERVAL")  # seconds between head checks
+    blockchain_receipt_watch_ttl: int = Field(default=600, alias="BLOCKCHAIN_RECEIPT_WATCH_TTL")  # seconds a polled hash stays watched
+    blockchain_receipt_timeout: int = Field(default=120, alias="BLOCKCHAIN_RECEIPT_TIMEOUT")  # seconds
+    blockchain_verify_timeout: int = Field(default=60, alias="BLOCKCHAIN_VERIFY_TIMEOUT")  # seconds
+    blockchain_tx_replace_after: int = Field(default=120, alias="BLOCKCHAIN_TX_REPLACE_AFTER")  # seconds before re-sending a stuck tx
+    blockchain_tx_max_replacements: int = Field(default=3, alias="BLOCKCHAIN_TX_MAX_REPLACEMENTS")
+    blockchain_tx_gas_bump_percent: int = Field(default=15, alias="BLOCKCHAIN_TX_GAS_BUMP_PERCENT")  # nodes require at least 10
+    blockchain_cid_verification: str = Field(default="local", alias="BLOCKCHAIN_CID_VERIFICATION")  # "local" hashes CIDs against getIPFSInfo, "contract" calls verifyCID
+    blockchain_coalesce_writes: bool = Field(default=False, alias="BLOCKCHAIN_COALESCE_WRITES")  # batch concurrent store_hash_for calls
+    blockchain_coalesce_window_ms: int = Field(default=200, alias="BLOCKCHAIN_COALESCE_WINDOW_MS")
+    blockchain_coalesce_max_batch: int = Field(default=50, alias="BLOCKCHAIN_COALESCE_MAX_BATCH")  # contract allows 50
+    multicall3_address: str = Field(default="0xcA11bde05977b3631167028862bE2a173976CA11", alias="MULTICALL3_ADDRESS")  # canonical deployment
+    multicall_max_calldata_bytes: int = Field(default=64000, alias="MULTICALL_MAX_CALLDATA_BYTES")  # per aggregated eth_call
+    fee_oracle_refresh_interval: int = Field(default=12, alias="FEE_ORACLE_REFRESH_INTERVAL")  # seconds between eth_feeHistory samples
+    fee_oracle_block_count: int = Field(default=20, alias="FEE_ORACLE_BLOCK_COUNT")  # blocks per sample
+    fee_oracle_urgency_levels: str = Field(default="low:10,standard:50,fast:90", alias="FEE_ORACLE_URGENCY_LEVELS")  # level:reward percentile
+    fee_oracle_default_urgency: str = Field(default="standard", alias="FEE_ORACLE_DEFAULT_URGENCY")
+    gas_model_enabled: bool = Field(default=True, alias="GAS_MODEL_ENABLED")  # predict batch gas limits from observed gas
+    gas_model_min_observations: int = Field(default=5, alias="GAS_MODEL_MIN_OBSERVATIONS")  # per function before predicting
+    gas_model_calibrate_every: int = Field(default=50, alias="GAS_MODEL_CALIBRATE_EVERY")  # predictions between live estimate_gas calls
+    gas_model_safety_margin: float = Field(default=0.2, alias="GAS_MODEL_SAFETY_MARGIN")  # fraction added to predictions
+    chain_indexer_enabled: bool = Field(default=True, alias="CHAIN_INDEXER_ENABLED")
+    chain_indexer_start_block: int = Field(default=0, alias="CHAIN_INDEXER_START_BLOCK")  # contract deployment block
+    chain_indexer_chunk_size: int = Field(default=10000, alias="CHAIN_INDEXER_CHUNK_SIZE")  # blocks per eth_getLogs
+    chain_indexer_poll_interval: int = Field(default=15, alias="CHAIN_INDEXER_POLL_INTERVAL")  # seconds
+    chain_indexer_reorg_depth: int = Field(default=12, alias="CHAIN_INDEXER_REORG_DEPTH")  # blocks
+    delegation_cache_ttl: int = Field(default=30, alias="DELEGATION_CACHE_TTL")  # seconds
+    delegation_cache_negative_ttl: int = Field(default=10, alias="DELEGATION_CACHE_NEGATIVE_TTL")  # seconds
+    migrations_enabled: bool = Field(default=True, alias="MIGRATIONS_ENABLED")  # run data backfills in the background
+    migration_batch_size: int = Field(default=500, alias="MIGRATION_BATCH_SIZE")  # documents per backfill batch
+    migration_batch_pause: float = Field(default=0.1, alias="MIGRATION_BATCH_PAUSE")  # seconds between batches
+    pagination_default_limit: int = Field(default=100, alias="PAGINATION_DEFAULT_LIMIT")  # items per page when no limit is given
+    pagination_max_limit: int = Field(default=500, alias="PAGINATION_MAX_LIMIT")  # largest page a client may request
+    tx_details_cache_max_entries: int = Field(default=10000, alias="TX_DETAILS_CACHE_MAX_ENTRIES")  # decoded transactions kept in memory
     
     # Web3 Storage settings
     web3_storage_service_url: str = Field(default="http://localhost:8080", alias="WEB3_STORAGE_SERVICE_URL")
+    ipfs_local_cid: bool = Field(default=True, alias="IPFS_LOCAL_CID")
+    ipfs_http_pool_size: int = Field(default=20, alias="IPFS_HTTP_POOL_SIZE")
+    ipfs_http2: bool = Field(default=False, alias="IPFS_HTTP2")
+    ipfs_upload_timeout: int = Field(default=90, alias="IPFS_UPLOAD_TIMEOUT")  # seconds
+    ipfs_retrieve_timeout: int = Field(default=60, alias="IPFS_RETRIEVE_TIMEOUT")  # seconds
+    ipfs_lookup_timeout: int = Field(default=15, alias="IPFS_LOOKUP_TIMEOUT")  # seconds
+    ipfs_batch_files_per_request: int = Field(default=25, alias="IPFS_BATCH_FILES_PER_REQUEST")
+    ipfs_upload_concurrency: int = Field(default=8, alias="IPFS_UPLOAD_CONCURRENCY")  # the IPFS Node service's UPLOAD_CONCURRENCY
+    ipfs_cache_max_bytes: int = Field(default=64 * 1024 * 1024, alias="IPFS_CACHE_MAX_BYTES")
+    ipfs_cache_dir: Optional[str] = Field(None, alias="IPFS_CACHE_DIR")  # unset disables the disk tier
+    ipfs_gateways: str = Field(
+        default="https://{cid}.ipfs.w3s.link,https://{cid}.ipfs.dweb.link",
+        alias="IPFS_GATEWAYS"
+    )  # URL templates tried after the storage service
+    ipfs_hedge_delay_ms: int = Field(default=750, alias="IPFS_HEDGE_DELAY_MS")  # until latency is observed
+    ipfs_hedge_min_delay_ms: int = Field(default=50, alias="IPFS_HEDGE_MIN_DELAY_MS")
+    ipfs_hedge_max_delay_ms: int = Field(default=5000, alias="IPFS_HEDGE_MAX_DELAY_MS")
     
     # JWT settings
     jwt_secret_key: str = Field(alias="JWT_SECRET_KEY")
@@ -68,6 +129,31 @@ class Settings(BaseSettings):
             return [self.cors_origins.strip()]
         return self.cors_origins
     
+    @property
+    def ipfs_gateways_list(self) -> List[str]:
+        """Parse IPFS gateway URL templates from comma-separated string"""
+        return [gateway.strip() for gateway in self.ipfs_gateways.split(",") if gateway.strip()]
+    
+    @property
+    def blockchain_rpc_fallback_urls_list(self) -> List[str]:
+        """Parse fallback RPC provider URLs from comma-separated string"""
+        return [url.strip() for url in self.blockchain_rpc_fallback_urls.split(",") if url.strip()]
+    
+    @property
+    def blockchain_rpc_rate_limits_list(self) -> List[float]:
+        """Parse per-provider RPC rate limits from comma-separated string"""
+        return [float(limit) for limit in self.blockchain_rpc_rate_limits.split(",") if limit.strip()]
+    
+    @property
+    def fee_oracle_urgency_percentiles(self) -> Dict[str, int]:
+        """Parse fee oracle urgency levels from comma-separated level:percentile pairs"""
+        levels = {}
+        for pair in self.fee_oracle_urgency_levels.split(","):
+            if pair.strip():
+                level, percentile = pair.split(":")
+                levels[level.strip()] = int(percentile)
+        return levels
+    
     class Config:
         # Load from backend-specific .env file (for local development)
         # Railway deployment uses environment variables directly
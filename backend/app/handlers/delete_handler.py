@@ -1,4 +1,5 @@
 from typing import List, Optional, Dict, Any
+import asyncio
 import logging
 from fastapi import HTTPException
 
@@ -7,6 +8,7 @@ from app.services.blockchain_service import BlockchainService
 from app.services.transaction_service import TransactionService
 from app.services.transaction_state_service import TransactionStateService
 from app.schemas.delete_schema import DeleteResponse, BatchDeleteResponse
+from app.utilities.delegation_cache import memoize_delegation_checks
 
 logger = logging.getLogger(__name__)
 
@@ -320,6 +322,7 @@ class DeleteHandler:
             logger.error(f"Error completing blockchain deletion: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Error completing deletion: {str(e)}")
     
+    @memoize_delegation_checks
     async def batch_delete_assets(
         self,
         asset_ids: List[str],
@@ -398,6 +401,7 @@ class DeleteHandler:
             logger.error(f"Error batch deleting assets: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Error batch deleting assets: {str(e)}")
     
+    @memoize_delegation_checks
     async def prepare_batch_deletion(
         self,
         asset_ids: List[str], 
@@ -436,10 +440,33 @@ class DeleteHandler:
             already_deleted_assets = []  # Assets already deleted on blockchain (need DB sync)
             owner_address_to_assets = {}  # Group assets by owner for efficient blockchain operations
             
+            # Read all assets concurrently and their on-chain status in one multicall
+            assets = await asyncio.gather(
+                *(self.asset_service.get_asset(asset_id) for asset_id in asset_ids),
+                return_exceptions=True
+            )
+            chain_statuses: List[Optional[Dict[str, bool]]] = [None] * len(asset_ids)
+            if self.blockchain_service:
+                lookups = [
+                    (idx, asset_id, asset.get("walletAddress", "").lower())
+                    for idx, (asset_id, asset) in enumerate(zip(asset_ids, assets))
+                    if asset and not isinstance(asset, Exception)
+                    and not asset.get("isDeleted", False) and asset.get("walletAddress")
+                ]
+                try:
+                    statuses = await self.blockchain_service.check_assets_exist_bulk(
+                        [(asset_id, owner_address) for _, asset_id, owner_address in lookups]
+                    )
+                    for (idx, _, _), status in zip(lookups, statuses):
+                        chain_statuses[idx] = status
+                except Exception as e:
+                    logger.warning(f"Bulk blockchain verification failed, checking assets individually: {str(e)}")
+            
             for idx, asset_id in enumerate(asset_ids):
                 try:
-                    # Get asset from database
-                    asset = await self.asset_service.get_asset(asset_id)
+                    asset = assets[idx]
+                    if isinstance(asset, Exception):
+                        raise asset
                     
                     if not asset:
                         raise ValueError(f"Asset {asset_id} not found")
@@ -461,17 +488,11 @@ class DeleteHandler:
                             server_wallet = self.blockchain_service.get_server_wallet_address()
                             
                             try:
-                                # Check if target wallet delegated the API key user
-                                is_user_delegated = await self.blockchain_service.check_delegation(
-                                    owner_address=owner_address,
-                                    delegate_address=initiator_address
-                                )
-                                
-                                # Check if target wallet delegated the server wallet  
-                                is_server_delegated = await self.blockchain_service.check_delegation(
-                                    owner_address=owner_address,
-                                    delegate_address=server_wallet
-                                )
+                                # Check whether the target wallet delegated the API key user and the server wallet
+                                is_user_delegated, is_server_delegated = await self.blockchain_service.check_delegations_bulk([
+                                    (owner_address, initiator_address),
+                                    (owner_address, server_wallet)
+                                ])
                                 
                                 # Both delegations are required for API key operations
                                 if not is_user_delegated and not is_server_delegated:
@@ -506,10 +527,12 @@ class DeleteHandler:
                     blockchain_already_deleted = False
                     if self.blockchain_service:
                         try:
-                            asset_exists = await self.blockchain_service.check_asset_exists(
-                                asset_id=asset_id,
-                                owner_address=owner_address
-                            )
+                            asset_exists = chain_statuses[idx]
+                            if asset_exists is None:
+                                asset_exists = await self.blockchain_service.check_asset_exists(
+                                    asset_id=asset_id,
+                                    owner_address=owner_address
+                                )
                             
                             if not asset_exists["exists"] or asset_exists["is_deleted"]:
                                 # Asset is already deleted on blockchain - sync database state
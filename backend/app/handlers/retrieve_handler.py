@@ -1,13 +1,17 @@
+import asyncio
 from datetime import timezone
 from typing import Optional, Dict, Any
 import logging
 from fastapi import HTTPException
 
+from app.config import settings
 from app.services.asset_service import AssetService
 from app.services.blockchain_service import BlockchainService
+from app.services.chain_indexer_service import get_chain_indexer
 from app.services.ipfs_service import IPFSService
 from app.services.transaction_service import TransactionService
 from app.schemas.retrieve_schema import MetadataRetrieveResponse, MetadataVerificationResult, ProgressCallback
+from app.utilities.cid_verification import hash_cid
 from app.utilities.format import get_ipfs_metadata
 
 logger = logging.getLogger(__name__)
@@ -80,7 +84,7 @@ class RetrieveHandler:
         
         # Method 2: Fallback to event logs
         try:
-            recovery_data = await self.blockchain_service.recover_data_from_events(asset_id, wallet_address)
+            recovery_data = await self._recover_from_events(asset_id, wallet_address)
             logger.info(f"CID recovered from events: {recovery_data['cid']}, correct TX hash: {recovery_data['tx_hash']}")
             return recovery_data
         except Exception as e:
@@ -122,13 +126,288 @@ class RetrieveHandler:
         # Method 2: Fallback to event logs
         await progress_callback(7, 9, "Searching blockchain event logs...")
         try:
-            recovery_data = await self.blockchain_service.recover_data_from_events(asset_id, wallet_address)
+            recovery_data = await self._recover_from_events(asset_id, wallet_address)
             logger.info(f"CID recovered from events: {recovery_data['cid']}, correct TX hash: {recovery_data['tx_hash']}")
             return recovery_data
         except Exception as e:
             logger.error(f"Event recovery also failed for asset {asset_id}: {str(e)}")
             raise Exception(f"Unable to recover authentic CID for asset {asset_id}: Transaction method failed, Event method failed")
         
+    async def _recover_from_events(self, asset_id: str, wallet_address: str) -> dict:
+        """
+        Recover the latest CID from the event index plus a scan of the blocks it hasn't reached.
+        
+        The index lags the head by up to one poll, so an update mined since the last sync
+        only shows up in the tail scan and takes precedence over the indexed event.
+        
+        Args:
+            asset_id: The asset ID
+            wallet_address: The wallet address of the asset owner
+            
+        Returns:
+            Dictionary containing CID and correct transaction hash
+        """
+        chain_indexer = get_chain_indexer()
+        if chain_indexer is None or not chain_indexer.is_ready() or chain_indexer.indexed_block is None:
+            return await self.blockchain_service.recover_data_from_events(asset_id, wallet_address)
+        
+        tail_from = chain_indexer.indexed_block + 1
+        indexed_data = await chain_indexer.find_latest_cid(asset_id, wallet_address)
+        try:
+            return await self.blockchain_service.recover_data_from_events(
+                asset_id, wallet_address, from_block=tail_from
+            )
+        except ValueError:
+            if indexed_data:
+                return indexed_data
+            raise
+        
+    async def _verify_document(
+        self,
+        asset_id: str,
+        document: Dict[str, Any],
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> MetadataVerificationResult:
+        """
+        Verify a stored asset version against the blockchain.
+        
+        The on-chain CID check, the transaction lookup and the CID computation are
+        independent of each other, so they run concurrently; only the final verdict
+        needs all three results.
+        
+        Args:
+            asset_id: The asset's unique identifier
+            document: The asset version document from MongoDB
+            progress_callback: Optional function to call with progress updates
+            
+        Returns:
+            MetadataVerificationResult with the verdict and recovery flag set
+        """
+        doc_version = document.get("versionNumber", 1)
+        # Use ipfsVersion if available, otherwise fall back to versionNumber
+        ipfs_version = document.get("ipfsVersion", doc_version)
+        is_latest_version = document.get("isCurrent", False)
+        wallet_address = document.get("walletAddress")
+        blockchain_tx_id = document.get("smartContractTxId")
+        
+        # Initialize verification result
+        verification_result = MetadataVerificationResult(
+            verified=False,
+            cid_match=False,
+            blockchain_cid="unknown",
+            computed_cid="unknown",
+            recovery_needed=False,
+            deletion_status_tampered=False
+        )
+        
+        if progress_callback:
+            await progress_callback(2, 9, "Verifying asset authenticity...")
+        
+        # Compute CID from MongoDB critical metadata while the chain is queried
+        metadata_for_ipfs = {
+            "asset_id": asset_id,
+            "wallet_address": wallet_address,
+            "critical_metadata": document.get("criticalMetadata", {})
+        }
+        compute_task = asyncio.create_task(
+            self.ipfs_service.compute_cid(get_ipfs_metadata(metadata_for_ipfs))
+        )
+        
+        try:
+            if progress_callback:
+                await progress_callback(3, 9, "Checking blockchain records...")
+            
+            ipfs_hash_verified = False
+            try:
+                if settings.blockchain_cid_verification == "local":
+                    verify_outcome, tx_outcome = await self._check_chain_locally(
+                        asset_id, document, ipfs_version, is_latest_version, compute_task
+                    )
+                else:
+                    # verifyCID already reports the on-chain version and deletion flag,
+                    # so a separate getIPFSInfo call is not needed
+                    # Important: Use ipfs_version instead of doc_version for blockchain verification
+                    verify_outcome, tx_outcome = await asyncio.gather(
+                        self.blockchain_service.verify_cid_on_chain(
+                            asset_id=asset_id,
+                            owner_address=wallet_address,
+                            cid=document.get("ipfsHash"),
+                            claimed_version=ipfs_version
+                        ),
+                        self.blockchain_service.get_transaction_details(blockchain_tx_id, asset_id),
+                        return_exceptions=True
+                    )
+                
+                if isinstance(verify_outcome, Exception):
+                    raise verify_outcome
+                
+                # Set verification results from blockchain response
+                verification_result.ipfs_version = verify_outcome["actual_version"]
+                verification_result.is_deleted = verify_outcome["is_deleted"]
+                verification_result.message = verify_outcome["message"]
+                
+                # Store result of IPFS hash verification (if stored ipfs_hash matches blockchain)
+                ipfs_hash_verified = verify_outcome["is_valid"]
+                
+                if tx_outcome is None:
+                    # The on-chain cidHash already proves the computed CID, so the transaction wasn't read
+                    verification_result.blockchain_cid = compute_task.result()
+                    verification_result.tx_sender_verified = None
+                else:
+                    if isinstance(tx_outcome, Exception):
+                        raise tx_outcome
+                    
+                    # Set blockchain CID from the transaction for additional verification
+                    verification_result.blockchain_cid = tx_outcome.get("cid", "unknown")
+                    verification_result.tx_sender_verified = self._verify_tx_sender(asset_id, tx_outcome.get("tx_sender", None))
+                
+            except Exception as e:
+                logger.error(f"Error verifying asset on blockchain: {str(e)}")
+                verification_result.message = f"Blockchain verification failed: {str(e)}"
+            
+            if progress_callback:
+                await progress_callback(4, 9, "Computing metadata integrity...")
+            
+            computed_cid = await compute_task
+        finally:
+            if not compute_task.done():
+                compute_task.cancel()
+        
+        # Set computed CID and compare with blockchain CID
+        verification_result.computed_cid = computed_cid
+        verification_result.cid_match = computed_cid == verification_result.blockchain_cid
+        
+        # Check specifically for deletion status tampering
+        deletion_status_tampered = verification_result.is_deleted and not document.get("isDeleted", False)
+        verification_result.deletion_status_tampered = deletion_status_tampered
+        
+        # Different verification logic for current vs. historical versions
+        if is_latest_version:
+            # For latest version, verify both the IPFS hash AND that the computed CID matches
+            verification_result.verified = ipfs_hash_verified and verification_result.cid_match and not deletion_status_tampered
+            verification_result.recovery_needed = not verification_result.verified
+            
+            if verification_result.verified:
+                logger.debug(f"Verification Success: Current version of asset {asset_id}, version={doc_version}, ipfs_version={ipfs_version}")
+            else:
+                logger.warning(f"Current version verification failed for asset {asset_id}, version {doc_version}, ipfs_version {ipfs_version}")
+                if deletion_status_tampered:
+                    verification_result.message = "Tampering detected: Asset is marked as deleted on blockchain but not in MongoDB"
+                elif not ipfs_hash_verified:
+                    if verification_result.is_deleted:
+                        verification_result.message = "Asset is marked as deleted on blockchain"
+                    else:
+                        verification_result.message = "IPFS hash verification failed - stored hash doesn't match blockchain"
+                elif not verification_result.cid_match:
+                    verification_result.message = "CID mismatch - computed CID from current data doesn't match blockchain CID"
+        else:
+            # For historical versions, use transaction history verification instead
+            # Consider it verified if the transaction data matches the computed data
+            verification_result.verified = verification_result.cid_match and verification_result.tx_sender_verified and not deletion_status_tampered
+            verification_result.recovery_needed = not verification_result.verified
+            
+            if verification_result.verified:
+                logger.debug(f"Verification Success: Historical version of asset {asset_id}, version={doc_version}, ipfs_version={ipfs_version}")
+                verification_result.message = "Historical version verified via transaction data"
+            else:
+                logger.warning(f"Historical version verification failed for asset {asset_id}, version {doc_version}, ipfs_version {ipfs_version}")
+                if deletion_status_tampered:
+                    verification_result.message = "Tampering detected: Asset is marked as deleted on blockchain but not in MongoDB"
+                elif verification_result.cid_match:
+                    verification_result.message = "Historical transaction sender verification failed"
+                else:
+                    verification_result.message = "Historical CID verification failed"
+        
+        # Additional logging if recovery needed
+        if verification_result.recovery_needed:
+            logger.warning(f"Verification failed for asset {asset_id}. "
+                         f"CID match: {verification_result.cid_match}, IPFS hash verified: {ipfs_hash_verified}, "
+                         f"needs recovery: {verification_result.recovery_needed}, deletion status tampered: {deletion_status_tampered}")
+        
+        return verification_result
+    
+    async def _check_chain_locally(
+        self,
+        asset_id: str,
+        document: Dict[str, Any],
+        ipfs_version: int,
+        is_latest_version: bool,
+        compute_task: "asyncio.Task"
+    ) -> tuple:
+        """
+        Check a version against one getIPFSInfo call, hashing CIDs locally as verifyCID does.
+        
+        For the current version a computed CID whose hash matches the on-chain cidHash
+        needs no further proof, so the transaction is only decoded for historical
+        versions or when the hashes differ.
+        
+        Args:
+            asset_id: The asset's unique identifier
+            document: The asset version document from MongoDB
+            ipfs_version: The version claimed by the document
+            is_latest_version: Whether the document is the current version
+            compute_task: Task computing the CID of the document's critical metadata
+            
+        Returns:
+            Tuple of the verification outcome and the transaction details, the exception
+            raised fetching them, or None if they were not needed
+        """
+        verify_request = self.blockchain_service.verify_cid_locally(
+            asset_id=asset_id,
+            owner_address=document.get("walletAddress"),
+            cid=document.get("ipfsHash"),
+            claimed_version=ipfs_version
+        )
+        blockchain_tx_id = document.get("smartContractTxId")
+        
+        if not is_latest_version:
+            return tuple(await asyncio.gather(
+                verify_request,
+                self.blockchain_service.get_transaction_details(blockchain_tx_id, asset_id),
+                return_exceptions=True
+            ))
+        
+        verify_outcome = await verify_request
+        cid_hash = verify_outcome.get("cid_hash")
+        if cid_hash and hash_cid(await compute_task) == cid_hash:
+            return verify_outcome, None
+        
+        try:
+            return verify_outcome, await self.blockchain_service.get_transaction_details(blockchain_tx_id, asset_id)
+        except Exception as e:
+            return verify_outcome, e
+    
+    def _verify_tx_sender(self, asset_id: str, tx_sender: Optional[str]) -> bool:
+        """
+        Check that a transaction was sent by the server wallet.
+        
+        Args:
+            asset_id: The asset ID (for logging)
+            tx_sender: The sender address from the transaction
+            
+        Returns:
+            True if the sender matches the server wallet address
+        """
+        server_wallet = self.blockchain_service.get_server_wallet_address()
+        
+        if tx_sender and server_wallet:
+            # Convert both addresses to lowercase for case-insensitive comparison
+            tx_sender_lower = tx_sender.lower() if isinstance(tx_sender, str) else None
+            server_wallet_lower = server_wallet.lower() if isinstance(server_wallet, str) else None
+            
+            # Check if transaction sender matches server wallet address
+            tx_sender_verified = (tx_sender_lower and server_wallet_lower and 
+                                tx_sender_lower == server_wallet_lower)
+            
+            if not tx_sender_verified:
+                logger.warning(f"Transaction sender verification failed for {asset_id}. "
+                              f"Expected: {server_wallet_lower}, Found: {tx_sender_lower}")
+            return tx_sender_verified
+        
+        logger.warning(f"Transaction sender verification failed - missing data. " 
+                      f"tx_sender: {tx_sender}, server_wallet: {server_wallet}")
+        return False
+    
     async def retrieve_metadata(
         self,
         asset_id: str,
@@ -218,136 +497,8 @@ class RetrieveHandler:
                     detail="Authentication required: unable to verify asset access"
                 )
             
-            # Initialize verification result
-            verification_result = MetadataVerificationResult(
-                verified=False,
-                cid_match=False,
-                blockchain_cid="unknown",
-                computed_cid="unknown",
-                recovery_needed=False,
-                deletion_status_tampered=False
-            )
-            
-            # 3. Use the contract's verification methods to verify the CID
-            blockchain_cid = "unknown"
-            ipfs_hash_verified = False
-            try:
-                # First get IPFS info from the blockchain
-                blockchain_data = await self.blockchain_service.get_ipfs_info(
-                    asset_id=asset_id,
-                    owner_address=wallet_address
-                )
-                logger.info(f"Initial Blockchain Data: asset_id={asset_id}, version={blockchain_data.get('ipfs_version')}, deleted={blockchain_data.get('is_deleted')}")
-
-                # Now verify the CID using the verifyCID function
-                # Important: Use ipfs_version instead of doc_version for blockchain verification
-                verify_result = await self.blockchain_service.verify_cid_on_chain(
-                    asset_id=asset_id,
-                    owner_address=wallet_address,
-                    cid=ipfs_hash,
-                    claimed_version=ipfs_version
-                )
-                
-                # Set verification results from blockchain response
-                verification_result.ipfs_version = verify_result["actual_version"]
-                verification_result.is_deleted = verify_result["is_deleted"]
-                verification_result.message = verify_result["message"]
-                
-                # Store result of IPFS hash verification (if stored ipfs_hash matches blockchain)
-                ipfs_hash_verified = verify_result["is_valid"]
-                
-                # Get transaction details for additional verification
-                tx_data = await self.blockchain_service.get_transaction_details(blockchain_tx_id, asset_id)
-                blockchain_cid = tx_data.get("cid", "unknown")
-                tx_sender = tx_data.get("tx_sender", None)
-
-                # Set blockchain CID
-                verification_result.blockchain_cid = blockchain_cid
-                
-                # Verify transaction sender if possible
-                server_wallet = self.blockchain_service.get_server_wallet_address()
-                
-                if tx_sender and server_wallet:
-                    # Convert both addresses to lowercase for case-insensitive comparison
-                    tx_sender_lower = tx_sender.lower() if isinstance(tx_sender, str) else None
-                    server_wallet_lower = server_wallet.lower() if isinstance(server_wallet, str) else None
-                    
-                    # Check if transaction sender matches server wallet address
-                    tx_sender_verified = (tx_sender_lower and server_wallet_lower and 
-                                        tx_sender_lower == server_wallet_lower)
-                    
-                    if not tx_sender_verified:
-                        logger.warning(f"Transaction sender verification failed for {asset_id}. "
-                                      f"Expected: {server_wallet_lower}, Found: {tx_sender_lower}")
-                else:
-                    tx_sender_verified = False
-                    logger.warning(f"Transaction sender verification failed - missing data. " 
-                                  f"tx_sender: {tx_sender}, server_wallet: {server_wallet}")
-                
-                verification_result.tx_sender_verified = tx_sender_verified
-                
-            except Exception as e:
-                logger.error(f"Error verifying asset on blockchain: {str(e)}")
-                verification_result.message = f"Blockchain verification failed: {str(e)}"
-            
-            # 4. Compute CID from MongoDB critical metadata
-            metadata_for_ipfs = {
-                "asset_id": asset_id,
-                "wallet_address": wallet_address,
-                "critical_metadata": critical_metadata
-            }
-            computed_cid = await self.ipfs_service.compute_cid(get_ipfs_metadata(metadata_for_ipfs))
-
-            # 5. Set computed CID and compare with blockchain CID
-            verification_result.computed_cid = computed_cid
-            verification_result.cid_match = computed_cid == verification_result.blockchain_cid
-
-            # Check specifically for deletion status tampering
-            deletion_status_tampered = verification_result.is_deleted and not document.get("isDeleted", False)
-            verification_result.deletion_status_tampered = deletion_status_tampered
-
-            # Different verification logic for current vs. historical versions
-            if is_latest_version:
-                # For latest version, verify both the IPFS hash AND that the computed CID matches
-                verification_result.verified = ipfs_hash_verified and verification_result.cid_match and not deletion_status_tampered
-                verification_result.recovery_needed = not verification_result.verified
-                
-                if verification_result.verified:
-                    logger.debug(f"Verification Success: Current version of asset {asset_id}, version={doc_version}, ipfs_version={ipfs_version}")
-                else:
-                    logger.warning(f"Current version verification failed for asset {asset_id}, version {doc_version}, ipfs_version {ipfs_version}")
-                    if deletion_status_tampered:
-                        verification_result.message = "Tampering detected: Asset is marked as deleted on blockchain but not in MongoDB"
-                    elif not ipfs_hash_verified:
-                        if verification_result.is_deleted:
-                            verification_result.message = "Asset is marked as deleted on blockchain"
-                        else:
-                            verification_result.message = "IPFS hash verification failed - stored hash doesn't match blockchain"
-                    elif not verification_result.cid_match:
-                        verification_result.message = "CID mismatch - computed CID from current data doesn't match blockchain CID"
-            else:
-                # For historical versions, use transaction history verification instead
-                # Consider it verified if the transaction data matches the computed data
-                verification_result.verified = verification_result.cid_match and verification_result.tx_sender_verified and not deletion_status_tampered
-                verification_result.recovery_needed = not verification_result.verified
-                
-                if verification_result.verified:
-                    logger.debug(f"Verification Success: Historical version of asset {asset_id}, version={doc_version}, ipfs_version={ipfs_version}")
-                    verification_result.message = "Historical version verified via transaction data"
-                else:
-                    logger.warning(f"Historical version verification failed for asset {asset_id}, version {doc_version}, ipfs_version {ipfs_version}")
-                    if deletion_status_tampered:
-                        verification_result.message = "Tampering detected: Asset is marked as deleted on blockchain but not in MongoDB"
-                    elif verification_result.cid_match:
-                        verification_result.message = "Historical transaction sender verification failed"
-                    else:
-                        verification_result.message = "Historical CID verification failed"
-            
-            # Additional logging if recovery needed
-            if verification_result.recovery_needed:
-                logger.warning(f"Verification failed for asset {asset_id}. "
-                             f"CID match: {verification_result.cid_match}, IPFS hash verified: {ipfs_hash_verified}, "
-                             f"needs recovery: {verification_result.recovery_needed}, deletion status tampered: {deletion_status_tampered}")
+            verification_result = await self._verify_document(asset_id, document)
+            computed_cid = verification_result.computed_cid
             
             # 6. If verification failed and auto-recover is enabled, try to recover
             new_version_created = False
@@ -541,31 +692,12 @@ class RetrieveHandler:
             verification_result.new_version_created = new_version_created
             
             # 8. Extract timestamp fields from document
-            # Get creation time from version 1 of this asset
+            # Creation time is stored on every version; older documents look it up from version 1
             try:
-                first_version = await self.asset_service.asset_repository.find_asset({
-                    "assetId": asset_id,
-                    "versionNumber": 1
-                })
-                
-                if first_version:
-                    # Handle case where _id might be a string (convert to ObjectId)
-                    version_id = first_version["_id"]
-                    if isinstance(version_id, str):
-                        try:
-                            from bson import ObjectId
-                            version_id = ObjectId(version_id)
-                        except Exception:
-                            version_id = None
-                    
-                    if version_id and hasattr(version_id, 'generation_time'):
-                        created_at = version_id.generation_time.isoformat()
-                    else:
-                        created_at = document.get("lastUpdated", "")
-                else:
-                    created_at = document.get("lastUpdated", "")
+                created_at_by_asset = await self.asset_service.get_created_at([document])
+                created_at = created_at_by_asset.get(asset_id) or document.get("lastUpdated", "")
             except Exception as e:
-                logger.warning(f"Could not find version 1 for asset {asset_id}: {e}")
+                logger.warning(f"Could not look up creation time for asset {asset_id}: {e}")
                 # Fallback to current document's ObjectId or lastUpdated
                 if hasattr(document["_id"], 'generation_time'):
                     created_at = document["_id"].generation_time.isoformat()
@@ -703,142 +835,8 @@ class RetrieveHandler:
                     detail="Authentication required: unable to verify asset access"
                 )
             
-            # Initialize verification result
-            verification_result = MetadataVerificationResult(
-                verified=False,
-                cid_match=False,
-                blockchain_cid="unknown",
-                computed_cid="unknown",
-                recovery_needed=False,
-                deletion_status_tampered=False
-            )
-            
-            await progress_callback(2, 9, "Verifying asset authenticity...")
-            
-            # 3. Use the contract's verification methods to verify the CID
-            blockchain_cid = "unknown"
-            ipfs_hash_verified = False
-            try:
-                # First get IPFS info from the blockchain
-                blockchain_data = await self.blockchain_service.get_ipfs_info(
-                    asset_id=asset_id,
-                    owner_address=wallet_address
-                )
-                logger.info(f"Initial Blockchain Data: asset_id={asset_id}, version={blockchain_data.get('ipfs_version')}, deleted={blockchain_data.get('is_deleted')}")
-
-                await progress_callback(3, 9, "Checking blockchain records...")
-
-                # Now verify the CID using the verifyCID function
-                # Important: Use ipfs_version instead of doc_version for blockchain verification
-                verify_result = await self.blockchain_service.verify_cid_on_chain(
-                    asset_id=asset_id,
-                    owner_address=wallet_address,
-                    cid=ipfs_hash,
-                    claimed_version=ipfs_version
-                )
-                
-                # Set verification results from blockchain response
-                verification_result.ipfs_version = verify_result["actual_version"]
-                verification_result.is_deleted = verify_result["is_deleted"]
-                verification_result.message = verify_result["message"]
-                
-                # Store result of IPFS hash verification (if stored ipfs_hash matches blockchain)
-                ipfs_hash_verified = verify_result["is_valid"]
-                
-                # Get transaction details for additional verification
-                tx_data = await self.blockchain_service.get_transaction_details(blockchain_tx_id, asset_id)
-                blockchain_cid = tx_data.get("cid", "unknown")
-                tx_sender = tx_data.get("tx_sender", None)
-
-                # Set blockchain CID
-                verification_result.blockchain_cid = blockchain_cid
-                
-                # Verify transaction sender if possible
-                server_wallet = self.blockchain_service.get_server_wallet_address()
-                
-                if tx_sender and server_wallet:
-                    # Convert both addresses to lowercase for case-insensitive comparison
-                    tx_sender_lower = tx_sender.lower() if isinstance(tx_sender, str) else None
-                    server_wallet_lower = server_wallet.lower() if isinstance(server_wallet, str) else None
-                    
-                    # Check if transaction sender matches server wallet address
-                    tx_sender_verified = (tx_sender_lower and server_wallet_lower and 
-                                        tx_sender_lower == server_wallet_lower)
-                    
-                    if not tx_sender_verified:
-                        logger.warning(f"Transaction sender verification failed for {asset_id}. "
-                                      f"Expected: {server_wallet_lower}, Found: {tx_sender_lower}")
-                else:
-                    tx_sender_verified = False
-                    logger.warning(f"Transaction sender verification failed - missing data. " 
-                                  f"tx_sender: {tx_sender}, server_wallet: {server_wallet}")
-                
-                verification_result.tx_sender_verified = tx_sender_verified
-                
-            except Exception as e:
-                logger.error(f"Error verifying asset on blockchain: {str(e)}")
-                verification_result.message = f"Blockchain verification failed: {str(e)}"
-            
-            await progress_callback(4, 9, "Computing metadata integrity...")
-            
-            # 4. Compute CID from MongoDB critical metadata
-            metadata_for_ipfs = {
-                "asset_id": asset_id,
-                "wallet_address": wallet_address,
-                "critical_metadata": critical_metadata
-            }
-            computed_cid = await self.ipfs_service.compute_cid(get_ipfs_metadata(metadata_for_ipfs))
-
-            # 5. Set computed CID and compare with blockchain CID
-            verification_result.computed_cid = computed_cid
-            verification_result.cid_match = computed_cid == verification_result.blockchain_cid
-
-            # Check specifically for deletion status tampering
-            deletion_status_tampered = verification_result.is_deleted and not document.get("isDeleted", False)
-            verification_result.deletion_status_tampered = deletion_status_tampered
-
-            # Different verification logic for current vs. historical versions
-            if is_latest_version:
-                # For latest version, verify both the IPFS hash AND that the computed CID matches
-                verification_result.verified = ipfs_hash_verified and verification_result.cid_match and not deletion_status_tampered
-                verification_result.recovery_needed = not verification_result.verified
-                
-                if verification_result.verified:
-                    logger.debug(f"Verification Success: Current version of asset {asset_id}, version={doc_version}, ipfs_version={ipfs_version}")
-                else:
-                    logger.warning(f"Current version verification failed for asset {asset_id}, version {doc_version}, ipfs_version {ipfs_version}")
-                    if deletion_status_tampered:
-                        verification_result.message = "Tampering detected: Asset is marked as deleted on blockchain but not in MongoDB"
-                    elif not ipfs_hash_verified:
-                        if verification_result.is_deleted:
-                            verification_result.message = "Asset is marked as deleted on blockchain"
-                        else:
-                            verification_result.message = "IPFS hash verification failed - stored hash doesn't match blockchain"
-                    elif not verification_result.cid_match:
-                        verification_result.message = "CID mismatch - computed CID from current data doesn't match blockchain CID"
-            else:
-                # For historical versions, use transaction history verification instead
-                # Consider it verified if the transaction data matches the computed data
-                verification_result.verified = verification_result.cid_match and verification_result.tx_sender_verified and not deletion_status_tampered
-                verification_result.recovery_needed = not verification_result.verified
-                
-                if verification_result.verified:
-                    logger.debug(f"Verification Success: Historical version of asset {asset_id}, version={doc_version}, ipfs_version={ipfs_version}")
-                    verification_result.message = "Historical version verified via transaction data"
-                else:
-                    logger.warning(f"Historical version verification failed for asset {asset_id}, version {doc_version}, ipfs_version {ipfs_version}")
-                    if deletion_status_tampered:
-                        verification_result.message = "Tampering detected: Asset is marked as deleted on blockchain but not in MongoDB"
-                    elif verification_result.cid_match:
-                        verification_result.message = "Historical transaction sender verification failed"
-                    else:
-                        verification_result.message = "Historical CID verification failed"
-            
-            # Additional logging if recovery needed
-            if verification_result.recovery_needed:
-                logger.warning(f"Verification failed for asset {asset_id}. "
-                             f"CID match: {verification_result.cid_match}, IPFS hash verified: {ipfs_hash_verified}, "
-                             f"needs recovery: {verification_result.recovery_needed}, deletion status tampered: {deletion_status_tampered}")
+            verification_result = await self._verify_document(asset_id, document, progress_callback)
+            computed_cid = verification_result.computed_cid
             
             # 6. If verification failed and auto-recover is enabled, try to recover
             new_version_created = False
@@ -1037,31 +1035,12 @@ class RetrieveHandler:
             verification_result.new_version_created = new_version_created
             
             # 8. Extract timestamp fields from document
-            # Get creation time from version 1 of this asset
+            # Creation time is stored on every version; older documents look it up from version 1
             try:
-                first_version = await self.asset_service.asset_repository.find_asset({
-                    "assetId": asset_id,
-                    "versionNumber": 1
-                })
-                
-                if first_version:
-                    # Handle case where _id might be a string (convert to ObjectId)
-                    version_id = first_version["_id"]
-                    if isinstance(version_id, str):
-                        try:
-                            from bson import ObjectId
-                            version_id = ObjectId(version_id)
-                        except Exception:
-                            version_id = None
-                    
-                    if version_id and hasattr(version_id, 'generation_time'):
-                        created_at = version_id.generation_time.isoformat()
-                    else:
-                        created_at = document.get("lastUpdated", "")
-                else:
-                    created_at = document.get("lastUpdated", "")
+                created_at_by_asset = await self.asset_service.get_created_at([document])
+                created_at = created_at_by_asset.get(asset_id) or document.get("lastUpdated", "")
             except Exception as e:
-                logger.warning(f"Could not find version 1 for asset {asset_id}: {e}")
+                logger.warning(f"Could not look up creation time for asset {asset_id}: {e}")
                 # Fallback to current document's ObjectId or lastUpdated
                 if hasattr(document["_id"], 'generation_time'):
                     created_at = document["_id"].generation_time.isoformat()
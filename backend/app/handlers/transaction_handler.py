@@ -72,8 +72,8 @@ class TransactionHandler:
                 if not is_owner:
                     # For transaction history, we need the blockchain service to check delegation
                     # Import here to avoid circular imports
-                    from app.services.blockchain_service import BlockchainService
-                    blockchain_service = BlockchainService()
+                    from app.services.blockchain_service import get_blockchain_service
+                    blockchain_service = get_blockchain_service()
                     
                     try:
                         is_delegated = await blockchain_service.check_delegation(
@@ -130,35 +130,36 @@ class TransactionHandler:
         self, 
         wallet_address: str,
         include_all_versions: bool = False,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        Get transaction history for a specific wallet.
+        Get one page of transaction history for a specific wallet.
         
         Args:
             wallet_address: The wallet address to get history for
             include_all_versions: Whether to include all versions or just current ones
-            limit: Optional limit on the number of transactions to return
+            limit: Optional page size, capped at PAGINATION_MAX_LIMIT
+            cursor: next_cursor from the previous page, or None for the first page
             
         Returns:
-            Dict containing transaction history for the wallet
+            Dict containing the page of transaction history and the cursor for the next page
             
         Raises:
-            HTTPException: If there's an error retrieving the history
+            HTTPException: If the cursor is invalid or there's an error retrieving the history
         """
         try:
             # Get the transaction history
-            transactions = await self.transaction_service.get_wallet_history(
+            page = await self.transaction_service.get_wallet_history_page(
                 wallet_address=wallet_address,
                 include_all_versions=include_all_versions,
-                asset_service=self.asset_service
+                asset_service=self.asset_service,
+                limit=limit,
+                cursor=cursor
             )
+            transactions = page["transactions"]
             
-            # Apply limit if specified
-            if limit is not None and limit > 0:
-                transactions = transactions[:limit]
-            
-            # Get some summary information
+            # Get some summary information for this page
             asset_ids = set()
             actions = {}
             
@@ -177,9 +178,12 @@ class TransactionHandler:
                 "transactions": transactions,
                 "count": len(transactions),
                 "unique_assets": len(asset_ids),
-                "action_summary": actions
+                "action_summary": actions,
+                "next_cursor": page["next_cursor"]
             }
             
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             logger.error(f"Error getting wallet history: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
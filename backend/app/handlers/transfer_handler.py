@@ -4,6 +4,7 @@ from fastapi import HTTPException
 
 from app.services.asset_service import AssetService
 from app.services.blockchain_service import BlockchainService
+from app.services.chain_indexer_service import ChainIndexerService, asset_id_hash, get_chain_indexer
 from app.services.transaction_service import TransactionService
 
 logger = logging.getLogger(__name__)
@@ -396,6 +397,11 @@ class TransferHandler:
             HTTPException: If retrieval fails
         """
         try:
+            # Answer from indexed transfer events when the chain indexer is up to date
+            chain_indexer = get_chain_indexer()
+            if chain_indexer is not None and chain_indexer.is_ready():
+                return await self._get_pending_transfers_indexed(chain_indexer, wallet_address)
+            
             # This is a more complex operation that would require fetching all assets owned by the user
             # and checking each for pending transfers.
             # For now, we'll implement a simplified version that checks assets owned by this wallet
@@ -405,27 +411,27 @@ class TransferHandler:
             
             outgoing_transfers = []
             
-            # 2. Check each asset for pending transfers
-            for asset in assets:
-                asset_id = asset.get("assetId")
-                
-                try:
-                    pending_to = await self.blockchain_service.get_pending_transfer(asset_id, wallet_address)
-                    
-                    if pending_to and pending_to != "0x0000000000000000000000000000000000000000":
-                        outgoing_transfers.append({
-                            "asset_id": asset_id,
-                            "from": wallet_address,
-                            "to": pending_to,
-                            "asset_info": {
-                                "document_id": asset.get("_id"),
-                                "version": asset.get("versionNumber"),
-                                "critical_metadata": asset.get("criticalMetadata", {})
-                            }
-                        })
-                except Exception as e:
-                    logger.error(f"Error checking pending transfers for asset {asset_id}: {str(e)}")
-                    # Continue checking other assets
+            # 2. Check all assets for pending transfers, packed into as few eth_calls as possible
+            try:
+                pending_targets = await self.blockchain_service.get_pending_transfers_bulk(
+                    [(asset.get("assetId"), wallet_address) for asset in assets]
+                )
+            except Exception as e:
+                logger.error(f"Error checking pending transfers for wallet {wallet_address}: {str(e)}")
+                pending_targets = []
+            
+            for asset, pending_to in zip(assets, pending_targets):
+                if pending_to and pending_to != "0x0000000000000000000000000000000000000000":
+                    outgoing_transfers.append({
+                        "asset_id": asset.get("assetId"),
+                        "from": wallet_address,
+                        "to": pending_to,
+                        "asset_info": {
+                            "document_id": asset.get("_id"),
+                            "version": asset.get("versionNumber"),
+                            "critical_metadata": asset.get("criticalMetadata", {})
+                        }
+                    })
             
             # 3. For incoming transfers, we would need to scan the blockchain events
             # This is a simplification - a real implementation would need to listen to transfer events
@@ -442,3 +448,58 @@ class TransferHandler:
         except Exception as e:
             logger.error(f"Error getting pending transfers: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Error getting pending transfers: {str(e)}")
+    
+    async def _get_pending_transfers_indexed(
+        self,
+        chain_indexer: ChainIndexerService,
+        wallet_address: str
+    ) -> Dict[str, Any]:
+        """
+        Build the pending transfer lists from indexed transfer events.
+        
+        Events only carry the hash of the asset ID, so each transfer is matched
+        against the assets of the wallet that sent it.
+        
+        Args:
+            chain_indexer: The running chain indexer
+            wallet_address: The wallet address to get pending transfers for
+            
+        Returns:
+            Dict containing lists of pending incoming and outgoing transfers
+        """
+        pending = await chain_indexer.get_pending_transfers(wallet_address)
+        assets_by_owner: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        
+        async def to_transfer(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            owner = event["owner"]
+            if owner not in assets_by_owner:
+                assets = await self.asset_service.get_documents_by_wallet(owner)
+                assets_by_owner[owner] = {
+                    asset_id_hash(asset["assetId"]): asset for asset in assets if asset.get("assetId")
+                }
+            
+            asset = assets_by_owner[owner].get(event["assetIdHash"])
+            if asset is None:
+                logger.warning(f"Pending transfer in tx {event['transactionHash']} does not match a known asset of {owner}")
+                return None
+            
+            return {
+                "asset_id": asset.get("assetId"),
+                "from": owner,
+                "to": event["to"],
+                "asset_info": {
+                    "document_id": asset.get("_id"),
+                    "version": asset.get("versionNumber"),
+                    "critical_metadata": asset.get("criticalMetadata", {})
+                }
+            }
+        
+        outgoing_transfers = [t for t in [await to_transfer(e) for e in pending["outgoing"]] if t]
+        incoming_transfers = [t for t in [await to_transfer(e) for e in pending["incoming"]] if t]
+        
+        return {
+            "wallet_address": wallet_address,
+            "outgoing_transfers": outgoing_transfers,
+            "incoming_transfers": incoming_transfers,
+            "total_pending": len(outgoing_transfers) + len(incoming_transfers)
+        }
@@ -7,10 +7,11 @@ import logging
 from dotenv import load_dotenv
 from app.services.asset_service import AssetService
 from app.services.ipfs_service import IPFSService
-from app.services.blockchain_service import BlockchainService
+from app.services.blockchain_service import BlockchainService, get_blockchain_service
 from app.services.transaction_service import TransactionService
 from app.services.transaction_state_service import TransactionStateService
 from app.utilities.format import get_ipfs_metadata
+from app.utilities.delegation_cache import memoize_delegation_checks
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +44,7 @@ class UploadHandler:
         """
         self.asset_service = asset_service
         self.ipfs_service = ipfs_service or IPFSService()
-        self.blockchain_service = blockchain_service or BlockchainService()
+        self.blockchain_service = blockchain_service or get_blockchain_service()
         self.transaction_service = transaction_service
         self.transaction_state_service = transaction_state_service or TransactionStateService()
         self.auth_context = auth_context
@@ -745,6 +746,7 @@ class UploadHandler:
             logger.error(f"Error processing metadata: {str(e)}")
             return {"asset_id": asset_id, "status": "error", "detail": f"Error processing metadata: {str(e)}"}
 
+    @memoize_delegation_checks
     async def handle_json_files(
         self, 
         files: List[UploadFile], 
@@ -951,11 +953,10 @@ class UploadHandler:
             
             logger.info(f"Starting background IPFS uploads for batch {batch_id}")
             
-            # Upload all assets concurrently
-            upload_results = await self.ipfs_service.store_metadata_batch_concurrent(
+            # Upload all assets as multi-file requests
+            upload_results = await self.ipfs_service.store_metadata_batch(
                 ipfs_metadata_list, 
-                progress_callback=update_progress,
-                max_concurrent=10
+                progress_callback=update_progress
             )
             
             # Check for any failed uploads
@@ -1142,6 +1143,7 @@ class UploadHandler:
             for asset_data in validated_assets:
                 progress_tracker.update_asset_progress(batch_id, asset_data["asset_id"], 0, "error")
 
+    @memoize_delegation_checks
     async def process_batch_metadata(
         self,
         assets: List[Dict[str, Any]],
@@ -1456,6 +1458,7 @@ class UploadHandler:
                 "asset_count": 0
             }
 
+    @memoize_delegation_checks
     async def process_csv_upload(
         self,
         files: List[UploadFile],
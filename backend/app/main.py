@@ -27,41 +27,75 @@ logging.basicConfig(
 async def lifespan(app: FastAPI):
     # Startup: Initialize indexes and other resources
     from app.database import get_db_client
-    from app.repositories.api_key_repo import APIKeyRepository
-    from app.repositories.user_repo import UserRepository
-    from app.repositories.delegation_repo import DelegationRepository
+    from app.utilities.index_manager import IndexManager
+    from app.services.blockchain_service import get_blockchain_service
+    from app.utilities.event_loop_monitor import event_loop_monitor
     from app.config import settings
     
     db_client = get_db_client()
     
+    # Track event-loop lag so blocking calls on the loop are visible
+    event_loop_monitor.start()
+    
+    try:
+        # Build every repository's indexes; existing indexes are left as they are
+        index_manager = IndexManager(db_client)
+        await index_manager.build()
+    except Exception as e:
+        logging.error(f"Error creating indexes: {e}")
+    
+    try:
+        # Backfill migrated fields in the background; queries switch over as each one completes
+        if settings.migrations_enabled:
+            from app.services.migration_service import start_migrations
+            await start_migrations(db_client)
+    except Exception as e:
+        logging.error(f"Error starting data migrations: {e}")
+    
     try:
-        # Initialize user indexes
-        user_repo = UserRepository(db_client)
-        await user_repo.create_indexes()
-        logging.info("User indexes created successfully")
+        # Persist decoded registry transactions so lookups survive restarts
+        from app.repositories.tx_details_repo import TxDetailsRepository
+        from app.utilities.tx_details_cache import tx_details_cache
+        tx_details_cache.attach(TxDetailsRepository(db_client))
     except Exception as e:
-        logging.error(f"Error creating user indexes: {e}")
+        logging.error(f"Error attaching transaction details store: {e}")
     
     try:
-        # Initialize API key indexes if enabled
-        if settings.api_key_auth_enabled:
-            api_key_repo = APIKeyRepository(db_client.get_collection("api_keys"))
-            await api_key_repo.create_indexes()
-            logging.info("API key indexes created successfully")
+        # Initialize the shared blockchain service and its health check
+        blockchain_service = get_blockchain_service()
+        await blockchain_service.start()
+        logging.info("Blockchain service initialized successfully")
     except Exception as e:
-        logging.error(f"Error creating API key indexes: {e}")
+        logging.error(f"Error initializing blockchain service: {e}")
     
     try:
-        # Initialize delegation indexes
-        delegation_repo = DelegationRepository(db_client)
-        await delegation_repo.create_indexes()
-        logging.info("Delegation indexes created successfully")
+        # Tail registry events into MongoDB for indexed recovery, transfer and delegation lookups
+        if settings.chain_indexer_enabled:
+            from app.services.chain_indexer_service import start_chain_indexer
+            await start_chain_indexer(get_blockchain_service(), db_client)
+            logging.info("Chain event indexer started")
     except Exception as e:
-        logging.error(f"Error creating delegation indexes: {e}")
+        logging.error(f"Error starting chain event indexer: {e}")
     
     yield
     
     # Shutdown: Clean up resources
+    from app.services.migration_service import close_migrations
+    await close_migrations()
+    
+    from app.services.chain_indexer_service import close_chain_indexer
+    await close_chain_indexer()
+    
+    from app.services.blockchain_service import close_blockchain_service
+    await close_blockchain_service()
+    logging.info("Blockchain service closed")
+    
+    from app.services.ipfs_service import close_ipfs_http_client
+    await close_ipfs_http_client()
+    logging.info("IPFS HTTP client closed")
+    
+    await event_loop_monitor.stop()
+    
     from app.database import db_client
     if db_client:
         db_client.close()
@@ -1,15 +1,59 @@
-from typing import Dict, Any, List, Optional
-from pymongo import DESCENDING
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timezone
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, IndexModel
 import logging
 
+from app.utilities.pagination import encode_cursor, keyset_query
+
 logger = logging.getLogger(__name__)
 
+def as_utc(value: Any) -> Any:
+    """
+    Mark a datetime read back from MongoDB as UTC.
+    
+    The client isn't tz_aware, so stored datetimes come back naive even though
+    they were written in UTC. Other values are returned unchanged.
+    
+    Args:
+        value: A datetime, or any other stored value
+        
+    Returns:
+        The value, timezone-aware if it is a datetime
+    """
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+def creation_time(first_version: Dict[str, Any]) -> Optional[datetime]:
+    """
+    Get an asset's creation time from its first version.
+    
+    Uses the stored createdAt, or for documents written before createdAt existed,
+    the time encoded in the version's ObjectId.
+    
+    Args:
+        first_version: The version 1 document, with at least _id and createdAt
+        
+    Returns:
+        The creation time, or None if it can't be determined
+    """
+    if first_version.get("createdAt"):
+        return as_utc(first_version["createdAt"])
+    try:
+        return ObjectId(str(first_version["_id"])).generation_time
+    except Exception:
+        return None
+
 class AssetRepository:
     """
     Repository for asset operations in MongoDB.
     Handles CRUD operations for the assets collection.
     """
     
+    # Address fields and the lowercase copies wallet lookups match on exactly
+    ADDRESS_FIELDS = {"walletAddress": "walletAddressLower"}
+    
     def __init__(self, db_client):
         """
         Initialize with MongoDB client.
@@ -19,6 +63,24 @@ class AssetRepository:
         """
         self.assets_collection = db_client.assets_collection
         
+    async def create_indexes(self):
+        """Create required indexes for the assets collection"""
+        indexes = [
+            # Index for current-version lookups by asset
+            IndexModel([("assetId", ASCENDING), ("isCurrent", ASCENDING)]),
+            # Index for specific versions and paging through version history
+            IndexModel([("assetId", ASCENDING), ("versionNumber", ASCENDING), ("_id", ASCENDING)]),
+            # Index for a wallet's current assets, newest first
+            IndexModel([
+                ("walletAddressLower", ASCENDING),
+                ("isCurrent", ASCENDING),
+                ("isDeleted", ASCENDING),
+                ("lastUpdated", DESCENDING),
+                ("_id", DESCENDING)
+            ])
+        ]
+        await self.assets_collection.create_indexes(indexes)
+        
     async def insert_asset(self, document: Dict[str, Any]) -> str:
         """
         Insert a new asset document.
@@ -30,6 +92,10 @@ class AssetRepository:
             String ID of the inserted document
         """
         try:
+            for field, lower_field in self.ADDRESS_FIELDS.items():
+                if isinstance(document.get(field), str):
+                    document[lower_field] = document[field].lower()
+                    
             result = await self.assets_collection.insert_one(document)
             doc_id = str(result.inserted_id)
             
@@ -91,6 +157,100 @@ class AssetRepository:
             logger.error(f"Error finding assets: {str(e)}")
             raise
             
+    async def find_assets_page(
+        self,
+        query: Dict[str, Any],
+        limit: int,
+        cursor: Optional[str] = None,
+        sort_field: str = "lastUpdated",
+        direction: int = DESCENDING
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Find one page of assets by keyset on (sort_field, _id).
+        
+        Args:
+            query: The query parameters to search by
+            limit: Maximum number of assets to return
+            cursor: Cursor token from the previous page, or None for the first page
+            sort_field: Field to sort by (default: lastUpdated)
+            direction: Sort direction of both sort_field and _id (default: newest first)
+            
+        Returns:
+            Tuple of (asset documents, cursor for the next page or None on the last page)
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            # Read one extra document to tell whether another page follows
+            cursor_query = keyset_query(query, sort_field, cursor, direction)
+            db_cursor = self.assets_collection.find(cursor_query).sort(
+                [(sort_field, direction), ("_id", direction)]
+            ).limit(limit + 1)
+            assets = await db_cursor.to_list(length=limit + 1)
+            
+            next_cursor = None
+            if len(assets) > limit:
+                assets = assets[:limit]
+                next_cursor = encode_cursor(assets[-1].get(sort_field), assets[-1]["_id"])
+            
+            # Convert ObjectId to string for each asset
+            for asset in assets:
+                asset["_id"] = str(asset["_id"])
+                
+            return assets, next_cursor
+            
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Error finding assets page: {str(e)}")
+            raise
+            
+    async def find_asset_ids(self, query: Dict[str, Any]) -> List[str]:
+        """
+        Get the distinct asset IDs matching a query, without loading the documents.
+        
+        Args:
+            query: The query parameters to search by
+            
+        Returns:
+            List of asset IDs
+        """
+        try:
+            return await self.assets_collection.distinct("assetId", query)
+            
+        except Exception as e:
+            logger.error(f"Error finding asset IDs: {str(e)}")
+            raise
+            
+    async def find_created_at(self, asset_ids: List[str]) -> Dict[str, datetime]:
+        """
+        Get the creation times of several assets in one query.
+        
+        Args:
+            asset_ids: The asset IDs to look up
+            
+        Returns:
+            Dict mapping asset ID to creation time, for assets whose first version was found
+        """
+        try:
+            cursor = self.assets_collection.find(
+                {"assetId": {"$in": asset_ids}, "versionNumber": 1},
+                {"assetId": 1, "createdAt": 1}
+            )
+            first_versions = await cursor.to_list(length=None)
+            
+            created_at = {}
+            for first_version in first_versions:
+                created = creation_time(first_version)
+                if created:
+                    created_at[first_version["assetId"]] = created
+            return created_at
+            
+        except Exception as e:
+            logger.error(f"Error finding asset creation times: {str(e)}")
+            raise
+            
     async def update_asset(self, query: Dict[str, Any], update: Dict[str, Any]) -> bool:
         """
         Update an asset document.
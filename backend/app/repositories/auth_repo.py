@@ -1,5 +1,6 @@
 from typing import Optional, Dict, Any
 import logging
+from pymongo import ASCENDING, IndexModel
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +20,21 @@ class AuthRepository:
         self.auth_collection = db_client.auth_collection
         self.sessions_collection = db_client.sessions_collection
         
+    async def create_indexes(self):
+        """Create required indexes for the auth and sessions collections"""
+        session_indexes = [
+            # Index for the session lookup made on every authenticated request
+            IndexModel([("sessionId", ASCENDING)], unique=True),
+            # TTL index so MongoDB removes sessions once they expire
+            IndexModel([("expiresAt", ASCENDING)], expireAfterSeconds=0)
+        ]
+        await self.sessions_collection.create_indexes(session_indexes)
+        
+        auth_indexes = [
+            IndexModel([("walletAddress", ASCENDING)])
+        ]
+        await self.auth_collection.create_indexes(auth_indexes)
+        
     async def get_auth_record(self, wallet_address: str) -> Optional[Dict[str, Any]]:
         """
         Get auth record for a wallet address.
@@ -0,0 +1,221 @@
+from typing import Optional, Dict, Any, List
+import logging
+from datetime import datetime, timezone
+from pymongo import ASCENDING, DESCENDING, IndexModel, UpdateOne
+
+logger = logging.getLogger(__name__)
+
+TRANSFER_EVENTS = ["TransferInitiated", "TransferCompleted", "TransferCancelled"]
+
+class ChainEventRepository:
+    """
+    Repository for indexed FuseVaultRegistry events in MongoDB.
+    Handles the chain_events collection and the indexer's block cursor.
+
+    Indexed string event arguments are only available as their keccak256 hash,
+    so assets are identified by assetIdHash rather than assetId.
+    """
+
+    def __init__(self, db_client):
+        """
+        Initialize with MongoDB client.
+
+        Args:
+            db_client: The MongoDB client with initialized collections
+        """
+        self.events_collection = db_client.get_collection("chain_events")
+        self.state_collection = db_client.get_collection("chain_index_state")
+
+    async def create_indexes(self):
+        """Create required indexes for the chain_events collection"""
+        indexes = [
+            # One document per log
+            IndexModel([("contract", ASCENDING), ("transactionHash", ASCENDING), ("logIndex", ASCENDING)], unique=True),
+            # Asset history lookups (recovery, outgoing transfers)
+            IndexModel([("contract", ASCENDING), ("owner", ASCENDING), ("assetIdHash", ASCENDING), ("event", ASCENDING)]),
+            # Incoming transfers
+            IndexModel([("contract", ASCENDING), ("to", ASCENDING), ("event", ASCENDING)], sparse=True),
+            # Delegation lookups
+            IndexModel([("contract", ASCENDING), ("owner", ASCENDING), ("delegate", ASCENDING), ("event", ASCENDING)], sparse=True),
+            # Reorg rollback
+            IndexModel([("contract", ASCENDING), ("blockNumber", DESCENDING)])
+        ]
+        await self.events_collection.create_indexes(indexes)
+
+    async def upsert_events(self, events: List[Dict[str, Any]]) -> int:
+        """
+        Insert indexed events, replacing any already stored for the same log.
+
+        Args:
+            events: Event documents including contract, transactionHash and logIndex
+
+        Returns:
+            Number of events inserted or modified
+        """
+        if not events:
+            return 0
+
+        try:
+            operations = [
+                UpdateOne(
+                    {
+                        "contract": event["contract"],
+                        "transactionHash": event["transactionHash"],
+                        "logIndex": event["logIndex"]
+                    },
+                    {"$set": event},
+                    upsert=True
+                )
+                for event in events
+            ]
+            result = await self.events_collection.bulk_write(operations, ordered=False)
+            return result.upserted_count + result.modified_count
+
+        except Exception as e:
+            logger.error(f"Error upserting chain events: {str(e)}")
+            raise
+
+    async def delete_events_after(self, contract: str, block_number: int) -> int:
+        """
+        Delete events above a block, used to roll back blocks that were reorganised away.
+
+        Args:
+            contract: The registry contract address
+            block_number: Last block whose events are kept
+
+        Returns:
+            Number of events deleted
+        """
+        try:
+            result = await self.events_collection.delete_many({
+                "contract": contract,
+                "blockNumber": {"$gt": block_number}
+            })
+            return result.deleted_count
+
+        except Exception as e:
+            logger.error(f"Error deleting chain events after block {block_number}: {str(e)}")
+            raise
+
+    async def get_cursor(self, contract: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the indexer's checkpoint for a contract.
+
+        Args:
+            contract: The registry contract address
+
+        Returns:
+            Cursor document with blockNumber and blockHash, or None if nothing is indexed yet
+        """
+        try:
+            return await self.state_collection.find_one({"_id": contract})
+        except Exception as e:
+            logger.error(f"Error getting chain index cursor: {str(e)}")
+            raise
+
+    async def set_cursor(self, contract: str, block_number: int, block_hash: str) -> None:
+        """
+        Record the last fully indexed block for a contract.
+
+        Args:
+            contract: The registry contract address
+            block_number: Last fully indexed block
+            block_hash: Hash of that block, used to detect reorgs
+        """
+        try:
+            await self.state_collection.update_one(
+                {"_id": contract},
+                {"$set": {
+                    "blockNumber": block_number,
+                    "blockHash": block_hash,
+                    "updatedAt": datetime.now(timezone.utc)
+                }},
+                upsert=True
+            )
+        except Exception as e:
+            logger.error(f"Error setting chain index cursor: {str(e)}")
+            raise
+
+    async def get_latest_ipfs_update(self, contract: str, owner: str, asset_id_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the highest-version non-deleted IPFSUpdated event for an asset.
+
+        Args:
+            contract: The registry contract address
+            owner: The owner's wallet address (lowercase)
+            asset_id_hash: keccak256 of the asset ID
+
+        Returns:
+            Event document or None if the asset has no indexed updates
+        """
+        try:
+            return await self.events_collection.find_one(
+                {
+                    "contract": contract,
+                    "owner": owner,
+                    "assetIdHash": asset_id_hash,
+                    "event": "IPFSUpdated",
+                    "isDeleted": False
+                },
+                sort=[("ipfsVersion", DESCENDING), ("blockNumber", DESCENDING)]
+            )
+        except Exception as e:
+            logger.error(f"Error getting latest IPFS update: {str(e)}")
+            raise
+
+    async def get_transfer_events(
+        self,
+        contract: str,
+        owners: Optional[List[str]] = None,
+        to: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get transfer events sent by the given owners or addressed to a recipient, oldest first.
+
+        Args:
+            contract: The registry contract address
+            owners: Sending owners' wallet addresses (lowercase)
+            to: Recipient wallet address (lowercase)
+
+        Returns:
+            List of transfer event documents
+        """
+        try:
+            query = {"contract": contract, "event": {"$in": TRANSFER_EVENTS}}
+            if owners is not None:
+                query["owner"] = {"$in": owners}
+            if to is not None:
+                query["to"] = to
+
+            cursor = self.events_collection.find(query).sort([("blockNumber", ASCENDING), ("logIndex", ASCENDING)])
+            return await cursor.to_list(length=None)
+
+        except Exception as e:
+            logger.error(f"Error getting transfer events: {str(e)}")
+            raise
+
+    async def get_latest_delegation_event(self, contract: str, owner: str, delegate: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the most recent DelegateStatusChanged event for an owner-delegate pair.
+
+        Args:
+            contract: The registry contract address
+            owner: The owner's wallet address (lowercase)
+            delegate: The delegate's wallet address (lowercase)
+
+        Returns:
+            Event document or None if the pair has no indexed events
+        """
+        try:
+            return await self.events_collection.find_one(
+                {
+                    "contract": contract,
+                    "owner": owner,
+                    "delegate": delegate,
+                    "event": "DelegateStatusChanged"
+                },
+                sort=[("blockNumber", DESCENDING), ("logIndex", DESCENDING)]
+            )
+        except Exception as e:
+            logger.error(f"Error getting delegation event: {str(e)}")
+            raise
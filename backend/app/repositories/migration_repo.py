@@ -0,0 +1,80 @@
+from typing import Optional, Dict, Any
+from datetime import datetime, timezone
+import logging
+
+logger = logging.getLogger(__name__)
+
+class MigrationRepository:
+    """
+    Repository for data migration progress in MongoDB.
+    Handles the migrations collection, one document per migration keyed by its name.
+    """
+
+    def __init__(self, db_client):
+        """
+        Initialize with MongoDB client.
+
+        Args:
+            db_client: The MongoDB client with initialized collections
+        """
+        self.migrations_collection = db_client.get_collection("migrations")
+
+    async def get_state(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the progress of a migration.
+
+        Args:
+            name: Migration name
+
+        Returns:
+            Dict with lastId, processed, modified and completed, or None if it never ran
+        """
+        try:
+            return await self.migrations_collection.find_one({"_id": name})
+        except Exception as e:
+            logger.error(f"Error getting migration state for {name}: {str(e)}")
+            raise
+
+    async def save_progress(self, name: str, last_id: Any, processed: int, modified: int) -> None:
+        """
+        Checkpoint a migration after a batch.
+
+        Args:
+            name: Migration name
+            last_id: _id of the last document processed
+            processed: Documents processed so far
+            modified: Documents modified so far
+        """
+        try:
+            await self.migrations_collection.update_one(
+                {"_id": name},
+                {"$set": {
+                    "lastId": last_id,
+                    "processed": processed,
+                    "modified": modified,
+                    "completed": False,
+                    "updatedAt": datetime.now(timezone.utc)
+                }},
+                upsert=True
+            )
+        except Exception as e:
+            logger.error(f"Error saving migration progress for {name}: {str(e)}")
+            raise
+
+    async def mark_completed(self, name: str) -> None:
+        """
+        Record that a migration has processed every document.
+
+        Args:
+            name: Migration name
+        """
+        try:
+            now = datetime.now(timezone.utc)
+            await self.migrations_collection.update_one(
+                {"_id": name},
+                {"$set": {"completed": True, "completedAt": now, "updatedAt": now}},
+                upsert=True
+            )
+        except Exception as e:
+            logger.error(f"Error marking migration {name} completed: {str(e)}")
+            raise
@@ -1,7 +1,9 @@
-from typing import Dict, Any, List, Optional
-from pymongo import DESCENDING
+from typing import Dict, Any, List, Optional, Tuple
+from pymongo import ASCENDING, DESCENDING, IndexModel
 import logging
 
+from app.utilities.pagination import encode_cursor, keyset_query
+
 logger = logging.getLogger(__name__)
 
 class TransactionRepository:
@@ -10,6 +12,9 @@ class TransactionRepository:
     Handles CRUD operations for the transaction collection.
     """
     
+    # Address fields and the lowercase copies wallet lookups match on exactly
+    ADDRESS_FIELDS = {"walletAddress": "walletAddressLower", "performedBy": "performedByLower"}
+    
     def __init__(self, db_client):
         """
         Initialize with MongoDB client.
@@ -19,6 +24,17 @@ class TransactionRepository:
         """
         self.transaction_collection = db_client.transaction_collection
         
+    async def create_indexes(self):
+        """Create required indexes for the transactions collection"""
+        indexes = [
+            # Index for an asset's history, newest first
+            IndexModel([("assetId", ASCENDING), ("timestamp", DESCENDING)]),
+            # Indexes for a wallet's history, as owner or as the delegate who performed the action
+            IndexModel([("walletAddressLower", ASCENDING), ("timestamp", DESCENDING), ("_id", DESCENDING)]),
+            IndexModel([("performedByLower", ASCENDING), ("timestamp", DESCENDING), ("_id", DESCENDING)])
+        ]
+        await self.transaction_collection.create_indexes(indexes)
+        
     async def insert_transaction(self, transaction_data: Dict[str, Any]) -> str:
         """
         Insert a new transaction record.
@@ -30,6 +46,10 @@ class TransactionRepository:
             String ID of the inserted transaction
         """
         try:
+            for field, lower_field in self.ADDRESS_FIELDS.items():
+                if isinstance(transaction_data.get(field), str):
+                    transaction_data[lower_field] = transaction_data[field].lower()
+                    
             result = await self.transaction_collection.insert_one(transaction_data)
             transaction_id = str(result.inserted_id)
             
@@ -79,6 +99,52 @@ class TransactionRepository:
             # Return empty list instead of raising to prevent frontend crashes
             return []
             
+    async def find_transactions_page(
+        self,
+        query: Dict[str, Any],
+        limit: int,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Find one page of transactions, newest first, by keyset on (timestamp, _id).
+        
+        Args:
+            query: MongoDB query to filter transactions
+            limit: Maximum number of transactions to return
+            cursor: Cursor token from the previous page, or None for the first page
+            
+        Returns:
+            Tuple of (transaction documents, cursor for the next page or None on the last page)
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            # Read one extra document to tell whether another page follows
+            cursor_query = keyset_query(query, "timestamp", cursor)
+            db_cursor = self.transaction_collection.find(cursor_query).sort(
+                [("timestamp", DESCENDING), ("_id", DESCENDING)]
+            ).limit(limit + 1)
+            transactions = await db_cursor.to_list(length=limit + 1)
+            
+            next_cursor = None
+            if len(transactions) > limit:
+                transactions = transactions[:limit]
+                next_cursor = encode_cursor(transactions[-1].get("timestamp"), transactions[-1]["_id"])
+            
+            # Convert ObjectId to string for each transaction
+            for tx in transactions:
+                if '_id' in tx:
+                    tx['_id'] = str(tx['_id'])
+                    
+            return transactions, next_cursor
+            
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Error finding transactions page: {str(e)}")
+            raise
+            
     async def find_transaction(self, query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Find a single transaction matching the query.
@@ -0,0 +1,56 @@
+from typing import Optional, Dict, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+class TxDetailsRepository:
+    """
+    Repository for decoded registry transactions in MongoDB.
+    Handles the tx_details collection, keyed by transaction hash.
+
+    A transaction hash commits to the transaction's contents, so documents are
+    written once and never updated.
+    """
+
+    def __init__(self, db_client):
+        """
+        Initialize with MongoDB client.
+
+        Args:
+            db_client: The MongoDB client with initialized collections
+        """
+        self.tx_details_collection = db_client.get_collection("tx_details")
+
+    async def get(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the decoded details of a transaction.
+
+        Args:
+            tx_hash: Lowercase 0x-prefixed transaction hash
+
+        Returns:
+            The stored document, or None if the transaction has not been decoded yet
+        """
+        try:
+            return await self.tx_details_collection.find_one({"_id": tx_hash})
+        except Exception as e:
+            logger.error(f"Error getting transaction details for {tx_hash}: {str(e)}")
+            raise
+
+    async def insert(self, tx_hash: str, details: Dict[str, Any]) -> None:
+        """
+        Store the decoded details of a transaction unless they are already stored.
+
+        Args:
+            tx_hash: Lowercase 0x-prefixed transaction hash
+            details: The decoded transaction document
+        """
+        try:
+            await self.tx_details_collection.update_one(
+                {"_id": tx_hash},
+                {"$setOnInsert": details},
+                upsert=True
+            )
+        except Exception as e:
+            logger.error(f"Error storing transaction details for {tx_hash}: {str(e)}")
+            raise
@@ -33,6 +33,7 @@ class WalletHistoryResponse(BaseModel):
     count: int = Field(..., description="Number of transactions")
     unique_assets: Optional[int] = Field(None, description="Number of unique assets", alias="uniqueAssets")
     action_summary: Optional[Dict[str, int]] = Field(None, description="Summary of actions by type", alias="actionSummary")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, absent on the last page", alias="nextCursor")
 
     model_config = {"populate_by_name": True}
 
@@ -2,7 +2,10 @@ from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
 import logging
 from bson import ObjectId
-from app.repositories.asset_repo import AssetRepository
+from pymongo import ASCENDING
+from app.repositories.asset_repo import AssetRepository, as_utc
+from app.services.migration_service import ASSET_WALLET_ADDRESS_MIGRATION, is_migration_complete
+from app.utilities.pagination import clamp_limit
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +24,29 @@ class AssetService:
         """
         self.asset_repository = asset_repository
         
+    def _owner_query(self, wallet_address: str) -> Dict[str, Any]:
+        """
+        Build the filter matching assets owned by a wallet address, in any capitalization.
+        
+        Once every asset carries walletAddressLower this is an exact, indexed match;
+        until then it falls back to a case-insensitive regex.
+        
+        Args:
+            wallet_address: The owner's wallet address
+            
+        Returns:
+            MongoDB filter on the owner address
+        """
+        normalized_address = wallet_address.lower()
+        if is_migration_complete(ASSET_WALLET_ADDRESS_MIGRATION):
+            return {"walletAddressLower": normalized_address}
+        return {
+            "$or": [
+                {"walletAddress": normalized_address},
+                {"walletAddress": {"$regex": f"^{normalized_address}$", "$options": "i"}}
+            ]
+        }
+        
     async def create_asset(
         self, 
         asset_id: str, 
@@ -90,13 +116,13 @@ class AssetService:
                         "walletAddress": wallet_address,
                         "smartContractTxId": smart_contract_tx_id,
                         "ipfsHash": ipfs_hash,
+                        "createdAt": datetime.now(timezone.utc),
                         "lastVerified": datetime.now(timezone.utc),
                         "lastUpdated": datetime.now(timezone.utc),
                         "criticalMetadata": critical_metadata,
                         "nonCriticalMetadata": non_critical_metadata or {},
                         "isCurrent": True,
-                        "isDeleted": False,
-                        "documentHistory": []
+                        "isDeleted": False
                     }
                     
                     # Insert into MongoDB
@@ -116,13 +142,13 @@ class AssetService:
                 "walletAddress": wallet_address,
                 "smartContractTxId": smart_contract_tx_id,
                 "ipfsHash": ipfs_hash,
+                "createdAt": datetime.now(timezone.utc),
                 "lastVerified": datetime.now(timezone.utc),
                 "lastUpdated": datetime.now(timezone.utc),
                 "criticalMetadata": critical_metadata,
                 "nonCriticalMetadata": non_critical_metadata or {},
                 "isCurrent": True,
-                "isDeleted": False,
-                "documentHistory": []
+                "isDeleted": False
             }
             
             # Insert into MongoDB
@@ -216,7 +242,10 @@ class AssetService:
         """
         try:
             # Build query
-            query = {"walletAddress": wallet_address}
+            if is_migration_complete(ASSET_WALLET_ADDRESS_MIGRATION):
+                query = self._owner_query(wallet_address)
+            else:
+                query = {"walletAddress": wallet_address}
             
             if not include_deleted:
                 query["isDeleted"] = False
@@ -231,6 +260,91 @@ class AssetService:
             logger.error(f"Error getting documents by wallet: {str(e)}")
             raise
             
+    async def get_created_at(self, assets: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Get the creation times of assets.
+        
+        Versions carry createdAt from when the asset was first created. Assets
+        written before that field existed are looked up by their first version,
+        all in a single query.
+        
+        Args:
+            assets: Asset documents, any version
+            
+        Returns:
+            Dict mapping asset ID to its UTC creation time, for assets whose creation time is known
+        """
+        created_at = {
+            asset["assetId"]: as_utc(asset["createdAt"])
+            for asset in assets
+            if asset.get("createdAt")
+        }
+        missing = list({asset["assetId"] for asset in assets if asset.get("assetId") and not asset.get("createdAt")})
+        if missing:
+            created_at.update(await self.asset_repository.find_created_at(missing))
+        return created_at
+        
+    def _user_assets_query(self, wallet_address: str) -> Dict[str, Any]:
+        """Build the filter for a wallet's current, non-deleted assets."""
+        # Some wallet addresses are stored with different capitalization
+        query = self._owner_query(wallet_address)
+        query["isCurrent"] = True
+        query["isDeleted"] = False
+        return query
+        
+    async def _format_user_assets(self, assets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Format asset documents to match frontend expectations.
+        
+        Args:
+            assets: Current asset documents
+            
+        Returns:
+            List of formatted assets
+        """
+        # Creation times are stored on every version; older assets are looked up together
+        try:
+            created_at_by_asset = await self.get_created_at(assets)
+        except Exception as e:
+            logger.warning(f"Could not look up creation times: {e}")
+            created_at_by_asset = {}
+        
+        # Format assets for frontend compatibility
+        formatted_assets = []
+        for asset in assets:
+            created_at = created_at_by_asset.get(asset.get("assetId")) or asset.get("lastUpdated", "")
+            
+            # Convert datetime objects to ISO strings if needed
+            if hasattr(created_at, 'isoformat'):
+                # Ensure timezone consistency - if timezone-naive, assume UTC
+                if created_at.tzinfo is None:
+                    created_at = created_at.replace(tzinfo=timezone.utc)
+                created_at = created_at.isoformat()
+            
+            # Handle updated_at conversion
+            updated_at = asset.get("lastUpdated", "")
+            if hasattr(updated_at, 'isoformat'):
+                # Ensure timezone consistency - if timezone-naive, assume UTC
+                if updated_at.tzinfo is None:
+                    updated_at = updated_at.replace(tzinfo=timezone.utc)
+                updated_at = updated_at.isoformat()
+            
+            # Format the asset data to match frontend expectations
+            formatted_asset = {
+                "_id": asset["_id"],
+                "assetId": asset.get("assetId", ""),
+                "walletAddress": asset.get("walletAddress", ""),
+                "criticalMetadata": asset.get("criticalMetadata", {}),
+                "nonCriticalMetadata": asset.get("nonCriticalMetadata", {}),
+                "ipfsCid": asset.get("ipfsHash", ""),
+                "versionNumber": asset.get("versionNumber", 1),
+                "createdAt": created_at,
+                "updatedAt": updated_at
+            }
+            formatted_assets.append(formatted_asset)
+        
+        return formatted_assets
+        
     async def get_user_assets(self, wallet_address: str) -> List[Dict[str, Any]]:
         """
         Get all assets owned by a specific wallet address.
@@ -246,100 +360,63 @@ class AssetService:
         try:
             logger.info(f"Getting assets for wallet: {wallet_address}")
             
-            # Updated query to support case-insensitive address matching
-            # Some wallet addresses might be stored with different capitalization
-            normalized_address = wallet_address.lower()
-            
-            # Create a query that matches regardless of case
-            # MongoDB regex with options 'i' for case-insensitive
-            query = {
-                "$or": [
-                    {"walletAddress": normalized_address},
-                    {"walletAddress": {"$regex": f"^{normalized_address}$", "$options": "i"}}
-                ]
-            }
-            
-            # Also ensure we're only getting current and non-deleted assets
-            query["isCurrent"] = True
-            query["isDeleted"] = False
-            
             # Find assets directly with the query instead of using get_documents_by_wallet
-            assets = await self.asset_repository.find_assets(query)
+            assets = await self.asset_repository.find_assets(self._user_assets_query(wallet_address))
 
             # Log asset count for monitoring
             if len(assets) > 0:
                 logger.debug(f"Found {len(assets)} assets from DB for wallet: {wallet_address}")
             
-            # Format assets for frontend compatibility
-            formatted_assets = []
-            for asset in assets:
-                # Get creation time from version 1 of this asset
-                asset_id_val = asset.get("assetId")
-                try:
-                    first_version = await self.asset_repository.find_asset({
-                        "assetId": asset_id_val,
-                        "versionNumber": 1
-                    })
-                    
-                    if first_version:
-                        # Handle case where _id might be a string (convert to ObjectId)
-                        version_id = first_version["_id"]
-                        if isinstance(version_id, str):
-                            try:
-                                version_id = ObjectId(version_id)
-                            except Exception:
-                                version_id = None
-                        
-                        if version_id and hasattr(version_id, 'generation_time'):
-                            created_at = version_id.generation_time.isoformat()
-                        else:
-                            created_at = asset.get("lastUpdated", "")
-                    else:
-                        created_at = asset.get("lastUpdated", "")
-                except Exception as e:
-                    logger.warning(f"Could not find version 1 for asset {asset_id_val}: {e}")
-                    # Fallback to current document's ObjectId or lastUpdated
-                    if hasattr(asset["_id"], 'generation_time'):
-                        created_at = asset["_id"].generation_time.isoformat()
-                    else:
-                        created_at = asset.get("lastUpdated", "")
-                
-                # Convert datetime objects to ISO strings if needed
-                if hasattr(created_at, 'isoformat'):
-                    # Ensure timezone consistency - if timezone-naive, assume UTC
-                    if created_at.tzinfo is None:
-                        created_at = created_at.replace(tzinfo=timezone.utc)
-                    created_at = created_at.isoformat()
-                
-                # Handle updated_at conversion
-                updated_at = asset.get("lastUpdated", "")
-                if hasattr(updated_at, 'isoformat'):
-                    # Ensure timezone consistency - if timezone-naive, assume UTC
-                    if updated_at.tzinfo is None:
-                        updated_at = updated_at.replace(tzinfo=timezone.utc)
-                    updated_at = updated_at.isoformat()
-                
-                # Format the asset data to match frontend expectations
-                formatted_asset = {
-                    "_id": asset["_id"],
-                    "assetId": asset.get("assetId", ""),
-                    "walletAddress": asset.get("walletAddress", ""),
-                    "criticalMetadata": asset.get("criticalMetadata", {}),
-                    "nonCriticalMetadata": asset.get("nonCriticalMetadata", {}),
-                    "ipfsCid": asset.get("ipfsHash", ""),
-                    "versionNumber": asset.get("versionNumber", 1),
-                    "createdAt": created_at,
-                    "updatedAt": updated_at
-                }
-                formatted_assets.append(formatted_asset)
-            
-            return formatted_assets
+            return await self._format_user_assets(assets)
             
         except Exception as e:
             logger.error(f"Error getting user assets: {str(e)}")
             # Return empty list on error to prevent frontend crashes
             return []
             
+    async def get_user_asset_ids(self, wallet_address: str) -> List[str]:
+        """
+        Get the IDs of a wallet's current, non-deleted assets.
+        
+        Args:
+            wallet_address: The wallet address to get asset IDs for
+            
+        Returns:
+            List of asset IDs
+        """
+        return await self.asset_repository.find_asset_ids(self._user_assets_query(wallet_address))
+        
+    async def get_user_assets_page(
+        self,
+        wallet_address: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get one page of the assets owned by a wallet address, most recently updated first.
+        Only returns current versions that are not deleted.
+        
+        Args:
+            wallet_address: The wallet address to get assets for
+            limit: Page size, capped at PAGINATION_MAX_LIMIT (default: PAGINATION_DEFAULT_LIMIT)
+            cursor: next_cursor from the previous page, or None for the first page
+            
+        Returns:
+            Dict with the formatted assets and next_cursor (None on the last page)
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        assets, next_cursor = await self.asset_repository.find_assets_page(
+            self._user_assets_query(wallet_address),
+            clamp_limit(limit),
+            cursor
+        )
+        return {
+            "assets": await self._format_user_assets(assets),
+            "next_cursor": next_cursor
+        }
+            
     async def create_new_version(
         self,
         asset_id: str,
@@ -394,6 +471,11 @@ class AssetService:
                 if smart_contract_tx_id == current_asset.get("smartContractTxId"):
                     ipfs_version = current_ipfs_version
             
+            # Carry the creation time forward; versions written before createdAt existed get it from version 1
+            created_at = current_asset.get("createdAt")
+            if not created_at:
+                created_at = (await self.asset_repository.find_created_at([asset_id])).get(asset_id)
+            
             # Mark current version as not current first
             await self.asset_repository.update_asset(
                 {"_id": ObjectId(current_asset["_id"])},
@@ -414,10 +496,13 @@ class AssetService:
                 "nonCriticalMetadata": non_critical_metadata or {},
                 "isCurrent": True,
                 "isDeleted": False,
-                "previousVersionId": current_asset["_id"],
-                "documentHistory": [*current_asset.get("documentHistory", []), current_asset["_id"]]
+                # Lineage is previousVersionId plus versionNumber; get_version_history pages through it
+                "previousVersionId": current_asset["_id"]
             }
             
+            if created_at:
+                new_doc["createdAt"] = created_at
+            
             # Add delegation audit trail if action was performed by someone else
             if performed_by and performed_by.lower() != wallet_address.lower():
                 new_doc["performedBy"] = performed_by
@@ -501,16 +586,27 @@ class AssetService:
             logger.error(f"Error soft deleting asset: {str(e)}")
             raise
             
-    async def get_version_history(self, asset_id: str, include_deleted: bool = False) -> List[Dict[str, Any]]:
+    async def get_version_history(
+        self,
+        asset_id: str,
+        include_deleted: bool = False,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
-        Get the version history for an asset.
+        Get one page of the version history for an asset, oldest version first.
         
         Args:
             asset_id: The asset ID to get history for
             include_deleted: Whether to include deleted versions (default: False)
+            limit: Page size, capped at PAGINATION_MAX_LIMIT (default: PAGINATION_DEFAULT_LIMIT)
+            cursor: next_cursor from the previous page, or None for the first page
             
         Returns:
-            List of asset versions ordered by version number
+            Dict with the asset versions ordered by version number and next_cursor (None on the last page)
+            
+        Raises:
+            ValueError: If the cursor is malformed
         """
         try:
             # Build query based on deletion status
@@ -519,11 +615,14 @@ class AssetService:
             if not include_deleted:
                 query["isDeleted"] = False
                 
-            return await self.asset_repository.find_assets(
+            versions, next_cursor = await self.asset_repository.find_assets_page(
                 query,
+                clamp_limit(limit),
+                cursor,
                 sort_field="versionNumber",
-                sort_direction=1  # Ascending order
+                direction=ASCENDING
             )
+            return {"versions": versions, "next_cursor": next_cursor}
             
         except Exception as e:
             logger.error(f"Error getting version history: {str(e)}")
@@ -1,321 +1,427 @@
+import asyncio
 import logging
-from web3 import Web3
-from typing import Any, Dict, Optional
+import time
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import AsyncWeb3, Web3
+from web3.exceptions import ContractLogicError, TimeExhausted
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from fastapi import HTTPException
 
 from app.config import settings
+from app.services.fee_oracle_service import FeeOracleService
 from app.services.transaction_builder_service import TransactionBuilderService
+from app.utilities.cid_verification import verify_cid_against_ipfs_info
+from app.utilities.delegation_cache import delegation_cache
+from app.utilities.gas_model import gas_model
+from app.utilities.nonce_manager import NonceManager, is_nonce_error
+from app.utilities.write_coalescer import WriteCoalescer
+from app.utilities.multicall import CallFailed, Multicall
+from app.utilities.rpc_batch import RpcBatchTransport
+from app.utilities.rpc_router import RoutedAsyncHTTPProvider, RpcRouter
+from app.utilities.tx_details_cache import tx_details_cache, with_asset_cids
+from app.services.receipt_watcher_service import ReceiptWatcherService, normalize_tx_hash
+from app.utilities.web3_utils import run_web3_call
 
 logger = logging.getLogger(__name__)
 
+# FuseVaultRegistry ABI, built once per process and shared by every service instance
+CONTRACT_ABI = [
+    # Asset Update Functions
+    {
+        "inputs": [
+            {"internalType": "string", "name": "_assetId", "type": "string"},
+            {"internalType": "string", "name": "_cid", "type": "string"}
+        ],
+        "name": "updateIPFS",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "address", "name": "_owner", "type": "address"},
+            {"internalType": "string", "name": "_assetId", "type": "string"},
+            {"internalType": "string", "name": "_cid", "type": "string"}
+        ],
+        "name": "updateIPFSFor",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+
+    # Delete Functions
+    {
+        "inputs": [
+            {"internalType": "string", "name": "_assetId", "type": "string"}
+        ],
+        "name": "deleteAsset",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "address", "name": "_owner", "type": "address"},
+            {"internalType": "string", "name": "_assetId", "type": "string"}
+        ],
+        "name": "deleteAssetFor",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+
+    # Batch Functions
+    {
+        "inputs": [
+            {"internalType": "string[]", "name": "_assetIds", "type": "string[]"},
+            {"internalType": "string[]", "name": "_cids", "type": "string[]"}
+        ],
+        "name": "batchUpdateIPFS",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "address", "name": "_owner", "type": "address"},
+            {"internalType": "string[]", "name": "_assetIds", "type": "string[]"},
+            {"internalType": "string[]", "name": "_cids", "type": "string[]"}
+        ],
+        "name": "batchUpdateIPFSFor",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "string[]", "name": "_assetIds", "type": "string[]"}
+        ],
+        "name": "batchDeleteAssets",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "address", "name": "_owner", "type": "address"},
+            {"internalType": "string[]", "name": "_assetIds", "type": "string[]"}
+        ],
+        "name": "batchDeleteAssetsFor",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+
+    # Info and Verification Functions
+    {
+        "inputs": [
+            {"internalType": "string", "name": "_assetId", "type": "string"},
+            {"internalType": "address", "name": "_owner", "type": "address"}
+        ],
+        "name": "getIPFSInfo",
+        "outputs": [
+            {"internalType": "uint32", "name": "ipfsVersion", "type": "uint32"},
+            {"internalType": "bytes32", "name": "cidHash", "type": "bytes32"},
+            {"internalType": "uint64", "name": "lastUpdated", "type": "uint64"},
+            {"internalType": "uint64", "name": "createdAt", "type": "uint64"},
+            {"internalType": "bool", "name": "isDeleted", "type": "bool"}
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "string", "name": "_assetId", "type": "string"},
+            {"internalType": "address", "name": "_owner", "type": "address"},
+            {"internalType": "string", "name": "_cid", "type": "string"},
+            {"internalType": "uint32", "name": "_claimedIpfsVersion", "type": "uint32"}
+        ],
+        "name": "verifyCID",
+        "outputs": [
+            {"internalType": "bool", "name": "isValid", "type": "bool"},
+            {"internalType": "string", "name": "message", "type": "string"},
+            {"internalType": "uint32", "name": "actualIpfsVersion", "type": "uint32"},
+            {"internalType": "bool", "name": "isDeleted", "type": "bool"}
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "string", "name": "_assetId", "type": "string"},
+            {"internalType": "address", "name": "_owner", "type": "address"}
+        ],
+        "name": "assetExists",
+        "outputs": [
+            {"internalType": "bool", "name": "exists", "type": "bool"},
+            {"internalType": "bool", "name": "isDeleted", "type": "bool"}
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "string", "name": "_assetId", "type": "string"}
+        ],
+        "name": "hashAssetId",
+        "outputs": [
+            {"internalType": "bytes32", "name": "", "type": "bytes32"}
+        ],
+        "stateMutability": "pure",
+        "type": "function"
+    },
+
+    # Admin Functions
+    {
+        "inputs": [
+            {"internalType": "address", "name": "_account", "type": "address"},
+            {"internalType": "bool", "name": "_isAdmin", "type": "bool"}
+        ],
+        "name": "setAdmin",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "address", "name": "_delegate", "type": "address"},
+            {"internalType": "bool", "name": "_status", "type": "bool"}
+        ],
+        "name": "setDelegate",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "address", "name": "owner", "type": "address"},
+            {"internalType": "address", "name": "delegate", "type": "address"}
+        ],
+        "name": "delegates",
+        "outputs": [
+            {"internalType": "bool", "name": "", "type": "bool"}
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+
+    # Transfer Functions
+    {
+        "inputs": [
+            {"internalType": "string", "name": "_assetId", "type": "string"},
+            {"internalType": "address", "name": "_newOwner", "type": "address"}
+        ],
+        "name": "initiateTransfer",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "string", "name": "_assetId", "type": "string"},
+            {"internalType": "address", "name": "_previousOwner", "type": "address"}
+        ],
+        "name": "acceptTransfer",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "string", "name": "_assetId", "type": "string"}
+        ],
+        "name": "cancelTransfer",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "string", "name": "_assetId", "type": "string"},
+            {"internalType": "address", "name": "_owner", "type": "address"}
+        ],
+        "name": "getPendingTransfer",
+        "outputs": [
+            {"internalType": "address", "name": "pendingTo", "type": "address"}
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+
+    # Events
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "internalType": "address", "name": "owner", "type": "address"},
+            {"indexed": True, "internalType": "string", "name": "assetId", "type": "string"},
+            {"indexed": False, "internalType": "uint32", "name": "ipfsVersion", "type": "uint32"},
+            {"indexed": False, "internalType": "string", "name": "cid", "type": "string"},
+            {"indexed": False, "internalType": "bool", "name": "isDeleted", "type": "bool"}
+        ],
+        "name": "IPFSUpdated",
+        "type": "event"
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "internalType": "address", "name": "account", "type": "address"},
+            {"indexed": False, "internalType": "bool", "name": "isAdmin", "type": "bool"}
+        ],
+        "name": "AdminStatusChanged",
+        "type": "event"
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "internalType": "address", "name": "owner", "type": "address"},
+            {"indexed": True, "internalType": "address", "name": "delegate", "type": "address"},
+            {"indexed": False, "internalType": "bool", "name": "status", "type": "bool"}
+        ],
+        "name": "DelegateStatusChanged",
+        "type": "event"
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "internalType": "address", "name": "owner", "type": "address"},
+            {"indexed": True, "internalType": "string", "name": "assetId", "type": "string"},
+            {"indexed": False, "internalType": "uint32", "name": "lastVersion", "type": "uint32"}
+        ],
+        "name": "AssetDeleted",
+        "type": "event"
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "internalType": "address", "name": "from", "type": "address"},
+            {"indexed": True, "internalType": "address", "name": "to", "type": "address"},
+            {"indexed": True, "internalType": "string", "name": "assetId", "type": "string"}
+        ],
+        "name": "TransferInitiated",
+        "type": "event"
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "internalType": "address", "name": "from", "type": "address"},
+            {"indexed": True, "internalType": "address", "name": "to", "type": "address"},
+            {"indexed": True, "internalType": "string", "name": "assetId", "type": "string"}
+        ],
+        "name": "TransferCompleted",
+        "type": "event"
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "internalType": "address", "name": "from", "type": "address"},
+            {"indexed": True, "internalType": "address", "name": "to", "type": "address"},
+            {"indexed": True, "internalType": "string", "name": "assetId", "type": "string"}
+        ],
+        "name": "TransferCancelled",
+        "type": "event"
+    }
+]
+
+# MAX_BATCH_SIZE of the registry contract
+MAX_BATCH_SIZE = 50
+
+# Registry events mirrored into MongoDB by the chain event indexer
+INDEXED_EVENTS = (
+    "IPFSUpdated",
+    "AssetDeleted",
+    "TransferInitiated",
+    "TransferCompleted",
+    "TransferCancelled",
+    "DelegateStatusChanged"
+)
+
+
 class BlockchainService:
     def __init__(self):
         self.provider_url = settings.alchemy_sepolia_url
         self.wallet_address = settings.wallet_address
         self.private_key = settings.private_key
         self.contract_address = settings.contract_address
-        self.contract_abi = [
-            # Asset Update Functions
-            {
-                "inputs": [
-                    {"internalType": "string", "name": "_assetId", "type": "string"},
-                    {"internalType": "string", "name": "_cid", "type": "string"}
-                ],
-                "name": "updateIPFS",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "address", "name": "_owner", "type": "address"},
-                    {"internalType": "string", "name": "_assetId", "type": "string"},
-                    {"internalType": "string", "name": "_cid", "type": "string"}
-                ],
-                "name": "updateIPFSFor",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-
-            # Delete Functions
-            {
-                "inputs": [
-                    {"internalType": "string", "name": "_assetId", "type": "string"}
-                ],
-                "name": "deleteAsset",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "address", "name": "_owner", "type": "address"},
-                    {"internalType": "string", "name": "_assetId", "type": "string"}
-                ],
-                "name": "deleteAssetFor",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-
-            # Batch Functions
-            {
-                "inputs": [
-                    {"internalType": "string[]", "name": "_assetIds", "type": "string[]"},
-                    {"internalType": "string[]", "name": "_cids", "type": "string[]"}
-                ],
-                "name": "batchUpdateIPFS",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "address", "name": "_owner", "type": "address"},
-                    {"internalType": "string[]", "name": "_assetIds", "type": "string[]"},
-                    {"internalType": "string[]", "name": "_cids", "type": "string[]"}
-                ],
-                "name": "batchUpdateIPFSFor",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "string[]", "name": "_assetIds", "type": "string[]"}
-                ],
-                "name": "batchDeleteAssets",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "address", "name": "_owner", "type": "address"},
-                    {"internalType": "string[]", "name": "_assetIds", "type": "string[]"}
-                ],
-                "name": "batchDeleteAssetsFor",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-
-            # Info and Verification Functions
-            {
-                "inputs": [
-                    {"internalType": "string", "name": "_assetId", "type": "string"},
-                    {"internalType": "address", "name": "_owner", "type": "address"}
-                ],
-                "name": "getIPFSInfo",
-                "outputs": [
-                    {"internalType": "uint32", "name": "ipfsVersion", "type": "uint32"},
-                    {"internalType": "bytes32", "name": "cidHash", "type": "bytes32"},
-                    {"internalType": "uint64", "name": "lastUpdated", "type": "uint64"},
-                    {"internalType": "uint64", "name": "createdAt", "type": "uint64"},
-                    {"internalType": "bool", "name": "isDeleted", "type": "bool"}
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "string", "name": "_assetId", "type": "string"},
-                    {"internalType": "address", "name": "_owner", "type": "address"},
-                    {"internalType": "string", "name": "_cid", "type": "string"},
-                    {"internalType": "uint32", "name": "_claimedIpfsVersion", "type": "uint32"}
-                ],
-                "name": "verifyCID",
-                "outputs": [
-                    {"internalType": "bool", "name": "isValid", "type": "bool"},
-                    {"internalType": "string", "name": "message", "type": "string"},
-                    {"internalType": "uint32", "name": "actualIpfsVersion", "type": "uint32"},
-                    {"internalType": "bool", "name": "isDeleted", "type": "bool"}
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "string", "name": "_assetId", "type": "string"},
-                    {"internalType": "address", "name": "_owner", "type": "address"}
-                ],
-                "name": "assetExists",
-                "outputs": [
-                    {"internalType": "bool", "name": "exists", "type": "bool"},
-                    {"internalType": "bool", "name": "isDeleted", "type": "bool"}
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "string", "name": "_assetId", "type": "string"}
-                ],
-                "name": "hashAssetId",
-                "outputs": [
-                    {"internalType": "bytes32", "name": "", "type": "bytes32"}
-                ],
-                "stateMutability": "pure",
-                "type": "function"
-            },
-
-            # Admin Functions
-            {
-                "inputs": [
-                    {"internalType": "address", "name": "_account", "type": "address"},
-                    {"internalType": "bool", "name": "_isAdmin", "type": "bool"}
-                ],
-                "name": "setAdmin",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "address", "name": "_delegate", "type": "address"},
-                    {"internalType": "bool", "name": "_status", "type": "bool"}
-                ],
-                "name": "setDelegate",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "address", "name": "owner", "type": "address"},
-                    {"internalType": "address", "name": "delegate", "type": "address"}
-                ],
-                "name": "delegates",
-                "outputs": [
-                    {"internalType": "bool", "name": "", "type": "bool"}
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-
-            # Transfer Functions
-            {
-                "inputs": [
-                    {"internalType": "string", "name": "_assetId", "type": "string"},
-                    {"internalType": "address", "name": "_newOwner", "type": "address"}
-                ],
-                "name": "initiateTransfer",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "string", "name": "_assetId", "type": "string"},
-                    {"internalType": "address", "name": "_previousOwner", "type": "address"}
-                ],
-                "name": "acceptTransfer",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "string", "name": "_assetId", "type": "string"}
-                ],
-                "name": "cancelTransfer",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "string", "name": "_assetId", "type": "string"},
-                    {"internalType": "address", "name": "_owner", "type": "address"}
-                ],
-                "name": "getPendingTransfer",
-                "outputs": [
-                    {"internalType": "address", "name": "pendingTo", "type": "address"}
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-
-            # Events
-            {
-                "anonymous": False,
-                "inputs": [
-                    {"indexed": True, "internalType": "address", "name": "owner", "type": "address"},
-                    {"indexed": True, "internalType": "string", "name": "assetId", "type": "string"},
-                    {"indexed": False, "internalType": "uint32", "name": "ipfsVersion", "type": "uint32"},
-                    {"indexed": False, "internalType": "string", "name": "cid", "type": "string"},
-                    {"indexed": False, "internalType": "bool", "name": "isDeleted", "type": "bool"}
-                ],
-                "name": "IPFSUpdated",
-                "type": "event"
-            },
-            {
-                "anonymous": False,
-                "inputs": [
-                    {"indexed": True, "internalType": "address", "name": "account", "type": "address"},
-                    {"indexed": False, "internalType": "bool", "name": "isAdmin", "type": "bool"}
-                ],
-                "name": "AdminStatusChanged",
-                "type": "event"
-            },
-            {
-                "anonymous": False,
-                "inputs": [
-                    {"indexed": True, "internalType": "address", "name": "owner", "type": "address"},
-                    {"indexed": True, "internalType": "address", "name": "delegate", "type": "address"},
-                    {"indexed": False, "internalType": "bool", "name": "status", "type": "bool"}
-                ],
-                "name": "DelegateStatusChanged",
-                "type": "event"
-            },
-            {
-                "anonymous": False,
-                "inputs": [
-                    {"indexed": True, "internalType": "address", "name": "owner", "type": "address"},
-                    {"indexed": True, "internalType": "string", "name": "assetId", "type": "string"},
-                    {"indexed": False, "internalType": "uint32", "name": "lastVersion", "type": "uint32"}
-                ],
-                "name": "AssetDeleted",
-                "type": "event"
-            },
-            {
-                "anonymous": False,
-                "inputs": [
-                    {"indexed": True, "internalType": "address", "name": "from", "type": "address"},
-                    {"indexed": True, "internalType": "address", "name": "to", "type": "address"},
-                    {"indexed": True, "internalType": "string", "name": "assetId", "type": "string"}
-                ],
-                "name": "TransferInitiated",
-                "type": "event"
-            },
-            {
-                "anonymous": False,
-                "inputs": [
-                    {"indexed": True, "internalType": "address", "name": "from", "type": "address"},
-                    {"indexed": True, "internalType": "address", "name": "to", "type": "address"},
-                    {"indexed": True, "internalType": "string", "name": "assetId", "type": "string"}
-                ],
-                "name": "TransferCompleted",
-                "type": "event"
-            },
-            {
-                "anonymous": False,
-                "inputs": [
-                    {"indexed": True, "internalType": "address", "name": "from", "type": "address"},
-                    {"indexed": True, "internalType": "address", "name": "to", "type": "address"},
-                    {"indexed": True, "internalType": "string", "name": "assetId", "type": "string"}
-                ],
-                "name": "TransferCancelled",
-                "type": "event"
-            }
-        ]
+        self.contract_abi = CONTRACT_ABI
+
+        # Native asyncio provider by default; the threaded sync provider stays
+        # available behind BLOCKCHAIN_ASYNC_WEB3=false for comparison
+        self.async_web3 = settings.blockchain_async_web3
+        self.session: Optional[requests.Session] = None
+        self.http_adapter: Optional[HTTPAdapter] = None
+        self.aiohttp_session: Optional[aiohttp.ClientSession] = None
+        self._aiohttp_stats = {"connections_created": 0, "connections_reused": 0}
+
+        # With fallback providers or rate limits configured, reads are routed to the fastest
+        # healthy provider and writes stay on ALCHEMY_SEPOLIA_URL
+        self.rpc_router: Optional[RpcRouter] = None
+        if self.async_web3 and (settings.blockchain_rpc_fallback_urls_list or settings.blockchain_rpc_rate_limits_list):
+            self.rpc_router = RpcRouter(
+                [self.provider_url, *settings.blockchain_rpc_fallback_urls_list],
+                rate_limits=settings.blockchain_rpc_rate_limits_list,
+                failure_threshold=settings.blockchain_rpc_breaker_failures,
+                cooldown=settings.blockchain_rpc_breaker_cooldown
+            )
+        elif settings.blockchain_rpc_fallback_urls_list:
+            logger.warning("BLOCKCHAIN_RPC_FALLBACK_URLS is only used with the async web3 backend")
+
+        if self.async_web3:
+            request_kwargs = {"timeout": aiohttp.ClientTimeout(total=settings.blockchain_rpc_timeout)}
+            if self.rpc_router is not None:
+                provider = RoutedAsyncHTTPProvider(self.rpc_router, request_kwargs=request_kwargs)
+            else:
+                provider = AsyncWeb3.AsyncHTTPProvider(self.provider_url, request_kwargs=request_kwargs)
+            self.web3 = AsyncWeb3(provider)
+        else:
+            # Pooled keep-alive session so RPC calls reuse TCP/TLS connections
+            self.session = requests.Session()
+            self.http_adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=settings.blockchain_rpc_pool_size
+            )
+            self.session.mount("https://", self.http_adapter)
+            self.session.mount("http://", self.http_adapter)
+
+            self.web3 = Web3(Web3.HTTPProvider(
+                self.provider_url,
+                request_kwargs={"timeout": settings.blockchain_rpc_timeout},
+                session=self.session
+            ))
+
+        # Reads issued together (e.g. a transaction lookup and a verifyCID call) share one JSON-RPC batch
+        self.rpc_batch: Optional[RpcBatchTransport] = None
+        if settings.blockchain_rpc_batching:
+            self.rpc_batch = RpcBatchTransport(
+                self.web3,
+                self.provider_url,
+                get_session=lambda: self.aiohttp_session,
+                timeout=settings.blockchain_rpc_timeout,
+                max_batch_size=settings.blockchain_rpc_batch_max,
+                router=self.rpc_router
+            )
 
-        self.web3 = Web3(Web3.HTTPProvider(self.provider_url))
+        # Server-wallet nonces are handed out locally so signed transactions can be pipelined
+        self.nonce_manager = NonceManager(self._fetch_pending_nonce)
+        # Receipts for all transactions the process waits on are matched block by block
+        self.receipt_watcher = ReceiptWatcherService(self)
+        # Fee suggestions and the chain ID come from a background sampler, not a read per build
+        self.fee_oracle = FeeOracleService(self)
+
+        # Opt-in: concurrent server-signed store_hash_for calls for one owner share a batchUpdateIPFSFor
+        self.store_hash_coalescer: Optional[WriteCoalescer] = None
+        if settings.blockchain_coalesce_writes:
+            self.store_hash_coalescer = WriteCoalescer(
+                self._flush_store_hash_batch,
+                window=settings.blockchain_coalesce_window_ms / 1000,
+                max_size=min(settings.blockchain_coalesce_max_batch, MAX_BATCH_SIZE)
+            )
 
-        if not self.web3.is_connected():
-            logger.error("Unable to connect to Alchemy Sepolia network.")
-            raise HTTPException(status_code=500, detail="Blockchain connection error")
+        # Connection health is checked on an interval by start(), not per request
+        self.connected: Optional[bool] = None
+        self.last_health_check: Optional[float] = None
+        self._health_check_task: Optional[asyncio.Task] = None
 
         try:
             self.contract = self.web3.eth.contract(
@@ -323,11 +429,411 @@ class BlockchainService:
                 abi=self.contract_abi
             )
             # Initialize transaction builder service
-            self.transaction_builder = TransactionBuilderService(self.web3, self.contract)
+            self.transaction_builder = TransactionBuilderService(self.web3, self.contract, self.fee_oracle)
+            # Bulk view reads are packed into Multicall3 aggregate3 eth_calls
+            self.multicall = Multicall(
+                self.web3,
+                lambda fn, *args, **kwargs: self._call(fn, *args, **kwargs),
+                address=settings.multicall3_address,
+                max_calldata_bytes=settings.multicall_max_calldata_bytes
+            )
         except Exception as e:
             logger.error(f"Error setting up contract: {str(e)}")
             raise
 
+    async def start(self) -> None:
+        """
+        Open the provider session, run the initial connectivity check and start
+        the periodic health check and fee sampling. Called once from the application lifespan.
+        """
+        if self.async_web3 and self.aiohttp_session is None:
+            await self._open_aiohttp_session()
+        await self.check_connection()
+        if self._health_check_task is None:
+            self._health_check_task = asyncio.create_task(self._health_check_loop())
+        self.fee_oracle.start()
+
+    async def close(self) -> None:
+        """Stop the health check, receipt watcher and fee oracle and release pooled provider connections."""
+        await self.receipt_watcher.stop()
+        await self.fee_oracle.stop()
+        if self._health_check_task:
+            self._health_check_task.cancel()
+            try:
+                await self._health_check_task
+            except asyncio.CancelledError:
+                pass
+            self._health_check_task = None
+        if self.rpc_batch is not None:
+            await self.rpc_batch.close()
+        if self.aiohttp_session is not None:
+            await self.aiohttp_session.close()
+            self.aiohttp_session = None
+        if self.session is not None:
+            self.session.close()
+
+    async def _open_aiohttp_session(self) -> None:
+        """
+        Create the pooled aiohttp session used by AsyncHTTPProvider.
+        Trace hooks count new versus reused connections for get_connection_stats().
+        """
+        stats = self._aiohttp_stats
+
+        async def on_connection_create_end(session, context, params):
+            stats["connections_created"] += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            stats["connections_reused"] += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+
+        self.aiohttp_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=settings.blockchain_rpc_pool_size),
+            raise_for_status=True,
+            trace_configs=[trace_config]
+        )
+        await self.web3.provider.cache_async_session(self.aiohttp_session)
+
+    async def check_connection(self) -> bool:
+        """
+        Check connectivity to the blockchain provider and record the result.
+
+        Returns:
+            True if the provider is reachable, False otherwise
+        """
+        try:
+            connected = await self._call(self.web3.is_connected)
+        except Exception as e:
+            logger.warning(f"Blockchain health check failed: {str(e)}")
+            connected = False
+
+        if not connected and self.connected is not False:
+            logger.error("Unable to connect to Alchemy Sepolia network.")
+        elif connected and self.connected is False:
+            logger.info("Blockchain provider connection restored")
+
+        self.connected = connected
+        self.last_health_check = time.time()
+        return connected
+
+    async def _health_check_loop(self) -> None:
+        """Re-check provider connectivity every blockchain_health_check_interval seconds."""
+        while True:
+            await asyncio.sleep(settings.blockchain_health_check_interval)
+            await self.check_connection()
+
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool statistics for the blockchain provider.
+
+        Returns:
+            Dict with request and connection counts and the connection reuse ratio
+        """
+        if self.async_web3:
+            connections_opened = self._aiohttp_stats["connections_created"]
+            requests_sent = connections_opened + self._aiohttp_stats["connections_reused"]
+        else:
+            pools = self.http_adapter.poolmanager.pools
+            requests_sent = 0
+            connections_opened = 0
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                requests_sent += pool.num_requests
+                connections_opened += pool.num_connections
+
+        reuse_ratio = 0.0
+        if requests_sent:
+            reuse_ratio = round(1 - (connections_opened / requests_sent), 4)
+
+        return {
+            "web3_backend": "async" if self.async_web3 else "sync",
+            "provider_requests": requests_sent,
+            "connections_opened": connections_opened,
+            "connection_reuse_ratio": reuse_ratio,
+            "pool_maxsize": settings.blockchain_rpc_pool_size,
+            "connected": self.connected,
+            "last_health_check": self.last_health_check
+        }
+
+    async def _call(self, fn, *args, **kwargs):
+        """Run a web3 call on the configured backend without blocking the event loop."""
+        return await run_web3_call(self.web3, fn, *args, **kwargs)
+
+    async def _rpc(self, method_name: str, *args):
+        """Send a web3.eth read, through the JSON-RPC batch transport when enabled."""
+        if self.rpc_batch is not None:
+            return await self.rpc_batch.request(method_name, *args)
+        if method_name == "get_block_number":
+            return await self._call(lambda: self.web3.eth.block_number)
+        return await self._call(getattr(self.web3.eth, method_name), *args)
+
+    async def _view(self, function):
+        """Run a contract view function, through the JSON-RPC batch transport when enabled."""
+        if self.rpc_batch is not None:
+            return await self.rpc_batch.call_function(function)
+        return await self._call(function.call)
+
+    @staticmethod
+    def _to_tx_hash_bytes(tx_hash: str) -> bytes:
+        """Convert a transaction hash hex string (with or without 0x) to bytes."""
+        if isinstance(tx_hash, str) and tx_hash.startswith('0x'):
+            return Web3.to_bytes(hexstr=tx_hash)
+        return Web3.to_bytes(hexstr=f"0x{tx_hash}")
+
+    def _sign_transaction(self, tx: Dict[str, Any]) -> bytes:
+        """
+        Sign a transaction with the server wallet key.
+
+        Args:
+            tx: The built transaction dict
+
+        Returns:
+            Raw signed transaction bytes
+        """
+        signed_tx = self.web3.eth.account.sign_transaction(tx, private_key=self.private_key)
+
+        # Different versions of Web3.py use different attribute names
+        if hasattr(signed_tx, 'rawTransaction'):
+            return signed_tx.rawTransaction
+        elif hasattr(signed_tx, 'raw_transaction'):
+            return signed_tx.raw_transaction
+        return bytes(signed_tx)
+
+    async def _fetch_pending_nonce(self) -> int:
+        """Read the server wallet's next nonce, counting transactions still in the mempool."""
+        return await self._call(self.web3.eth.get_transaction_count, self.wallet_address, "pending")
+
+    async def _send_server_transaction(
+        self,
+        contract_function,
+        gas: int = 2000000,
+        gas_price: Optional[int] = None
+    ):
+        """
+        Build, sign and send a contract call from the server wallet and wait for its receipt.
+
+        Args:
+            contract_function: The bound contract function to call
+            gas: Gas limit for the transaction
+            gas_price: Optional legacy gas price; the fee oracle's EIP-1559 fees are used if omitted
+
+        Returns:
+            The transaction receipt
+        """
+        submitted = await self._submit_server_transaction(contract_function, gas, gas_price)
+        return await self._wait_for_server_transaction(submitted)
+
+    async def _submit_server_transaction(
+        self,
+        contract_function,
+        gas: int = 2000000,
+        gas_price: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Build, sign and send a contract call from the server wallet without waiting for it to be mined.
+
+        The nonce comes from the server wallet's NonceManager, so concurrent callers
+        get consecutive nonces and their transactions are pending at the same time.
+        Signing is CPU-bound and runs in a worker thread so the event loop stays free.
+
+        Args:
+            contract_function: The bound contract function to call
+            gas: Gas limit for the transaction
+            gas_price: Optional legacy gas price; the fee oracle's EIP-1559 fees are used if omitted
+
+        Returns:
+            Submitted transaction dict with tx_hash, nonce and the built tx,
+            to be passed to _wait_for_server_transaction
+        """
+        if gas_price is not None:
+            fee_fields = {'gasPrice': gas_price}
+        else:
+            fees = await self.fee_oracle.get_fees()
+            if fees["eip1559"]:
+                fee_fields = {
+                    'maxFeePerGas': fees["max_fee_per_gas"],
+                    'maxPriorityFeePerGas': fees["max_priority_fee_per_gas"]
+                }
+            else:
+                fee_fields = {'gasPrice': fees["gas_price"]}
+        chain_id = await self.fee_oracle.get_chain_id()
+
+        # One retry with a fresh nonce if the node already has a transaction at ours
+        for attempt in range(2):
+            nonce = await self.nonce_manager.reserve()
+            try:
+                tx = await self._call(contract_function.build_transaction, {
+                    'from': self.wallet_address,
+                    'nonce': nonce,
+                    'gas': gas,
+                    'chainId': chain_id,
+                    **fee_fields
+                })
+                tx_hash = await self._sign_and_send(tx)
+            except Exception as e:
+                await self.nonce_manager.release(nonce, e)
+                if attempt == 0 and is_nonce_error(e):
+                    continue
+                raise
+
+            return {"tx_hash": tx_hash, "nonce": nonce, "tx": tx, "hashes": [tx_hash]}
+
+    async def _sign_and_send(self, tx: Dict[str, Any]) -> bytes:
+        """Sign a server-wallet transaction and send it, returning its hash."""
+        raw_tx = await asyncio.to_thread(self._sign_transaction, tx)
+        return await self._call(self.web3.eth.send_raw_transaction, raw_tx)
+
+    async def _wait_for_server_transaction(self, submitted: Dict[str, Any]):
+        """
+        Wait for a submitted server-wallet transaction to be mined.
+
+        If it is not mined within blockchain_tx_replace_after seconds it is re-sent
+        with the same nonce and a higher gas price, up to blockchain_tx_max_replacements
+        times. Whichever version is mined first is returned.
+
+        Args:
+            submitted: The dict returned by _submit_server_transaction
+
+        Returns:
+            The transaction receipt
+        """
+        nonce = submitted["nonce"]
+        replacements = 0
+        try:
+            while True:
+                try:
+                    # An earlier version may be mined instead of the latest replacement
+                    return await self.receipt_watcher.wait_for_any(
+                        submitted["hashes"],
+                        timeout=settings.blockchain_tx_replace_after
+                    )
+                except TimeExhausted:
+                    if replacements >= settings.blockchain_tx_max_replacements:
+                        raise
+                    replacements += 1
+                    await self._replace_server_transaction(submitted)
+        finally:
+            await self.nonce_manager.complete(nonce)
+
+    async def _replace_server_transaction(self, submitted: Dict[str, Any]) -> None:
+        """Re-send a stuck transaction with the same nonce and a higher gas price."""
+        tx = dict(submitted["tx"])
+        bump = 100 + settings.blockchain_tx_gas_bump_percent
+        # Nodes require both EIP-1559 fees to go up for a replacement
+        fee_keys = ["maxFeePerGas", "maxPriorityFeePerGas"] if "maxFeePerGas" in tx else ["gasPrice"]
+        for key in fee_keys:
+            tx[key] = tx[key] * bump // 100 + 1
+
+        try:
+            tx_hash = await self._sign_and_send(tx)
+        except Exception as e:
+            if is_nonce_error(e):
+                # The nonce was used in the meantime, most likely by an earlier version being mined
+                logger.info(f"Not replacing server transaction with nonce {submitted['nonce']}: {str(e)}")
+                return
+            raise
+
+        logger.warning(
+            f"Server transaction with nonce {submitted['nonce']} not mined after "
+            f"{settings.blockchain_tx_replace_after}s; replaced with {Web3.to_hex(tx_hash)} "
+            f"at {fee_keys[0]} {tx[fee_keys[0]]}"
+        )
+        self.nonce_manager.record_replacement()
+        submitted.update({"tx": tx, "tx_hash": tx_hash})
+        submitted["hashes"].append(tx_hash)
+
+    async def get_transaction_receipt(self, tx_hash: str):
+        """
+        Get the receipt of a mined transaction.
+
+        Args:
+            tx_hash: The transaction hash
+
+        Returns:
+            The transaction receipt
+
+        Raises:
+            TransactionNotFound: If the transaction has not been mined
+        """
+        return await self._rpc("get_transaction_receipt", self._to_tx_hash_bytes(tx_hash))
+
+    async def get_transaction(self, tx_hash: str):
+        """
+        Get a transaction by hash.
+
+        Args:
+            tx_hash: The transaction hash
+
+        Returns:
+            The transaction data
+
+        Raises:
+            TransactionNotFound: If the transaction is unknown to the provider
+        """
+        return await self._rpc("get_transaction", self._to_tx_hash_bytes(tx_hash))
+
+    async def get_latest_block_number(self) -> int:
+        """
+        Get the latest block number.
+
+        Returns:
+            The latest block number
+        """
+        return await self._rpc("get_block_number")
+
+    async def get_block_hash(self, block_number: int) -> str:
+        """
+        Get the hash of a block on the provider's canonical chain.
+
+        Args:
+            block_number: The block number
+
+        Returns:
+            The block hash as a hex string
+        """
+        block = await self._rpc("get_block", block_number)
+        return block["hash"].hex()
+
+    async def get_registry_events(
+        self,
+        from_block: int,
+        to_block: int,
+        event_names: Sequence[str] = INDEXED_EVENTS
+    ) -> List[Any]:
+        """
+        Fetch and decode registry events of several types with one eth_getLogs call.
+
+        Args:
+            from_block: First block to scan
+            to_block: Last block to scan (inclusive)
+            event_names: Names of the contract events to return
+
+        Returns:
+            Decoded events in log order
+        """
+        events_by_topic = {}
+        for name in event_names:
+            event = getattr(self.contract.events, name)
+            events_by_topic[event.topic] = event()
+
+        logs = await self._call(self.web3.eth.get_logs, {
+            "address": self.contract.address,
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "topics": [list(events_by_topic)]
+        })
+
+        decoded = []
+        for log in logs:
+            event = events_by_topic.get(Web3.to_hex(log["topics"][0]))
+            if event is not None:
+                decoded.append(event.process_log(log))
+        return decoded
+
     async def store_hash(self, cid: str, asset_id: str, auth_context: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Store a CID hash on the blockchain for a specific asset.
@@ -372,34 +878,12 @@ class BlockchainService:
             HTTPException: If blockchain transaction fails
         """
         try:
-            # Build transaction
-            nonce = self.web3.eth.get_transaction_count(self.wallet_address)
-            tx = self.contract.functions.updateIPFS(
-                asset_id,
-                cid
-            ).build_transaction({
-                'from': self.wallet_address,
-                'nonce': nonce,
-                'gasPrice': self.web3.eth.gas_price,
-                'gas': 2000000,
-            })
-
-            # Sign transaction
-            signed_tx = self.web3.eth.account.sign_transaction(tx, private_key=self.private_key)
-
-            # Different versions of Web3.py use different attribute names
-            if hasattr(signed_tx, 'rawTransaction'):
-                raw_tx = signed_tx.rawTransaction
-            elif hasattr(signed_tx, 'raw_transaction'):
-                raw_tx = signed_tx.raw_transaction
-            else:
-                raw_tx = bytes(signed_tx)
-
-            # Send transaction
-            tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
-
-            # Wait for transaction receipt
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = await self._send_server_transaction(
+                self.contract.functions.updateIPFS(
+                    asset_id,
+                    cid
+                )
+            )
 
             logger.info(f"CID successfully stored on blockchain for asset {asset_id}. Transaction hash: {receipt.transactionHash.hex()}")
 
@@ -436,6 +920,11 @@ class BlockchainService:
                 cid=cid,
                 from_address=auth_context.get("wallet_address")
             )
+        elif self.store_hash_coalescer is not None:
+            # Server-signed, batched with other writes for the same owner
+            return await self.store_hash_coalescer.submit(
+                owner_address.lower(), (asset_id, cid), item_id=asset_id
+            )
         else:
             # Existing server-signed logic for API keys
             return await self._store_hash_for_signed(cid, asset_id, owner_address)
@@ -456,31 +945,13 @@ class BlockchainService:
             HTTPException: If blockchain transaction fails
         """
         try:
-            # Build transaction
-            nonce = self.web3.eth.get_transaction_count(self.wallet_address)
-            tx = self.contract.functions.updateIPFSFor(
-                Web3.to_checksum_address(owner_address),
-                asset_id,
-                cid
-            ).build_transaction({
-                'from': self.wallet_address,
-                'nonce': nonce,
-                'gasPrice': self.web3.eth.gas_price,
-                'gas': 2000000,
-            })
-
-            # Sign and send the transaction
-            signed_tx = self.web3.eth.account.sign_transaction(tx, private_key=self.private_key)
-            
-            if hasattr(signed_tx, 'rawTransaction'):
-                raw_tx = signed_tx.rawTransaction
-            elif hasattr(signed_tx, 'raw_transaction'):
-                raw_tx = signed_tx.raw_transaction
-            else:
-                raw_tx = bytes(signed_tx)
-
-            tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = await self._send_server_transaction(
+                self.contract.functions.updateIPFSFor(
+                    Web3.to_checksum_address(owner_address),
+                    asset_id,
+                    cid
+                )
+            )
 
             logger.info(f"CID successfully stored on blockchain for asset {asset_id} owned by {owner_address}. Transaction hash: {receipt.transactionHash.hex()}")
 
@@ -490,6 +961,56 @@ class BlockchainService:
             logger.error(f"Blockchain error storing hash for another owner: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Blockchain transaction failed: {str(e)}")
 
+    async def _flush_store_hash_batch(self, owner_address: str, items: List[tuple]) -> List[Any]:
+        """
+        Write coalesced store_hash_for calls for one owner in a single batchUpdateIPFSFor transaction.
+
+        The batch is atomic, so if gas estimation shows it would revert, the writes
+        are sent individually and only the failing ones get an error.
+
+        Args:
+            owner_address: The owner all assets belong to
+            items: (asset_id, cid) pairs, each asset ID at most once
+
+        Returns:
+            One result dict or exception per item
+        """
+        if len(items) == 1:
+            asset_id, cid = items[0]
+            return [await self._store_hash_for_signed(cid, asset_id, owner_address)]
+
+        asset_ids = [asset_id for asset_id, _ in items]
+        cids = [cid for _, cid in items]
+        contract_function = self.contract.functions.batchUpdateIPFSFor(
+            Web3.to_checksum_address(owner_address),
+            asset_ids,
+            cids
+        )
+
+        try:
+            estimated_gas = await self._call(contract_function.estimate_gas, {'from': self.wallet_address})
+        except Exception as e:
+            logger.warning(
+                f"Batched update of {len(items)} assets for {owner_address} would fail ({str(e)}); "
+                f"sending them individually"
+            )
+            return await asyncio.gather(
+                *(self._store_hash_for_signed(cid, asset_id, owner_address) for asset_id, cid in items),
+                return_exceptions=True
+            )
+
+        try:
+            receipt = await self._send_server_transaction(contract_function, gas=int(estimated_gas * 1.2))
+            if receipt.status != 1:
+                raise ValueError(f"Batch transaction {receipt.transactionHash.hex()} reverted")
+        except Exception as e:
+            logger.error(f"Blockchain error storing batched hashes for {owner_address}: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Blockchain transaction failed: {str(e)}")
+
+        tx_hash = receipt.transactionHash.hex()
+        logger.info(f"CIDs for {len(items)} assets owned by {owner_address} stored in one transaction: {tx_hash}")
+        return [{"tx_hash": tx_hash, "batch_size": len(items)} for _ in items]
+
     async def delete_asset(self, asset_id: str, auth_context: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Mark an asset as deleted on the blockchain.
@@ -531,27 +1052,9 @@ class BlockchainService:
             HTTPException: If blockchain transaction fails
         """
         try:
-            # Build transaction
-            nonce = self.web3.eth.get_transaction_count(self.wallet_address)
-            tx = self.contract.functions.deleteAsset(asset_id).build_transaction({
-                'from': self.wallet_address,
-                'nonce': nonce,
-                'gasPrice': self.web3.eth.gas_price,
-                'gas': 2000000,
-            })
-
-            # Sign and send the transaction
-            signed_tx = self.web3.eth.account.sign_transaction(tx, private_key=self.private_key)
-            
-            if hasattr(signed_tx, 'rawTransaction'):
-                raw_tx = signed_tx.rawTransaction
-            elif hasattr(signed_tx, 'raw_transaction'):
-                raw_tx = signed_tx.raw_transaction
-            else:
-                raw_tx = bytes(signed_tx)
-
-            tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = await self._send_server_transaction(
+                self.contract.functions.deleteAsset(asset_id)
+            )
 
             logger.info(f"Asset {asset_id} marked as deleted on blockchain. Transaction hash: {receipt.transactionHash.hex()}")
 
@@ -605,30 +1108,12 @@ class BlockchainService:
             HTTPException: If blockchain transaction fails
         """
         try:
-            # Build transaction
-            nonce = self.web3.eth.get_transaction_count(self.wallet_address)
-            tx = self.contract.functions.deleteAssetFor(
-                Web3.to_checksum_address(owner_address),
-                asset_id
-            ).build_transaction({
-                'from': self.wallet_address,
-                'nonce': nonce,
-                'gasPrice': self.web3.eth.gas_price,
-                'gas': 2000000,
-            })
-
-            # Sign and send the transaction
-            signed_tx = self.web3.eth.account.sign_transaction(tx, private_key=self.private_key)
-            
-            if hasattr(signed_tx, 'rawTransaction'):
-                raw_tx = signed_tx.rawTransaction
-            elif hasattr(signed_tx, 'raw_transaction'):
-                raw_tx = signed_tx.raw_transaction
-            else:
-                raw_tx = bytes(signed_tx)
-
-            tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = await self._send_server_transaction(
+                self.contract.functions.deleteAssetFor(
+                    Web3.to_checksum_address(owner_address),
+                    asset_id
+                )
+            )
 
             logger.info(f"Asset {asset_id} owned by {owner_address} marked as deleted on blockchain. Transaction hash: {receipt.transactionHash.hex()}")
 
@@ -642,8 +1127,13 @@ class BlockchainService:
         """
         Get details of a transaction.
         
+        Mined, successful transactions are cached permanently, so later lookups
+        of any asset from the same transaction make no RPC calls. Pending or
+        reverted ones are decoded on every call.
+        
         Args:
             tx_hash: Transaction hash to query
+            asset_id: Asset whose CID to pick out of a batch transaction
             
         Returns:
             Dict containing transaction details
@@ -652,73 +1142,19 @@ class BlockchainService:
             HTTPException: If retrieval fails
         """
         try:
-            # Convert hex string to bytes if necessary
-            if isinstance(tx_hash, str) and tx_hash.startswith('0x'):
-                tx_hash_bytes = Web3.to_bytes(hexstr=tx_hash)
-            else:
-                tx_hash_bytes = Web3.to_bytes(hexstr=f"0x{tx_hash}")
-                
-            # Get transaction data
-            tx_data = self.web3.eth.get_transaction(tx_hash_bytes)
-            
-            if not tx_data:
-                raise ValueError(f"Transaction with hash {tx_hash} not found on blockchain")
-                
-            # Verify this transaction was sent to our contract
-            if tx_data['to'] and tx_data['to'].lower() != self.contract_address.lower():
-                raise ValueError(f"Transaction {tx_hash} was not sent to our contract address")
-            
-            # Get transaction sender
-            tx_sender = tx_data.get('from', None)
-                
-            # Get the input data from the transaction
-            input_data = tx_data['input']
-            
-            # Decode the function call
-            try:
-                # Try to decode the function call and arguments
-                func_obj, func_params = self.contract.decode_function_input(input_data)
-                
-                # Format the result based on the function called
-                result = {
-                    "function": func_obj.fn_name,
-                    "params": func_params,
-                    "tx_hash": tx_hash,
-                    "tx_sender": tx_sender.lower() if tx_sender else None,
-                    "status": "success"
-                }
-                
-                # For updateIPFS functions, extract asset_id and cid
-                if func_obj.fn_name == 'updateIPFS':
-                    result["asset_id"] = func_params['_assetId']
-                    result["cid"] = func_params['_cid']
-                elif func_obj.fn_name == 'updateIPFSFor':
-                    result["asset_id"] = func_params['_assetId']
-                    result["cid"] = func_params['_cid']
-                    result["owner"] = func_params['_owner']
-                elif func_obj.fn_name == 'batchUpdateIPFS':
-                    result["asset_ids"] = func_params['_assetIds']
-                    result["cids"] = func_params['_cids']
-                    # If specific asset_id requested, find its CID
-                    if asset_id and asset_id in func_params['_assetIds']:
-                        asset_index = func_params['_assetIds'].index(asset_id)
-                        result["cid"] = func_params['_cids'][asset_index]
-                        result["asset_id"] = asset_id
-                elif func_obj.fn_name == 'batchUpdateIPFSFor':
-                    result["asset_ids"] = func_params['_assetIds']
-                    result["cids"] = func_params['_cids']
-                    result["owner"] = func_params['_owner']
-                    # If specific asset_id requested, find its CID
-                    if asset_id and asset_id in func_params['_assetIds']:
-                        asset_index = func_params['_assetIds'].index(asset_id)
-                        result["cid"] = func_params['_cids'][asset_index]
-                        result["asset_id"] = asset_id
-                
-                return result
-                
-            except Exception as decode_error:
-                logger.error(f"Error decoding transaction input: {str(decode_error)}")
-                raise ValueError(f"Could not decode transaction {tx_hash}")
+            key = normalize_tx_hash(tx_hash)
+            cached = await tx_details_cache.get(key)
+            if cached is None:
+                details, final = await self._decode_transaction(tx_hash)
+                cached = await tx_details_cache.put(key, details) if final else with_asset_cids(details)
+            
+            result = {name: value for name, value in cached.items() if name != "asset_cids"}
+            result["tx_hash"] = tx_hash
+            # If specific asset_id requested from a batch, find its CID
+            if "asset_ids" in result and asset_id and asset_id in cached["asset_cids"]:
+                result["cid"] = cached["asset_cids"][asset_id]
+                result["asset_id"] = asset_id
+            return result
                 
         except HTTPException:
             raise
@@ -729,6 +1165,72 @@ class BlockchainService:
                 detail=f"Failed to retrieve transaction details: {str(e)}"
             )
 
+    async def _decode_transaction(self, tx_hash: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        Fetch a registry transaction and decode its function call.
+        
+        Returns:
+            Tuple of (decoded details, whether the transaction is mined and succeeded)
+        """
+        # Get transaction data
+        tx_data = await self.get_transaction(tx_hash)
+        
+        if not tx_data:
+            raise ValueError(f"Transaction with hash {tx_hash} not found on blockchain")
+            
+        # Verify this transaction was sent to our contract
+        if tx_data['to'] and tx_data['to'].lower() != self.contract_address.lower():
+            raise ValueError(f"Transaction {tx_hash} was not sent to our contract address")
+        
+        # Get transaction sender
+        tx_sender = tx_data.get('from', None)
+            
+        # Get the input data from the transaction
+        input_data = tx_data['input']
+        
+        # Decode the function call
+        try:
+            # Try to decode the function call and arguments
+            func_obj, func_params = self.contract.decode_function_input(input_data)
+        except Exception as decode_error:
+            logger.error(f"Error decoding transaction input: {str(decode_error)}")
+            raise ValueError(f"Could not decode transaction {tx_hash}")
+        
+        # Format the result based on the function called
+        details = {
+            "function": func_obj.fn_name,
+            "params": func_params,
+            "tx_sender": tx_sender.lower() if tx_sender else None,
+            "status": "success"
+        }
+        
+        # For updateIPFS functions, extract asset_id and cid
+        if func_obj.fn_name == 'updateIPFS':
+            details["asset_id"] = func_params['_assetId']
+            details["cid"] = func_params['_cid']
+        elif func_obj.fn_name == 'updateIPFSFor':
+            details["asset_id"] = func_params['_assetId']
+            details["cid"] = func_params['_cid']
+            details["owner"] = func_params['_owner']
+        elif func_obj.fn_name == 'batchUpdateIPFS':
+            details["asset_ids"] = func_params['_assetIds']
+            details["cids"] = func_params['_cids']
+        elif func_obj.fn_name == 'batchUpdateIPFSFor':
+            details["asset_ids"] = func_params['_assetIds']
+            details["cids"] = func_params['_cids']
+            details["owner"] = func_params['_owner']
+        
+        # Only a mined, successful transaction is final; a pending one may be replaced under a new hash
+        final = False
+        if tx_data.get('blockNumber') is not None:
+            try:
+                receipt = await self.get_transaction_receipt(tx_hash)
+                final = receipt is not None and receipt.get('status') == 1
+            except Exception as e:
+                logger.warning(f"Could not get receipt for {tx_hash}: {str(e)}")
+        
+        return details, final
+
     async def get_ipfs_info(self, asset_id: str, owner_address: str) -> Dict[str, Any]:
         """
         Get IPFS version information for an asset.
@@ -741,10 +1243,10 @@ class BlockchainService:
             Dict containing IPFS version information
         """
         try:
-            result = self.contract.functions.getIPFSInfo(
+            result = await self._view(self.contract.functions.getIPFSInfo(
                 asset_id,
                 Web3.to_checksum_address(owner_address)
-            ).call()
+            ))
             
             # Parse the result tuple
             ipfs_version, cid_hash, last_updated, created_at, is_deleted = result
@@ -774,12 +1276,12 @@ class BlockchainService:
             Dict containing verification results
         """
         try:
-            result = self.contract.functions.verifyCID(
+            result = await self._view(self.contract.functions.verifyCID(
                 asset_id,
                 Web3.to_checksum_address(owner_address),
                 cid,
                 claimed_version
-            ).call()
+            ))
             
             # Parse the result tuple
             is_valid, message, actual_version, is_deleted = result
@@ -794,6 +1296,43 @@ class BlockchainService:
             logger.error(f"Error verifying CID on chain: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Failed to verify CID: {str(e)}")
 
+    async def verify_cid_locally(self, asset_id: str, owner_address: str, cid: str, claimed_version: int) -> Dict[str, Any]:
+        """
+        Verify a CID against blockchain records with a single getIPFSInfo call.
+        
+        The CID is hashed locally the way verifyCID hashes it, so the result
+        matches verify_cid_on_chain without a second eth_call.
+        
+        Args:
+            asset_id: The asset ID to verify
+            owner_address: The owner's address
+            cid: The CID to verify
+            claimed_version: The version being claimed
+            
+        Returns:
+            Dict containing verification results and the on-chain cid_hash
+        """
+        try:
+            try:
+                result = await self._view(self.contract.functions.getIPFSInfo(
+                    asset_id,
+                    Web3.to_checksum_address(owner_address)
+                ))
+                ipfs_version, cid_hash, last_updated, created_at, is_deleted = result
+                ipfs_info = {
+                    "ipfs_version": ipfs_version,
+                    "cid_hash": "0x" + cid_hash.hex(),
+                    "is_deleted": is_deleted
+                }
+            except ContractLogicError:
+                # getIPFSInfo reverts for assets that were never stored
+                ipfs_info = None
+            
+            return verify_cid_against_ipfs_info(ipfs_info, cid, claimed_version)
+        except Exception as e:
+            logger.error(f"Error verifying CID locally: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Failed to verify CID: {str(e)}")
+
     async def check_asset_exists(self, asset_id: str, owner_address: str) -> Dict[str, bool]:
         """
         Check if an asset exists on the blockchain.
@@ -806,10 +1345,10 @@ class BlockchainService:
             Dict containing existence and deletion status
         """
         try:
-            result = self.contract.functions.assetExists(
+            result = await self._view(self.contract.functions.assetExists(
                 asset_id,
                 Web3.to_checksum_address(owner_address)
-            ).call()
+            ))
             
             exists, is_deleted = result
             
@@ -821,6 +1360,97 @@ class BlockchainService:
             logger.error(f"Error checking if asset exists: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Failed to check if asset exists: {str(e)}")
 
+    async def get_ipfs_info_bulk(self, items: Sequence[tuple]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get IPFS version information for many assets in as few eth_calls as possible.
+
+        Args:
+            items: (asset_id, owner_address) pairs
+
+        Returns:
+            One dict per item in the format of get_ipfs_info, or None where the call reverted
+        """
+        try:
+            results = await self.multicall.aggregate([
+                self.contract.functions.getIPFSInfo(asset_id, Web3.to_checksum_address(owner_address))
+                for asset_id, owner_address in items
+            ])
+        except Exception as e:
+            logger.error(f"Error getting IPFS info in bulk: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Failed to get IPFS info: {str(e)}")
+
+        infos = []
+        for result in results:
+            if isinstance(result, CallFailed):
+                infos.append(None)
+                continue
+            ipfs_version, cid_hash, last_updated, created_at, is_deleted = result
+            infos.append({
+                "ipfs_version": ipfs_version,
+                "cid_hash": "0x" + cid_hash.hex(),
+                "last_updated": last_updated,
+                "created_at": created_at,
+                "is_deleted": is_deleted
+            })
+        return infos
+
+    async def verify_cids_bulk(self, items: Sequence[tuple]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Verify many CIDs against blockchain records in as few eth_calls as possible.
+
+        Args:
+            items: (asset_id, owner_address, cid, claimed_version) tuples
+
+        Returns:
+            One dict per item in the format of verify_cid_on_chain, or None where the call reverted
+        """
+        try:
+            results = await self.multicall.aggregate([
+                self.contract.functions.verifyCID(asset_id, Web3.to_checksum_address(owner_address), cid, claimed_version)
+                for asset_id, owner_address, cid, claimed_version in items
+            ])
+        except Exception as e:
+            logger.error(f"Error verifying CIDs in bulk: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Failed to verify CID: {str(e)}")
+
+        verifications = []
+        for result in results:
+            if isinstance(result, CallFailed):
+                verifications.append(None)
+                continue
+            is_valid, message, actual_version, is_deleted = result
+            verifications.append({
+                "is_valid": is_valid,
+                "message": message,
+                "actual_version": actual_version,
+                "is_deleted": is_deleted
+            })
+        return verifications
+
+    async def check_assets_exist_bulk(self, items: Sequence[tuple]) -> List[Optional[Dict[str, bool]]]:
+        """
+        Check whether many assets exist on the blockchain in as few eth_calls as possible.
+
+        Args:
+            items: (asset_id, owner_address) pairs
+
+        Returns:
+            One dict per item in the format of check_asset_exists, or None where the call reverted
+        """
+        try:
+            results = await self.multicall.aggregate([
+                self.contract.functions.assetExists(asset_id, Web3.to_checksum_address(owner_address))
+                for asset_id, owner_address in items
+            ])
+        except Exception as e:
+            logger.error(f"Error checking if assets exist in bulk: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Failed to check if asset exists: {str(e)}")
+
+        return [
+            None if isinstance(result, CallFailed) else {"exists": result[0], "is_deleted": result[1]}
+            for result in results
+        ]
+
     async def set_admin(self, account_address: str, is_admin: bool) -> Dict[str, Any]:
         """
         Set or remove an admin.
@@ -833,30 +1463,12 @@ class BlockchainService:
             Dict containing transaction hash
         """
         try:
-            # Build transaction
-            nonce = self.web3.eth.get_transaction_count(self.wallet_address)
-            tx = self.contract.functions.setAdmin(
-                Web3.to_checksum_address(account_address),
-                is_admin
-            ).build_transaction({
-                'from': self.wallet_address,
-                'nonce': nonce,
-                'gasPrice': self.web3.eth.gas_price,
-                'gas': 2000000,
-            })
-
-            # Sign and send the transaction
-            signed_tx = self.web3.eth.account.sign_transaction(tx, private_key=self.private_key)
-            
-            if hasattr(signed_tx, 'rawTransaction'):
-                raw_tx = signed_tx.rawTransaction
-            elif hasattr(signed_tx, 'raw_transaction'):
-                raw_tx = signed_tx.raw_transaction
-            else:
-                raw_tx = bytes(signed_tx)
-
-            tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = await self._send_server_transaction(
+                self.contract.functions.setAdmin(
+                    Web3.to_checksum_address(account_address),
+                    is_admin
+                )
+            )
 
             action = "set" if is_admin else "removed"
             logger.info(f"Admin status {action} for {account_address}. Transaction hash: {receipt.transactionHash.hex()}")
@@ -879,30 +1491,14 @@ class BlockchainService:
             Dict containing transaction hash
         """
         try:
-            # Build transaction
-            nonce = self.web3.eth.get_transaction_count(self.wallet_address)
-            tx = self.contract.functions.setDelegate(
-                Web3.to_checksum_address(delegate_address),
-                status
-            ).build_transaction({
-                'from': self.wallet_address,
-                'nonce': nonce,
-                'gasPrice': self.web3.eth.gas_price,
-                'gas': 2000000,
-            })
-
-            # Sign and send the transaction
-            signed_tx = self.web3.eth.account.sign_transaction(tx, private_key=self.private_key)
-            
-            if hasattr(signed_tx, 'rawTransaction'):
-                raw_tx = signed_tx.rawTransaction
-            elif hasattr(signed_tx, 'raw_transaction'):
-                raw_tx = signed_tx.raw_transaction
-            else:
-                raw_tx = bytes(signed_tx)
+            receipt = await self._send_server_transaction(
+                self.contract.functions.setDelegate(
+                    Web3.to_checksum_address(delegate_address),
+                    status
+                )
+            )
 
-            tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            delegation_cache.invalidate(self.wallet_address, delegate_address)
 
             action = "added" if status else "removed"
             logger.info(f"Delegate {delegate_address} {action}. Transaction hash: {receipt.transactionHash.hex()}")
@@ -925,30 +1521,12 @@ class BlockchainService:
             Dict containing transaction hash
         """
         try:
-            # Build transaction
-            nonce = self.web3.eth.get_transaction_count(self.wallet_address)
-            tx = self.contract.functions.initiateTransfer(
-                asset_id,
-                Web3.to_checksum_address(new_owner)
-            ).build_transaction({
-                'from': self.wallet_address,
-                'nonce': nonce,
-                'gasPrice': self.web3.eth.gas_price,
-                'gas': 2000000,
-            })
-
-            # Sign and send the transaction
-            signed_tx = self.web3.eth.account.sign_transaction(tx, private_key=self.private_key)
-            
-            if hasattr(signed_tx, 'rawTransaction'):
-                raw_tx = signed_tx.rawTransaction
-            elif hasattr(signed_tx, 'raw_transaction'):
-                raw_tx = signed_tx.raw_transaction
-            else:
-                raw_tx = bytes(signed_tx)
-
-            tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = await self._send_server_transaction(
+                self.contract.functions.initiateTransfer(
+                    asset_id,
+                    Web3.to_checksum_address(new_owner)
+                )
+            )
 
             logger.info(f"Transfer initiated for asset {asset_id} to {new_owner}. Transaction hash: {receipt.transactionHash.hex()}")
 
@@ -970,30 +1548,12 @@ class BlockchainService:
             Dict containing transaction hash
         """
         try:
-            # Build transaction
-            nonce = self.web3.eth.get_transaction_count(self.wallet_address)
-            tx = self.contract.functions.acceptTransfer(
-                asset_id,
-                Web3.to_checksum_address(previous_owner)
-            ).build_transaction({
-                'from': self.wallet_address,
-                'nonce': nonce,
-                'gasPrice': self.web3.eth.gas_price,
-                'gas': 2000000,
-            })
-
-            # Sign and send the transaction
-            signed_tx = self.web3.eth.account.sign_transaction(tx, private_key=self.private_key)
-            
-            if hasattr(signed_tx, 'rawTransaction'):
-                raw_tx = signed_tx.rawTransaction
-            elif hasattr(signed_tx, 'raw_transaction'):
-                raw_tx = signed_tx.raw_transaction
-            else:
-                raw_tx = bytes(signed_tx)
-
-            tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = await self._send_server_transaction(
+                self.contract.functions.acceptTransfer(
+                    asset_id,
+                    Web3.to_checksum_address(previous_owner)
+                )
+            )
 
             logger.info(f"Transfer accepted for asset {asset_id} from {previous_owner}. Transaction hash: {receipt.transactionHash.hex()}")
 
@@ -1014,27 +1574,9 @@ class BlockchainService:
             Dict containing transaction hash
         """
         try:
-            # Build transaction
-            nonce = self.web3.eth.get_transaction_count(self.wallet_address)
-            tx = self.contract.functions.cancelTransfer(asset_id).build_transaction({
-                'from': self.wallet_address,
-                'nonce': nonce,
-                'gasPrice': self.web3.eth.gas_price,
-                'gas': 2000000,
-            })
-
-            # Sign and send the transaction
-            signed_tx = self.web3.eth.account.sign_transaction(tx, private_key=self.private_key)
-            
-            if hasattr(signed_tx, 'rawTransaction'):
-                raw_tx = signed_tx.rawTransaction
-            elif hasattr(signed_tx, 'raw_transaction'):
-                raw_tx = signed_tx.raw_transaction
-            else:
-                raw_tx = bytes(signed_tx)
-
-            tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = await self._send_server_transaction(
+                self.contract.functions.cancelTransfer(asset_id)
+            )
 
             logger.info(f"Transfer cancelled for asset {asset_id}. Transaction hash: {receipt.transactionHash.hex()}")
 
@@ -1056,16 +1598,37 @@ class BlockchainService:
             Address the asset is pending transfer to, or zero address if none
         """
         try:
-            pending_to = self.contract.functions.getPendingTransfer(
+            pending_to = await self._view(self.contract.functions.getPendingTransfer(
                 asset_id,
                 Web3.to_checksum_address(owner_address)
-            ).call()
+            ))
             
             return pending_to
             
         except Exception as e:
             logger.error(f"Error getting pending transfer: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Failed to get pending transfer: {str(e)}")
+
+    async def get_pending_transfers_bulk(self, items: Sequence[tuple]) -> List[Optional[str]]:
+        """
+        Get pending transfer addresses for many assets in as few eth_calls as possible.
+
+        Args:
+            items: (asset_id, owner_address) pairs
+
+        Returns:
+            One address per item, zero address if none, or None where the call reverted
+        """
+        try:
+            results = await self.multicall.aggregate([
+                self.contract.functions.getPendingTransfer(asset_id, Web3.to_checksum_address(owner_address))
+                for asset_id, owner_address in items
+            ])
+        except Exception as e:
+            logger.error(f"Error getting pending transfers in bulk: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Failed to get pending transfer: {str(e)}")
+
+        return [None if isinstance(result, CallFailed) else result for result in results]
             
     async def broadcast_signed_transaction(self, signed_transaction: str) -> Dict[str, Any]:
         """
@@ -1091,10 +1654,10 @@ class BlockchainService:
                 signed_tx_bytes = signed_transaction
             
             # Send transaction
-            tx_hash = self.web3.eth.send_raw_transaction(signed_tx_bytes)
+            tx_hash = await self._call(self.web3.eth.send_raw_transaction, signed_tx_bytes)
             
             # Wait for transaction receipt
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = await self.receipt_watcher.wait_for_receipt(tx_hash, timeout=settings.blockchain_receipt_timeout)
             
             logger.info(f"Signed transaction broadcasted successfully. Transaction hash: {receipt.transactionHash.hex()}")
             
@@ -1124,45 +1687,15 @@ class BlockchainService:
         Raises:
             HTTPException: If verification fails
         """
-        import asyncio
-        
         try:
-            # Convert hex string to bytes if necessary
-            if isinstance(tx_hash, str) and tx_hash.startswith('0x'):
-                tx_hash_bytes = Web3.to_bytes(hexstr=tx_hash)
-            else:
-                tx_hash_bytes = Web3.to_bytes(hexstr=f"0x{tx_hash}")
-                
-            # Retry logic for transaction receipt (transaction might still be pending)
-            max_retries = 30  # Wait up to ~60 seconds
-            retry_delay = 2   # Start with 2 second delay
-            receipt = None
-            
-            for attempt in range(max_retries):
-                try:
-                    receipt = self.web3.eth.get_transaction_receipt(tx_hash_bytes)
-                    if receipt:
-                        break
-                except Exception as e:
-                    if "not found" in str(e).lower() or "not mined" in str(e).lower():
-                        # Transaction not yet mined, wait and retry
-                        if attempt < max_retries - 1:
-                            logger.info(f"Transaction {tx_hash} not yet mined, retrying in {retry_delay}s (attempt {attempt + 1}/{max_retries})")
-                            await asyncio.sleep(retry_delay)
-                            retry_delay = min(retry_delay * 1.2, 5)  # Exponential backoff with max 5s
-                            continue
-                        else:
-                            raise e
-                    else:
-                        # Different error, don't retry
-                        raise e
-            
-            if not receipt:
-                # Still no receipt after all retries
-                chain_id = self.web3.eth.chain_id
+            # The transaction might still be pending; wait for the shared receipt watcher to see it mined
+            try:
+                receipt = await self.receipt_watcher.wait_for_receipt(tx_hash, timeout=settings.blockchain_verify_timeout)
+            except TimeExhausted:
+                chain_id = await self.fee_oracle.get_chain_id()
                 network_name = "Sepolia" if chain_id == 11155111 else f"Chain {chain_id}"
                 raise ValueError(
-                    f"Transaction with hash '{tx_hash}' not found on {network_name} after {max_retries} attempts. "
+                    f"Transaction with hash '{tx_hash}' not found on {network_name} after {settings.blockchain_verify_timeout} seconds. "
                     f"This typically means: (1) The transaction was sent to a different network, "
                     f"(2) The transaction failed to send, or (3) Network congestion is causing delays. "
                     f"Please verify your wallet was connected to Sepolia when the transaction was sent."
@@ -1184,10 +1717,11 @@ class BlockchainService:
             if not success:
                 try:
                     # Get the transaction data
-                    tx_data = self.web3.eth.get_transaction(tx_hash_bytes)
+                    tx_data = await self.get_transaction(tx_hash)
                     
                     # Try to call the transaction to get revert reason
-                    call_result = self.web3.eth.call(
+                    call_result = await self._call(
+                        self.web3.eth.call,
                         {
                             'to': tx_data['to'],
                             'from': tx_data['from'],
@@ -1235,17 +1769,24 @@ class BlockchainService:
         Returns:
             True if delegated, False otherwise
         """
+        cached = delegation_cache.get(owner_address, delegate_address)
+        if cached is not None:
+            return cached
+
         try:
+            generation = delegation_cache.generation()
+
             # Call the delegates mapping on the contract
-            is_delegated = self.contract.functions.delegates(
+            is_delegated = await self._view(self.contract.functions.delegates(
                 Web3.to_checksum_address(owner_address),
                 Web3.to_checksum_address(delegate_address)
-            ).call()
+            ))
             
             logger.debug(
                 f"Delegation check: {owner_address} -> {delegate_address} = {is_delegated}"
             )
             
+            delegation_cache.put(owner_address, delegate_address, is_delegated, generation)
             return is_delegated
             
         except Exception as e:
@@ -1255,6 +1796,44 @@ class BlockchainService:
                 detail=f"Failed to check delegation: {str(e)}"
             )
 
+    async def check_delegations_bulk(self, pairs: Sequence[tuple]) -> List[bool]:
+        """
+        Check many (owner, delegate) pairs, reading uncached ones in as few eth_calls as possible.
+
+        Args:
+            pairs: (owner_address, delegate_address) pairs
+
+        Returns:
+            Delegation status per pair
+        """
+        statuses: List[Optional[bool]] = [delegation_cache.get(owner, delegate) for owner, delegate in pairs]
+        missing = [i for i, status in enumerate(statuses) if status is None]
+        if not missing:
+            return statuses
+
+        try:
+            generation = delegation_cache.generation()
+            results = await self.multicall.aggregate([
+                self.contract.functions.delegates(
+                    Web3.to_checksum_address(pairs[i][0]),
+                    Web3.to_checksum_address(pairs[i][1])
+                )
+                for i in missing
+            ])
+            for i, result in zip(missing, results):
+                if isinstance(result, CallFailed):
+                    raise result
+                delegation_cache.put(pairs[i][0], pairs[i][1], result, generation)
+                statuses[i] = result
+            return statuses
+
+        except Exception as e:
+            logger.error(f"Error checking delegations: {str(e)}")
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to check delegation: {str(e)}"
+            )
+
     async def check_server_delegation(self, user_address: str) -> bool:
         """
         Check if the user has delegated the server wallet for API key usage.
@@ -1279,12 +1858,11 @@ class BlockchainService:
             Dict with delegation status for both user and server wallet
         """
         try:
-            # Check both delegations in parallel for efficiency
-            user_delegated_task = self.check_delegation(owner_address, api_key_user_address)
-            server_delegated_task = self.check_delegation(owner_address, self.wallet_address)
-            
-            is_user_delegated = await user_delegated_task
-            is_server_delegated = await server_delegated_task
+            # Both delegations are read in one eth_call
+            is_user_delegated, is_server_delegated = await self.check_delegations_bulk([
+                (owner_address, api_key_user_address),
+                (owner_address, self.wallet_address)
+            ])
             
             return {
                 "user_delegated": is_user_delegated,
@@ -1341,25 +1919,38 @@ class BlockchainService:
             # For wallet auth, always use batchUpdateIPFS (user owns the assets)
             contract_function = self.contract.functions.batchUpdateIPFS(asset_ids, cids)
             
-            # Build transaction
-            nonce = self.web3.eth.get_transaction_count(Web3.to_checksum_address(from_address))
-            gas_price = self.web3.eth.gas_price
-            
-            # Estimate gas
-            estimated_gas = contract_function.estimate_gas({
-                'from': Web3.to_checksum_address(from_address),
-                'gasPrice': gas_price
-            })
-            
-            # Add 20% buffer to gas estimate
-            gas_limit = int(estimated_gas * 1.2)
+            from_checksum = Web3.to_checksum_address(from_address)
+            
+            async def estimate() -> int:
+                return await self._call(contract_function.estimate_gas, {
+                    'from': from_checksum,
+                    'gasPrice': await self.fee_oracle.get_gas_price()
+                })
+            
+            # Gas limit from the learned model; estimate_gas only while calibrating
+            gas = await gas_model.gas_limit("batchUpdateIPFS", asset_ids, cids, estimate)
+            estimated_gas, gas_limit = gas["estimated_gas"], gas["gas_limit"]
+            
+            # Wallets sign legacy transactions, so the oracle's gas price is used. A predicted
+            # limit skips estimate_gas, so the call is dry-run to catch reverts before the user
+            # pays for them; it runs alongside the nonce and fee lookups, costing an RPC but
+            # no extra round trip.
+            lookups = [
+                self._call(self.web3.eth.get_transaction_count, from_checksum),
+                self.fee_oracle.get_gas_price(),
+                self.fee_oracle.get_chain_id()
+            ]
+            if gas["source"] == "model":
+                lookups.append(self._call(contract_function.call, {'from': from_checksum}))
+            nonce, gas_price, chain_id = (await asyncio.gather(*lookups))[:3]
             
             # Build the unsigned transaction
-            transaction = contract_function.build_transaction({
-                'from': Web3.to_checksum_address(from_address),
+            transaction = await self._call(contract_function.build_transaction, {
+                'from': from_checksum,
                 'nonce': nonce,
                 'gasPrice': gas_price,
                 'gas': gas_limit,
+                'chainId': chain_id
             })
             
             logger.info(f"Prepared batch transaction for {len(asset_ids)} assets from {from_address}")
@@ -1369,6 +1960,7 @@ class BlockchainService:
                 "transaction": transaction,
                 "estimated_gas": estimated_gas,
                 "gas_limit": gas_limit,
+                "gas_source": gas["source"],
                 "gas_price": gas_price,
                 "function_name": "batchUpdateIPFS",
                 "asset_count": len(asset_ids)
@@ -1422,6 +2014,7 @@ class BlockchainService:
                     raise ValueError("All assets in a batch must have the same owner for API key authentication")
                 
                 owner_address = unique_owners[0]
+                function_name = "batchUpdateIPFSFor"
                 contract_function = self.contract.functions.batchUpdateIPFSFor(
                     Web3.to_checksum_address(owner_address),
                     asset_ids,
@@ -1430,46 +2023,27 @@ class BlockchainService:
                 logger.info(f"Executing batch transaction for {len(asset_ids)} assets owned by {owner_address}")
             else:
                 # Fallback to batchUpdateIPFS (server owns assets - probably not desired)
+                function_name = "batchUpdateIPFS"
                 contract_function = self.contract.functions.batchUpdateIPFS(asset_ids, cids)
                 logger.warning(f"Executing batch transaction with server as owner - this may not be intended")
             
-            # Build transaction
-            nonce = self.web3.eth.get_transaction_count(self.wallet_address)
-            gas_price = self.web3.eth.gas_price
-            
-            # Estimate gas
-            estimated_gas = contract_function.estimate_gas({
-                'from': self.wallet_address,
-                'gasPrice': gas_price
-            })
-            
-            # Add 20% buffer to gas estimate
-            gas_limit = int(estimated_gas * 1.2)
-            
-            # Build and sign transaction
-            tx = contract_function.build_transaction({
-                'from': self.wallet_address,
-                'nonce': nonce,
-                'gasPrice': gas_price,
-                'gas': gas_limit,
-            })
-            
-            # Sign transaction
-            signed_tx = self.web3.eth.account.sign_transaction(tx, private_key=self.private_key)
-            
-            # Handle different Web3.py versions
-            if hasattr(signed_tx, 'rawTransaction'):
-                raw_tx = signed_tx.rawTransaction
-            elif hasattr(signed_tx, 'raw_transaction'):
-                raw_tx = signed_tx.raw_transaction
-            else:
-                raw_tx = bytes(signed_tx)
+            # Gas limit from the learned model; estimate_gas only while calibrating
+            gas = await gas_model.gas_limit(
+                function_name,
+                asset_ids,
+                cids,
+                lambda: self._call(contract_function.estimate_gas, {'from': self.wallet_address})
+            )
             
-            # Send transaction
-            tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
+            # A predicted limit skips estimate_gas, so dry-run the call to catch reverts before sending
+            if gas["source"] == "model":
+                await self._call(contract_function.call, {'from': self.wallet_address})
             
-            # Wait for transaction receipt
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            # Build, sign and send transaction with the fee oracle's fees, then wait for the receipt
+            receipt = await self._send_server_transaction(contract_function, gas=gas["gas_limit"])
+            if receipt.status != 1:
+                raise ValueError(f"Batch transaction {receipt.transactionHash.hex()} reverted")
+            gas_model.observe(function_name, asset_ids, cids, receipt.gasUsed)
             
             tx_hash_hex = receipt.transactionHash.hex()
             logger.info(f"Batch transaction successful. {len(asset_ids)} assets processed. Transaction hash: {tx_hash_hex}")
@@ -1536,31 +2110,9 @@ class BlockchainService:
             if len(asset_ids) > 50:  # MAX_BATCH_SIZE from contract
                 raise ValueError("Batch size cannot exceed 50 assets")
                 
-            # Build transaction
-            nonce = self.web3.eth.get_transaction_count(self.wallet_address)
-            tx = self.contract.functions.batchDeleteAssets(asset_ids).build_transaction({
-                'from': self.wallet_address,
-                'nonce': nonce,
-                'gasPrice': self.web3.eth.gas_price,
-                'gas': 2000000,
-            })
-
-            # Sign transaction
-            signed_tx = self.web3.eth.account.sign_transaction(tx, private_key=self.private_key)
-
-            # Different versions of Web3.py use different attribute names
-            if hasattr(signed_tx, 'rawTransaction'):
-                raw_tx = signed_tx.rawTransaction
-            elif hasattr(signed_tx, 'raw_transaction'):
-                raw_tx = signed_tx.raw_transaction
-            else:
-                raw_tx = bytes(signed_tx)
-
-            # Send transaction
-            tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
-
-            # Wait for transaction receipt
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = await self._send_server_transaction(
+                self.contract.functions.batchDeleteAssets(asset_ids)
+            )
 
             logger.info(f"Batch deleted {len(asset_ids)} assets. Transaction hash: {receipt.transactionHash.hex()}")
 
@@ -1625,30 +2177,12 @@ class BlockchainService:
             if len(asset_ids) > 50:  # MAX_BATCH_SIZE from contract
                 raise ValueError("Batch size cannot exceed 50 assets")
                 
-            # Build transaction
-            nonce = self.web3.eth.get_transaction_count(self.wallet_address)
-            tx = self.contract.functions.batchDeleteAssetsFor(
-                Web3.to_checksum_address(owner_address),
-                asset_ids
-            ).build_transaction({
-                'from': self.wallet_address,
-                'nonce': nonce,
-                'gasPrice': self.web3.eth.gas_price,
-                'gas': 2000000,
-            })
-
-            # Sign and send the transaction
-            signed_tx = self.web3.eth.account.sign_transaction(tx, private_key=self.private_key)
-            
-            if hasattr(signed_tx, 'rawTransaction'):
-                raw_tx = signed_tx.rawTransaction
-            elif hasattr(signed_tx, 'raw_transaction'):
-                raw_tx = signed_tx.raw_transaction
-            else:
-                raw_tx = bytes(signed_tx)
-
-            tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = await self._send_server_transaction(
+                self.contract.functions.batchDeleteAssetsFor(
+                    Web3.to_checksum_address(owner_address),
+                    asset_ids
+                )
+            )
 
             logger.info(f"Batch deleted {len(asset_ids)} assets for owner {owner_address}. Transaction hash: {receipt.transactionHash.hex()}")
 
@@ -1658,11 +2192,18 @@ class BlockchainService:
             logger.error(f"Blockchain error batch deleting assets for another owner: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Blockchain transaction failed: {str(e)}")
 
-    async def recover_data_from_events(self, asset_id: str, owner_address: str) -> dict:
+    async def recover_data_from_events(
+        self,
+        asset_id: str,
+        owner_address: str,
+        from_block: Optional[int] = None
+    ) -> dict:
         """
-        Fallback recovery: Get CID and transaction hash from blockchain event logs with tiered search.
+        Fallback recovery: Get CID and transaction hash from blockchain event logs.
         
-        This method uses an intelligent search strategy:
+        With from_block, a single chunked scan covers from_block to the head; the
+        event index answers for everything before it. Without it, this uses a
+        tiered search:
         1. Search recent blocks first (most likely to contain the event)
         2. If not found, expand search to older blocks
         3. Use chunked queries to avoid RPC provider limits
@@ -1670,6 +2211,7 @@ class BlockchainService:
         Args:
             asset_id: The asset ID to recover data for
             owner_address: The owner's address
+            from_block: Optional first block to scan, skipping the tiered search
             
         Returns:
             Dictionary containing:
@@ -1681,7 +2223,14 @@ class BlockchainService:
             HTTPException: If blockchain query fails
         """
         try:
-            latest_block = self.web3.eth.get_block('latest')['number']
+            latest_block = await self.get_latest_block_number()
+            
+            if from_block is not None:
+                events = await self._query_events_chunked(asset_id, owner_address, from_block, latest_block)
+                latest_event = self._latest_update_event(events)
+                if latest_event is None:
+                    raise ValueError(f"No IPFSUpdated events found for asset {asset_id} since block {from_block}")
+                return {"cid": latest_event['args']['cid'], "tx_hash": latest_event['transactionHash'].hex()}
             
             # Tiered search strategy - start recent, expand if needed
             search_ranges = [
@@ -1703,18 +2252,13 @@ class BlockchainService:
                         asset_id, owner_address, from_block, latest_block
                     )
                     
-                    if events:
-                        # Filter out deletion events and get valid updates
-                        update_events = [e for e in events if not e['args']['isDeleted']]
+                    latest_event = self._latest_update_event(events)
+                    if latest_event is not None:
+                        authentic_cid = latest_event['args']['cid']
+                        correct_tx_hash = latest_event['transactionHash'].hex()
                         
-                        if update_events:
-                            # Get event with highest ipfsVersion (latest update)
-                            latest_event = max(update_events, key=lambda e: e['args']['ipfsVersion'])
-                            authentic_cid = latest_event['args']['cid']
-                            correct_tx_hash = latest_event['transactionHash'].hex()
-                            
-                            logger.info(f"Successfully recovered CID from events: {authentic_cid} for asset {asset_id}, correct TX hash: {correct_tx_hash}")
-                            return {"cid": authentic_cid, "tx_hash": correct_tx_hash}
+                        logger.info(f"Successfully recovered CID from events: {authentic_cid} for asset {asset_id}, correct TX hash: {correct_tx_hash}")
+                        return {"cid": authentic_cid, "tx_hash": correct_tx_hash}
                 
                 except Exception as e:
                     logger.warning(f"Search range {from_block}-{latest_block} failed: {str(e)}")
@@ -1733,6 +2277,14 @@ class BlockchainService:
                 detail=f"Failed to recover CID from events: {str(e)}"
             )
     
+    @staticmethod
+    def _latest_update_event(events: list) -> Optional[Any]:
+        """Get the non-deletion IPFSUpdated event with the highest ipfsVersion, or None."""
+        update_events = [e for e in events if not e['args']['isDeleted']]
+        if not update_events:
+            return None
+        return max(update_events, key=lambda e: e['args']['ipfsVersion'])
+    
     async def _query_events_chunked(self, asset_id: str, owner_address: str, from_block: int, to_block: int) -> list:
         """
         Query events in chunks to avoid RPC provider limits.
@@ -1754,8 +2306,9 @@ class BlockchainService:
             current_to = min(current_from + CHUNK_SIZE - 1, to_block)
             
             try:
-                # Create event filter for this chunk
-                event_filter = self.contract.events.IPFSUpdated.create_filter(
+                # Fetch logs for this chunk in a single eth_getLogs call
+                chunk_events = await self._call(
+                    self.contract.events.IPFSUpdated.get_logs,
                     from_block=current_from,
                     to_block=current_to,
                     argument_filters={
@@ -1763,9 +2316,6 @@ class BlockchainService:
                         'assetId': asset_id
                     }
                 )
-                
-                # Get events for this chunk
-                chunk_events = event_filter.get_all_entries()
                 all_events.extend(chunk_events)
                 
                 logger.debug(f"Chunk {current_from}-{current_to}: found {len(chunk_events)} events")
@@ -1777,3 +2327,35 @@ class BlockchainService:
             current_from = current_to + 1
         
         return all_events
+
+
+# Shared instance, created on first use and managed by the application lifespan
+_blockchain_service: Optional[BlockchainService] = None
+
+def get_blockchain_service() -> BlockchainService:
+    """
+    Get the process-wide BlockchainService instance.
+
+    Returns:
+        Shared BlockchainService instance
+
+    Raises:
+        HTTPException: If the last health check found the provider unreachable
+    """
+    global _blockchain_service
+
+    if _blockchain_service is None:
+        _blockchain_service = BlockchainService()
+
+    if _blockchain_service.connected is False:
+        raise HTTPException(status_code=500, detail="Blockchain connection error")
+
+    return _blockchain_service
+
+async def close_blockchain_service() -> None:
+    """Close the shared BlockchainService instance if one was created."""
+    global _blockchain_service
+
+    if _blockchain_service is not None:
+        await _blockchain_service.close()
+        _blockchain_service = None
@@ -0,0 +1,329 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from web3 import Web3
+
+from app.config import settings
+from app.repositories.chain_event_repo import ChainEventRepository
+from app.services.blockchain_service import BlockchainService
+from app.utilities.delegation_cache import delegation_cache
+
+logger = logging.getLogger(__name__)
+
+
+def asset_id_hash(asset_id: str) -> str:
+    """Hash an asset ID the way the registry's indexed `string assetId` topics are hashed."""
+    return Web3.to_hex(Web3.keccak(text=asset_id))
+
+
+class ChainIndexerService:
+    """
+    Tails FuseVaultRegistry events into MongoDB so recovery, pending-transfer and
+    delegation lookups are indexed queries instead of eth_getLogs scans.
+
+    The block cursor is checkpointed after every chunk together with the hash of
+    its block. Each sync first checks that hash against the chain; if it changed,
+    the last `reorg_depth` blocks of events are dropped and indexed again.
+    """
+
+    def __init__(
+        self,
+        blockchain_service: BlockchainService,
+        event_repo: ChainEventRepository,
+        start_block: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        reorg_depth: Optional[int] = None
+    ):
+        """
+        Initialize with the services the indexer reads from and writes to.
+
+        Args:
+            blockchain_service: Service used to read blocks and registry events
+            event_repo: Repository the events and cursor are stored in
+            start_block: First block to index (the contract deployment block)
+            chunk_size: Blocks per eth_getLogs call
+            poll_interval: Seconds between syncs
+            reorg_depth: Blocks re-indexed when a reorg is detected
+        """
+        self.blockchain_service = blockchain_service
+        self.event_repo = event_repo
+        self.contract = blockchain_service.contract_address.lower()
+        self.start_block = settings.chain_indexer_start_block if start_block is None else start_block
+        self.chunk_size = chunk_size or settings.chain_indexer_chunk_size
+        self.poll_interval = poll_interval or settings.chain_indexer_poll_interval
+        self.reorg_depth = settings.chain_indexer_reorg_depth if reorg_depth is None else reorg_depth
+
+        self.indexed_block: Optional[int] = None
+        self.last_synced_at: Optional[float] = None
+        self.reorgs_handled = 0
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Create indexes and start tailing the chain in the background."""
+        await self.event_repo.create_indexes()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop tailing the chain."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sync_once()
+            except Exception as e:
+                logger.error(f"Chain indexer sync failed: {str(e)}")
+            await asyncio.sleep(self.poll_interval)
+
+    def is_ready(self) -> bool:
+        """Whether the index has caught up with the chain recently enough to answer queries."""
+        if self.last_synced_at is None:
+            return False
+        return time.time() - self.last_synced_at <= max(3 * self.poll_interval, 30)
+
+    async def sync_once(self) -> int:
+        """
+        Index all registry events up to the current head.
+
+        Returns:
+            Number of events inserted or modified
+        """
+        async with self._lock:
+            head = await self.blockchain_service.get_latest_block_number()
+            cursor = await self.event_repo.get_cursor(self.contract)
+
+            if cursor is not None and cursor.get("blockHash"):
+                current_hash = await self.blockchain_service.get_block_hash(cursor["blockNumber"])
+                if current_hash != cursor["blockHash"]:
+                    cursor = await self._rollback(cursor["blockNumber"])
+
+            next_block = self.start_block if cursor is None else cursor["blockNumber"] + 1
+            indexed = 0
+
+            while next_block <= head:
+                to_block = min(next_block + self.chunk_size - 1, head)
+
+                # Read the hash before the logs so a reorg in between is caught by the next check
+                block_hash = await self.blockchain_service.get_block_hash(to_block)
+                events = await self.blockchain_service.get_registry_events(next_block, to_block)
+                documents = [self._to_document(event) for event in events]
+                indexed += await self.event_repo.upsert_events(documents)
+                for document in documents:
+                    if document["event"] == "DelegateStatusChanged":
+                        delegation_cache.invalidate(document["owner"], document["delegate"])
+                await self.event_repo.set_cursor(self.contract, to_block, block_hash)
+
+                logger.debug(f"Indexed blocks {next_block}-{to_block}: {len(events)} events")
+                self.indexed_block = to_block
+                next_block = to_block + 1
+
+            # Everything up to the head is indexed now, including when the cursor was already there
+            self.indexed_block = next_block - 1
+            self.last_synced_at = time.time()
+            if indexed:
+                logger.info(f"Chain indexer stored {indexed} events up to block {head}")
+            return indexed
+
+    async def _rollback(self, cursor_block: int) -> Optional[Dict[str, Any]]:
+        """
+        Drop events from blocks that may have been reorganised away and move the cursor back.
+
+        Args:
+            cursor_block: The checkpointed block whose hash no longer matches
+
+        Returns:
+            The new cursor, or None if indexing restarts from the start block
+        """
+        safe_block = cursor_block - self.reorg_depth
+        deleted = await self.event_repo.delete_events_after(self.contract, max(safe_block, self.start_block - 1))
+        self.reorgs_handled += 1
+        logger.warning(
+            f"Chain reorg detected at block {cursor_block}; "
+            f"removed {deleted} events above block {safe_block} for re-indexing"
+        )
+
+        if safe_block < self.start_block:
+            await self.event_repo.set_cursor(self.contract, self.start_block - 1, None)
+            return None
+
+        block_hash = await self.blockchain_service.get_block_hash(safe_block)
+        await self.event_repo.set_cursor(self.contract, safe_block, block_hash)
+        return {"blockNumber": safe_block, "blockHash": block_hash}
+
+    def _to_document(self, event: Any) -> Dict[str, Any]:
+        """Flatten a decoded registry event into its chain_events document."""
+        args = event["args"]
+        name = event["event"]
+        document = {
+            "contract": self.contract,
+            "event": name,
+            "transactionHash": event["transactionHash"].hex(),
+            "logIndex": event["logIndex"],
+            "blockNumber": event["blockNumber"],
+            "blockHash": event["blockHash"].hex()
+        }
+
+        if name == "IPFSUpdated":
+            document.update({
+                "owner": args["owner"].lower(),
+                "assetIdHash": Web3.to_hex(args["assetId"]),
+                "ipfsVersion": args["ipfsVersion"],
+                "cid": args["cid"],
+                "isDeleted": args["isDeleted"]
+            })
+        elif name == "AssetDeleted":
+            document.update({
+                "owner": args["owner"].lower(),
+                "assetIdHash": Web3.to_hex(args["assetId"]),
+                "lastVersion": args["lastVersion"]
+            })
+        elif name == "DelegateStatusChanged":
+            document.update({
+                "owner": args["owner"].lower(),
+                "delegate": args["delegate"].lower(),
+                "status": args["status"]
+            })
+        else:
+            # Transfer events: the sending owner is stored as owner
+            document.update({
+                "owner": args["from"].lower(),
+                "to": args["to"].lower(),
+                "assetIdHash": Web3.to_hex(args["assetId"])
+            })
+
+        return document
+
+    async def find_latest_cid(self, asset_id: str, owner_address: str) -> Optional[Dict[str, str]]:
+        """
+        Look up the latest CID an owner recorded for an asset.
+
+        Args:
+            asset_id: The asset ID
+            owner_address: The owner's wallet address
+
+        Returns:
+            Dict with "cid" and "tx_hash", or None if no update is indexed
+        """
+        event = await self.event_repo.get_latest_ipfs_update(
+            self.contract, owner_address.lower(), asset_id_hash(asset_id)
+        )
+        if event is None:
+            return None
+        return {"cid": event["cid"], "tx_hash": event["transactionHash"]}
+
+    async def get_pending_transfers(self, wallet_address: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Find transfers that were initiated but not yet completed or cancelled.
+
+        Args:
+            wallet_address: Wallet to find outgoing and incoming transfers for
+
+        Returns:
+            Dict with "outgoing" and "incoming" lists of TransferInitiated event documents
+        """
+        wallet = wallet_address.lower()
+
+        outgoing_events = await self.event_repo.get_transfer_events(self.contract, owners=[wallet])
+        outgoing = [
+            event for event in self._latest_by_asset(outgoing_events).values()
+            if event["event"] == "TransferInitiated"
+        ]
+
+        # A transfer to this wallet is only pending if it is still the sender's latest transfer of that asset
+        addressed = await self.event_repo.get_transfer_events(self.contract, to=wallet)
+        senders = sorted({event["owner"] for event in addressed})
+        sender_events = await self.event_repo.get_transfer_events(self.contract, owners=senders) if senders else []
+        incoming = [
+            event for event in self._latest_by_asset(sender_events).values()
+            if event["event"] == "TransferInitiated" and event["to"] == wallet
+        ]
+
+        return {"outgoing": outgoing, "incoming": incoming}
+
+    @staticmethod
+    def _latest_by_asset(events: List[Dict[str, Any]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Keep the last of each (owner, assetIdHash) from events sorted oldest first."""
+        latest = {}
+        for event in events:
+            latest[(event["owner"], event["assetIdHash"])] = event
+        return latest
+
+    async def get_delegation_status(self, owner_address: str, delegate_address: str) -> bool:
+        """
+        Get the delegation status from the latest indexed DelegateStatusChanged event.
+
+        Args:
+            owner_address: The owner's wallet address
+            delegate_address: The delegate's wallet address
+
+        Returns:
+            True if the delegate is currently approved
+        """
+        event = await self.event_repo.get_latest_delegation_event(
+            self.contract, owner_address.lower(), delegate_address.lower()
+        )
+        return bool(event and event["status"])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get indexer progress.
+
+        Returns:
+            Dict with the indexed block, readiness and reorg count
+        """
+        return {
+            "indexed_block": self.indexed_block,
+            "ready": self.is_ready(),
+            "last_synced_at": self.last_synced_at,
+            "reorgs_handled": self.reorgs_handled
+        }
+
+
+# Shared instance, created by the application lifespan when indexing is enabled
+_chain_indexer: Optional[ChainIndexerService] = None
+
+def get_chain_indexer() -> Optional[ChainIndexerService]:
+    """
+    Get the process-wide chain indexer.
+
+    Returns:
+        The running ChainIndexerService, or None if indexing is disabled or not started
+    """
+    return _chain_indexer
+
+async def start_chain_indexer(blockchain_service: BlockchainService, db_client) -> ChainIndexerService:
+    """
+    Create and start the shared chain indexer.
+
+    Args:
+        blockchain_service: Shared blockchain service
+        db_client: The MongoDB client
+
+    Returns:
+        The started ChainIndexerService
+    """
+    global _chain_indexer
+
+    if _chain_indexer is None:
+        _chain_indexer = ChainIndexerService(blockchain_service, ChainEventRepository(db_client))
+        await _chain_indexer.start()
+    return _chain_indexer
+
+async def close_chain_indexer() -> None:
+    """Stop the shared chain indexer if one was started."""
+    global _chain_indexer
+
+    if _chain_indexer is not None:
+        await _chain_indexer.stop()
+        _chain_indexer = None
@@ -0,0 +1,271 @@
+import asyncio
+import logging
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Tip used when none of the sampled blocks carried a transaction to learn from
+MIN_PRIORITY_FEE = 100_000_000  # 0.1 gwei
+
+
+class FeeOracleService:
+    """
+    Background sampler of eth_feeHistory serving EIP-1559 fee suggestions.
+
+    Every refresh_interval seconds the oracle reads the base fees and reward
+    percentiles of the last block_count blocks. Each urgency level maps to a
+    reward percentile: its tip is the median of that percentile across the
+    sampled blocks, and its max fee is twice the next block's base fee plus
+    the tip. A legacy gas price (next base fee plus one 12.5% increase, plus
+    the tip) is derived for transactions signed by wallets that only send
+    gasPrice. Nodes without feeHistory fall back to eth_gasPrice.
+
+    The chain ID is read once and kept for the life of the process.
+    """
+
+    def __init__(
+        self,
+        blockchain_service,
+        refresh_interval: Optional[float] = None,
+        block_count: Optional[int] = None,
+        urgency_percentiles: Optional[Dict[str, int]] = None,
+        default_urgency: Optional[str] = None
+    ):
+        """
+        Initialize with the blockchain service used for RPC calls.
+
+        Args:
+            blockchain_service: Service whose web3 instance and _call are used
+            refresh_interval: Seconds between fee history samples
+            block_count: Number of recent blocks per sample
+            urgency_percentiles: Urgency level -> reward percentile
+            default_urgency: Level served when a caller doesn't name one
+        """
+        self.blockchain_service = blockchain_service
+        self.refresh_interval = refresh_interval or settings.fee_oracle_refresh_interval
+        self.block_count = block_count or settings.fee_oracle_block_count
+        self.urgency_percentiles = urgency_percentiles or settings.fee_oracle_urgency_percentiles
+        self.default_urgency = default_urgency or settings.fee_oracle_default_urgency
+        if self.default_urgency not in self.urgency_percentiles:
+            raise ValueError(f"Default urgency '{self.default_urgency}' is not a configured level")
+        # A sample older than this is refreshed on demand, e.g. if the loop isn't running
+        self.max_age = self.refresh_interval * 3
+
+        self.chain_id: Optional[int] = None
+        self._sample: Optional[Dict[str, Any]] = None
+        self._lock = asyncio.Lock()
+        self._chain_id_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {
+            "samples": 0,
+            "sample_errors": 0,
+            "legacy_samples": 0,
+            "on_demand_samples": 0,
+            "suggestions_served": 0,
+            "chain_id_reads": 0
+        }
+
+    @property
+    def levels(self) -> List[str]:
+        """The configured urgency levels."""
+        return list(self.urgency_percentiles)
+
+    def start(self) -> None:
+        """Start sampling fee history in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the sampling loop. The last sample keeps being served until it is stale."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Fee oracle sample failed: {str(e)}")
+            await asyncio.sleep(self.refresh_interval)
+
+    async def get_chain_id(self) -> int:
+        """
+        Get the chain ID, reading it from the provider only the first time.
+
+        Returns:
+            The chain ID
+        """
+        if self.chain_id is None:
+            async with self._chain_id_lock:
+                if self.chain_id is None:
+                    service = self.blockchain_service
+                    self.chain_id = await service._call(lambda: service.web3.eth.chain_id)
+                    self.stats["chain_id_reads"] += 1
+        return self.chain_id
+
+    async def get_fees(self, urgency: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get fee suggestions for an urgency level.
+
+        Args:
+            urgency: One of levels; defaults to default_urgency
+
+        Returns:
+            Dict with urgency, eip1559, base_fee_per_gas, max_priority_fee_per_gas,
+            max_fee_per_gas, gas_price, block_number and sampled_at
+
+        Raises:
+            ValueError: If the urgency level is not configured
+        """
+        urgency = urgency or self.default_urgency
+        if urgency not in self.urgency_percentiles:
+            raise ValueError(f"Unknown urgency '{urgency}'; expected one of {', '.join(self.levels)}")
+
+        sample = self._sample
+        if sample is None or time.time() - sample["sampled_at"] > self.max_age:
+            sample = await self._refresh_stale()
+
+        self.stats["suggestions_served"] += 1
+        return {
+            "urgency": urgency,
+            "eip1559": sample["eip1559"],
+            "block_number": sample["block_number"],
+            "sampled_at": sample["sampled_at"],
+            **sample["levels"][urgency]
+        }
+
+    async def get_gas_price(self, urgency: Optional[str] = None) -> int:
+        """
+        Get the legacy gas price suggestion for an urgency level.
+
+        Args:
+            urgency: One of levels; defaults to default_urgency
+
+        Returns:
+            Gas price in wei
+        """
+        return (await self.get_fees(urgency))["gas_price"]
+
+    async def _refresh_stale(self) -> Dict[str, Any]:
+        """Sample once for callers that found no fresh sample, sharing the read between them."""
+        async with self._lock:
+            sample = self._sample
+            if sample is not None and time.time() - sample["sampled_at"] <= self.max_age:
+                return sample
+            self.stats["on_demand_samples"] += 1
+            try:
+                return await self._fetch_sample()
+            except Exception as e:
+                if sample is None:
+                    raise
+                logger.warning(f"Fee oracle refresh failed, serving a sample from block {sample['block_number']}: {str(e)}")
+                return sample
+
+    async def refresh(self) -> Dict[str, Any]:
+        """
+        Take a new fee sample.
+
+        Returns:
+            The new sample
+        """
+        async with self._lock:
+            return await self._fetch_sample()
+
+    async def _fetch_sample(self) -> Dict[str, Any]:
+        service = self.blockchain_service
+        percentiles = sorted(set(self.urgency_percentiles.values()))
+        try:
+            history = await service._call(service.web3.eth.fee_history, self.block_count, "latest", percentiles)
+            sample = self._sample_from_history(history, percentiles)
+        except Exception as e:
+            # Pre-London chains and some providers don't serve eth_feeHistory
+            logger.info(f"eth_feeHistory unavailable, using eth_gasPrice: {str(e)}")
+            try:
+                gas_price = await service._call(lambda: service.web3.eth.gas_price)
+                block_number = await service._call(lambda: service.web3.eth.block_number)
+            except Exception:
+                self.stats["sample_errors"] += 1
+                raise
+            sample = self._legacy_sample(gas_price, block_number)
+            self.stats["legacy_samples"] += 1
+
+        self.stats["samples"] += 1
+        self._sample = sample
+        return sample
+
+    def _sample_from_history(self, history: Dict[str, Any], percentiles: List[int]) -> Dict[str, Any]:
+        """Turn an eth_feeHistory result into per-level suggestions."""
+        base_fees = history["baseFeePerGas"]
+        if not base_fees or not base_fees[-1]:
+            raise ValueError("no base fee in fee history")
+        # The last entry is the base fee of the block after the newest one sampled
+        next_base_fee = int(base_fees[-1])
+
+        # Empty blocks report zero rewards and say nothing about the going tip
+        rewards = [
+            block_rewards
+            for block_rewards, ratio in zip(history.get("reward") or [], history["gasUsedRatio"])
+            if ratio > 0 and block_rewards
+        ]
+
+        levels = {}
+        for urgency, percentile in self.urgency_percentiles.items():
+            column = percentiles.index(percentile)
+            tip = int(statistics.median(r[column] for r in rewards)) if rewards else MIN_PRIORITY_FEE
+            levels[urgency] = {
+                "base_fee_per_gas": next_base_fee,
+                "max_priority_fee_per_gas": tip,
+                # Stays includable through six consecutive full blocks
+                "max_fee_per_gas": 2 * next_base_fee + tip,
+                # Legacy transactions pay their whole price, so only one base fee increase is covered
+                "gas_price": next_base_fee * 9 // 8 + tip
+            }
+
+        return {
+            "eip1559": True,
+            "block_number": int(history["oldestBlock"]) + len(history["gasUsedRatio"]) - 1,
+            "sampled_at": time.time(),
+            "levels": levels
+        }
+
+    def _legacy_sample(self, gas_price: int, block_number: int) -> Dict[str, Any]:
+        """Serve the node's eth_gasPrice at every level."""
+        suggestion = {
+            "base_fee_per_gas": None,
+            "max_priority_fee_per_gas": gas_price,
+            "max_fee_per_gas": gas_price,
+            "gas_price": gas_price
+        }
+        return {
+            "eip1559": False,
+            "block_number": block_number,
+            "sampled_at": time.time(),
+            "levels": {urgency: dict(suggestion) for urgency in self.urgency_percentiles}
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get oracle statistics.
+
+        Returns:
+            Dict with sample counters, the cached chain ID and the current suggestions
+        """
+        sample = self._sample
+        return {
+            **self.stats,
+            "running": self._task is not None and not self._task.done(),
+            "chain_id": self.chain_id,
+            "eip1559": sample["eip1559"] if sample else None,
+            "block_number": sample["block_number"] if sample else None,
+            "sample_age": round(time.time() - sample["sampled_at"], 1) if sample else None,
+            "levels": sample["levels"] if sample else None
+        }
@@ -2,18 +2,29 @@ import httpx
 import json
 import logging
 import asyncio
+import math
+import time
 from typing import Dict, Any, List, Callable, Optional
-from fastapi import UploadFile, HTTPException
+from fastapi import HTTPException
 from app.utilities.format import format_json, get_ipfs_metadata
+from app.utilities.unixfs import CHUNK_SIZE, compute_file_cid
+from app.utilities.cid_cache import cid_cache
+from app.utilities.gateway_scoreboard import gateway_scoreboard
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
 class IPFSService:
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.storage_service_url = settings.web3_storage_service_url
+        self._client = client
         logger.info(f"Using Web3 Storage service at: {self.storage_service_url}")
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client used for storage service and gateway requests (the shared pool unless one was injected)."""
+        return self._client or get_ipfs_http_client()
+
     async def store_metadata(self, metadata: Dict[str, Any]) -> str:
         """
         Store metadata on IPFS.
@@ -29,9 +40,12 @@ class IPFSService:
 
             files = {"files": ("metadata.json", formatted_metadata, "application/json")}
 
-            async with httpx.AsyncClient(timeout=90.0) as client:
-                response = await client.post(f"{self.storage_service_url}/upload", files=files)
-                response.raise_for_status()
+            response = await self.client.post(
+                f"{self.storage_service_url}/upload",
+                files=files,
+                timeout=settings.ipfs_upload_timeout
+            )
+            response.raise_for_status()
 
             # Get the response JSON and log it for debugging
             response_json = response.json()
@@ -39,11 +53,7 @@ class IPFSService:
 
             # Extract CID from the response
             if "cids" in response_json and len(response_json["cids"]) > 0 and "cid" in response_json["cids"][0]:
-                cid_dict = response_json["cids"][0]["cid"]
-                if isinstance(cid_dict, dict) and "/" in cid_dict:
-                    cid = cid_dict["/"]
-                else:
-                    cid = str(cid_dict)
+                cid = self._extract_cid(response_json["cids"][0])
             else:
                 raise ValueError(f"Unable to extract CID from response: {response_json}")
             
@@ -51,6 +61,9 @@ class IPFSService:
                 raise ValueError(f"Unable to extract CID from response: {response_json}")
 
             logger.info(f"Successfully stored metadata on IPFS. CID: {cid}")
+
+            # We already hold the uploaded bytes, so later reads of this CID never leave the process
+            await self._cache_content(cid, formatted_metadata)
             return cid
 
         except httpx.HTTPError as exc:
@@ -60,6 +73,16 @@ class IPFSService:
             logger.error(f"General error uploading metadata to IPFS: {str(e)}")
             raise
 
+    @staticmethod
+    def _extract_cid(entry: Dict[str, Any]) -> Optional[str]:
+        """Get the CID string from one entry of the storage service's `cids` array."""
+        cid_dict = entry.get("cid")
+        if not cid_dict:
+            return None
+        if isinstance(cid_dict, dict) and "/" in cid_dict:
+            return cid_dict["/"]
+        return str(cid_dict)
+
     async def retrieve_metadata(self, cid: str) -> Dict[str, Any]:
         """
         Retrieve metadata from IPFS by CID.
@@ -71,60 +94,25 @@ class IPFSService:
             Dict containing the metadata
         """
         try:
-            async with httpx.AsyncClient(timeout=90.0) as client:
-                try:
-                    # Try using the storage service URL first
-                    response = await client.get(f"{self.storage_service_url}/file/{cid}/contents")
-                    response.raise_for_status()
-                except httpx.HTTPStatusError as exc:
-                    # If the storage service fails, try using the specified IPFS gateways
-                    # Primary gateway: w3s.link
-                    try:
-                        w3s_url = f"https://{cid}.ipfs.w3s.link"
-                        logger.info(f"Storage service failed, trying W3S gateway: {w3s_url}")
-                        response = await client.get(w3s_url)
-                        response.raise_for_status()
-                    except Exception as w3s_error:
-                        # Fallback gateway: dweb.link
-                        logger.info(f"W3S gateway failed: {str(w3s_error)}, trying dweb.link")
-                        dweb_url = f"https://{cid}.ipfs.dweb.link"
-                        try:
-                            response = await client.get(dweb_url)
-                            response.raise_for_status()
-                        except Exception as dweb_error:
-                            # If both gateways fail, re-raise the original exception
-                            logger.error(f"All IPFS gateways failed. Storage service error: {exc}, W3S error: {w3s_error}, Dweb error: {dweb_error}")
-                            raise exc
-                
-                # Try to parse as JSON
-                try:
-                    metadata = response.json()
-                except json.JSONDecodeError:
-                    # If it's not valid JSON, try to handle it as text
-                    text_content = response.text
-                    try:
-                        metadata = json.loads(text_content)
-                    except json.JSONDecodeError:
-                        # Try to fix common corruption patterns (e.g., trailing garbage)
-                        logger.warning(f"Retrieved content is not valid JSON: {text_content[:100]}...")
-                        
-                        import re
-                        # Attempt to fix trailing garbage by removing extra characters after the final }
-                        fixed_content = re.sub(r'\}[^}]*\}*$', '}', text_content)
-                        
-                        try:
-                            metadata = json.loads(fixed_content)
-                            logger.info(f"Successfully recovered corrupted JSON for CID: {cid}")
-                        except json.JSONDecodeError:
-                            # If all else fails, use fallback but log the full content for debugging
-                            logger.error(f"Cannot recover corrupted JSON. Full content: {text_content}")
-                            metadata = {
-                                "critical_metadata": {"recovered_content": text_content[:500]},
-                                "retrieval_error": "Content is not valid JSON"
-                            }
-                
-                logger.info(f"Successfully retrieved metadata from IPFS with CID: {cid}")
-                return metadata
+            cached = await self._cached_content(cid)
+            if cached is not None:
+                logger.debug(f"Serving metadata for CID {cid} from cache")
+                return self._parse_metadata_text(cid, cached.decode("utf-8", errors="replace"))
+
+            # Race the storage service and the configured gateways
+            response = await self._fetch_hedged(cid)
+            
+            await self._cache_content(cid, response.content)
+
+            # Try to parse as JSON
+            try:
+                metadata = response.json()
+            except json.JSONDecodeError:
+                # If it's not valid JSON, try to handle it as text
+                metadata = self._parse_metadata_text(cid, response.text)
+            
+            logger.info(f"Successfully retrieved metadata from IPFS with CID: {cid}")
+            return metadata
 
         except httpx.HTTPError as exc:
             logger.error(f"HTTP error retrieving from IPFS: {str(exc)}")
@@ -133,42 +121,132 @@ class IPFSService:
             logger.error(f"General error retrieving metadata from IPFS: {str(e)}")
             raise
             
-    async def upload_files(self, files: List[UploadFile]) -> Dict[str, Any]:
+    async def _fetch_hedged(self, cid: str) -> httpx.Response:
         """
-        Upload multiple files to IPFS.
+        Fetch a CID from the storage service and IPFS gateways with hedged requests.
+        
+        Sources are tried best-ranked first. If the current source has not answered
+        within its hedge delay (its observed p95 latency), the next source is started
+        alongside it; a source that fails starts the next one straight away. The first
+        successful response wins and the remaining requests are cancelled.
         
         Args:
-            files: List of files to upload
+            cid: Content identifier to fetch
             
         Returns:
-            Dict containing result information including CIDs
-        """
-        try:
-            # Prepare multipart form data for multiple files
-            multipart_data = []
-            for file in files:
-                file_content = await file.read()
-                multipart_data.append(
-                    ("files", (file.filename, file_content, file.content_type))
-                )
+            The winning response
             
-            async with httpx.AsyncClient(timeout=90.0) as client:
-                response = await client.post(
-                    f"{self.storage_service_url}/upload",
-                    files=multipart_data
-                )
+        Raises:
+            Exception: The storage service's error (or the last error) if every source fails
+        """
+        sources = {"storage": f"{self.storage_service_url}/file/{cid}/contents"}
+        for gateway in settings.ipfs_gateways_list:
+            sources[gateway] = gateway.format(cid=cid)
+        ranked = gateway_scoreboard.rank(list(sources))
+        client = self.client
+
+        async def attempt(source: str) -> httpx.Response:
+            started = time.monotonic()
+            try:
+                response = await client.get(sources[source], timeout=settings.ipfs_retrieve_timeout)
                 response.raise_for_status()
+            except asyncio.CancelledError:
+                gateway_scoreboard.record(source, time.monotonic() - started, "cancelled")
+                raise
+            except Exception:
+                gateway_scoreboard.record(source, time.monotonic() - started, "error")
+                raise
+            gateway_scoreboard.record(source, time.monotonic() - started, "ok")
+            return response
 
-            result = response.json()
-            logger.info(f"Successfully uploaded {len(files)} files to IPFS")
-            return result
+        pending: Dict[asyncio.Task, str] = {}
+        errors: Dict[str, Exception] = {}
+        remaining = list(ranked)
+
+        def start_next() -> str:
+            source = remaining.pop(0)
+            pending[asyncio.create_task(attempt(source))] = source
+            return source
+
+        try:
+            last_started = start_next()
+            while pending:
+                delay = gateway_scoreboard.hedge_delay(last_started) if remaining else None
+                done, _ = await asyncio.wait(pending, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    logger.info(f"No response from {last_started} within {delay:.2f}s, also trying {remaining[0]}")
+                    last_started = start_next()
+                    continue
+
+                for task in done:
+                    source = pending.pop(task)
+                    if task.exception() is None:
+                        if source != "storage":
+                            logger.info(f"Retrieved CID {cid} from gateway {sources[source]}")
+                        return task.result()
+                    errors[source] = task.exception()
+                    logger.info(f"IPFS source {source} failed for CID {cid}: {str(errors[source])}")
+
+                if remaining:
+                    last_started = start_next()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        logger.error(f"All IPFS sources failed for CID {cid}: {errors}")
+        raise errors.get("storage") or list(errors.values())[-1]
+
+    def _parse_metadata_text(self, cid: str, text_content: str) -> Dict[str, Any]:
+        """
+        Parse retrieved metadata text, repairing common corruption where possible.
+        
+        Args:
+            cid: Content identifier the text was retrieved for
+            text_content: The retrieved content
             
-        except httpx.HTTPError as exc:
-            logger.error(f"HTTP error uploading files to IPFS: {str(exc)}")
-            raise
+        Returns:
+            Dict containing the metadata, or a fallback dict describing the retrieval error
+        """
+        try:
+            return json.loads(text_content)
+        except json.JSONDecodeError:
+            # Try to fix common corruption patterns (e.g., trailing garbage)
+            logger.warning(f"Retrieved content is not valid JSON: {text_content[:100]}...")
+            
+            import re
+            # Attempt to fix trailing garbage by removing extra characters after the final }
+            fixed_content = re.sub(r'\}[^}]*\}*$', '}', text_content)
+            
+            try:
+                metadata = json.loads(fixed_content)
+                logger.info(f"Successfully recovered corrupted JSON for CID: {cid}")
+                return metadata
+            except json.JSONDecodeError:
+                # If all else fails, use fallback but log the full content for debugging
+                logger.error(f"Cannot recover corrupted JSON. Full content: {text_content}")
+                return {
+                    "critical_metadata": {"recovered_content": text_content[:500]},
+                    "retrieval_error": "Content is not valid JSON"
+                }
+
+    async def _cached_content(self, cid: str) -> Optional[bytes]:
+        """Look up content in the CID cache; a cache failure is treated as a miss."""
+        try:
+            return await cid_cache.get(cid)
         except Exception as e:
-            logger.error(f"General error uploading files to IPFS: {str(e)}")
-            raise
+            logger.warning(f"Could not read cached content for CID {cid}: {str(e)}")
+            return None
+
+    async def _cache_content(self, cid: str, content: bytes) -> None:
+        """Add content to the CID cache; a cache failure never fails the IPFS operation."""
+        try:
+            computed_cid = await self._compute_cid_remote(content) if len(content) > CHUNK_SIZE else None
+            await cid_cache.put(cid, content, computed_cid)
+        except Exception as e:
+            logger.warning(f"Could not cache content for CID {cid}: {str(e)}")
             
     async def get_file_url(self, cid: str) -> Dict[str, Any]:
         """
@@ -181,9 +259,11 @@ class IPFSService:
             Dict containing the URL information
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{self.storage_service_url}/file/{cid}")
-                response.raise_for_status()
+            response = await self.client.get(
+                f"{self.storage_service_url}/file/{cid}",
+                timeout=settings.ipfs_lookup_timeout
+            )
+            response.raise_for_status()
                 
             result = response.json()
             return result
@@ -207,16 +287,22 @@ class IPFSService:
             The file contents in the specified format
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{self.storage_service_url}/file/{cid}/contents")
+            content = await self._cached_content(cid)
+            if content is None:
+                response = await self.client.get(
+                    f"{self.storage_service_url}/file/{cid}/contents",
+                    timeout=settings.ipfs_retrieve_timeout
+                )
                 response.raise_for_status()
+                content = response.content
+                await self._cache_content(cid, content)
                 
             if response_type == "json":
-                return response.json()
+                return json.loads(content)
             elif response_type == "bytes":
-                return response.content
+                return content
             else:
-                return response.text
+                return content.decode("utf-8", errors="replace")
                 
         except httpx.HTTPError as exc:
             logger.error(f"HTTP error getting file contents: {str(exc)}")
@@ -227,7 +313,12 @@ class IPFSService:
     
     async def compute_cid(self, metadata: Dict[str, Any]) -> str:
         """
-        Compute CID from given metadata by interacting with IPFS Node service.
+        Compute CID from given metadata.
+        
+        Metadata that fits in one chunk is hashed in-process the way web3.storage
+        stores it, as a single raw block. Larger metadata is chunked into a dag-pb
+        tree, so its CID comes from the IPFS Node service. Set IPFS_LOCAL_CID=false
+        to always ask the IPFS Node service.
         
         Args:
             metadata: Metadata to compute CID for
@@ -242,30 +333,45 @@ class IPFSService:
             # Format the metadata using the consistent format_json utility
             formatted_metadata = format_json(metadata)
             
-            # Create a file content for direct multipart upload
-            files = {
-                "file": ("metadata.json", formatted_metadata, "application/json")
-            }
-
-            async with httpx.AsyncClient(timeout=90.0) as client:
-                response = await client.post(
-                    f"{self.storage_service_url}/calculate-cid",
-                    files=files
-                )
-                response.raise_for_status()
-
-            result = response.json()
-            computed_cid = result.get("computed_cid")
+            if settings.ipfs_local_cid and len(formatted_metadata) <= CHUNK_SIZE:
+                return compute_file_cid(formatted_metadata)
             
-            if not computed_cid:
-                raise ValueError("No CID returned from IPFS service")
-                
-            return computed_cid
+            return await self._compute_cid_remote(formatted_metadata)
 
         except Exception as e:
             logger.error(f"Error computing CID: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
 
+    async def _compute_cid_remote(self, formatted_metadata: bytes) -> str:
+        """
+        Compute CID for file contents via the IPFS Node service's /calculate-cid endpoint.
+        
+        Args:
+            formatted_metadata: Metadata bytes as produced by format_json, or fetched file contents
+            
+        Returns:
+            Computed CID string
+        """
+        # Create a file content for direct multipart upload
+        files = {
+            "file": ("metadata.json", formatted_metadata, "application/json")
+        }
+
+        response = await self.client.post(
+            f"{self.storage_service_url}/calculate-cid",
+            files=files,
+            timeout=settings.ipfs_lookup_timeout
+        )
+        response.raise_for_status()
+
+        result = response.json()
+        computed_cid = result.get("computed_cid")
+        
+        if not computed_cid:
+            raise ValueError("No CID returned from IPFS service")
+            
+        return computed_cid
+
     async def verify_cid(self, metadata: Dict[str, Any], provided_cid: str) -> bool:
         """
         Compares provided CID against computed CID from metadata.
@@ -294,79 +400,202 @@ class IPFSService:
             logger.error(f"Error verifying CID: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
 
-    async def store_metadata_batch_concurrent(
-        self, 
-        assets_metadata: List[Dict[str, Any]], 
+    async def store_metadata_batch(
+        self,
+        assets_metadata: List[Dict[str, Any]],
         progress_callback: Optional[Callable[[str, int, str], None]] = None,
-        max_concurrent: int = 10
+        files_per_request: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
-        Store multiple metadata objects on IPFS concurrently with progress tracking.
+        Store multiple metadata objects on IPFS using multi-file uploads.
+        
+        Documents are sent as files of a single /upload request (or one request per
+        `files_per_request` documents, sent concurrently), and the storage service
+        uploads them concurrently and returns a CID per file in order.
         
         Args:
             assets_metadata: List of metadata dictionaries to store
             progress_callback: Callback function(asset_id, progress, status) for progress updates
-            max_concurrent: Maximum number of concurrent uploads (default: 3)
+            files_per_request: Maximum documents per request (default: IPFS_BATCH_FILES_PER_REQUEST)
             
         Returns:
-            List of dicts with asset_id, cid, status, and optional error
+            List of dicts with asset_id, cid, status, and optional error, in input order
         """
-        try:
-            results = []
-            semaphore = asyncio.Semaphore(max_concurrent)
+        files_per_request = files_per_request or settings.ipfs_batch_files_per_request
+        asset_ids = [
+            asset_data.get("asset_id", f"asset_{index}")
+            for index, asset_data in enumerate(assets_metadata)
+        ]
+        payloads = [format_json(get_ipfs_metadata(asset_data)) for asset_data in assets_metadata]
+
+        async def upload_group(start: int) -> List[Dict[str, Any]]:
+            indexes = range(start, min(start + files_per_request, len(payloads)))
             
-            async def upload_single_asset(asset_data: Dict[str, Any], index: int) -> Dict[str, Any]:
-                async with semaphore:
-                    asset_id = asset_data.get("asset_id", f"asset_{index}")
-                    
-                    try:
-                        # Progress: Starting upload
-                        if progress_callback:
-                            progress_callback(asset_id, 0, "uploading")
-                        
-                        # Store metadata
-                        cid = await self.store_metadata(asset_data)
-                        
-                        # Progress: Upload completed
-                        if progress_callback:
-                            progress_callback(asset_id, 100, "completed")
-                        
-                        return {
-                            "asset_id": asset_id,
-                            "cid": cid,
-                            "status": "completed",
-                            "error": None
-                        }
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to upload asset {asset_id} to IPFS: {str(e)}")
-                        
-                        # Progress: Upload failed
-                        if progress_callback:
-                            progress_callback(asset_id, 0, "error")
-                        
-                        return {
-                            "asset_id": asset_id,
-                            "cid": None,
-                            "status": "error",
-                            "error": str(e)
-                        }
+            if progress_callback:
+                for index in indexes:
+                    progress_callback(asset_ids[index], 0, "uploading")
             
-            # Create tasks for all uploads
-            tasks = [
-                upload_single_asset(asset_data, idx) 
-                for idx, asset_data in enumerate(assets_metadata)
+            files = [
+                ("files", (f"metadata-{index}.json", payloads[index], "application/json"))
+                for index in indexes
             ]
             
-            # Execute all uploads concurrently and collect results
-            results = await asyncio.gather(*tasks, return_exceptions=False)
-            
-            # Log summary
-            successful_count = sum(1 for r in results if r["status"] == "completed")
-            logger.info(f"Batch IPFS upload completed: {successful_count}/{len(assets_metadata)} successful")
+            try:
+                # Node uploads in waves of concurrent files, so allow the same 30s per wave it allows itself
+                waves = math.ceil(len(files) / max(1, settings.ipfs_upload_concurrency))
+                response = await self.client.post(
+                    f"{self.storage_service_url}/upload",
+                    files=files,
+                    timeout=max(settings.ipfs_upload_timeout, 30 * waves)
+                )
+                response.raise_for_status()
+                entries = response.json().get("cids", [])
+                if len(entries) != len(files):
+                    raise ValueError(f"Expected {len(files)} CIDs from the storage service, got {len(entries)}")
+            except Exception as e:
+                logger.error(f"Failed to upload {len(files)} metadata documents to IPFS: {str(e)}")
+                entries = [{"cid": None, "error": str(e)}] * len(files)
             
+            results = []
+            for index, entry in zip(indexes, entries):
+                # A null entry means the storage service never got to that file
+                entry = entry or {"error": "No upload result from the storage service"}
+                cid = self._extract_cid(entry)
+                if cid:
+                    await self._cache_content(cid, payloads[index])
+                    result = {"asset_id": asset_ids[index], "cid": cid, "status": "completed", "error": None}
+                else:
+                    error = entry.get("error") or f"Unable to extract CID from response entry: {entry}"
+                    result = {"asset_id": asset_ids[index], "cid": None, "status": "error", "error": error}
+                
+                if progress_callback:
+                    progress_callback(
+                        result["asset_id"],
+                        100 if result["status"] == "completed" else 0,
+                        result["status"]
+                    )
+                results.append(result)
             return results
-            
-        except Exception as e:
-            logger.error(f"Error in concurrent batch IPFS upload: {str(e)}")
-            raise
+
+        groups = await asyncio.gather(*[
+            upload_group(start) for start in range(0, len(payloads), files_per_request)
+        ])
+        results = [result for group in groups for result in group]
+        
+        successful_count = sum(1 for r in results if r["status"] == "completed")
+        logger.info(
+            f"Batch IPFS upload completed: {successful_count}/{len(assets_metadata)} successful "
+            f"in {len(groups)} request(s)"
+        )
+        return results
+
+
+# Shared HTTP client, created on first use and closed by the application lifespan
+_http_client: Optional[httpx.AsyncClient] = None
+_http2_enabled = False
+_request_count = 0
+
+# Keep idle connections for less than Node's default 5s keep-alive timeout so
+# the pool never reuses a socket the storage service is about to close
+KEEPALIVE_EXPIRY = 4.0
+
+def _http2_available() -> bool:
+    """Check whether the optional h2 package needed for HTTP/2 is installed."""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+async def _count_request(request: httpx.Request) -> None:
+    global _request_count
+    _request_count += 1
+
+def get_ipfs_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide pooled HTTP client for the storage service and IPFS gateways.
+
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _http_client, _http2_enabled
+
+    if _http_client is None or _http_client.is_closed:
+        http2 = settings.ipfs_http2
+        if http2 and not _http2_available():
+            logger.warning("IPFS_HTTP2 is enabled but the h2 package is not installed; using HTTP/1.1")
+            http2 = False
+
+        _http_client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.ipfs_http_pool_size,
+                max_keepalive_connections=settings.ipfs_http_pool_size,
+                keepalive_expiry=KEEPALIVE_EXPIRY
+            ),
+            timeout=settings.ipfs_retrieve_timeout,
+            event_hooks={"request": [_count_request]}
+        )
+        _http2_enabled = http2
+        logger.info(
+            f"IPFS HTTP client created (pool size: {settings.ipfs_http_pool_size}, http2: {http2})"
+        )
+
+    return _http_client
+
+def get_ipfs_pool_stats() -> Dict[str, Any]:
+    """
+    Get connection pool statistics for the shared IPFS HTTP client.
+
+    Returns:
+        Dict with pool size, open/active/idle connections, queued requests and saturation.
+        The connection figures are None when the installed httpcore doesn't expose its pool.
+    """
+    stats = {
+        "pool_size": settings.ipfs_http_pool_size,
+        "http2": _http2_enabled,
+        "requests": _request_count,
+        "connections": 0,
+        "active_connections": 0,
+        "idle_connections": 0,
+        "queued_requests": 0,
+        "saturation": 0.0
+    }
+
+    if _http_client is None or _http_client.is_closed:
+        return stats
+
+    # httpcore keeps its connections and pending requests on the transport's pool.
+    # These are private, so any change in their shape degrades the figures to None.
+    try:
+        pool = getattr(getattr(_http_client, "_transport", None), "_pool", None)
+        connections = list(pool.connections)
+        active = sum(1 for connection in connections if not connection.is_idle())
+        queued = sum(1 for request in getattr(pool, "_requests", []) if request.is_queued())
+    except Exception as e:
+        logger.debug(f"IPFS connection pool stats unavailable: {str(e)}")
+        stats.update({
+            "connections": None,
+            "active_connections": None,
+            "idle_connections": None,
+            "queued_requests": None,
+            "saturation": None
+        })
+        return stats
+
+    stats.update({
+        "connections": len(connections),
+        "active_connections": active,
+        "idle_connections": len(connections) - active,
+        "queued_requests": queued,
+        "saturation": round(active / settings.ipfs_http_pool_size, 2) if settings.ipfs_http_pool_size else 0.0
+    })
+    return stats
+
+async def close_ipfs_http_client() -> None:
+    """Close the shared IPFS HTTP client if one was created."""
+    global _http_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
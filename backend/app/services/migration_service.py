@@ -0,0 +1,319 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from pymongo import ASCENDING, UpdateOne
+
+from app.config import settings
+from app.repositories.asset_repo import AssetRepository, creation_time
+from app.repositories.migration_repo import MigrationRepository
+from app.repositories.transaction_repo import TransactionRepository
+
+logger = logging.getLogger(__name__)
+
+# Migration names, as stored in the migrations collection
+ASSET_WALLET_ADDRESS_MIGRATION = "assets_wallet_address_lower"
+TRANSACTION_WALLET_ADDRESS_MIGRATION = "transactions_wallet_address_lower"
+ASSET_CREATED_AT_MIGRATION = "assets_created_at"
+ASSET_DOCUMENT_HISTORY_MIGRATION = "assets_document_history"
+
+
+class Backfill:
+    """
+    An online migration of one collection.
+
+    Documents are visited in _id order, so progress is a single _id that
+    survives restarts. Writes made while the backfill runs must already produce
+    migrated documents; the backfill only has to convert what came before it.
+    """
+
+    name: str = ""
+    collection_attr: str = ""
+    projection: Optional[Dict[str, Any]] = None
+
+    def update_for(self, document: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get the update migrating one document.
+
+        Args:
+            document: The document, limited to the projection
+
+        Returns:
+            Update operations, or None if the document is already migrated
+        """
+        raise NotImplementedError
+
+    async def operations(self, collection, documents: List[Dict[str, Any]]) -> List[UpdateOne]:
+        """
+        Get the writes migrating a batch of documents.
+
+        Args:
+            collection: The collection being migrated
+            documents: The batch, limited to the projection
+
+        Returns:
+            One UpdateOne per document that needs migrating
+        """
+        operations = []
+        for document in documents:
+            update = self.update_for(document)
+            if update:
+                operations.append(UpdateOne({"_id": document["_id"]}, update))
+        return operations
+
+
+class LowercaseAddressBackfill(Backfill):
+    """Adds the lowercase copies of address fields that exact-match wallet lookups use."""
+
+    def __init__(self, name: str, collection_attr: str, address_fields: Dict[str, str]):
+        self.name = name
+        self.collection_attr = collection_attr
+        self.address_fields = address_fields
+        self.projection = {field: 1 for pair in address_fields.items() for field in pair}
+
+    def update_for(self, document: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        changes = {
+            lower_field: document[field].lower()
+            for field, lower_field in self.address_fields.items()
+            if isinstance(document.get(field), str) and document.get(lower_field) != document[field].lower()
+        }
+        return {"$set": changes} if changes else None
+
+
+class CreatedAtBackfill(Backfill):
+    """Copies each asset's creation time, taken from its first version, onto every version."""
+
+    name = ASSET_CREATED_AT_MIGRATION
+    collection_attr = "assets_collection"
+    projection = {"assetId": 1, "createdAt": 1, "lastUpdated": 1}
+
+    async def operations(self, collection, documents: List[Dict[str, Any]]) -> List[UpdateOne]:
+        pending = [document for document in documents if not document.get("createdAt")]
+        if not pending:
+            return []
+
+        # One lookup of the first versions for the whole batch
+        cursor = collection.find(
+            {"assetId": {"$in": list({document["assetId"] for document in pending})}, "versionNumber": 1},
+            {"assetId": 1, "createdAt": 1}
+        )
+        created_at_by_asset = {
+            first_version["assetId"]: creation_time(first_version)
+            for first_version in await cursor.to_list(length=None)
+        }
+
+        operations = []
+        for document in pending:
+            created_at = created_at_by_asset.get(document["assetId"]) or document.get("lastUpdated")
+            if created_at:
+                operations.append(UpdateOne({"_id": document["_id"]}, {"$set": {"createdAt": created_at}}))
+        return operations
+
+
+class DocumentHistoryBackfill(Backfill):
+    """
+    Strips documentHistory, which copied every earlier version's _id onto each new version.
+
+    Lineage is now derived from previousVersionId and versionNumber. Only _id is
+    projected so the arrays being removed are never read back.
+    """
+
+    name = ASSET_DOCUMENT_HISTORY_MIGRATION
+    collection_attr = "assets_collection"
+    projection = {"_id": 1}
+
+    async def operations(self, collection, documents: List[Dict[str, Any]]) -> List[UpdateOne]:
+        return [
+            UpdateOne({"_id": document["_id"], "documentHistory": {"$exists": True}}, {"$unset": {"documentHistory": ""}})
+            for document in documents
+        ]
+
+
+def default_backfills() -> List[Backfill]:
+    """Get the backfills run at startup, in order."""
+    return [
+        LowercaseAddressBackfill(ASSET_WALLET_ADDRESS_MIGRATION, "assets_collection", AssetRepository.ADDRESS_FIELDS),
+        LowercaseAddressBackfill(
+            TRANSACTION_WALLET_ADDRESS_MIGRATION, "transaction_collection", TransactionRepository.ADDRESS_FIELDS
+        ),
+        CreatedAtBackfill(),
+        DocumentHistoryBackfill()
+    ]
+
+
+class MigrationService:
+    """
+    Runs backfills in the background while the API keeps serving.
+
+    Each backfill works through its collection in batches of batch_size,
+    pausing between batches so it doesn't crowd out request traffic, and
+    checkpoints the last _id after every batch. A restart resumes from the
+    checkpoint. Once a backfill finishes, is_complete() turns true and callers
+    switch to queries that rely on the migrated fields.
+    """
+
+    def __init__(
+        self,
+        db_client,
+        backfills: Optional[List[Backfill]] = None,
+        batch_size: Optional[int] = None,
+        batch_pause: Optional[float] = None
+    ):
+        """
+        Initialize with the database and the backfills to run.
+
+        Args:
+            db_client: The MongoDB client with initialized collections
+            backfills: Backfills to run, in order (default: default_backfills())
+            batch_size: Documents per batch
+            batch_pause: Seconds to wait between batches
+        """
+        self.db_client = db_client
+        self.migration_repo = MigrationRepository(db_client)
+        self.backfills = default_backfills() if backfills is None else backfills
+        self.batch_size = batch_size or settings.migration_batch_size
+        self.batch_pause = settings.migration_batch_pause if batch_pause is None else batch_pause
+        self.completed = set()
+        self.progress: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Load finished migrations and run the rest in the background."""
+        for backfill in self.backfills:
+            state = await self.migration_repo.get_state(backfill.name)
+            if state and state.get("completed"):
+                self.completed.add(backfill.name)
+        if self._task is None and len(self.completed) < len(self.backfills):
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop the running backfill; it resumes from its checkpoint on the next start."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def is_complete(self, name: str) -> bool:
+        """Whether a migration has processed every document."""
+        return name in self.completed
+
+    async def run(self) -> None:
+        """Run every unfinished backfill in order."""
+        for backfill in self.backfills:
+            if backfill.name in self.completed:
+                continue
+            try:
+                await self.run_backfill(backfill)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Later backfills may depend on earlier ones, so stop here and retry on the next start
+                logger.error(f"Migration {backfill.name} failed: {str(e)}")
+                return
+
+    async def run_backfill(self, backfill: Backfill) -> None:
+        """
+        Run one backfill from its checkpoint to the end of the collection.
+
+        Args:
+            backfill: The backfill to run
+        """
+        collection = getattr(self.db_client, backfill.collection_attr)
+        state = await self.migration_repo.get_state(backfill.name) or {}
+        last_id = state.get("lastId")
+        progress = self.progress[backfill.name] = {
+            "processed": state.get("processed", 0),
+            "modified": state.get("modified", 0)
+        }
+        logger.info(f"Running migration {backfill.name} from {last_id or 'the start'}")
+
+        while True:
+            query = {"_id": {"$gt": last_id}} if last_id is not None else {}
+            cursor = collection.find(query, backfill.projection).sort("_id", ASCENDING).limit(self.batch_size)
+            documents = await cursor.to_list(length=self.batch_size)
+            if not documents:
+                break
+
+            operations = await backfill.operations(collection, documents)
+            if operations:
+                result = await collection.bulk_write(operations, ordered=False)
+                progress["modified"] += result.modified_count
+
+            last_id = documents[-1]["_id"]
+            progress["processed"] += len(documents)
+            await self.migration_repo.save_progress(backfill.name, last_id, progress["processed"], progress["modified"])
+            await asyncio.sleep(self.batch_pause)
+
+        await self.migration_repo.mark_completed(backfill.name)
+        self.completed.add(backfill.name)
+        logger.info(
+            f"Migration {backfill.name} completed: {progress['processed']} documents, {progress['modified']} modified"
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get migration statistics.
+
+        Returns:
+            Dict with each backfill's completion and progress
+        """
+        return {
+            backfill.name: {
+                "completed": backfill.name in self.completed,
+                **self.progress.get(backfill.name, {})
+            }
+            for backfill in self.backfills
+        }
+
+
+# Shared instance, created by the application lifespan when migrations are enabled
+_migration_service: Optional[MigrationService] = None
+
+def get_migration_service() -> Optional[MigrationService]:
+    """
+    Get the shared migration service, if one was started.
+
+    Returns:
+        The MigrationService or None
+    """
+    return _migration_service
+
+def is_migration_complete(name: str) -> bool:
+    """
+    Whether a migration has finished, so queries may rely on the fields it adds.
+
+    Args:
+        name: Migration name
+
+    Returns:
+        False until the shared migration service has seen the migration complete
+    """
+    return _migration_service is not None and _migration_service.is_complete(name)
+
+async def start_migrations(db_client) -> MigrationService:
+    """
+    Create and start the shared migration service.
+
+    Args:
+        db_client: The MongoDB client
+
+    Returns:
+        The started MigrationService
+    """
+    global _migration_service
+
+    if _migration_service is None:
+        _migration_service = MigrationService(db_client)
+        await _migration_service.start()
+    return _migration_service
+
+async def close_migrations() -> None:
+    """Stop the shared migration service if one was started."""
+    global _migration_service
+
+    if _migration_service is not None:
+        await _migration_service.stop()
+        _migration_service = None
@@ -0,0 +1,302 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from web3 import Web3
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+TxHash = Union[str, bytes]
+
+# Further behind than this, pending hashes are looked up directly instead of scanning every block
+MAX_BLOCKS_PER_SCAN = 20
+
+
+def normalize_tx_hash(tx_hash: TxHash) -> str:
+    """Format a transaction hash as lowercase 0x-prefixed hex."""
+    if isinstance(tx_hash, (bytes, bytearray)):
+        return Web3.to_hex(tx_hash)
+    tx_hash = tx_hash.lower()
+    return tx_hash if tx_hash.startswith("0x") else f"0x{tx_hash}"
+
+
+class ReceiptWatcherService:
+    """
+    One background watcher for all transaction receipts the process is waiting on.
+
+    Each watched hash is looked up directly once when it is first registered.
+    After that the watcher reads each new block once, matches its transaction
+    hashes against everything pending and fetches the matching receipts in
+    bulk. Callers waiting on the same hash share one future, so RPC load grows
+    with the block rate rather than with the number of waiters.
+    """
+
+    def __init__(
+        self,
+        blockchain_service,
+        poll_interval: Optional[float] = None,
+        watch_ttl: Optional[float] = None,
+        max_resolved: int = 1024
+    ):
+        """
+        Initialize with the blockchain service used for RPC calls.
+
+        Args:
+            blockchain_service: Service whose web3 instance and _call are used
+            poll_interval: Seconds between head checks while hashes are pending
+            watch_ttl: Seconds a hash nobody is waiting on stays watched
+            max_resolved: Number of recent receipts kept for repeated lookups
+        """
+        self.blockchain_service = blockchain_service
+        self.poll_interval = poll_interval or settings.blockchain_receipt_poll_interval
+        self.watch_ttl = watch_ttl or settings.blockchain_receipt_watch_ttl
+        self.max_resolved = max_resolved
+
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._unchecked: set = set()
+        self._resolved: "OrderedDict[str, Any]" = OrderedDict()
+        self._last_block: Optional[int] = None
+        self._block_receipts_supported = True
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {
+            "watched": 0,
+            "resolved": 0,
+            "expired": 0,
+            "blocks_scanned": 0,
+            "direct_lookups": 0,
+            "block_receipt_calls": 0
+        }
+
+    async def stop(self) -> None:
+        """Stop the watcher loop. Pending waiters keep waiting until their own timeout."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._wakeup.set()
+
+    def watch(self, tx_hash: TxHash, ttl: Optional[float] = None) -> "asyncio.Future":
+        """
+        Start watching a transaction hash.
+
+        Args:
+            tx_hash: The transaction hash
+            ttl: Seconds to keep watching without a waiter; defaults to watch_ttl
+
+        Returns:
+            Future resolved with the receipt once the transaction is mined
+        """
+        key = normalize_tx_hash(tx_hash)
+        expires_at = time.monotonic() + (ttl or self.watch_ttl)
+
+        entry = self._pending.get(key)
+        if entry is None:
+            future = asyncio.get_running_loop().create_future()
+            if key in self._resolved:
+                future.set_result(self._resolved[key])
+                return future
+            entry = self._pending[key] = {"future": future, "expires_at": expires_at}
+            self._unchecked.add(key)
+            self.stats["watched"] += 1
+            self._ensure_running()
+        else:
+            entry["expires_at"] = max(entry["expires_at"], expires_at)
+
+        return entry["future"]
+
+    async def wait_for_receipt(self, tx_hash: TxHash, timeout: float) -> Any:
+        """
+        Wait for a transaction to be mined.
+
+        Args:
+            tx_hash: The transaction hash
+            timeout: Seconds to wait
+
+        Returns:
+            The transaction receipt
+
+        Raises:
+            TimeExhausted: If the transaction is not mined within the timeout
+        """
+        return await self.wait_for_any([tx_hash], timeout)
+
+    async def wait_for_any(self, tx_hashes: Sequence[TxHash], timeout: float) -> Any:
+        """
+        Wait until one of several transactions is mined, e.g. a transaction and its replacements.
+
+        Args:
+            tx_hashes: The transaction hashes
+            timeout: Seconds to wait
+
+        Returns:
+            The receipt of the first transaction mined
+
+        Raises:
+            TimeExhausted: If none is mined within the timeout
+        """
+        futures = [self.watch(tx_hash, ttl=timeout + self.poll_interval) for tx_hash in tx_hashes]
+        # Shield the shared futures so one waiter timing out doesn't cancel them for the others
+        done, _ = await asyncio.wait(
+            [asyncio.shield(future) for future in futures],
+            timeout=timeout,
+            return_when=asyncio.FIRST_COMPLETED
+        )
+        for future in done:
+            if not future.cancelled():
+                return future.result()
+
+        raise TimeExhausted(
+            f"Transaction {normalize_tx_hash(tx_hashes[-1])} is not in the chain after {timeout} seconds"
+        )
+
+    async def get_receipt(self, tx_hash: TxHash) -> Optional[Any]:
+        """
+        Get a receipt without waiting, for status polling.
+
+        A hash already being watched costs no RPC call; an unknown hash is looked
+        up once and then watched, so later polls are answered from the watcher.
+
+        Args:
+            tx_hash: The transaction hash
+
+        Returns:
+            The receipt, or None if the transaction is not mined yet
+        """
+        key = normalize_tx_hash(tx_hash)
+        if key in self._resolved:
+            self._resolved.move_to_end(key)
+            return self._resolved[key]
+
+        already_watched = key in self._pending and key not in self._unchecked
+        future = self.watch(key)
+        if already_watched:
+            return future.result() if future.done() else None
+
+        receipt = await self._lookup(key)
+        if receipt is not None:
+            self._resolve(key, receipt)
+        else:
+            self._unchecked.discard(key)
+        return receipt
+
+    async def _run(self) -> None:
+        while True:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            try:
+                await self._poll()
+            except Exception as e:
+                logger.error(f"Receipt watcher poll failed: {str(e)}")
+            await asyncio.sleep(self.poll_interval)
+
+    async def _poll(self) -> None:
+        """Check newly registered hashes directly, then scan blocks mined since the last poll."""
+        self._expire()
+        head = await self.blockchain_service._call(lambda: self.blockchain_service.web3.eth.block_number)
+
+        if self._last_block is None or head - self._last_block > MAX_BLOCKS_PER_SCAN:
+            # First poll or too far behind: every pending hash is checked directly instead
+            self._unchecked.update(self._pending)
+            self._last_block = head
+
+        unchecked, self._unchecked = list(self._unchecked), set()
+        if unchecked:
+            await self._lookup_all(unchecked)
+
+        for block_number in range(self._last_block + 1, head + 1):
+            if not self._pending:
+                break
+            await self._scan_block(block_number)
+        self._last_block = head
+
+    async def _scan_block(self, block_number: int) -> None:
+        """Resolve every pending hash included in a block."""
+        block = await self.blockchain_service._call(self.blockchain_service.web3.eth.get_block, block_number)
+        self.stats["blocks_scanned"] += 1
+
+        matched = {normalize_tx_hash(tx_hash) for tx_hash in block["transactions"]} & self._pending.keys()
+        if not matched:
+            return
+
+        if self._block_receipts_supported and len(matched) > 1:
+            try:
+                receipts = await self.blockchain_service._call(
+                    self.blockchain_service.web3.eth.get_block_receipts, block_number
+                )
+                self.stats["block_receipt_calls"] += 1
+                for receipt in receipts:
+                    key = normalize_tx_hash(receipt["transactionHash"])
+                    if key in matched:
+                        self._resolve(key, receipt)
+                return
+            except Exception as e:
+                # Not every provider implements eth_getBlockReceipts
+                logger.info(f"eth_getBlockReceipts unavailable, fetching receipts individually: {str(e)}")
+                self._block_receipts_supported = False
+
+        await self._lookup_all(list(matched))
+
+    async def _lookup_all(self, keys: List[str]) -> None:
+        receipts = await asyncio.gather(*(self._lookup(key) for key in keys), return_exceptions=True)
+        for key, receipt in zip(keys, receipts):
+            if isinstance(receipt, Exception):
+                logger.warning(f"Receipt lookup for {key} failed: {str(receipt)}")
+                self._unchecked.add(key)
+            elif receipt is not None:
+                self._resolve(key, receipt)
+
+    async def _lookup(self, key: str) -> Optional[Any]:
+        self.stats["direct_lookups"] += 1
+        try:
+            return await self.blockchain_service._call(self.blockchain_service.web3.eth.get_transaction_receipt, key)
+        except TransactionNotFound:
+            return None
+
+    def _resolve(self, key: str, receipt: Any) -> None:
+        entry = self._pending.pop(key, None)
+        self._unchecked.discard(key)
+        if entry is not None and not entry["future"].done():
+            entry["future"].set_result(receipt)
+            self.stats["resolved"] += 1
+
+        self._resolved[key] = receipt
+        self._resolved.move_to_end(key)
+        while len(self._resolved) > self.max_resolved:
+            self._resolved.popitem(last=False)
+
+    def _expire(self) -> None:
+        """Stop watching hashes whose waiters have all given up."""
+        now = time.monotonic()
+        for key in [key for key, entry in self._pending.items() if entry["expires_at"] < now]:
+            entry = self._pending.pop(key)
+            self._unchecked.discard(key)
+            entry["future"].cancel()
+            self.stats["expired"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get watcher statistics.
+
+        Returns:
+            Dict with pending count, last scanned block and lookup counters
+        """
+        return {
+            **self.stats,
+            "pending": len(self._pending),
+            "last_block": self._last_block,
+            "block_receipts_supported": self._block_receipts_supported
+        }
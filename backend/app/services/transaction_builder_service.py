@@ -1,16 +1,36 @@
-from typing import Dict, Any, Optional
-from web3 import Web3
+from typing import Dict, Any, Optional, Union
+from web3 import Web3, AsyncWeb3
 from eth_utils import to_checksum_address
 import logging
 
+from app.utilities.web3_utils import run_web3_call
+
 logger = logging.getLogger(__name__)
 
 class TransactionBuilderService:
     """Service for building unsigned blockchain transactions."""
     
-    def __init__(self, web3: Web3, contract):
+    def __init__(self, web3: Union[Web3, AsyncWeb3], contract, fee_oracle=None):
         self.web3 = web3
         self.contract = contract
+        # FeeOracleService; without one, fees and the chain ID are read from the provider per build
+        self.fee_oracle = fee_oracle
+
+    async def _call(self, fn, *args, **kwargs):
+        """Run a web3 call on the configured backend without blocking the event loop."""
+        return await run_web3_call(self.web3, fn, *args, **kwargs)
+
+    async def _get_gas_price(self, urgency: Optional[str] = None) -> int:
+        """Get the suggested legacy gas price from the fee oracle, or the provider without one."""
+        if self.fee_oracle is not None:
+            return await self.fee_oracle.get_gas_price(urgency)
+        return await self._call(lambda: self.web3.eth.gas_price)
+
+    async def _get_chain_id(self) -> int:
+        """Get the chain ID cached by the fee oracle, or from the provider without one."""
+        if self.fee_oracle is not None:
+            return await self.fee_oracle.get_chain_id()
+        return await self._call(lambda: self.web3.eth.chain_id)
     
     async def build_update_ipfs_transaction(
         self,
@@ -33,19 +53,19 @@ class TransactionBuilderService:
         """
         try:
             from_address = to_checksum_address(from_address)
-            nonce = self.web3.eth.get_transaction_count(from_address)
-            gas_price = self.web3.eth.gas_price
+            nonce = await self._call(self.web3.eth.get_transaction_count, from_address)
+            gas_price = await self._get_gas_price()
             
             # Build transaction
-            tx = self.contract.functions.updateIPFS(
+            tx = await self._call(self.contract.functions.updateIPFS(
                 asset_id,
                 cid
-            ).build_transaction({
+            ).build_transaction, {
                 'from': from_address,
                 'nonce': nonce,
                 'gasPrice': gas_price,
                 'gas': gas_limit or 2000000,
-                'chainId': self.web3.eth.chain_id
+                'chainId': await self._get_chain_id()
             })
             
             # Remove fields that will be added during signing
@@ -93,20 +113,20 @@ class TransactionBuilderService:
         try:
             from_address = to_checksum_address(from_address)
             owner_address = to_checksum_address(owner_address)
-            nonce = self.web3.eth.get_transaction_count(from_address)
-            gas_price = self.web3.eth.gas_price
+            nonce = await self._call(self.web3.eth.get_transaction_count, from_address)
+            gas_price = await self._get_gas_price()
             
             # Build transaction
-            tx = self.contract.functions.updateIPFSFor(
+            tx = await self._call(self.contract.functions.updateIPFSFor(
                 owner_address,
                 asset_id,
                 cid
-            ).build_transaction({
+            ).build_transaction, {
                 'from': from_address,
                 'nonce': nonce,
                 'gasPrice': gas_price,
                 'gas': gas_limit or 2000000,
-                'chainId': self.web3.eth.chain_id
+                'chainId': await self._get_chain_id()
             })
             
             # Remove fields that will be added during signing
@@ -149,16 +169,16 @@ class TransactionBuilderService:
         """
         try:
             from_address = to_checksum_address(from_address)
-            nonce = self.web3.eth.get_transaction_count(from_address)
-            gas_price = self.web3.eth.gas_price
+            nonce = await self._call(self.web3.eth.get_transaction_count, from_address)
+            gas_price = await self._get_gas_price()
             
             # Build transaction
-            tx = self.contract.functions.deleteAsset(asset_id).build_transaction({
+            tx = await self._call(self.contract.functions.deleteAsset(asset_id).build_transaction, {
                 'from': from_address,
                 'nonce': nonce,
                 'gasPrice': gas_price,
                 'gas': gas_limit or 2000000,
-                'chainId': self.web3.eth.chain_id
+                'chainId': await self._get_chain_id()
             })
             
             # Remove fields that will be added during signing
@@ -204,19 +224,19 @@ class TransactionBuilderService:
         try:
             from_address = to_checksum_address(from_address)
             owner_address = to_checksum_address(owner_address)
-            nonce = self.web3.eth.get_transaction_count(from_address)
-            gas_price = self.web3.eth.gas_price
+            nonce = await self._call(self.web3.eth.get_transaction_count, from_address)
+            gas_price = await self._get_gas_price()
             
             # Build transaction
-            tx = self.contract.functions.deleteAssetFor(
+            tx = await self._call(self.contract.functions.deleteAssetFor(
                 owner_address,
                 asset_id
-            ).build_transaction({
+            ).build_transaction, {
                 'from': from_address,
                 'nonce': nonce,
                 'gasPrice': gas_price,
                 'gas': gas_limit or 2000000,
-                'chainId': self.web3.eth.chain_id
+                'chainId': await self._get_chain_id()
             })
             
             # Remove fields that will be added during signing
@@ -244,6 +264,7 @@ class TransactionBuilderService:
         self,
         function_name: str,
         from_address: str,
+        urgency: Optional[str] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -252,6 +273,7 @@ class TransactionBuilderService:
         Args:
             function_name: Name of the contract function
             from_address: The wallet address that will sign the transaction
+            urgency: Fee oracle urgency level; defaults to the oracle's default
             **kwargs: Function-specific arguments
             
         Returns:
@@ -261,30 +283,30 @@ class TransactionBuilderService:
             from_address = to_checksum_address(from_address)
             
             if function_name == "updateIPFS":
-                gas_estimate = self.contract.functions.updateIPFS(
+                gas_estimate = await self._call(self.contract.functions.updateIPFS(
                     kwargs['asset_id'],
                     kwargs['cid']
-                ).estimate_gas({'from': from_address})
+                ).estimate_gas, {'from': from_address})
                 
             elif function_name == "updateIPFSFor":
                 owner_address = to_checksum_address(kwargs['owner_address'])
-                gas_estimate = self.contract.functions.updateIPFSFor(
+                gas_estimate = await self._call(self.contract.functions.updateIPFSFor(
                     owner_address,
                     kwargs['asset_id'],
                     kwargs['cid']
-                ).estimate_gas({'from': from_address})
+                ).estimate_gas, {'from': from_address})
                 
             elif function_name == "deleteAsset":
-                gas_estimate = self.contract.functions.deleteAsset(
+                gas_estimate = await self._call(self.contract.functions.deleteAsset(
                     kwargs['asset_id']
-                ).estimate_gas({'from': from_address})
+                ).estimate_gas, {'from': from_address})
                 
             elif function_name == "deleteAssetFor":
                 owner_address = to_checksum_address(kwargs['owner_address'])
-                gas_estimate = self.contract.functions.deleteAssetFor(
+                gas_estimate = await self._call(self.contract.functions.deleteAssetFor(
                     owner_address,
                     kwargs['asset_id']
-                ).estimate_gas({'from': from_address})
+                ).estimate_gas, {'from': from_address})
                 
             elif function_name == "batchDeleteAssets":
                 asset_ids = kwargs['asset_ids']
@@ -292,9 +314,9 @@ class TransactionBuilderService:
                     raise ValueError("Must provide at least one asset ID")
                 if len(asset_ids) > 50:
                     raise ValueError("Batch size cannot exceed 50 assets")
-                gas_estimate = self.contract.functions.batchDeleteAssets(
+                gas_estimate = await self._call(self.contract.functions.batchDeleteAssets(
                     asset_ids
-                ).estimate_gas({'from': from_address})
+                ).estimate_gas, {'from': from_address})
                 
             elif function_name == "batchDeleteAssetsFor":
                 owner_address = to_checksum_address(kwargs['owner_address'])
@@ -303,15 +325,19 @@ class TransactionBuilderService:
                     raise ValueError("Must provide at least one asset ID")
                 if len(asset_ids) > 50:
                     raise ValueError("Batch size cannot exceed 50 assets")
-                gas_estimate = self.contract.functions.batchDeleteAssetsFor(
+                gas_estimate = await self._call(self.contract.functions.batchDeleteAssetsFor(
                     owner_address,
                     asset_ids
-                ).estimate_gas({'from': from_address})
+                ).estimate_gas, {'from': from_address})
                 
             else:
                 raise ValueError(f"Unknown function: {function_name}")
             
-            gas_price = self.web3.eth.gas_price
+            if self.fee_oracle is not None:
+                fees = await self.fee_oracle.get_fees(urgency)
+            else:
+                fees = {"gas_price": await self._get_gas_price()}
+            gas_price = fees["gas_price"]
             estimated_cost = gas_estimate * gas_price
             
             logger.info(f"Gas estimation for {function_name}: {gas_estimate} gas")
@@ -320,6 +346,10 @@ class TransactionBuilderService:
                 "success": True,
                 "gas_estimate": gas_estimate,
                 "gas_price": gas_price,
+                "max_fee_per_gas": fees.get("max_fee_per_gas"),
+                "max_priority_fee_per_gas": fees.get("max_priority_fee_per_gas"),
+                "base_fee_per_gas": fees.get("base_fee_per_gas"),
+                "urgency": fees.get("urgency"),
                 "estimated_cost_wei": estimated_cost,
                 "estimated_cost_eth": self.web3.from_wei(estimated_cost, 'ether'),
                 "function_name": function_name
@@ -362,7 +392,7 @@ class TransactionBuilderService:
             # Estimate gas if not provided
             if not gas_limit:
                 try:
-                    gas_limit = function.estimate_gas({'from': from_address})
+                    gas_limit = await self._call(function.estimate_gas, {'from': from_address})
                     # Add 10% buffer
                     gas_limit = int(gas_limit * 1.1)
                 except Exception as e:
@@ -370,17 +400,17 @@ class TransactionBuilderService:
                     gas_limit = 150000
             
             # Get current gas price
-            gas_price = self.web3.eth.gas_price
+            gas_price = await self._get_gas_price()
             
             # Build transaction
-            nonce = self.web3.eth.get_transaction_count(from_address)
+            nonce = await self._call(self.web3.eth.get_transaction_count, from_address)
             
-            transaction = function.build_transaction({
+            transaction = await self._call(function.build_transaction, {
                 'from': from_address,
                 'nonce': nonce,
                 'gas': gas_limit,
                 'gasPrice': gas_price,
-                'chainId': self.web3.eth.chain_id
+                'chainId': await self._get_chain_id()
             })
             
             # Remove 'from' field as it's not needed for signing
@@ -431,8 +461,8 @@ class TransactionBuilderService:
                 raise ValueError("Batch size cannot exceed 50 assets")
             
             from_address = to_checksum_address(from_address)
-            nonce = self.web3.eth.get_transaction_count(from_address)
-            gas_price = self.web3.eth.gas_price
+            nonce = await self._call(self.web3.eth.get_transaction_count, from_address)
+            gas_price = await self._get_gas_price()
             
             # Build transaction
             contract_function = self.contract.functions.batchDeleteAssets(asset_ids)
@@ -440,7 +470,7 @@ class TransactionBuilderService:
             # Estimate gas if not provided
             if not gas_limit:
                 try:
-                    gas_limit = contract_function.estimate_gas({
+                    gas_limit = await self._call(contract_function.estimate_gas, {
                         'from': from_address,
                         'gasPrice': gas_price
                     })
@@ -450,12 +480,12 @@ class TransactionBuilderService:
                     logger.warning(f"Gas estimation failed, using default: {e}")
                     gas_limit = 2000000
             
-            tx = contract_function.build_transaction({
+            tx = await self._call(contract_function.build_transaction, {
                 'from': from_address,
                 'nonce': nonce,
                 'gasPrice': gas_price,
                 'gas': gas_limit,
-                'chainId': self.web3.eth.chain_id
+                'chainId': await self._get_chain_id()
             })
             
             # Remove fields that will be added during signing
@@ -508,8 +538,8 @@ class TransactionBuilderService:
             
             from_address = to_checksum_address(from_address)
             owner_address = to_checksum_address(owner_address)
-            nonce = self.web3.eth.get_transaction_count(from_address)
-            gas_price = self.web3.eth.gas_price
+            nonce = await self._call(self.web3.eth.get_transaction_count, from_address)
+            gas_price = await self._get_gas_price()
             
             # Build transaction
             contract_function = self.contract.functions.batchDeleteAssetsFor(
@@ -520,7 +550,7 @@ class TransactionBuilderService:
             # Estimate gas if not provided
             if not gas_limit:
                 try:
-                    gas_limit = contract_function.estimate_gas({
+                    gas_limit = await self._call(contract_function.estimate_gas, {
                         'from': from_address,
                         'gasPrice': gas_price
                     })
@@ -530,12 +560,12 @@ class TransactionBuilderService:
                     logger.warning(f"Gas estimation failed, using default: {e}")
                     gas_limit = 2000000
             
-            tx = contract_function.build_transaction({
+            tx = await self._call(contract_function.build_transaction, {
                 'from': from_address,
                 'nonce': nonce,
                 'gasPrice': gas_price,
                 'gas': gas_limit,
-                'chainId': self.web3.eth.chain_id
+                'chainId': await self._get_chain_id()
             })
             
             # Remove fields that will be added during signing
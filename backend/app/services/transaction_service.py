@@ -3,6 +3,8 @@ from datetime import datetime, timezone
 import logging
 from fastapi import HTTPException
 from app.repositories.transaction_repo import TransactionRepository
+from app.services.migration_service import TRANSACTION_WALLET_ADDRESS_MIGRATION, is_migration_complete
+from app.utilities.pagination import clamp_limit
 from pymongo import DESCENDING
 from bson import ObjectId
 
@@ -26,6 +28,37 @@ class TransactionService:
         self.transaction_repository = transaction_repository
         self.asset_service = asset_service
 
+    def _wallet_query(self, wallet_address: str) -> Dict[str, Any]:
+        """
+        Build the filter matching transactions a wallet owns or performed, in any capitalization.
+        
+        Once every transaction carries the lowercase address fields this is an
+        exact match on two indexed fields; until then it falls back to
+        case-insensitive regexes.
+        
+        Args:
+            wallet_address: The wallet address
+            
+        Returns:
+            MongoDB filter on the owner and performer addresses
+        """
+        normalized_address = wallet_address.lower()
+        if is_migration_complete(TRANSACTION_WALLET_ADDRESS_MIGRATION):
+            return {
+                "$or": [
+                    {"walletAddressLower": normalized_address},
+                    {"performedByLower": normalized_address}
+                ]
+            }
+        return {
+            "$or": [
+                {"walletAddress": normalized_address},
+                {"walletAddress": {"$regex": f"^{normalized_address}$", "$options": "i"}},
+                {"performedBy": normalized_address},
+                {"performedBy": {"$regex": f"^{normalized_address}$", "$options": "i"}}
+            ]
+        }
+
     async def get_asset_history(
         self, 
         asset_id: str, 
@@ -90,14 +123,7 @@ class TransactionService:
             normalized_address = wallet_address.lower()
             
             # Build query with case insensitivity - include both owned assets and delegated actions
-            query = {
-                "$or": [
-                    {"walletAddress": normalized_address},
-                    {"walletAddress": {"$regex": f"^{normalized_address}$", "$options": "i"}},
-                    {"performedBy": normalized_address},
-                    {"performedBy": {"$regex": f"^{normalized_address}$", "$options": "i"}}
-                ]
-            }
+            query = self._wallet_query(normalized_address)
             
             # First get all current document IDs for this wallet if we're filtering versions
             current_asset_ids = []
@@ -143,6 +169,50 @@ class TransactionService:
             logger.error(f"Error retrieving wallet history: {str(e)}")
             raise
 
+    async def get_wallet_history_page(
+        self,
+        wallet_address: str,
+        include_all_versions: bool = False,
+        asset_service = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get one page of a wallet's transaction history, newest first.
+        By default, only includes transactions for current versions
+        unless include_all_versions is True.
+        
+        Args:
+            wallet_address: The wallet address to get history for
+            include_all_versions: Whether to include all versions or just current ones
+            asset_service: Optional asset service for retrieving current asset IDs
+            limit: Page size, capped at PAGINATION_MAX_LIMIT (default: PAGINATION_DEFAULT_LIMIT)
+            cursor: next_cursor from the previous page, or None for the first page
+            
+        Returns:
+            Dict with the formatted transactions and next_cursor (None on the last page)
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = self._wallet_query(wallet_address)
+        
+        if not include_all_versions and asset_service:
+            current_asset_ids = await asset_service.get_user_asset_ids(wallet_address)
+            if not current_asset_ids:
+                return {"transactions": [], "next_cursor": None}
+            query["assetId"] = {"$in": current_asset_ids}
+        
+        transactions, next_cursor = await self.transaction_repository.find_transactions_page(
+            query,
+            clamp_limit(limit),
+            cursor
+        )
+        return {
+            "transactions": self._format_transactions(transactions),
+            "next_cursor": next_cursor
+        }
+
     async def record_transaction(
         self, 
         asset_id: str, 
@@ -239,9 +309,11 @@ class TransactionService:
         """
         try:
             # Get all transactions for the wallet
-            transactions = await self.transaction_repository.find_transactions(
-                {"walletAddress": wallet_address}
-            )
+            if is_migration_complete(TRANSACTION_WALLET_ADDRESS_MIGRATION):
+                query = {"walletAddressLower": wallet_address.lower()}
+            else:
+                query = {"walletAddress": wallet_address}
+            transactions = await self.transaction_repository.find_transactions(query)
             
             # Initialize default values
             total_transactions = len(transactions)
@@ -326,6 +398,10 @@ class TransactionService:
             if '_id' in formatted_tx:
                 formatted_tx['id'] = formatted_tx.pop('_id')
                 
+            # The lowercase address copies only exist for indexed lookups
+            for lower_field in TransactionRepository.ADDRESS_FIELDS.values():
+                formatted_tx.pop(lower_field, None)
+                
             # Convert timestamp to ISO format if needed
             if 'timestamp' in formatted_tx and isinstance(formatted_tx['timestamp'], datetime):
                 formatted_tx['timestamp'] = formatted_tx['timestamp'].isoformat()
@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import os
+import re
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.config import settings
+from app.utilities.unixfs import CHUNK_SIZE, compute_file_cid
+
+logger = logging.getLogger(__name__)
+
+# Only base32 CIDv1 strings are used as disk file names
+_CID_PATTERN = re.compile(r"^b[a-z2-7]{20,}$")
+
+# Larger content is hashed in a worker thread to keep the event loop free
+_INLINE_VERIFY_BYTES = 256 * 1024
+
+
+class CIDCache:
+    """
+    Content cache for IPFS files, keyed by CID.
+
+    Content behind a CID never changes, so entries have no TTL. A bounded
+    in-memory LRU sits in front of an optional on-disk store. Content is
+    only accepted if it hashes to the CID it is stored under. Files over one
+    chunk can't be hashed locally, so they need a CID computed by the IPFS
+    Node service and are kept in memory only.
+    """
+
+    def __init__(self, max_bytes: int, cache_dir: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir or None
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self.stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "rejected": 0
+        }
+
+    async def get(self, cid: str) -> Optional[bytes]:
+        """
+        Get the content stored under a CID.
+
+        Args:
+            cid: Content identifier
+
+        Returns:
+            The content bytes, or None if the CID is not cached
+        """
+        content = self._entries.get(cid)
+        if content is not None:
+            self._entries.move_to_end(cid)
+            self.stats["memory_hits"] += 1
+            return content
+
+        if self.cache_dir and _CID_PATTERN.match(cid):
+            content = await asyncio.to_thread(self._read_disk, cid)
+            if content is not None:
+                self.stats["disk_hits"] += 1
+                self._remember(cid, content)
+                return content
+
+        self.stats["misses"] += 1
+        return None
+
+    async def put(self, cid: str, content: bytes, computed_cid: Optional[str] = None) -> bool:
+        """
+        Cache content under its CID after checking that it hashes to that CID.
+
+        Args:
+            cid: Content identifier the content was fetched or stored under
+            content: The file bytes
+            computed_cid: CID the IPFS Node service computed for content over one chunk
+
+        Returns:
+            True if the content was cached, False if it did not match the CID or could not be checked
+        """
+        if cid in self._entries:
+            return True
+
+        if len(content) > CHUNK_SIZE:
+            if computed_cid is None:
+                return False
+        elif len(content) > _INLINE_VERIFY_BYTES:
+            computed_cid = await asyncio.to_thread(compute_file_cid, content)
+        else:
+            computed_cid = compute_file_cid(content)
+
+        if computed_cid != cid:
+            self.stats["rejected"] += 1
+            logger.warning(f"Not caching content for CID {cid}: content does not hash to that CID")
+            return False
+
+        self._remember(cid, content)
+        # Disk reads re-check the hash locally, which only works for single-chunk files
+        if self.cache_dir and len(content) <= CHUNK_SIZE:
+            await asyncio.to_thread(self._write_disk, cid, content)
+        return True
+
+    def _remember(self, cid: str, content: bytes) -> None:
+        """Add verified content to the memory tier, evicting least recently used entries."""
+        if len(content) > self.max_bytes:
+            return
+
+        # Concurrent disk hits or puts for one CID all land here after their awaits
+        if cid in self._entries:
+            self._entries.move_to_end(cid)
+            return
+
+        self._entries[cid] = content
+        self._size += len(content)
+        while self._entries and self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+            self.stats["evictions"] += 1
+
+    def _disk_path(self, cid: str) -> str:
+        return os.path.join(self.cache_dir, cid[-2:], cid)
+
+    def _read_disk(self, cid: str) -> Optional[bytes]:
+        path = self._disk_path(cid)
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Error reading cached content for CID {cid}: {str(e)}")
+            return None
+
+        # Drop files that were corrupted on disk
+        if compute_file_cid(content) != cid:
+            logger.warning(f"Cached content for CID {cid} is corrupt, removing it")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+        return content
+
+    def _write_disk(self, cid: str, content: bytes) -> None:
+        path = self._disk_path(cid)
+        if os.path.exists(path):
+            return
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first so readers never see a partial file
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Error writing cached content for CID {cid}: {str(e)}")
+
+    def clear(self) -> None:
+        """Drop the memory tier. The disk store is left untouched."""
+        self._entries.clear()
+        self._size = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hit, miss, eviction and rejection counters and memory usage
+        """
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        lookups = hits + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_ratio": round(hits / lookups, 3) if lookups else None,
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "disk_enabled": bool(self.cache_dir)
+        }
+
+
+# Global instance shared by all IPFSService instances
+cid_cache = CIDCache(settings.ipfs_cache_max_bytes, settings.ipfs_cache_dir)
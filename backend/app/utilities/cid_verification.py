@@ -0,0 +1,57 @@
+from typing import Any, Dict, Optional
+
+from web3 import Web3
+
+
+def hash_cid(cid: str) -> str:
+    """
+    Hash a CID the way FuseVaultRegistry does: keccak256(abi.encodePacked(cid)).
+
+    Args:
+        cid: The CID string
+
+    Returns:
+        The hash as 0x-prefixed hex, comparable to getIPFSInfo's cid_hash
+    """
+    return "0x" + Web3.keccak(text=cid).hex().removeprefix("0x")
+
+
+def verify_cid_against_ipfs_info(
+    ipfs_info: Optional[Dict[str, Any]],
+    cid: str,
+    claimed_version: int
+) -> Dict[str, Any]:
+    """
+    Reproduce FuseVaultRegistry.verifyCID from a getIPFSInfo result.
+
+    Checks and messages follow the contract in the same order, so the outcome
+    matches verify_cid_on_chain without a second eth_call.
+
+    Args:
+        ipfs_info: get_ipfs_info's dict, or None if the asset does not exist
+        cid: The CID to verify
+        claimed_version: The version being claimed
+
+    Returns:
+        Dict with is_valid, message, actual_version and is_deleted as returned by
+        verify_cid_on_chain, plus the on-chain cid_hash
+    """
+    if ipfs_info is None or ipfs_info["ipfs_version"] == 0:
+        return {"is_valid": False, "message": "Asset does not exist", "actual_version": 0, "is_deleted": False, "cid_hash": None}
+
+    outcome = {
+        "actual_version": ipfs_info["ipfs_version"],
+        "is_deleted": ipfs_info["is_deleted"],
+        "cid_hash": ipfs_info["cid_hash"]
+    }
+    if ipfs_info["is_deleted"]:
+        return {**outcome, "is_valid": False, "message": "Asset is deleted"}
+    if claimed_version != ipfs_info["ipfs_version"]:
+        return {
+            **outcome,
+            "is_valid": False,
+            "message": "IPFS version mismatch - MongoDB record references outdated version"
+        }
+    if cid is None or hash_cid(cid) != ipfs_info["cid_hash"]:
+        return {**outcome, "is_valid": False, "message": "CID mismatch - Content does not match what's on blockchain"}
+    return {**outcome, "is_valid": True, "message": "Valid CID matches blockchain record"}
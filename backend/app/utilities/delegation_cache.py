@@ -0,0 +1,164 @@
+import functools
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import settings
+
+# Per-request memo of delegation results, set by memoize_delegation_checks
+_request_memo: ContextVar[Optional[Dict[Tuple[str, str], bool]]] = ContextVar("delegation_memo", default=None)
+
+
+def _key(owner_address: str, delegate_address: str) -> Tuple[str, str]:
+    return owner_address.lower(), delegate_address.lower()
+
+
+class DelegationCache:
+    """
+    Short-lived cache of on-chain delegates(owner, delegate) results.
+
+    Approvals and refusals are cached with separate TTLs so a freshly granted
+    delegation is picked up quickly. Entries are invalidated as soon as a
+    DelegateStatusChanged event or a confirmed setDelegate transaction is seen.
+    Inside memoize_delegation_checks, results are also kept for the rest of the
+    call regardless of TTL, so a CSV or batch checks each pair only once.
+    """
+
+    def __init__(self, ttl: float, negative_ttl: float, max_entries: int = 10000):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[bool, float]]" = OrderedDict()
+        # Bumped on every invalidation so lookups that started before it are not cached
+        self._generation = 0
+        self.stats = {
+            "memo_hits": 0,
+            "hits": 0,
+            "misses": 0,
+            "invalidations": 0
+        }
+
+    def get(self, owner_address: str, delegate_address: str) -> Optional[bool]:
+        """
+        Get a cached delegation status.
+
+        Args:
+            owner_address: The owner's wallet address
+            delegate_address: The delegate's wallet address
+
+        Returns:
+            The cached status, or None if it has to be read from the chain
+        """
+        key = _key(owner_address, delegate_address)
+
+        memo = _request_memo.get()
+        if memo is not None and key in memo:
+            self.stats["memo_hits"] += 1
+            return memo[key]
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            status, expires_at = entry
+            if time.monotonic() < expires_at:
+                self.stats["hits"] += 1
+                if memo is not None:
+                    memo[key] = status
+                return status
+            del self._entries[key]
+
+        self.stats["misses"] += 1
+        return None
+
+    def generation(self) -> int:
+        """Get the invalidation counter to pass to put() after a chain read."""
+        return self._generation
+
+    def put(self, owner_address: str, delegate_address: str, status: bool, generation: Optional[int] = None) -> None:
+        """
+        Cache a delegation status read from the chain.
+
+        Args:
+            owner_address: The owner's wallet address
+            delegate_address: The delegate's wallet address
+            status: Whether the delegate is approved
+            generation: Value of generation() before the read; the result is dropped
+                if an invalidation happened since
+        """
+        if generation is not None and generation != self._generation:
+            return
+
+        key = _key(owner_address, delegate_address)
+        memo = _request_memo.get()
+        if memo is not None:
+            memo[key] = status
+
+        ttl = self.ttl if status else self.negative_ttl
+        if ttl <= 0:
+            return
+
+        self._entries[key] = (status, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, owner_address: str, delegate_address: str) -> None:
+        """
+        Drop the cached status of an owner-delegate pair after it changed on-chain.
+
+        Args:
+            owner_address: The owner's wallet address
+            delegate_address: The delegate's wallet address
+        """
+        key = _key(owner_address, delegate_address)
+        self._entries.pop(key, None)
+        memo = _request_memo.get()
+        if memo is not None:
+            memo.pop(key, None)
+        self._generation += 1
+        self.stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        """Drop all cached statuses."""
+        self._entries.clear()
+        self._generation += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hit, miss and invalidation counters and the entry count
+        """
+        lookups = self.stats["memo_hits"] + self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_ratio": round((lookups - self.stats["misses"]) / lookups, 3) if lookups else None,
+            "entries": len(self._entries),
+            "ttl": self.ttl,
+            "negative_ttl": self.negative_ttl
+        }
+
+
+def memoize_delegation_checks(func):
+    """
+    Decorate an async function so delegation results are reused for the rest of the call.
+
+    Nested decorated calls share the outermost memo.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        if _request_memo.get() is not None:
+            return await func(*args, **kwargs)
+
+        token = _request_memo.set({})
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _request_memo.reset(token)
+
+    return wrapper
+
+
+# Global instance shared by all BlockchainService instances
+delegation_cache = DelegationCache(settings.delegation_cache_ttl, settings.delegation_cache_negative_ttl)
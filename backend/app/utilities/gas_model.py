@@ -0,0 +1,231 @@
+import logging
+import math
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Keeps the normal equations solvable before batch sizes and string lengths vary
+RIDGE = 1.0
+
+
+def _words(values: Sequence[str]) -> int:
+    """Number of 32-byte words the strings take up, as stored and ABI-encoded."""
+    return sum(math.ceil(len(value.encode()) / 32) for value in values)
+
+
+def gas_features(asset_ids: Sequence[str], cids: Sequence[str] = ()) -> List[float]:
+    """
+    Features a batch call's gas is linear in.
+
+    Args:
+        asset_ids: The batch's asset IDs
+        cids: The batch's CIDs, empty for deletions
+
+    Returns:
+        [1, batch size, asset ID words, CID words]
+    """
+    return [1.0, float(len(asset_ids)), float(_words(asset_ids)), float(_words(cids))]
+
+
+def _solve(matrix: List[List[float]], vector: List[float]) -> List[float]:
+    """Solve a small linear system by Gaussian elimination with partial pivoting."""
+    size = len(vector)
+    rows = [list(matrix[i]) + [vector[i]] for i in range(size)]
+    for col in range(size):
+        pivot = max(range(col, size), key=lambda r: abs(rows[r][col]))
+        if abs(rows[pivot][col]) < 1e-12:
+            raise ValueError("singular system")
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        for r in range(col + 1, size):
+            factor = rows[r][col] / rows[col][col]
+            for c in range(col, size + 1):
+                rows[r][c] -= factor * rows[col][c]
+    solution = [0.0] * size
+    for r in reversed(range(size)):
+        solution[r] = (rows[r][size] - sum(rows[r][c] * solution[c] for c in range(r + 1, size))) / rows[r][r]
+    return solution
+
+
+class _FunctionModel:
+    """Least-squares fit of gas used against gas_features for one contract function."""
+
+    def __init__(self, size: int):
+        self.xtx = [[0.0] * size for _ in range(size)]
+        self.xty = [0.0] * size
+        self.observations = 0
+        self.coefficients: Optional[List[float]] = None
+        # Largest actual / fitted ratio seen, so the margin covers e.g. first writes costing more than updates
+        self.worst_ratio = 1.0
+        self.predictions_since_calibration = 0
+        # Predictions are only made inside the observed range, never extrapolated
+        self.max_features = [0.0] * size
+
+    def fit(self, x: List[float]) -> Optional[float]:
+        if self.coefficients is None or any(value > limit for value, limit in zip(x, self.max_features)):
+            return None
+        return sum(c * v for c, v in zip(self.coefficients, x))
+
+    def add(self, x: List[float], gas_used: int, track_ratio: bool) -> None:
+        fitted = self.fit(x)
+        if track_ratio and fitted and fitted > 0:
+            self.worst_ratio = max(self.worst_ratio, gas_used / fitted)
+
+        for i, xi in enumerate(x):
+            self.xty[i] += xi * gas_used
+            for j, xj in enumerate(x):
+                self.xtx[i][j] += xi * xj
+        self.observations += 1
+        self.max_features = [max(current, value) for current, value in zip(self.max_features, x)]
+
+        regularized = [
+            [value + (RIDGE if i == j and i > 0 else 0.0) for j, value in enumerate(row)]
+            for i, row in enumerate(self.xtx)
+        ]
+        try:
+            self.coefficients = _solve(regularized, self.xty)
+        except ValueError:
+            self.coefficients = None
+
+
+class GasModel:
+    """
+    Learned gas limits for batch registry calls.
+
+    Gas used by batchUpdateIPFS and friends is close to linear in the batch size
+    and the number of 32-byte words in its asset IDs and CIDs. Each function gets
+    its own least-squares fit, fed by receipts of mined transactions and by the
+    live estimate_gas calls the model still makes: until a function has
+    min_observations samples, for calls larger than any sampled so far, and once
+    every calibrate_every predictions.
+    Predicted limits carry safety_margin on top of the fit, scaled by the
+    largest underestimate observed so far.
+    """
+
+    def __init__(self, min_observations: int, calibrate_every: int, safety_margin: float, enabled: bool = True):
+        self.enabled = enabled
+        self.min_observations = min_observations
+        self.calibrate_every = calibrate_every
+        self.safety_margin = safety_margin
+        self._models: Dict[str, _FunctionModel] = {}
+        self.stats = {
+            "predictions": 0,
+            "live_estimates": 0,
+            "observations": 0
+        }
+
+    def _model(self, function_name: str) -> _FunctionModel:
+        model = self._models.get(function_name)
+        if model is None:
+            model = self._models[function_name] = _FunctionModel(len(gas_features([])))
+        return model
+
+    def observe(self, function_name: str, asset_ids: Sequence[str], cids: Sequence[str], gas_used: int) -> None:
+        """
+        Add a gas sample for a call.
+
+        Args:
+            function_name: Contract function name
+            asset_ids: The call's asset IDs
+            cids: The call's CIDs, empty for deletions
+            gas_used: Receipt gasUsed, or an estimate_gas result
+        """
+        model = self._model(function_name)
+        # Early fits are rough; only misses of a model that is already serving predictions widen the margin
+        model.add(gas_features(asset_ids, cids), gas_used, track_ratio=model.observations >= self.min_observations)
+        self.stats["observations"] += 1
+
+    def predict(self, function_name: str, asset_ids: Sequence[str], cids: Sequence[str] = ()) -> Optional[int]:
+        """
+        Predict a gas limit for a call.
+
+        Args:
+            function_name: Contract function name
+            asset_ids: The call's asset IDs
+            cids: The call's CIDs, empty for deletions
+
+        Returns:
+            Gas limit including the safety margin, or None if the function has too few
+            samples or the call is larger than any seen so far
+        """
+        model = self._models.get(function_name)
+        if model is None or model.observations < self.min_observations:
+            return None
+        fitted = model.fit(gas_features(asset_ids, cids))
+        if not fitted or fitted <= 0:
+            return None
+        return int(fitted * (1 + self.safety_margin) * model.worst_ratio)
+
+    async def gas_limit(
+        self,
+        function_name: str,
+        asset_ids: Sequence[str],
+        cids: Sequence[str],
+        estimate: Callable[[], Awaitable[int]]
+    ) -> Dict[str, Any]:
+        """
+        Get a gas limit from the model, or from a live estimate when one is due.
+
+        Args:
+            function_name: Contract function name
+            asset_ids: The call's asset IDs
+            cids: The call's CIDs, empty for deletions
+            estimate: Coroutine function running estimate_gas for the call
+
+        Returns:
+            Dict with estimated_gas, gas_limit and source ("model" or "estimate")
+        """
+        if self.enabled:
+            model = self._models.get(function_name)
+            prediction = self.predict(function_name, asset_ids, cids)
+            if prediction is not None and model.predictions_since_calibration < self.calibrate_every:
+                model.predictions_since_calibration += 1
+                self.stats["predictions"] += 1
+                return {
+                    "estimated_gas": int(model.fit(gas_features(asset_ids, cids))),
+                    "gas_limit": prediction,
+                    "source": "model"
+                }
+
+        estimated_gas = await estimate()
+        self.stats["live_estimates"] += 1
+        if self.enabled:
+            self.observe(function_name, asset_ids, cids, estimated_gas)
+            self._model(function_name).predictions_since_calibration = 0
+        return {
+            "estimated_gas": estimated_gas,
+            "gas_limit": int(estimated_gas * (1 + self.safety_margin)),
+            "source": "estimate"
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get model statistics.
+
+        Returns:
+            Dict with prediction and estimate counters and each function's fit
+        """
+        if not self.enabled:
+            return {"enabled": False}
+        return {
+            **self.stats,
+            "functions": {
+                name: {
+                    "observations": model.observations,
+                    "ready": model.observations >= self.min_observations and model.coefficients is not None,
+                    "coefficients": [round(c, 2) for c in model.coefficients] if model.coefficients else None,
+                    "worst_ratio": round(model.worst_ratio, 4)
+                }
+                for name, model in self._models.items()
+            }
+        }
+
+
+# Global instance shared by all BlockchainService instances
+gas_model = GasModel(
+    min_observations=settings.gas_model_min_observations,
+    calibrate_every=settings.gas_model_calibrate_every,
+    safety_margin=settings.gas_model_safety_margin,
+    enabled=settings.gas_model_enabled
+)
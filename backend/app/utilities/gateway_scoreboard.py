@@ -0,0 +1,99 @@
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.config import settings
+
+# Fewer successful samples than this and the configured hedge delay is used instead of p95
+MIN_P95_SAMPLES = 5
+
+
+class GatewayScoreboard:
+    """
+    Rolling latency and error record for each IPFS content source.
+
+    Sources are ranked by the mean latency of their successful attempts plus
+    a penalty for their recent error rate. A source that lost a hedged race
+    and was cancelled is recorded, but the time it had taken when the winner
+    answered says nothing about how fast it is, so it only counts as an
+    attempt. Sources that have never succeeded rank after those that have.
+    """
+
+    def __init__(self, window: int = 50, error_penalty: float = 5.0, default_latency: float = 1.0):
+        self.window = window
+        self.error_penalty = error_penalty
+        self.default_latency = default_latency
+        self._samples: Dict[str, Deque[Tuple[float, str]]] = {}
+
+    def record(self, source: str, latency: float, outcome: str) -> None:
+        """
+        Record one attempt against a source.
+
+        Args:
+            source: Source name
+            latency: Seconds the attempt took
+            outcome: "ok", "error" or "cancelled"
+        """
+        self._samples.setdefault(source, deque(maxlen=self.window)).append((latency, outcome))
+
+    def score(self, source: str) -> float:
+        """Get the ranking score of a source in seconds; lower is better."""
+        samples = self._samples.get(source)
+        if not samples:
+            return self.default_latency
+
+        latencies = [latency for latency, outcome in samples if outcome == "ok"]
+        mean_latency = sum(latencies) / len(latencies) if latencies else self.default_latency
+        error_rate = sum(1 for _, outcome in samples if outcome == "error") / len(samples)
+        return mean_latency + error_rate * self.error_penalty
+
+    def rank(self, sources: List[str]) -> List[str]:
+        """Order sources best first, keeping the given order for equal scores."""
+        return sorted(sources, key=lambda source: (not self._has_succeeded(source), self.score(source)))
+
+    def _has_succeeded(self, source: str) -> bool:
+        return any(outcome == "ok" for _, outcome in self._samples.get(source, ()))
+
+    def p95_latency(self, source: str) -> Optional[float]:
+        """Get the p95 latency of successful attempts, or None with too few samples."""
+        latencies = sorted(latency for latency, outcome in self._samples.get(source, ()) if outcome == "ok")
+        if len(latencies) < MIN_P95_SAMPLES:
+            return None
+        return latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+
+    def hedge_delay(self, source: str) -> float:
+        """
+        Get how long to wait on a source before racing the next one.
+
+        Args:
+            source: The source most recently started
+
+        Returns:
+            Delay in seconds, the source's p95 latency clamped to the configured bounds
+        """
+        p95 = self.p95_latency(source)
+        delay_ms = settings.ipfs_hedge_delay_ms if p95 is None else p95 * 1000
+        delay_ms = min(max(delay_ms, settings.ipfs_hedge_min_delay_ms), settings.ipfs_hedge_max_delay_ms)
+        return delay_ms / 1000
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get per-source statistics.
+
+        Returns:
+            Dict keyed by source with attempt counts, error rate, p95 latency and score
+        """
+        stats = {}
+        for source, samples in self._samples.items():
+            p95 = self.p95_latency(source)
+            stats[source] = {
+                "attempts": len(samples),
+                "errors": sum(1 for _, outcome in samples if outcome == "error"),
+                "cancelled": sum(1 for _, outcome in samples if outcome == "cancelled"),
+                "p95_ms": round(p95 * 1000, 2) if p95 is not None else None,
+                "score": round(self.score(source), 3)
+            }
+        return stats
+
+
+# Global instance shared by all IPFSService instances
+gateway_scoreboard = GatewayScoreboard()
@@ -0,0 +1,206 @@
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import ASCENDING, DESCENDING
+
+from app.config import settings
+from app.repositories.api_key_repo import APIKeyRepository
+from app.repositories.asset_repo import AssetRepository
+from app.repositories.auth_repo import AuthRepository
+from app.repositories.delegation_repo import DelegationRepository
+from app.repositories.transaction_repo import TransactionRepository
+from app.repositories.user_repo import UserRepository
+
+logger = logging.getLogger(__name__)
+
+# Placeholder values for explain(); plans only depend on the shape of a query
+SAMPLE_WALLET = "0x0000000000000000000000000000000000000000"
+SAMPLE_ASSET_ID = "index-check"
+SAMPLE_SESSION_ID = "index-check"
+
+# (name, filter, sort) of a query a repository serves on a hot path
+CanonicalQuery = Tuple[str, Dict[str, Any], Optional[List[Tuple[str, int]]]]
+
+
+def canonical_queries() -> Dict[str, List[CanonicalQuery]]:
+    """
+    Get the queries every repository is expected to answer from an index.
+
+    Returns:
+        Dict mapping collection name to (name, filter, sort) tuples
+    """
+    now = datetime.now(timezone.utc)
+    return {
+        "assets": [
+            ("current version", {"assetId": SAMPLE_ASSET_ID, "isCurrent": True}, None),
+            ("specific version", {"assetId": SAMPLE_ASSET_ID, "versionNumber": 1}, None),
+            (
+                "version history",
+                {"assetId": SAMPLE_ASSET_ID, "isDeleted": False},
+                [("versionNumber", ASCENDING), ("_id", ASCENDING)]
+            ),
+            (
+                "wallet assets",
+                {"walletAddressLower": SAMPLE_WALLET, "isCurrent": True, "isDeleted": False},
+                [("lastUpdated", DESCENDING), ("_id", DESCENDING)]
+            )
+        ],
+        "transactions": [
+            ("asset history", {"assetId": SAMPLE_ASSET_ID}, [("timestamp", DESCENDING)]),
+            (
+                "wallet history",
+                {"$or": [{"walletAddressLower": SAMPLE_WALLET}, {"performedByLower": SAMPLE_WALLET}]},
+                [("timestamp", DESCENDING), ("_id", DESCENDING)]
+            )
+        ],
+        "sessions": [
+            ("active session", {"sessionId": SAMPLE_SESSION_ID, "expiresAt": {"$gt": now}, "isActive": True}, None)
+        ],
+        "auth": [
+            ("auth record", {"walletAddress": SAMPLE_WALLET}, None)
+        ],
+        "users": [
+            ("user by wallet", {"walletAddress": SAMPLE_WALLET}, None)
+        ],
+        "api_keys": [
+            ("key lookup", {"key_hash": "index-check"}, None),
+            ("wallet keys", {"wallet_address": SAMPLE_WALLET}, None)
+        ],
+        "delegations": [
+            ("owner delegations", {"ownerAddress": SAMPLE_WALLET, "isActive": True}, [("createdAt", DESCENDING)]),
+            ("delegate delegations", {"delegateAddress": SAMPLE_WALLET, "isActive": True}, [("createdAt", DESCENDING)])
+        ]
+    }
+
+
+def plan_nodes(plan: Any) -> List[Dict[str, Any]]:
+    """
+    Flatten a query plan into its stages, outermost first.
+
+    Args:
+        plan: A winningPlan (or any part of an explain() document)
+
+    Returns:
+        List of plan nodes, each with a stage name such as IXSCAN, FETCH, SORT or COLLSCAN
+    """
+    nodes = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            nodes.append(plan)
+        for value in plan.values():
+            nodes.extend(plan_nodes(value))
+    elif isinstance(plan, list):
+        for item in plan:
+            nodes.extend(plan_nodes(item))
+    return nodes
+
+
+class IndexManager:
+    """
+    Builds and checks the indexes of every repository.
+
+    Each repository declares its own indexes in create_indexes(). build() runs
+    them all at startup; MongoDB treats creating an existing index as a no-op,
+    so it is safe on every start. explain_queries() runs explain() on each
+    repository's canonical queries and flags the ones answered by a collection
+    scan or an in-memory sort.
+    """
+
+    def __init__(self, db_client):
+        """
+        Initialize with MongoDB client.
+
+        Args:
+            db_client: The MongoDB client with initialized collections
+        """
+        self.db_client = db_client
+        self.repositories = {
+            "users": UserRepository(db_client),
+            "assets": AssetRepository(db_client),
+            "transactions": TransactionRepository(db_client),
+            "auth and sessions": AuthRepository(db_client),
+            "delegations": DelegationRepository(db_client)
+        }
+        if settings.api_key_auth_enabled:
+            self.repositories["api_keys"] = APIKeyRepository(db_client.get_collection("api_keys"))
+        self.collections = {
+            "assets": db_client.assets_collection,
+            "transactions": db_client.transaction_collection,
+            "sessions": db_client.sessions_collection,
+            "auth": db_client.auth_collection,
+            "users": db_client.users_collection,
+            "delegations": db_client.delegations_collection,
+            "api_keys": db_client.get_collection("api_keys")
+        }
+
+    async def build(self) -> Dict[str, bool]:
+        """
+        Create every repository's indexes.
+
+        A failure (e.g. an existing index with conflicting options) is logged and
+        doesn't stop the other repositories' indexes from being built.
+
+        Returns:
+            Dict mapping repository name to whether its indexes were created
+        """
+        results = {}
+        for name, repository in self.repositories.items():
+            try:
+                await repository.create_indexes()
+                results[name] = True
+                logger.info(f"Indexes for {name} created successfully")
+            except Exception as e:
+                results[name] = False
+                logger.error(f"Error creating indexes for {name}: {str(e)}")
+        return results
+
+    async def explain(
+        self,
+        collection_name: str,
+        query: Dict[str, Any],
+        sort: Optional[List[Tuple[str, int]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Explain one query and summarise its winning plan.
+
+        Args:
+            collection_name: Collection to query
+            query: Query filter
+            sort: Optional sort specification
+
+        Returns:
+            Dict with the plan's stages, the indexes it uses and collscan / in_memory_sort flags
+        """
+        cursor = self.collections[collection_name].find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        explanation = await cursor.explain()
+
+        nodes = plan_nodes(explanation.get("queryPlanner", {}).get("winningPlan", {}))
+        stages = [node["stage"] for node in nodes]
+
+        return {
+            "stages": stages,
+            "indexes": [node["indexName"] for node in nodes if node.get("indexName")],
+            "collscan": "COLLSCAN" in stages,
+            "in_memory_sort": "SORT" in stages
+        }
+
+    async def explain_queries(self) -> List[Dict[str, Any]]:
+        """
+        Explain every repository's canonical queries.
+
+        Returns:
+            One report per query with collection, name, plan summary and an error if explain() failed
+        """
+        reports = []
+        for collection_name, queries in canonical_queries().items():
+            for name, query, sort in queries:
+                report = {"collection": collection_name, "query": name}
+                try:
+                    report.update(await self.explain(collection_name, query, sort))
+                except Exception as e:
+                    report["error"] = str(e)
+                reports.append(report)
+        return reports
@@ -0,0 +1,185 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from eth_utils.abi import get_abi_output_types
+from web3 import Web3
+
+logger = logging.getLogger(__name__)
+
+# Multicall3 is deployed at the same address on Sepolia, mainnet and most other chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+# ABI-encoded size of one Call3 besides its calldata: offset, target, allowFailure, bytes offset and length
+_CALL3_OVERHEAD_BYTES = 5 * 32
+
+
+def decode_function_result(web3: Any, function: Any, return_data: bytes) -> Any:
+    """Decode a view call's return data the way ContractFunction.call() would."""
+    output_types = get_abi_output_types(function.abi)
+    values = web3.codec.decode(output_types, return_data)
+    values = [
+        Web3.to_checksum_address(value) if output_type == "address" else value
+        for output_type, value in zip(output_types, values)
+    ]
+    return values[0] if len(values) == 1 else list(values)
+
+
+class CallFailed(Exception):
+    """A view call inside a multicall reverted."""
+
+
+class Multicall:
+    """
+    Packs many contract view calls into Multicall3 aggregate3 eth_calls.
+
+    Calls are split into chunks so no single eth_call carries more than
+    max_calldata_bytes of calldata, and chunks run concurrently. Each call may
+    fail on its own; its result is then a CallFailed. If no Multicall3 contract
+    is deployed at the configured address, the calls are made one by one.
+    """
+
+    def __init__(
+        self,
+        web3: Any,
+        call: Callable[..., Awaitable[Any]],
+        address: str = MULTICALL3_ADDRESS,
+        max_calldata_bytes: int = 64 * 1024
+    ):
+        """
+        Initialize with the web3 instance and call runner of BlockchainService.
+
+        Args:
+            web3: The Web3 or AsyncWeb3 instance
+            call: Coroutine function running a web3 call on the configured backend
+            address: Multicall3 contract address
+            max_calldata_bytes: Calldata budget per eth_call
+        """
+        self.web3 = web3
+        self._call = call
+        self.address = Web3.to_checksum_address(address)
+        self.max_calldata_bytes = max_calldata_bytes
+        self.contract = web3.eth.contract(address=self.address, abi=MULTICALL3_ABI)
+        self._available: Optional[bool] = None
+        self.stats = {"calls": 0, "eth_calls": 0, "fallback_calls": 0}
+
+    async def is_available(self) -> bool:
+        """Whether a contract is deployed at the Multicall3 address, checked once."""
+        if self._available is None:
+            code = await self._call(self.web3.eth.get_code, self.address)
+            self._available = len(code) > 0
+            if not self._available:
+                logger.warning(f"No Multicall3 contract at {self.address}; view calls will be sent individually")
+        return self._available
+
+    def chunk(self, encoded_calls: List[Tuple[str, bytes]]) -> List[List[int]]:
+        """
+        Split calls into chunks within the calldata budget.
+
+        Args:
+            encoded_calls: (target, calldata) pairs
+
+        Returns:
+            Lists of call indexes, one list per eth_call
+        """
+        chunks: List[List[int]] = []
+        current: List[int] = []
+        size = 0
+        for index, (_, calldata) in enumerate(encoded_calls):
+            call_size = _CALL3_OVERHEAD_BYTES + (len(calldata) + 31) // 32 * 32
+            if current and size + call_size > self.max_calldata_bytes:
+                chunks.append(current)
+                current, size = [], 0
+            current.append(index)
+            size += call_size
+        if current:
+            chunks.append(current)
+        return chunks
+
+    async def aggregate(self, contract_functions: List[Any]) -> List[Any]:
+        """
+        Run many bound contract view functions.
+
+        Args:
+            contract_functions: Bound functions, e.g. contract.functions.assetExists(asset_id, owner)
+
+        Returns:
+            One decoded result per function, in order, or a CallFailed for calls that reverted
+        """
+        if not contract_functions:
+            return []
+        self.stats["calls"] += len(contract_functions)
+
+        if not await self.is_available():
+            return await self._call_individually(contract_functions)
+
+        encoded = [
+            (function.address, Web3.to_bytes(hexstr=function._encode_transaction_data()))
+            for function in contract_functions
+        ]
+        results: List[Any] = [None] * len(contract_functions)
+
+        async def run_chunk(indexes: List[int]) -> None:
+            calls = [(encoded[i][0], True, encoded[i][1]) for i in indexes]
+            self.stats["eth_calls"] += 1
+            responses = await self._call(self.contract.functions.aggregate3(calls).call)
+            for i, (success, return_data) in zip(indexes, responses):
+                results[i] = self._decode(contract_functions[i], success, return_data)
+
+        await asyncio.gather(*(run_chunk(indexes) for indexes in self.chunk(encoded)))
+        return results
+
+    def _decode(self, function: Any, success: bool, return_data: bytes) -> Any:
+        if not success:
+            return CallFailed(f"{function.fn_name} reverted")
+        return decode_function_result(self.web3, function, return_data)
+
+    async def _call_individually(self, contract_functions: List[Any]) -> List[Any]:
+        async def call_one(function):
+            self.stats["fallback_calls"] += 1
+            try:
+                return await self._call(function.call)
+            except Exception as e:
+                return CallFailed(f"{function.fn_name} failed: {str(e)}")
+
+        return await asyncio.gather(*(call_one(function) for function in contract_functions))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get multicall statistics.
+
+        Returns:
+            Dict with the number of view calls, the eth_calls they were packed into and fallbacks
+        """
+        return {**self.stats, "address": self.address, "available": self._available}
@@ -0,0 +1,136 @@
+import asyncio
+import heapq
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Provider error fragments meaning the node's view of the account nonce differs from ours
+NONCE_ERRORS = ("nonce too low", "already known", "known transaction", "replacement transaction underpriced")
+
+
+def is_nonce_error(error: Exception) -> bool:
+    """Whether a send failure was caused by a nonce the node already has a transaction for."""
+    message = str(error).lower()
+    return any(fragment in message for fragment in NONCE_ERRORS)
+
+
+class NonceManager:
+    """
+    Hands out server-wallet nonces locally so signed transactions can be sent
+    back to back without waiting for each other's receipts.
+
+    The first nonce comes from the node's pending transaction count. After that
+    nonces are counted locally under a lock. A nonce whose transaction was never
+    accepted is handed out again before any new one, so no gap blocks the
+    transactions after it. When nothing is in flight, or a send fails with a
+    nonce error, the count is read from the node again.
+    """
+
+    def __init__(self, fetch_pending_nonce: Callable[[], Awaitable[int]]):
+        """
+        Initialize with the call that reads the account's pending transaction count.
+
+        Args:
+            fetch_pending_nonce: Coroutine function returning the next nonce according to the node
+        """
+        self.fetch_pending_nonce = fetch_pending_nonce
+        self._lock = asyncio.Lock()
+        self._next_nonce: Optional[int] = None
+        self._gaps: List[int] = []
+        self._in_flight = 0
+        self.stats = {
+            "reserved": 0,
+            "released": 0,
+            "resyncs": 0,
+            "replacements": 0
+        }
+
+    async def reserve(self) -> int:
+        """
+        Reserve the next nonce for a transaction about to be signed.
+
+        Every reserved nonce must be handed back with release() if the transaction
+        is not accepted by the node, and with complete() once it is mined or dropped.
+
+        Returns:
+            The nonce to sign with
+        """
+        async with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = await self.fetch_pending_nonce()
+                self._gaps.clear()
+
+            if self._gaps:
+                nonce = heapq.heappop(self._gaps)
+            else:
+                nonce = self._next_nonce
+                self._next_nonce += 1
+
+            self._in_flight += 1
+            self.stats["reserved"] += 1
+            return nonce
+
+    async def release(self, nonce: int, error: Optional[Exception] = None) -> None:
+        """
+        Hand back a nonce whose transaction the node did not accept.
+
+        Args:
+            nonce: The reserved nonce
+            error: The send failure; nonce errors trigger a resync with the node
+        """
+        async with self._lock:
+            self._in_flight = max(self._in_flight - 1, 0)
+            self.stats["released"] += 1
+
+            if error is not None and is_nonce_error(error):
+                await self._resync(nonce)
+            elif self._next_nonce is not None:
+                if nonce == self._next_nonce - 1:
+                    self._next_nonce = nonce
+                else:
+                    heapq.heappush(self._gaps, nonce)
+
+            if self._in_flight == 0:
+                self._next_nonce = None
+
+    async def complete(self, nonce: int) -> None:
+        """
+        Mark a sent transaction as finished, whether it was mined or given up on.
+
+        Args:
+            nonce: The reserved nonce
+        """
+        async with self._lock:
+            self._in_flight = max(self._in_flight - 1, 0)
+            if self._in_flight == 0:
+                # Idle: pick up transactions sent from this wallet elsewhere on the next reserve
+                self._next_nonce = None
+
+    async def _resync(self, failed_nonce: int) -> None:
+        """Move the local count up to the node's after a nonce collision. Caller holds the lock."""
+        pending_nonce = await self.fetch_pending_nonce()
+        self.stats["resyncs"] += 1
+        logger.warning(f"Server wallet nonce {failed_nonce} was rejected; node's pending nonce is {pending_nonce}")
+
+        self._next_nonce = max(self._next_nonce or 0, pending_nonce)
+        self._gaps = [gap for gap in self._gaps if gap >= pending_nonce]
+        heapq.heapify(self._gaps)
+
+    def record_replacement(self) -> None:
+        """Count a stuck transaction that was re-sent with a higher gas price."""
+        self.stats["replacements"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get nonce manager statistics.
+
+        Returns:
+            Dict with the next nonce, transactions in flight and reservation counters
+        """
+        return {
+            **self.stats,
+            "next_nonce": self._next_nonce,
+            "in_flight": self._in_flight,
+            "gaps": sorted(self._gaps)
+        }
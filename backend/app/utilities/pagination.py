@@ -0,0 +1,99 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from bson import ObjectId
+from pymongo import DESCENDING
+
+from app.config import settings
+
+
+def clamp_limit(limit: Optional[int]) -> int:
+    """
+    Get the page size to use for a requested limit.
+
+    Args:
+        limit: Requested page size, or None for the default
+
+    Returns:
+        A page size between 1 and PAGINATION_MAX_LIMIT
+    """
+    if limit is None or limit <= 0:
+        limit = settings.pagination_default_limit
+    return min(limit, settings.pagination_max_limit)
+
+
+def encode_cursor(sort_value: Any, document_id: Any) -> str:
+    """
+    Encode the position after a document as an opaque cursor token.
+
+    Args:
+        sort_value: The document's value of the sort field
+        document_id: The document's _id, which breaks ties between equal sort values
+
+    Returns:
+        URL-safe token for the next page
+    """
+    if isinstance(sort_value, datetime):
+        value = {"$date": sort_value.isoformat()}
+    else:
+        value = sort_value
+    payload = json.dumps({"v": value, "id": str(document_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Tuple[Any, Any]:
+    """
+    Decode a cursor token made by encode_cursor.
+
+    Args:
+        token: The cursor token
+
+    Returns:
+        Tuple of (sort value, _id)
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        value = payload["v"]
+        if isinstance(value, dict) and "$date" in value:
+            value = datetime.fromisoformat(value["$date"])
+        document_id = payload["id"]
+        if ObjectId.is_valid(document_id):
+            document_id = ObjectId(document_id)
+        return value, document_id
+    except Exception:
+        raise ValueError("Invalid pagination cursor")
+
+
+def keyset_query(query: Dict[str, Any], sort_field: str, cursor: Optional[str], direction: int = DESCENDING) -> Dict[str, Any]:
+    """
+    Restrict a query to the documents after a cursor in (sort_field, _id) order.
+
+    Args:
+        query: The base query
+        sort_field: Field the results are sorted by, before _id
+        cursor: Cursor token from the previous page, or None for the first page
+        direction: Sort direction of both sort_field and _id
+
+    Returns:
+        The query for the requested page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return query
+    value, document_id = decode_cursor(cursor)
+    operator = "$lt" if direction == DESCENDING else "$gt"
+    after = {
+        "$or": [
+            {sort_field: {operator: value}},
+            {sort_field: value, "_id": {operator: document_id}}
+        ]
+    }
+    return {"$and": [query, after]} if query else after
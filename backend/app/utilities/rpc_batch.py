@@ -0,0 +1,243 @@
+import asyncio
+import inspect
+import itertools
+import logging
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import aiohttp
+from web3._utils.encoding import FriendlyJsonSerde, Web3JsonEncoder
+from web3.datastructures import AttributeDict
+from web3.module import apply_result_formatters
+
+from app.utilities.multicall import decode_function_result
+
+logger = logging.getLogger(__name__)
+
+# Public web3.eth method names mapped to the web3 Method objects that build their requests
+ETH_METHODS = {
+    "get_transaction": "_get_transaction",
+    "get_transaction_receipt": "_transaction_receipt",
+    "get_block_number": "get_block_number",
+    "get_block": "_get_block",
+    "get_block_receipts": "_get_block_receipts",
+    "get_code": "_get_code",
+    "call": "_call"
+}
+
+
+class RpcBatchTransport:
+    """
+    JSON-RPC batching layer for heterogeneous reads.
+
+    Requests issued within the same event-loop tick, or passed together to
+    request_many, are sent as one HTTP batch and the responses matched back by
+    id. Requests are built and results formatted by web3's own method
+    definitions, so callers get the same values as from web3.eth. If the
+    provider rejects a batch, or leaves a request out of its answer, the
+    affected requests are retried one by one.
+    """
+
+    def __init__(
+        self,
+        web3: Any,
+        endpoint_uri: str,
+        get_session: Optional[Callable[[], Optional[aiohttp.ClientSession]]] = None,
+        timeout: float = 30,
+        max_batch_size: int = 50,
+        router: Optional[Any] = None
+    ):
+        """
+        Initialize with the web3 instance whose methods define the requests.
+
+        Args:
+            web3: The Web3 or AsyncWeb3 instance
+            endpoint_uri: JSON-RPC HTTP endpoint
+            get_session: Returns a shared aiohttp session; one is created if it returns None
+            timeout: Seconds per HTTP request
+            max_batch_size: Requests per HTTP batch
+            router: Optional RpcRouter choosing the endpoint of each HTTP request
+        """
+        self.web3 = web3
+        self.endpoint_uri = endpoint_uri
+        self._get_session = get_session or (lambda: None)
+        self._own_session: Optional[aiohttp.ClientSession] = None
+        self.timeout = timeout
+        self.max_batch_size = max_batch_size
+        self.router = router
+
+        self._ids = itertools.count(1)
+        self._queue: List[Dict[str, Any]] = []
+        self._flush_scheduled = False
+        self._tasks: set = set()
+        self.stats = {
+            "requests": 0,
+            "batches": 0,
+            "batched_requests": 0,
+            "single_requests": 0,
+            "batches_rejected": 0,
+            "fallback_requests": 0
+        }
+
+    async def request(self, method_name: str, *args: Any) -> Any:
+        """
+        Send a web3.eth request, batched with others issued in the same tick.
+
+        Args:
+            method_name: web3.eth method name, e.g. "get_transaction"
+            *args: The method's arguments
+
+        Returns:
+            The formatted result, as web3.eth would return it
+        """
+        return await self._submit(method_name, args)
+
+    async def request_many(self, requests: Sequence[Tuple[str, tuple]]) -> List[Any]:
+        """
+        Send a group of web3.eth requests together.
+
+        Args:
+            requests: (method_name, args) pairs
+
+        Returns:
+            One result per request, or the exception it raised
+        """
+        futures = [self._submit(method_name, args) for method_name, args in requests]
+        return list(await asyncio.gather(*futures, return_exceptions=True))
+
+    async def call_function(self, function: Any) -> Any:
+        """
+        Run a bound contract view function as a batched eth_call.
+
+        Args:
+            function: e.g. contract.functions.getIPFSInfo(asset_id, owner)
+
+        Returns:
+            The decoded result, as function.call() would return it
+        """
+        return_data = await self.request(
+            "call", {"to": function.address, "data": function._encode_transaction_data()}
+        )
+        return decode_function_result(self.web3, function, return_data)
+
+    def _submit(self, method_name: str, args: tuple) -> "asyncio.Future":
+        """Queue a request synchronously so requests submitted together share a batch."""
+        method = inspect.getattr_static(type(self.web3.eth), ETH_METHODS[method_name])
+        (rpc_method, params), formatters = method.process_params(self.web3.eth, *args)
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append({
+            "payload": {"jsonrpc": "2.0", "id": next(self._ids), "method": rpc_method, "params": params},
+            "formatters": formatters,
+            "future": future
+        })
+        self.stats["requests"] += 1
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._start_flush)
+        return future
+
+    def _start_flush(self) -> None:
+        self._flush_scheduled = False
+        queue, self._queue = self._queue, []
+        for start in range(0, len(queue), self.max_batch_size):
+            task = asyncio.create_task(self._send_batch(queue[start:start + self.max_batch_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send_batch(self, entries: List[Dict[str, Any]]) -> None:
+        if len(entries) == 1:
+            self.stats["single_requests"] += 1
+            await self._send_single(entries[0])
+            return
+
+        self.stats["batches"] += 1
+        self.stats["batched_requests"] += len(entries)
+        try:
+            responses = await self._post([entry["payload"] for entry in entries])
+            if not isinstance(responses, list):
+                raise ValueError(f"Provider answered a batch with {responses!r}")
+        except Exception as e:
+            logger.warning(f"JSON-RPC batch of {len(entries)} rejected, sending individually: {str(e)}")
+            self.stats["batches_rejected"] += 1
+            self.stats["fallback_requests"] += len(entries)
+            await asyncio.gather(*(self._send_single(entry) for entry in entries))
+            return
+
+        by_id = {response.get("id"): response for response in responses if isinstance(response, dict)}
+        missing = []
+        for entry in entries:
+            response = by_id.get(entry["payload"]["id"])
+            if response is None:
+                missing.append(entry)
+            else:
+                self._resolve(entry, response)
+        if missing:
+            self.stats["fallback_requests"] += len(missing)
+            await asyncio.gather(*(self._send_single(entry) for entry in missing))
+
+    async def _send_single(self, entry: Dict[str, Any]) -> None:
+        if entry["future"].done():
+            return
+        try:
+            response = await self._post(entry["payload"])
+        except Exception as e:
+            entry["future"].set_exception(e)
+            return
+        self._resolve(entry, response)
+
+    def _resolve(self, entry: Dict[str, Any], response: Dict[str, Any]) -> None:
+        """Format a response with the request's web3 formatters, mirroring web3's own batch handling."""
+        future = entry["future"]
+        if future.done():
+            return
+        result_formatters, error_formatters, null_result_formatters = entry["formatters"]
+        try:
+            result = self.web3.manager.formatted_response(
+                response, entry["payload"]["params"], error_formatters, null_result_formatters
+            )
+            result = apply_result_formatters(result_formatters, result)
+            future.set_result(AttributeDict.recursive(result) if isinstance(result, (dict, list)) else result)
+        except Exception as e:
+            future.set_exception(e)
+
+    async def _post(self, payload: Any) -> Any:
+        if self.router is not None:
+            return await self.router.send(lambda endpoint_uri: self._post_to(endpoint_uri, payload))
+        return await self._post_to(self.endpoint_uri, payload)
+
+    async def _post_to(self, endpoint_uri: str, payload: Any) -> Any:
+        session = self._get_session()
+        if session is None:
+            if self._own_session is None or self._own_session.closed:
+                self._own_session = aiohttp.ClientSession()
+            session = self._own_session
+
+        async with session.post(
+            endpoint_uri,
+            data=FriendlyJsonSerde().json_encode(payload, cls=Web3JsonEncoder),
+            headers={"Content-Type": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        ) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    async def close(self) -> None:
+        """Close the session this transport opened itself, if any."""
+        if self._own_session is not None:
+            await self._own_session.close()
+            self._own_session = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get batching statistics.
+
+        Returns:
+            Dict with request, batch and fallback counts and the mean batch size
+        """
+        return {
+            **self.stats,
+            "max_batch_size": self.max_batch_size,
+            "mean_batch_size": round(self.stats["batched_requests"] / self.stats["batches"], 2)
+            if self.stats["batches"] else None
+        }
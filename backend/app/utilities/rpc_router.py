@@ -0,0 +1,299 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+from eth_typing import URI
+from web3 import AsyncWeb3
+from web3._utils.batching import sort_batch_response_by_response_ids
+
+logger = logging.getLogger(__name__)
+
+# Methods whose effect or answer depends on the node's own mempool always go to the primary
+PINNED_METHODS = {"eth_sendRawTransaction", "eth_sendTransaction"}
+
+
+def is_pinned_request(method: str, params: Any) -> bool:
+    """
+    Whether a JSON-RPC request must be sent to the primary provider.
+
+    Transactions are sent to one node, and the server wallet's pending nonce is
+    read from that same node so it counts what was just sent.
+
+    Args:
+        method: JSON-RPC method name
+        params: Request params
+
+    Returns:
+        True for writes and pending nonce reads
+    """
+    if method in PINNED_METHODS:
+        return True
+    return method == "eth_getTransactionCount" and len(params) > 1 and params[1] == "pending"
+
+
+class _Endpoint:
+    """One provider's rolling latency record, circuit breaker and request budget."""
+
+    def __init__(self, index: int, url: str, rate_limit: Optional[float], window: int):
+        self.url = url
+        # Provider URLs often embed an API key, so stats only show the host
+        self.name = f"{index}:{urlparse(url).hostname or url}"
+        self.samples: Deque[Tuple[float, bool]] = deque(maxlen=window)
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+        self.rate_limit = rate_limit or None
+        self.tokens = self.rate_limit or 0.0
+        self.refilled_at = time.monotonic()
+        self.requests = 0
+        self.rate_limited = 0
+
+    def take_token(self) -> bool:
+        """Spend one request of the budget, refilled continuously up to one second's worth."""
+        if self.rate_limit is None:
+            return True
+        now = time.monotonic()
+        self.tokens = min(self.rate_limit, self.tokens + (now - self.refilled_at) * self.rate_limit)
+        self.refilled_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def token_wait(self) -> float:
+        """Seconds until the next request fits the budget."""
+        if self.rate_limit is None:
+            return 0.0
+        return max(0.0, (1 - self.tokens) / self.rate_limit)
+
+
+class RpcRouter:
+    """
+    Routes JSON-RPC requests across several providers.
+
+    Reads go to the healthy provider with the lowest mean latency plus a
+    penalty for its recent error rate, and fail over to the next one when a
+    provider errors or is out of its per-second budget. Writes and pending nonce
+    reads are pinned to the first (primary) provider. After failure_threshold
+    consecutive failures a provider's circuit opens and it gets no reads for
+    cooldown seconds; then one read probes it and either closes the circuit or
+    opens it again.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        rate_limits: Optional[Sequence[float]] = None,
+        failure_threshold: int = 5,
+        cooldown: float = 30,
+        window: int = 50,
+        error_penalty: float = 5.0,
+        default_latency: float = 0.5
+    ):
+        """
+        Initialize with the provider URLs, primary first.
+
+        Args:
+            urls: JSON-RPC HTTP endpoints; the first takes writes
+            rate_limits: Requests per second per provider, in the same order; 0 or missing is unlimited
+            failure_threshold: Consecutive failures that open a provider's circuit
+            cooldown: Seconds an open circuit stays open before a probe
+            window: Requests per provider kept for latency and error rate
+            error_penalty: Seconds added to the score per unit of error rate
+            default_latency: Score of a provider with no successful samples
+        """
+        rate_limits = list(rate_limits or [])
+        self.endpoints = [
+            _Endpoint(index, url, rate_limits[index] if index < len(rate_limits) else None, window)
+            for index, url in enumerate(urls)
+        ]
+        self.primary = self.endpoints[0]
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.error_penalty = error_penalty
+        self.default_latency = default_latency
+        self.stats = {
+            "reads": 0,
+            "writes": 0,
+            "failovers": 0,
+            "circuits_opened": 0,
+            "rate_limit_waits": 0
+        }
+
+    @property
+    def urls(self) -> List[str]:
+        return [endpoint.url for endpoint in self.endpoints]
+
+    def score(self, endpoint: _Endpoint) -> float:
+        """Get the ranking score of a provider in seconds; lower is better."""
+        if not endpoint.samples:
+            return self.default_latency
+        latencies = [latency for latency, ok in endpoint.samples if ok]
+        mean_latency = sum(latencies) / len(latencies) if latencies else self.default_latency
+        error_rate = sum(1 for _, ok in endpoint.samples if not ok) / len(endpoint.samples)
+        return mean_latency + error_rate * self.error_penalty
+
+    def _state(self, endpoint: _Endpoint, now: float) -> str:
+        if endpoint.opened_at is None:
+            return "closed"
+        if endpoint.probing or now - endpoint.opened_at < self.cooldown:
+            return "open"
+        return "half_open"
+
+    def _read_order(self) -> List[_Endpoint]:
+        """Providers due a probe first, then healthy ones by score. Open circuits are left out."""
+        now = time.monotonic()
+        states = {endpoint.name: self._state(endpoint, now) for endpoint in self.endpoints}
+        probes = [endpoint for endpoint in self.endpoints if states[endpoint.name] == "half_open"]
+        healthy = sorted(
+            (endpoint for endpoint in self.endpoints if states[endpoint.name] == "closed"),
+            key=self.score
+        )
+        return probes + healthy
+
+    def _record(self, endpoint: _Endpoint, latency: float, ok: bool) -> None:
+        endpoint.samples.append((latency, ok))
+        was_probe, endpoint.probing = endpoint.probing, False
+        if ok:
+            endpoint.consecutive_failures = 0
+            if endpoint.opened_at is not None:
+                logger.info(f"RPC provider {endpoint.name} recovered; closing its circuit")
+                endpoint.opened_at = None
+                # Start over so the old errors don't keep it at the back
+                endpoint.samples.clear()
+                endpoint.samples.append((latency, ok))
+            return
+
+        endpoint.consecutive_failures += 1
+        if was_probe or (endpoint.opened_at is None and endpoint.consecutive_failures >= self.failure_threshold):
+            if endpoint.opened_at is None:
+                self.stats["circuits_opened"] += 1
+                logger.warning(
+                    f"RPC provider {endpoint.name} failed {endpoint.consecutive_failures} times in a row; "
+                    f"taking it out of rotation for {self.cooldown}s"
+                )
+            endpoint.opened_at = time.monotonic()
+
+    async def _attempt(self, endpoint: _Endpoint, post: Callable[[str], Awaitable[Any]]) -> Any:
+        if self._state(endpoint, time.monotonic()) == "half_open":
+            endpoint.probing = True
+        endpoint.requests += 1
+        started = time.monotonic()
+        try:
+            result = await post(endpoint.url)
+        except asyncio.CancelledError:
+            endpoint.probing = False
+            raise
+        except Exception:
+            self._record(endpoint, time.monotonic() - started, False)
+            raise
+        self._record(endpoint, time.monotonic() - started, True)
+        return result
+
+    async def send(self, post: Callable[[str], Awaitable[Any]], write: bool = False) -> Any:
+        """
+        Send a request to the best provider, failing over on errors.
+
+        Args:
+            post: Sends the request to a provider URL and returns the response
+            write: Pin the request to the primary provider
+
+        Returns:
+            The first successful response
+
+        Raises:
+            Exception: The last provider's error if none succeeded
+        """
+        if write:
+            self.stats["writes"] += 1
+            endpoint = self.primary
+            while not endpoint.take_token():
+                endpoint.rate_limited += 1
+                self.stats["rate_limit_waits"] += 1
+                await asyncio.sleep(endpoint.token_wait())
+            return await self._attempt(endpoint, post)
+
+        self.stats["reads"] += 1
+        candidates = self._read_order() or [self.primary]
+        last_error: Optional[Exception] = None
+        throttled = []
+        for endpoint in candidates:
+            if not endpoint.take_token():
+                endpoint.rate_limited += 1
+                throttled.append(endpoint)
+                continue
+            if last_error is not None:
+                self.stats["failovers"] += 1
+            try:
+                return await self._attempt(endpoint, post)
+            except Exception as e:
+                logger.warning(f"RPC provider {endpoint.name} failed: {str(e)}")
+                last_error = e
+
+        if throttled:
+            # Every untried provider is out of budget; wait for whichever frees up first
+            endpoint = min(throttled, key=lambda e: e.token_wait())
+            self.stats["rate_limit_waits"] += 1
+            await asyncio.sleep(endpoint.token_wait())
+            endpoint.take_token()
+            return await self._attempt(endpoint, post)
+
+        raise last_error
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get routing statistics.
+
+        Returns:
+            Dict with read, write and failover counters and each provider's health
+        """
+        now = time.monotonic()
+        providers = {}
+        for endpoint in self.endpoints:
+            latencies = [latency for latency, ok in endpoint.samples if ok]
+            providers[endpoint.name] = {
+                "primary": endpoint is self.primary,
+                "circuit": self._state(endpoint, now),
+                "requests": endpoint.requests,
+                "errors": sum(1 for _, ok in endpoint.samples if not ok),
+                "mean_latency_ms": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else None,
+                "score": round(self.score(endpoint), 3),
+                "rate_limit": endpoint.rate_limit,
+                "rate_limited": endpoint.rate_limited
+            }
+        return {**self.stats, "providers": providers}
+
+
+class RoutedAsyncHTTPProvider(AsyncWeb3.AsyncHTTPProvider):
+    """AsyncHTTPProvider that sends each request through an RpcRouter instead of one endpoint."""
+
+    def __init__(self, router: RpcRouter, request_kwargs: Optional[Any] = None):
+        # The router fails over between providers, so web3's own retries are turned off
+        super().__init__(router.primary.url, request_kwargs=request_kwargs, exception_retry_configuration=None)
+        self.router = router
+
+    async def cache_async_session(self, session):
+        """Use one pooled session for every provider."""
+        for url in self.router.urls:
+            await self._request_session_manager.async_cache_and_return_session(URI(url), session)
+        return session
+
+    def _post(self, request_data: bytes) -> Callable[[str], Awaitable[bytes]]:
+        async def post(url: str) -> bytes:
+            return await self._request_session_manager.async_make_post_request(
+                URI(url), request_data, **self.get_request_kwargs()
+            )
+        return post
+
+    async def make_request(self, method, params):
+        request_data = self.encode_rpc_request(method, params)
+        raw_response = await self.router.send(self._post(request_data), write=is_pinned_request(method, params))
+        return self.decode_rpc_response(raw_response)
+
+    async def make_batch_request(self, batch_requests):
+        request_data = self.encode_batch_rpc_request(batch_requests)
+        raw_response = await self.router.send(self._post(request_data))
+        return sort_batch_response_by_response_ids(self.decode_rpc_response(raw_response))
@@ -0,0 +1,144 @@
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def with_asset_cids(details: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Add the assetId -> CID map to decoded transaction details.
+
+    Args:
+        details: Decoded details, with asset_ids and cids for batch transactions
+
+    Returns:
+        A copy of the details with their asset_cids map
+    """
+    asset_cids: Dict[str, str] = {}
+    if "asset_ids" in details:
+        for asset_id, cid in zip(details["asset_ids"], details["cids"]):
+            # The first occurrence wins, as in the original list lookup
+            asset_cids.setdefault(asset_id, cid)
+    elif "asset_id" in details:
+        asset_cids[details["asset_id"]] = details["cid"]
+    return {**details, "asset_cids": asset_cids}
+
+
+class TxDetailsCache:
+    """
+    Cache of decoded registry transactions, keyed by transaction hash.
+
+    A mined transaction's hash commits to its input, so decoded details never
+    go stale and entries have no TTL. Callers only put transactions that were
+    mined and succeeded; a pending one may be replaced and never land. A
+    bounded in-memory LRU sits in front of an optional MongoDB repository that
+    survives restarts. Each entry carries an assetId -> CID map so any asset of
+    a batch transaction is a dictionary lookup.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.repository = None
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.stats = {
+            "memory_hits": 0,
+            "db_hits": 0,
+            "misses": 0,
+            "evictions": 0
+        }
+
+    def attach(self, repository) -> None:
+        """
+        Persist entries through a repository.
+
+        Args:
+            repository: TxDetailsRepository or any object with async get and insert
+        """
+        self.repository = repository
+
+    async def get(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the decoded details of a transaction.
+
+        Args:
+            tx_hash: Lowercase 0x-prefixed transaction hash
+
+        Returns:
+            The details with their asset_cids map, or None if not cached
+        """
+        entry = self._entries.get(tx_hash)
+        if entry is not None:
+            self._entries.move_to_end(tx_hash)
+            self.stats["memory_hits"] += 1
+            return entry
+
+        if self.repository is not None:
+            try:
+                document = await self.repository.get(tx_hash)
+            except Exception as e:
+                logger.warning(f"Transaction details lookup for {tx_hash} failed: {str(e)}")
+                document = None
+            if document is not None:
+                document.pop("_id", None)
+                self.stats["db_hits"] += 1
+                return self._remember(tx_hash, document)
+
+        self.stats["misses"] += 1
+        return None
+
+    async def put(self, tx_hash: str, details: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Cache the decoded details of a transaction.
+
+        Args:
+            tx_hash: Lowercase 0x-prefixed transaction hash
+            details: Decoded details, with asset_ids and cids for batch transactions
+
+        Returns:
+            The cached entry with its asset_cids map
+        """
+        entry = self._remember(tx_hash, details)
+        if self.repository is not None:
+            try:
+                await self.repository.insert(tx_hash, details)
+            except Exception as e:
+                logger.warning(f"Storing transaction details for {tx_hash} failed: {str(e)}")
+        return entry
+
+    def _remember(self, tx_hash: str, details: Dict[str, Any]) -> Dict[str, Any]:
+        """Add details to the memory tier with their assetId -> CID map."""
+        entry = with_asset_cids(details)
+        self._entries[tx_hash] = entry
+        self._entries.move_to_end(tx_hash)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+        return entry
+
+    def clear(self) -> None:
+        """Drop the memory tier. The repository is left untouched."""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hit, miss and eviction counters and the number of entries in memory
+        """
+        hits = self.stats["memory_hits"] + self.stats["db_hits"]
+        lookups = hits + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_ratio": round(hits / lookups, 3) if lookups else None,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "persistent": self.repository is not None
+        }
+
+
+# Global instance shared by all BlockchainService instances
+tx_details_cache = TxDetailsCache(settings.tx_details_cache_max_entries)
@@ -0,0 +1,59 @@
+import base64
+import hashlib
+
+# @web3-storage/upload-client (UnixFS.encodeFile) uses raw leaves and 1 MiB chunks,
+# so a file that fits in one chunk is stored as a single raw block. Larger files
+# become a dag-pb tree, which is left to the IPFS Node service.
+CHUNK_SIZE = 1024 * 1024
+
+RAW_CODEC = 0x55
+DAG_PB_CODEC = 0x70
+SHA2_256 = 0x12
+
+
+def _varint(value: int) -> bytes:
+    """Encode an unsigned integer as a multiformats varint."""
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def cid_bytes(codec: int, block: bytes) -> bytes:
+    """
+    Build the binary CIDv1 of a block using a sha2-256 multihash.
+
+    Args:
+        codec: Multicodec code of the block (raw or dag-pb)
+        block: The encoded block bytes
+
+    Returns:
+        Binary CIDv1
+    """
+    digest = hashlib.sha256(block).digest()
+    return _varint(1) + _varint(codec) + _varint(SHA2_256) + _varint(len(digest)) + digest
+
+
+def cid_to_string(cid: bytes) -> str:
+    """Encode a binary CID as a multibase base32 string (the 'b...' form)."""
+    return "b" + base64.b32encode(cid).decode("ascii").lower().rstrip("=")
+
+
+def compute_file_cid(data: bytes) -> str:
+    """
+    Compute the CID web3.storage assigns to a file of at most one chunk.
+
+    Args:
+        data: The file contents
+
+    Returns:
+        CIDv1 string in base32
+
+    Raises:
+        ValueError: If the file is larger than one chunk
+    """
+    if len(data) > CHUNK_SIZE:
+        raise ValueError(f"Files over {CHUNK_SIZE} bytes are chunked; compute their CID with the IPFS Node service")
+    return cid_to_string(cid_bytes(RAW_CODEC, data))
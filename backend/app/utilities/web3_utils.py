@@ -0,0 +1,26 @@
+import asyncio
+from typing import Any, Callable
+
+from web3 import AsyncWeb3
+
+
+async def run_web3_call(web3: Any, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a web3 call without blocking the event loop.
+
+    With an AsyncWeb3 instance the call returns a coroutine and is awaited directly.
+    With the synchronous Web3 backend the call is run in a worker thread instead.
+    Property reads such as gas_price can be passed as a lambda.
+
+    Args:
+        web3: The Web3 or AsyncWeb3 instance the call belongs to
+        fn: The web3 callable (e.g. web3.eth.get_transaction_count)
+        *args: Positional arguments for the call
+        **kwargs: Keyword arguments for the call
+
+    Returns:
+        The result of the web3 call
+    """
+    if isinstance(web3, AsyncWeb3):
+        return await fn(*args, **kwargs)
+    return await asyncio.to_thread(fn, *args, **kwargs)
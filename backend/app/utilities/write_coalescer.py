@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class WriteCoalescer:
+    """
+    Gathers concurrent writes that share a key into batches.
+
+    The first write for a key opens a batch. The batch is flushed when the
+    window elapses or max_size writes are queued, whichever comes first. A
+    write whose item ID is already in the open batch flushes that batch early
+    and opens a new one, so each item appears at most once per batch.
+    Every caller gets the result for its own item.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[Hashable, List[Any]], Awaitable[List[Any]]],
+        window: float,
+        max_size: int,
+        latency_samples: int = 500
+    ):
+        """
+        Initialize with the function that writes one batch.
+
+        Args:
+            flush: Coroutine function taking (key, items) and returning one result per item
+            window: Seconds a batch stays open after its first write
+            max_size: Writes per batch
+            latency_samples: Number of recent added-latency samples kept for stats
+        """
+        self.flush = flush
+        self.window = window
+        self.max_size = max_size
+        self._batches: Dict[Hashable, Dict[str, Any]] = {}
+        self._flush_tasks: set = set()
+        self._added_latency: Deque[float] = deque(maxlen=latency_samples)
+        self._batch_sizes: Deque[int] = deque(maxlen=latency_samples)
+        self.stats = {
+            "submitted": 0,
+            "batches": 0,
+            "flushed_by_size": 0,
+            "flushed_by_window": 0,
+            "flushed_by_duplicate": 0
+        }
+
+    async def submit(self, key: Hashable, item: Any, item_id: Optional[Hashable] = None) -> Any:
+        """
+        Add a write to the open batch for its key and wait for the batch to be written.
+
+        Args:
+            key: Writes with the same key are batched together
+            item: The write passed to the flush function
+            item_id: Identifies the item within a batch; duplicates go to the next batch
+
+        Returns:
+            The flush function's result for this item
+        """
+        batch = self._batches.get(key)
+        if batch is not None and item_id is not None and item_id in batch["ids"]:
+            self._start_flush(key, "flushed_by_duplicate")
+            batch = None
+
+        if batch is None:
+            batch = {"items": [], "ids": set(), "futures": [], "queued_at": []}
+            batch["timer"] = asyncio.get_running_loop().call_later(
+                self.window, self._start_flush, key, "flushed_by_window", batch
+            )
+            self._batches[key] = batch
+
+        future = asyncio.get_running_loop().create_future()
+        batch["items"].append(item)
+        batch["futures"].append(future)
+        batch["queued_at"].append(time.monotonic())
+        if item_id is not None:
+            batch["ids"].add(item_id)
+        self.stats["submitted"] += 1
+
+        if len(batch["items"]) >= self.max_size:
+            self._start_flush(key, "flushed_by_size")
+
+        return await future
+
+    def _start_flush(self, key: Hashable, reason: str, expected: Optional[Dict[str, Any]] = None) -> None:
+        """Close the open batch for a key and write it in the background."""
+        batch = self._batches.get(key)
+        if batch is None or (expected is not None and batch is not expected):
+            # The window timer of a batch that was already flushed
+            return
+
+        del self._batches[key]
+        batch["timer"].cancel()
+        self.stats[reason] += 1
+
+        task = asyncio.create_task(self._flush_batch(key, batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_batch(self, key: Hashable, batch: Dict[str, Any]) -> None:
+        started = time.monotonic()
+        self._added_latency.extend(started - queued_at for queued_at in batch["queued_at"])
+        self._batch_sizes.append(len(batch["items"]))
+        self.stats["batches"] += 1
+
+        try:
+            results = await self.flush(key, batch["items"])
+        except Exception as e:
+            for future in batch["futures"]:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, result in zip(batch["futures"], results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get batching statistics.
+
+        Returns:
+            Dict with the window, max batch size, batch counts, mean batch size and
+            the latency batching added to each write
+        """
+        latencies = sorted(self._added_latency)
+        sizes = list(self._batch_sizes)
+        return {
+            **self.stats,
+            "window_ms": round(self.window * 1000, 2),
+            "max_size": self.max_size,
+            "open_batches": len(self._batches),
+            "mean_batch_size": round(sum(sizes) / len(sizes), 2) if sizes else None,
+            "added_latency_mean_ms": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else None,
+            "added_latency_p95_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000, 2)
+            if latencies else None,
+            "added_latency_max_ms": round(latencies[-1] * 1000, 2) if latencies else None
+        }
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Index diagnostic for the MongoDB collections.
+Runs explain() on each repository's canonical queries and flags collection scans.
+
+Usage (from backend/):
+    python scripts/check_indexes.py           # explain only
+    python scripts/check_indexes.py --build   # build missing indexes first
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import get_db_client
+from app.utilities.index_manager import IndexManager
+
+# Define colors for output
+GREEN = "\033[92m"
+YELLOW = "\033[93m"
+RED = "\033[91m"
+RESET = "\033[0m"
+BOLD = "\033[1m"
+
+def success(msg):
+    print(f"{GREEN}✓ {msg}{RESET}")
+
+def warning(msg):
+    print(f"{YELLOW}⚠ {msg}{RESET}")
+
+def error(msg):
+    print(f"{RED}✗ {msg}{RESET}")
+
+def info(msg):
+    print(f"{BOLD}{msg}{RESET}")
+
+async def check_indexes(build=False):
+    """Explain the canonical queries and return the number of collection scans."""
+    db_client = get_db_client()
+    if db_client.using_mock:
+        error("MongoDB is not reachable; explain() needs a real database")
+        return 1
+
+    index_manager = IndexManager(db_client)
+    if build:
+        info("Building indexes...")
+        for name, created in (await index_manager.build()).items():
+            (success if created else error)(f"{name} indexes")
+
+    info("Explaining canonical queries...")
+    collscans = 0
+    for report in await index_manager.explain_queries():
+        label = f"{report['collection']}: {report['query']}"
+        if "error" in report:
+            error(f"{label} - explain failed: {report['error']}")
+        elif report["collscan"]:
+            collscans += 1
+            error(f"{label} - COLLSCAN ({' > '.join(report['stages'])})")
+        elif report["in_memory_sort"]:
+            warning(f"{label} - in-memory SORT using {', '.join(report['indexes'])}")
+        else:
+            success(f"{label} - {', '.join(report['indexes'])}")
+
+    db_client.close()
+    return collscans
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Flag MongoDB queries that scan whole collections")
+    parser.add_argument("--build", action="store_true", help="Build every repository's indexes first")
+    args = parser.parse_args()
+    sys.exit(1 if asyncio.run(check_indexes(args.build)) else 0)
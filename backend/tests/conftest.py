@@ -1,8 +1,10 @@
 # conftest.py
+import inspect
 import pytest
 import pytest_asyncio
 from unittest.mock import MagicMock, AsyncMock
 from datetime import datetime, timezone
+from types import SimpleNamespace
 
 # Fixed timestamp for use in tests for consistency
 @pytest.fixture
@@ -18,6 +20,102 @@ def event_loop():
     yield loop
     loop.close()
 
+# In-memory MongoDB stand-ins
+def _matches(document, query):
+    """Evaluate the subset of MongoDB query operators the repositories and backfills use."""
+    for key, value in query.items():
+        if key == "$and":
+            if not all(_matches(document, part) for part in value):
+                return False
+        elif key == "$or":
+            if not any(_matches(document, part) for part in value):
+                return False
+        elif isinstance(value, dict) and "$exists" in value:
+            if (key in document) != value["$exists"]:
+                return False
+        elif isinstance(value, dict) and "$gt" in value:
+            if not document.get(key) > value["$gt"]:
+                return False
+        elif isinstance(value, dict) and "$lt" in value:
+            if not document.get(key) < value["$lt"]:
+                return False
+        elif isinstance(value, dict) and "$in" in value:
+            if document.get(key) not in value["$in"]:
+                return False
+        elif document.get(key) != value:
+            return False
+    return True
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, key_or_list, direction=1):
+        keys = key_or_list if isinstance(key_or_list, list) else [(key_or_list, direction)]
+        for field, field_direction in reversed(keys):
+            self.documents.sort(key=lambda d: d[field], reverse=field_direction < 0)
+        return self
+
+    def limit(self, count):
+        self.documents = self.documents[:count]
+        return self
+
+    async def to_list(self, length=None):
+        return self.documents
+
+class FakeCollection:
+    """In-memory collection covering find, find_one, update_one and bulk_write."""
+
+    def __init__(self, documents=()):
+        self.documents = [dict(d) for d in documents]
+        self.queries = []
+        self.batches = 0
+
+    def find(self, query=None, projection=None):
+        self.queries.append(query)
+        found = [dict(d) for d in self.documents if _matches(d, query or {})]
+        if projection:
+            found = [{k: v for k, v in d.items() if k == "_id" or k in projection} for d in found]
+        return FakeCursor(found)
+
+    async def find_one(self, query):
+        return next((dict(d) for d in self.documents if _matches(d, query)), None)
+
+    async def update_one(self, query, update, upsert=False):
+        document = next((d for d in self.documents if _matches(d, query)), None)
+        if document is None:
+            if not upsert:
+                return SimpleNamespace(modified_count=0)
+            document = dict(query)
+            self.documents.append(document)
+        document.update(update.get("$set", {}))
+        for field in update.get("$unset", {}):
+            document.pop(field, None)
+        return SimpleNamespace(modified_count=1)
+
+    async def bulk_write(self, operations, ordered=True):
+        self.batches += 1
+        for operation in operations:
+            await self.update_one(operation._filter, operation._doc)
+        return SimpleNamespace(modified_count=len(operations))
+
+@pytest.fixture
+def fake_db():
+    """Return a factory for a database client backed by in-memory collections."""
+    def make(assets=(), transactions=()):
+        collections = {
+            "assets": FakeCollection(assets),
+            "transactions": FakeCollection(transactions),
+            "migrations": FakeCollection()
+        }
+        db_client = SimpleNamespace(
+            assets_collection=collections["assets"],
+            transaction_collection=collections["transactions"],
+            get_collection=lambda name: collections[name]
+        )
+        return db_client, collections
+    return make
+
 # Database and Repository Mocks
 @pytest.fixture
 def mock_db_client():
@@ -36,10 +134,13 @@ def mock_asset_repo():
     repo = MagicMock()
     repo.find_asset = AsyncMock()
     repo.find_assets = AsyncMock()
+    repo.find_assets_page = AsyncMock(return_value=([], None))
+    repo.find_asset_ids = AsyncMock(return_value=[])
     repo.insert_asset = AsyncMock()
     repo.update_asset = AsyncMock()
     repo.update_assets = AsyncMock()
     repo.delete_asset = AsyncMock()
+    repo.find_created_at = AsyncMock(return_value={})
     return repo
 
 @pytest.fixture
@@ -60,6 +161,7 @@ def mock_transaction_repo():
     repo = MagicMock()
     repo.insert_transaction = AsyncMock()
     repo.find_transactions = AsyncMock()
+    repo.find_transactions_page = AsyncMock(return_value=([], None))
     repo.find_transaction = AsyncMock()
     repo.update_transaction = AsyncMock()
     repo.delete_transaction = AsyncMock()
@@ -89,12 +191,15 @@ def mock_asset_service():
     service.get_asset = AsyncMock()
     service.get_asset_with_deleted = AsyncMock()
     service.get_documents_by_wallet = AsyncMock()
+    service.get_user_asset_ids = AsyncMock(return_value=[])
+    service.get_user_assets_page = AsyncMock(return_value={"assets": [], "next_cursor": None})
     service.create_asset = AsyncMock()
     service.create_new_version = AsyncMock()
     service.update_non_critical_metadata = AsyncMock()
     service.soft_delete = AsyncMock()
     service.undelete_asset = AsyncMock()
     service.get_version_history = AsyncMock()
+    service.get_created_at = AsyncMock(return_value={})
     return service
 
 @pytest.fixture
@@ -117,6 +222,7 @@ def mock_transaction_service():
     service = MagicMock()
     service.get_asset_history = AsyncMock()
     service.get_wallet_history = AsyncMock()
+    service.get_wallet_history_page = AsyncMock(return_value={"transactions": [], "next_cursor": None})
     service.record_transaction = AsyncMock()
     service.get_transaction_by_id = AsyncMock()
     service.get_transaction_summary = AsyncMock()
@@ -145,13 +251,32 @@ def mock_blockchain_service():
     service.wallet_address = "0x9876543210987654321098765432109876543210"
     return service
 
+@pytest.fixture
+def blockchain_service_double():
+    """Create a real BlockchainService over mock web3 and contract objects.
+
+    _call runs each RPC inline, awaiting it if needed, and records it in rpc_calls.
+    """
+    from app.services.blockchain_service import BlockchainService
+
+    service = BlockchainService()
+    service.web3 = MagicMock()
+    service.contract = MagicMock()
+    service.rpc_calls = []
+
+    async def call(fn, *args, **kwargs):
+        service.rpc_calls.append(fn)
+        result = fn(*args, **kwargs)
+        return await result if inspect.isawaitable(result) else result
+    service._call = call
+    return service
+
 @pytest.fixture
 def mock_ipfs_service():
     """Create mock IPFSService."""
     service = MagicMock()
     service.store_metadata = AsyncMock()
     service.retrieve_metadata = AsyncMock()
-    service.upload_files = AsyncMock()
     service.get_file_url = AsyncMock()
     service.get_file_contents = AsyncMock()
     service.compute_cid = AsyncMock()
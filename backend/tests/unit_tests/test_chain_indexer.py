@@ -0,0 +1,269 @@
+import os
+
+import pytest
+from hexbytes import HexBytes
+from web3 import Web3
+
+from app.handlers.retrieve_handler import RetrieveHandler
+from app.services.blockchain_service import BlockchainService
+from app.services.chain_indexer_service import ChainIndexerService, asset_id_hash
+
+OWNER = "0x1111111111111111111111111111111111111111"
+RECIPIENT = "0x2222222222222222222222222222222222222222"
+CONTRACT = "0x3333333333333333333333333333333333333333"
+
+
+class InMemoryEventRepository:
+    """Keeps chain events in lists with the same interface as ChainEventRepository."""
+
+    def __init__(self):
+        self.events = {}
+        self.cursors = {}
+
+    async def create_indexes(self):
+        pass
+
+    async def upsert_events(self, events):
+        for event in events:
+            self.events[(event["contract"], event["transactionHash"], event["logIndex"])] = event
+        return len(events)
+
+    async def delete_events_after(self, contract, block_number):
+        doomed = [key for key, event in self.events.items() if event["contract"] == contract and event["blockNumber"] > block_number]
+        for key in doomed:
+            del self.events[key]
+        return len(doomed)
+
+    async def get_cursor(self, contract):
+        return self.cursors.get(contract)
+
+    async def set_cursor(self, contract, block_number, block_hash):
+        self.cursors[contract] = {"blockNumber": block_number, "blockHash": block_hash}
+
+    def _sorted(self, predicate):
+        return sorted(
+            (event for event in self.events.values() if predicate(event)),
+            key=lambda event: (event["blockNumber"], event["logIndex"])
+        )
+
+    async def get_latest_ipfs_update(self, contract, owner, asset_id_hash):
+        updates = self._sorted(lambda e: e["event"] == "IPFSUpdated" and e["owner"] == owner
+                               and e["assetIdHash"] == asset_id_hash and not e["isDeleted"])
+        return max(updates, key=lambda e: e["ipfsVersion"]) if updates else None
+
+    async def get_transfer_events(self, contract, owners=None, to=None):
+        return self._sorted(lambda e: e["event"].startswith("Transfer")
+                            and (owners is None or e["owner"] in owners)
+                            and (to is None or e["to"] == to))
+
+    async def get_latest_delegation_event(self, contract, owner, delegate):
+        events = self._sorted(lambda e: e["event"] == "DelegateStatusChanged"
+                              and e["owner"] == owner and e["delegate"] == delegate)
+        return events[-1] if events else None
+
+
+class FakeChain:
+    """Blocks with hashes and decoded registry events, served like BlockchainService does."""
+
+    def __init__(self, head):
+        self.contract_address = CONTRACT
+        self.head = head
+        self.fork = 0
+        self.events = []
+        self.log_calls = []
+
+    def block_hash(self, block_number, fork=None):
+        return f"{block_number:04x}{self.fork if fork is None else fork:02x}"
+
+    def add_event(self, name, block_number, log_index=0, **args):
+        self.events.append({
+            "event": name,
+            "args": args,
+            "blockNumber": block_number,
+            "logIndex": log_index,
+            "transactionHash": HexBytes(Web3.keccak(text=f"{name}-{block_number}-{log_index}-{self.fork}")),
+            "blockHash": HexBytes(bytes.fromhex(self.block_hash(block_number)))
+        })
+
+    async def get_latest_block_number(self):
+        return self.head
+
+    async def get_block_hash(self, block_number):
+        return self.block_hash(block_number)
+
+    async def get_registry_events(self, from_block, to_block):
+        self.log_calls.append((from_block, to_block))
+        return [e for e in self.events if from_block <= e["blockNumber"] <= to_block]
+
+
+class RecoveringChain(FakeChain):
+    """FakeChain that also answers BlockchainService's event-log recovery."""
+
+    recover_data_from_events = BlockchainService.recover_data_from_events
+    _latest_update_event = staticmethod(BlockchainService._latest_update_event)
+
+    async def _query_events_chunked(self, asset_id, owner_address, from_block, to_block):
+        self.log_calls.append((from_block, to_block))
+        return [e for e in self.events if e["event"] == "IPFSUpdated" and from_block <= e["blockNumber"] <= to_block
+                and e["args"]["assetId"] == Web3.keccak(text=asset_id)]
+
+
+def ipfs_updated(chain, block_number, asset_id, version, cid, owner=OWNER):
+    chain.add_event(
+        "IPFSUpdated", block_number,
+        owner=Web3.to_checksum_address(owner), assetId=Web3.keccak(text=asset_id),
+        ipfsVersion=version, cid=cid, isDeleted=False
+    )
+
+
+def transfer(chain, name, block_number, asset_id, sender=OWNER, to=RECIPIENT):
+    chain.add_event(
+        name, block_number,
+        **{"from": Web3.to_checksum_address(sender), "to": Web3.to_checksum_address(to),
+           "assetId": Web3.keccak(text=asset_id)}
+    )
+
+
+class TestChainIndexer:
+    @pytest.mark.asyncio
+    async def test_sync_checkpoints_chunks_and_answers_recovery(self):
+        """Test that events are indexed chunk by chunk and the latest CID comes from the index."""
+        chain = FakeChain(head=250)
+        ipfs_updated(chain, 10, "asset-1", 1, "bafy-v1")
+        ipfs_updated(chain, 180, "asset-1", 2, "bafy-v2")
+        repo = InMemoryEventRepository()
+        indexer = ChainIndexerService(chain, repo, start_block=0, chunk_size=100, poll_interval=15, reorg_depth=5)
+
+        assert await indexer.sync_once() == 2
+        assert chain.log_calls == [(0, 99), (100, 199), (200, 250)]
+        assert repo.cursors[CONTRACT] == {"blockNumber": 250, "blockHash": chain.block_hash(250)}
+        assert indexer.is_ready()
+
+        recovered = await indexer.find_latest_cid("asset-1", OWNER)
+        assert recovered["cid"] == "bafy-v2"
+        assert recovered["tx_hash"] == chain.events[1]["transactionHash"].hex()
+        assert await indexer.find_latest_cid("asset-2", OWNER) is None
+
+        # Nothing new: the next sync starts after the cursor
+        chain.log_calls.clear()
+        chain.head = 260
+        await indexer.sync_once()
+        assert chain.log_calls == [(251, 260)]
+
+    @pytest.mark.asyncio
+    async def test_reorg_rolls_back_and_reindexes(self):
+        """Test that a changed cursor block hash drops recent events and indexes the new fork."""
+        chain = FakeChain(head=100)
+        ipfs_updated(chain, 50, "asset-1", 1, "bafy-v1")
+        ipfs_updated(chain, 98, "asset-1", 2, "bafy-orphaned")
+        repo = InMemoryEventRepository()
+        indexer = ChainIndexerService(chain, repo, start_block=0, chunk_size=1000, poll_interval=15, reorg_depth=5)
+        await indexer.sync_once()
+
+        # Blocks from 96 on are replaced; the update lands in block 99 with a different CID
+        chain.fork = 1
+        chain.events = [e for e in chain.events if e["blockNumber"] < 96]
+        ipfs_updated(chain, 99, "asset-1", 2, "bafy-canonical")
+        chain.head = 102
+        original_hash = chain.block_hash
+        chain.block_hash = lambda n, fork=None: original_hash(n, 0 if n < 96 else 1)
+
+        await indexer.sync_once()
+
+        assert indexer.reorgs_handled == 1
+        assert (await indexer.find_latest_cid("asset-1", OWNER))["cid"] == "bafy-canonical"
+        assert [e["cid"] for e in repo.events.values()] == ["bafy-v1", "bafy-canonical"]
+        assert repo.cursors[CONTRACT]["blockHash"] == chain.block_hash(102)
+
+    @pytest.mark.asyncio
+    async def test_pending_transfers_and_delegation_status(self):
+        """Test that pending transfers and delegation status follow the latest indexed event."""
+        chain = FakeChain(head=40)
+        transfer(chain, "TransferInitiated", 10, "asset-pending")
+        transfer(chain, "TransferInitiated", 11, "asset-cancelled")
+        transfer(chain, "TransferCancelled", 12, "asset-cancelled")
+        transfer(chain, "TransferInitiated", 13, "asset-redirected")
+        transfer(chain, "TransferCancelled", 14, "asset-redirected")
+        transfer(chain, "TransferInitiated", 15, "asset-redirected", to=OWNER, sender=RECIPIENT)
+        chain.add_event("DelegateStatusChanged", 20, owner=Web3.to_checksum_address(OWNER),
+                        delegate=Web3.to_checksum_address(RECIPIENT), status=True)
+        chain.add_event("DelegateStatusChanged", 30, owner=Web3.to_checksum_address(OWNER),
+                        delegate=Web3.to_checksum_address(RECIPIENT), status=False)
+        indexer = ChainIndexerService(chain, InMemoryEventRepository(), start_block=0, chunk_size=1000, poll_interval=15)
+        await indexer.sync_once()
+
+        owner_pending = await indexer.get_pending_transfers(OWNER)
+        assert [e["assetIdHash"] for e in owner_pending["outgoing"]] == [asset_id_hash("asset-pending")]
+        assert [e["assetIdHash"] for e in owner_pending["incoming"]] == [asset_id_hash("asset-redirected")]
+
+        recipient_pending = await indexer.get_pending_transfers(RECIPIENT)
+        assert [e["assetIdHash"] for e in recipient_pending["incoming"]] == [asset_id_hash("asset-pending")]
+
+        assert await indexer.get_delegation_status(OWNER, RECIPIENT) is False
+
+    @pytest.mark.asyncio
+    async def test_recovery_scans_only_blocks_past_the_index(self, monkeypatch):
+        """Test that an update mined after the last sync wins over the indexed CID."""
+        chain = RecoveringChain(head=100)
+        ipfs_updated(chain, 10, "asset-1", 1, "bafy-v1")
+        ipfs_updated(chain, 20, "asset-2", 1, "bafy-other")
+        indexer = ChainIndexerService(chain, InMemoryEventRepository(), start_block=0, chunk_size=1000, poll_interval=15)
+        await indexer.sync_once()
+        monkeypatch.setattr("app.handlers.retrieve_handler.get_chain_indexer", lambda: indexer)
+        handler = RetrieveHandler(None, chain, None)
+
+        ipfs_updated(chain, 105, "asset-1", 2, "bafy-v2")
+        chain.head = 110
+        chain.log_calls.clear()
+
+        assert (await handler._recover_from_events("asset-1", OWNER))["cid"] == "bafy-v2"
+        assert (await handler._recover_from_events("asset-2", OWNER))["cid"] == "bafy-other"
+        assert chain.log_calls == [(101, 110), (101, 110)]
+        with pytest.raises(ValueError):
+            await handler._recover_from_events("asset-3", OWNER)
+
+
+# Run against a local Hardhat node with a deployed FuseVaultRegistry:
+#   npm run node && npm run deploy:local   (in blockchain/)
+#   HARDHAT_RPC_URL=http://127.0.0.1:8545 HARDHAT_CONTRACT_ADDRESS=0x... pytest tests/unit_tests/test_chain_indexer.py
+HARDHAT_RPC_URL = os.environ.get("HARDHAT_RPC_URL")
+HARDHAT_CONTRACT_ADDRESS = os.environ.get("HARDHAT_CONTRACT_ADDRESS")
+# Hardhat's first default account
+HARDHAT_ACCOUNT = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+HARDHAT_PRIVATE_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+
+@pytest.mark.skipif(
+    not (HARDHAT_RPC_URL and HARDHAT_CONTRACT_ADDRESS),
+    reason="Set HARDHAT_RPC_URL and HARDHAT_CONTRACT_ADDRESS to run against a local Hardhat node"
+)
+class TestChainIndexerHardhat:
+    @pytest.mark.asyncio
+    async def test_indexes_events_from_local_node(self, monkeypatch):
+        """Test indexing real IPFSUpdated and DelegateStatusChanged events from a Hardhat node."""
+        from app.config import settings
+        from app.services.blockchain_service import BlockchainService
+
+        monkeypatch.setattr(settings, "alchemy_sepolia_url", HARDHAT_RPC_URL)
+        monkeypatch.setattr(settings, "contract_address", HARDHAT_CONTRACT_ADDRESS)
+        monkeypatch.setattr(settings, "wallet_address", HARDHAT_ACCOUNT)
+        monkeypatch.setattr(settings, "private_key", HARDHAT_PRIVATE_KEY)
+
+        service = BlockchainService()
+        await service.start()
+        try:
+            start_block = await service.get_latest_block_number() + 1
+            asset_id = f"indexer-test-{start_block}"
+            await service.store_hash("bafy-hardhat-v1", asset_id)
+            await service.store_hash("bafy-hardhat-v2", asset_id)
+            await service.set_delegate(RECIPIENT, True)
+
+            indexer = ChainIndexerService(service, InMemoryEventRepository(), start_block=start_block, chunk_size=5)
+            assert await indexer.sync_once() == 3
+
+            recovered = await indexer.find_latest_cid(asset_id, HARDHAT_ACCOUNT)
+            assert recovered["cid"] == "bafy-hardhat-v2"
+            assert recovered == await service.recover_data_from_events(asset_id, HARDHAT_ACCOUNT)
+            assert await indexer.get_delegation_status(HARDHAT_ACCOUNT, RECIPIENT) is True
+        finally:
+            await service.close()
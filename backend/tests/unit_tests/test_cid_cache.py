@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from app.utilities.cid_cache import CIDCache
+from app.utilities.unixfs import CHUNK_SIZE, compute_file_cid
+
+
+def content_and_cid(text):
+    content = text.encode("utf-8")
+    return content, compute_file_cid(content)
+
+
+class TestCIDCache:
+    @pytest.mark.asyncio
+    async def test_put_rejects_content_that_does_not_match_cid(self):
+        """Test that only content hashing to its CID is cached."""
+        cache = CIDCache(max_bytes=1024)
+        content, cid = content_and_cid('{"name":"Test Asset"}')
+
+        assert await cache.put(cid, b'{"name":"Tampered"}') is False
+        assert await cache.get(cid) is None
+        assert await cache.put(cid, content) is True
+        assert await cache.get(cid) == content
+
+        stats = cache.get_stats()
+        assert stats["rejected"] == 1
+        assert stats["memory_hits"] == 1 and stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_evicts_least_recently_used(self):
+        """Test that the memory tier stays within its byte budget in LRU order."""
+        first, first_cid = content_and_cid("a" * 40)
+        second, second_cid = content_and_cid("b" * 40)
+        third, third_cid = content_and_cid("c" * 40)
+        cache = CIDCache(max_bytes=100)
+
+        await cache.put(first_cid, first)
+        await cache.put(second_cid, second)
+        await cache.get(first_cid)
+        await cache.put(third_cid, third)
+
+        assert await cache.get(second_cid) is None
+        assert await cache.get(first_cid) == first
+        assert cache.get_stats()["evictions"] == 1
+        assert cache.get_stats()["bytes"] == 80
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_memory_loss_and_drops_corrupt_files(self, tmp_path):
+        """Test that the disk tier refills memory and discards files whose content no longer matches."""
+        content, cid = content_and_cid('{"name":"Test Asset"}')
+        cache = CIDCache(max_bytes=1024, cache_dir=str(tmp_path))
+        await cache.put(cid, content)
+
+        cache.clear()
+        assert await cache.get(cid) == content
+        assert cache.get_stats()["disk_hits"] == 1
+
+        cache.clear()
+        with open(cache._disk_path(cid), "wb") as f:
+            f.write(b"corrupted")
+        assert await cache.get(cid) is None
+        assert not (tmp_path / cid[-2:] / cid).exists()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_disk_hits_count_content_once(self, tmp_path):
+        """Test that two lookups refilling the same CID from disk don't double its size."""
+        content, cid = content_and_cid("a" * 600)
+        cache = CIDCache(max_bytes=1000, cache_dir=str(tmp_path))
+        await cache.put(cid, content)
+        cache.clear()
+
+        assert await asyncio.gather(cache.get(cid), cache.get(cid)) == [content, content]
+
+        stats = cache.get_stats()
+        assert (stats["entries"], stats["bytes"], stats["evictions"]) == (1, 600, 0)
+
+    @pytest.mark.asyncio
+    async def test_chunked_content_needs_a_computed_cid(self, tmp_path):
+        """Test that files over one chunk are only cached with a CID from the IPFS Node service, in memory."""
+        content, cid = b"x" * (CHUNK_SIZE + 1), "bafybeichunked"
+        cache = CIDCache(max_bytes=4 * CHUNK_SIZE, cache_dir=str(tmp_path))
+
+        assert await cache.put(cid, content) is False
+        assert await cache.put(cid, content, computed_cid="bafybeiother") is False
+        assert await cache.put(cid, content, computed_cid=cid) is True
+
+        assert await cache.get(cid) == content
+        assert not (tmp_path / cid[-2:] / cid).exists()
@@ -0,0 +1,155 @@
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from web3 import Web3
+
+from app.handlers.retrieve_handler import RetrieveHandler
+from app.utilities.cid_verification import hash_cid, verify_cid_against_ipfs_info
+
+OWNER = "0x1234567890123456789012345678901234567890"
+SERVER_WALLET = "0x9876543210987654321098765432109876543210"
+CID = "bafkreigh2akiscaildcqabsyg3dfr6chu3fgpregiymsck7e7aqa4s52zy"
+
+
+def ipfs_info(cid=CID, version=2, is_deleted=False):
+    return {"ipfs_version": version, "cid_hash": hash_cid(cid), "is_deleted": is_deleted}
+
+
+class TestCidHash:
+    @pytest.mark.parametrize("cid", [CID, "QmYwAPJzv5CZsnA625s3Xf2nemtYgPpHdWEz79ojWnPbdG", "", "bafy-ünïcode"])
+    def test_hash_matches_solidity_encode_packed(self, cid):
+        """Test that CIDs hash like keccak256(abi.encodePacked(string)) in FuseVaultRegistry."""
+        assert hash_cid(cid) == Web3.to_hex(Web3.solidity_keccak(["string"], [cid]))
+
+    @pytest.mark.parametrize("info, cid, claimed_version, expected", [
+        (None, CID, 1, (False, "Asset does not exist", 0, False)),
+        (ipfs_info(is_deleted=True), CID, 2, (False, "Asset is deleted", 2, True)),
+        (ipfs_info(), CID, 1, (False, "IPFS version mismatch - MongoDB record references outdated version", 2, False)),
+        (ipfs_info(), CID + "x", 2, (False, "CID mismatch - Content does not match what's on blockchain", 2, False)),
+        (ipfs_info(), CID, 2, (True, "Valid CID matches blockchain record", 2, False)),
+    ])
+    def test_outcomes_follow_verify_cid(self, info, cid, claimed_version, expected):
+        """Test that each verifyCID branch is reproduced with the contract's message."""
+        outcome = verify_cid_against_ipfs_info(info, cid, claimed_version)
+        assert (outcome["is_valid"], outcome["message"], outcome["actual_version"], outcome["is_deleted"]) == expected
+
+
+class TestLocalVerificationInRetrieve:
+    def make_handler(self, monkeypatch, stored_cid, is_current=True):
+        from app.config import settings
+        monkeypatch.setattr(settings, "blockchain_cid_verification", "local")
+
+        asset_service = MagicMock()
+        asset_service.get_asset_with_deleted = AsyncMock(return_value={"assetId": "asset-1"})
+        asset_service.get_asset = AsyncMock(return_value={
+            "_id": "doc123",
+            "assetId": "asset-1",
+            "versionNumber": 2,
+            "ipfsVersion": 2,
+            "isCurrent": is_current,
+            "walletAddress": OWNER,
+            "smartContractTxId": "0xabc123",
+            "ipfsHash": stored_cid,
+            "criticalMetadata": {"name": "Asset"},
+            "nonCriticalMetadata": {}
+        })
+        asset_service.asset_repository.find_asset = AsyncMock(return_value=None)
+
+        blockchain_service = MagicMock()
+        blockchain_service.get_server_wallet_address.return_value = SERVER_WALLET
+        blockchain_service.verify_cid_locally = AsyncMock(
+            side_effect=lambda asset_id, owner_address, cid, claimed_version:
+                verify_cid_against_ipfs_info(ipfs_info(), cid, claimed_version)
+        )
+        blockchain_service.verify_cid_on_chain = AsyncMock()
+        blockchain_service.get_transaction_details = AsyncMock(return_value={"cid": CID, "tx_sender": SERVER_WALLET})
+
+        ipfs_service = MagicMock()
+        ipfs_service.compute_cid = AsyncMock(return_value=stored_cid)
+
+        handler = RetrieveHandler(
+            asset_service=asset_service,
+            blockchain_service=blockchain_service,
+            ipfs_service=ipfs_service
+        )
+        return handler, blockchain_service
+
+    @pytest.mark.asyncio
+    async def test_current_version_needs_one_view_call(self, monkeypatch):
+        """Test that a current version whose CID hashes to the on-chain cidHash skips the transaction."""
+        handler, blockchain_service = self.make_handler(monkeypatch, CID)
+
+        result = await handler.retrieve_metadata("asset-1", initiator_address=OWNER)
+
+        assert result.verification.verified is True
+        assert result.verification.blockchain_cid == CID
+        assert result.verification.tx_sender_verified is None
+        blockchain_service.verify_cid_locally.assert_awaited_once()
+        blockchain_service.verify_cid_on_chain.assert_not_awaited()
+        blockchain_service.get_transaction_details.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_hash_mismatch_and_historical_versions_decode_the_transaction(self, monkeypatch):
+        """Test that the transaction is still read when the hash can't prove the CID."""
+        tampered, blockchain_service = self.make_handler(monkeypatch, "bafy-tampered")
+        result = await tampered.retrieve_metadata("asset-1", auto_recover=False, initiator_address=OWNER)
+        assert result.verification.verified is False and result.verification.recovery_needed is True
+        assert result.verification.blockchain_cid == CID
+        blockchain_service.get_transaction_details.assert_awaited_once()
+
+        historical, blockchain_service = self.make_handler(monkeypatch, CID, is_current=False)
+        result = await historical.retrieve_metadata("asset-1", version=1, initiator_address=OWNER)
+        assert result.verification.tx_sender_verified is True
+        blockchain_service.get_transaction_details.assert_awaited_once()
+
+
+# Parity with verifyCID on a local Hardhat node with a deployed FuseVaultRegistry:
+#   npm run node && npm run deploy:local   (in blockchain/)
+#   HARDHAT_RPC_URL=http://127.0.0.1:8545 HARDHAT_CONTRACT_ADDRESS=0x... pytest tests/unit_tests/test_cid_verification.py
+HARDHAT_RPC_URL = os.environ.get("HARDHAT_RPC_URL")
+HARDHAT_CONTRACT_ADDRESS = os.environ.get("HARDHAT_CONTRACT_ADDRESS")
+# Hardhat's first default account
+HARDHAT_ACCOUNT = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+HARDHAT_PRIVATE_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+
+@pytest.mark.skipif(
+    not (HARDHAT_RPC_URL and HARDHAT_CONTRACT_ADDRESS),
+    reason="Set HARDHAT_RPC_URL and HARDHAT_CONTRACT_ADDRESS to run against a local Hardhat node"
+)
+class TestCidVerificationHardhatParity:
+    @pytest.mark.asyncio
+    async def test_local_verification_matches_verify_cid(self, monkeypatch):
+        """Test that local verification agrees with verifyCID for every outcome."""
+        from app.config import settings
+        from app.services.blockchain_service import BlockchainService
+
+        monkeypatch.setattr(settings, "alchemy_sepolia_url", HARDHAT_RPC_URL)
+        monkeypatch.setattr(settings, "contract_address", HARDHAT_CONTRACT_ADDRESS)
+        monkeypatch.setattr(settings, "wallet_address", HARDHAT_ACCOUNT)
+        monkeypatch.setattr(settings, "private_key", HARDHAT_PRIVATE_KEY)
+
+        service = BlockchainService()
+        await service.start()
+        try:
+            block = await service.get_latest_block_number()
+            live, deleted = f"parity-live-{block}", f"parity-deleted-{block}"
+            await service.store_hash("bafy-parity-v1", live)
+            await service.store_hash("bafy-parity-ünïcode-v2", live)
+            await service.store_hash("bafy-parity-deleted", deleted)
+            await service.delete_asset(deleted)
+
+            cases = [
+                (live, "bafy-parity-ünïcode-v2", 2),
+                (live, "bafy-parity-v1", 2),
+                (live, "bafy-parity-v1", 1),
+                (deleted, "bafy-parity-deleted", 1),
+                (f"parity-missing-{block}", "bafy-parity-v1", 1),
+            ]
+            for asset_id, cid, version in cases:
+                on_chain = await service.verify_cid_on_chain(asset_id, HARDHAT_ACCOUNT, cid, version)
+                local = await service.verify_cid_locally(asset_id, HARDHAT_ACCOUNT, cid, version)
+                assert {key: local[key] for key in on_chain} == on_chain, (asset_id, cid, version)
+        finally:
+            await service.close()
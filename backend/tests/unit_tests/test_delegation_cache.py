@@ -0,0 +1,67 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services import blockchain_service as blockchain_module
+from app.services.blockchain_service import BlockchainService
+from app.utilities import delegation_cache as cache_module
+from app.utilities.delegation_cache import DelegationCache, memoize_delegation_checks
+
+OWNER = "0x1111111111111111111111111111111111111111"
+DELEGATE = "0x2222222222222222222222222222222222222222"
+
+
+class TestDelegationCache:
+    def test_positive_and_negative_results_expire_separately(self, monkeypatch):
+        """Test that approvals and refusals are cached for their own TTLs, case-insensitively."""
+        now = [100.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache = DelegationCache(ttl=30, negative_ttl=5)
+
+        cache.put(OWNER, DELEGATE, True)
+        cache.put(DELEGATE, OWNER, False)
+        assert cache.get(OWNER.upper(), DELEGATE) is True
+        assert cache.get(DELEGATE, OWNER) is False
+
+        now[0] += 10
+        assert cache.get(OWNER, DELEGATE) is True
+        assert cache.get(DELEGATE, OWNER) is None
+
+        now[0] += 30
+        assert cache.get(OWNER, DELEGATE) is None
+        assert cache.get_stats()["entries"] == 0
+
+    def test_invalidation_discards_lookups_already_in_flight(self):
+        """Test that a chain read started before an invalidation is not cached."""
+        cache = DelegationCache(ttl=30, negative_ttl=5)
+        cache.put(OWNER, DELEGATE, True)
+
+        generation = cache.generation()
+        cache.invalidate(OWNER, DELEGATE)
+        assert cache.get(OWNER, DELEGATE) is None
+
+        cache.put(OWNER, DELEGATE, True, generation)
+        assert cache.get(OWNER, DELEGATE) is None
+
+        cache.put(OWNER, DELEGATE, False, cache.generation())
+        assert cache.get(OWNER, DELEGATE) is False
+
+    @pytest.mark.asyncio
+    async def test_check_delegation_reuses_results_within_a_memoized_call(self, monkeypatch):
+        """Test that a batch checks each pair on-chain once even with caching disabled."""
+        monkeypatch.setattr(blockchain_module, "delegation_cache", DelegationCache(ttl=0, negative_ttl=0))
+        service = BlockchainService()
+        service.contract = MagicMock()
+        service.rpc_batch = None
+        service._call = AsyncMock(return_value=True)
+
+        @memoize_delegation_checks
+        async def check_rows():
+            return [await service.check_delegation(OWNER, DELEGATE) for _ in range(5)]
+
+        assert await check_rows() == [True] * 5
+        assert service._call.await_count == 1
+
+        # Outside a memoized call, nothing is kept
+        await service.check_delegation(OWNER, DELEGATE)
+        assert service._call.await_count == 2
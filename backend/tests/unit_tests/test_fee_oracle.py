@@ -0,0 +1,141 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.fee_oracle_service import MIN_PRIORITY_FEE, FeeOracleService
+from app.services.transaction_builder_service import TransactionBuilderService
+
+GWEI = 10 ** 9
+LEVELS = {"low": 10, "standard": 50, "fast": 90}
+
+
+def fee_history(base_fees, rewards, ratios):
+    return {
+        "oldestBlock": 100,
+        "baseFeePerGas": base_fees,
+        "gasUsedRatio": ratios,
+        "reward": rewards
+    }
+
+
+def make_oracle(service, history=None, fee_history_error=None, gas_price=7 * GWEI):
+    eth = SimpleNamespace(
+        fee_history=AsyncMock(return_value=history, side_effect=fee_history_error),
+        gas_price=gas_price,
+        block_number=123,
+        chain_id=11155111
+    )
+    service.web3 = SimpleNamespace(eth=eth)
+    reads = service.rpc_calls
+    oracle = FeeOracleService(
+        service,
+        refresh_interval=12,
+        block_count=3,
+        urgency_percentiles=LEVELS,
+        default_urgency="standard"
+    )
+    return oracle, eth, reads
+
+
+class TestFeeOracle:
+    @pytest.mark.asyncio
+    async def test_levels_follow_reward_percentiles(self, blockchain_service_double):
+        """Test that each urgency level takes the median of its percentile across non-empty blocks."""
+        history = fee_history(
+            base_fees=[10 * GWEI, 11 * GWEI, 12 * GWEI, 16 * GWEI],
+            rewards=[[1 * GWEI, 2 * GWEI, 5 * GWEI], [0, 0, 0], [3 * GWEI, 4 * GWEI, 9 * GWEI]],
+            ratios=[0.5, 0.0, 0.9]
+        )
+        oracle, eth, _ = make_oracle(blockchain_service_double, history)
+
+        low = await oracle.get_fees("low")
+        standard = await oracle.get_fees()
+        fast = await oracle.get_fees("fast")
+
+        assert standard["urgency"] == "standard" and standard["eip1559"] is True
+        assert standard["base_fee_per_gas"] == 16 * GWEI
+        # The empty block's zero rewards are ignored
+        assert [low["max_priority_fee_per_gas"], standard["max_priority_fee_per_gas"], fast["max_priority_fee_per_gas"]] == [
+            2 * GWEI, 3 * GWEI, 7 * GWEI
+        ]
+        assert standard["max_fee_per_gas"] == 2 * 16 * GWEI + 3 * GWEI
+        assert standard["gas_price"] == 18 * GWEI + 3 * GWEI
+        assert standard["block_number"] == 102
+        eth.fee_history.assert_awaited_once_with(3, "latest", [10, 50, 90])
+
+    @pytest.mark.asyncio
+    async def test_fresh_sample_and_chain_id_are_served_without_rpc(self, blockchain_service_double):
+        """Test that repeated builds read neither fee history nor the chain ID again."""
+        history = fee_history([GWEI, GWEI], [[0, 0, 0]], [0.0])
+        oracle, eth, reads = make_oracle(blockchain_service_double, history)
+
+        results = await asyncio.gather(*(oracle.get_fees() for _ in range(5)), *(oracle.get_chain_id() for _ in range(5)))
+
+        assert results[5:] == [11155111] * 5
+        assert results[0]["max_priority_fee_per_gas"] == MIN_PRIORITY_FEE
+        assert len(reads) == 2
+        stats = oracle.get_stats()
+        assert stats["on_demand_samples"] == 1 and stats["chain_id_reads"] == 1
+
+    @pytest.mark.asyncio
+    async def test_nodes_without_fee_history_get_eth_gas_price(self, blockchain_service_double):
+        """Test that pre-London nodes serve eth_gasPrice at every level."""
+        oracle, _, _ = make_oracle(blockchain_service_double, fee_history_error=ValueError("the method eth_feeHistory does not exist"))
+
+        fees = await oracle.get_fees("fast")
+
+        assert fees["eip1559"] is False
+        assert fees["gas_price"] == fees["max_fee_per_gas"] == 7 * GWEI
+        assert fees["block_number"] == 123
+        assert oracle.get_stats()["legacy_samples"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_urgency_is_rejected(self, blockchain_service_double):
+        """Test that only configured urgency levels are served."""
+        oracle, _, _ = make_oracle(blockchain_service_double, fee_history([GWEI, GWEI], [[1, 2, 3]], [0.5]))
+        with pytest.raises(ValueError, match="Unknown urgency"):
+            await oracle.get_fees("instant")
+
+
+class TestFeeOracleConsumers:
+    @pytest.mark.asyncio
+    async def test_wallet_builds_use_the_oracle_gas_price(self, blockchain_service_double):
+        """Test that unsigned wallet transactions are priced by the oracle with its cached chain ID."""
+        oracle, _, _ = make_oracle(blockchain_service_double, fee_history([10 * GWEI, 16 * GWEI], [[GWEI, 2 * GWEI, 3 * GWEI]], [0.5]))
+        web3 = MagicMock()
+        web3.eth.get_transaction_count = AsyncMock(return_value=4)
+        contract = MagicMock()
+        contract.functions.deleteAsset.return_value.build_transaction = AsyncMock(side_effect=lambda params: dict(params))
+        builder = TransactionBuilderService(web3, contract, oracle)
+        builder._call = oracle.blockchain_service._call
+
+        result = await builder.build_delete_asset_transaction("asset-1", "0x1234567890123456789012345678901234567890")
+
+        assert result["gas_price"] == 18 * GWEI + 2 * GWEI
+        assert result["transaction"]["chainId"] == 11155111
+        assert result["transaction"]["gasPrice"] == result["gas_price"]
+
+    @pytest.mark.asyncio
+    async def test_server_transactions_use_eip1559_fees_and_bump_both_on_replacement(self, blockchain_service_double, monkeypatch):
+        """Test that server-signed writes are type-2 transactions and replacements raise both fees."""
+        from app.config import settings
+        monkeypatch.setattr(settings, "blockchain_tx_gas_bump_percent", 15)
+        service = blockchain_service_double
+        oracle, _, _ = make_oracle(service, fee_history([10 * GWEI, 16 * GWEI], [[GWEI, 2 * GWEI, 3 * GWEI]], [0.5]))
+        service.fee_oracle = oracle
+        service.nonce_manager.reserve = AsyncMock(return_value=9)
+        service._sign_and_send = AsyncMock(side_effect=[b"first", b"second"])
+        contract_function = MagicMock()
+        contract_function.build_transaction = AsyncMock(side_effect=lambda params: dict(params))
+
+        submitted = await service._submit_server_transaction(contract_function, gas=100000)
+        tx = submitted["tx"]
+        assert "gasPrice" not in tx and tx["chainId"] == 11155111
+        assert (tx["maxFeePerGas"], tx["maxPriorityFeePerGas"]) == (34 * GWEI, 2 * GWEI)
+
+        await service._replace_server_transaction(submitted)
+        assert submitted["tx"]["maxFeePerGas"] == 34 * GWEI * 115 // 100 + 1
+        assert submitted["tx"]["maxPriorityFeePerGas"] == 2 * GWEI * 115 // 100 + 1
+        assert submitted["hashes"] == [b"first", b"second"]
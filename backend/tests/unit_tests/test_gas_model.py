@@ -0,0 +1,227 @@
+import asyncio
+import os
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import HTTPException
+
+from app.services import blockchain_service as blockchain_module
+from app.services.blockchain_service import BlockchainService
+from app.utilities.gas_model import GasModel, gas_features
+
+CID = "bafkreigh2akiscaildcqabsyg3dfr6chu3fgpregiymsck7e7aqa4s52zy"  # 2 words
+
+
+def batch(size, id_length=10):
+    return [f"a{n}".ljust(id_length, "x") for n in range(size)], [CID] * size
+
+
+def true_gas(asset_ids, cids):
+    _, items, id_words, cid_words = gas_features(asset_ids, cids)
+    return int(30000 + 25000 * items + 1500 * id_words + 21000 * cid_words)
+
+
+class TestGasModel:
+    @pytest.mark.asyncio
+    async def test_estimates_until_calibrated_then_predicts_with_margin(self):
+        """Test that live estimates train the model and later limits come from the fit."""
+        model = GasModel(min_observations=4, calibrate_every=100, safety_margin=0.2)
+        estimate_calls = []
+
+        async def estimate_for(asset_ids, cids):
+            estimate_calls.append(len(asset_ids))
+            return true_gas(asset_ids, cids)
+
+        for size, id_length in [(1, 10), (50, 40), (10, 10), (25, 70)]:
+            ids, cids = batch(size, id_length)
+            result = await model.gas_limit("batchUpdateIPFS", ids, cids, lambda: estimate_for(ids, cids))
+            assert result["source"] == "estimate"
+
+        ids, cids = batch(17, 33)
+        result = await model.gas_limit("batchUpdateIPFS", ids, cids, lambda: estimate_for(ids, cids))
+
+        assert result["source"] == "model"
+        assert len(estimate_calls) == 4
+        assert result["estimated_gas"] == pytest.approx(true_gas(ids, cids), rel=0.01)
+        assert result["gas_limit"] == pytest.approx(1.2 * true_gas(ids, cids), rel=0.01)
+        # Functions are fitted separately
+        assert model.predict("batchUpdateIPFSFor", ids, cids) is None
+
+    @pytest.mark.asyncio
+    async def test_larger_calls_and_due_calibrations_use_estimate_gas(self):
+        """Test that the model never extrapolates and re-checks itself periodically."""
+        model = GasModel(min_observations=2, calibrate_every=2, safety_margin=0.2)
+        for size in (1, 10):
+            ids, cids = batch(size)
+            model.observe("batchUpdateIPFS", ids, cids, true_gas(ids, cids))
+
+        estimate = AsyncMock(return_value=2_000_000)
+        big_ids, big_cids = batch(20)
+        assert (await model.gas_limit("batchUpdateIPFS", big_ids, big_cids, estimate))["source"] == "estimate"
+
+        ids, cids = batch(5)
+        sources = [(await model.gas_limit("batchUpdateIPFS", ids, cids, estimate))["source"] for _ in range(3)]
+        assert sources == ["model", "model", "estimate"]
+        assert estimate.await_count == 2
+
+    def test_underestimates_widen_the_margin(self):
+        """Test that a receipt above the fit (e.g. a first write) raises later limits."""
+        model = GasModel(min_observations=2, calibrate_every=100, safety_margin=0.1)
+        for size in (1, 10, 20):
+            ids, cids = batch(size)
+            model.observe("batchUpdateIPFS", ids, cids, true_gas(ids, cids))
+        ids, cids = batch(10)
+        before = model.predict("batchUpdateIPFS", ids, cids)
+
+        model.observe("batchUpdateIPFS", ids, cids, int(true_gas(ids, cids) * 1.5))
+
+        assert model.predict("batchUpdateIPFS", ids, cids) > before * 1.3
+        assert model.get_stats()["functions"]["batchUpdateIPFS"]["worst_ratio"] > 1.3
+
+
+def make_service(service, monkeypatch, model):
+    monkeypatch.setattr(blockchain_module, "gas_model", model)
+
+    service.web3.eth.get_transaction_count = AsyncMock(return_value=3)
+    function = service.contract.functions.batchUpdateIPFS.return_value
+    function.estimate_gas = AsyncMock(side_effect=lambda params: 10 ** 6)
+    function.call = AsyncMock(return_value=None)
+    function.build_transaction = AsyncMock(side_effect=lambda params: dict(params))
+    service.fee_oracle = SimpleNamespace(get_gas_price=AsyncMock(return_value=100), get_chain_id=AsyncMock(return_value=1))
+    return service, function
+
+
+def receipt_for(ids, cids, status=1):
+    return SimpleNamespace(status=status, gasUsed=true_gas(ids, cids), transactionHash=SimpleNamespace(hex=lambda: "0xabc"))
+
+
+async def calibrate(service, sizes=(1, 30, 50)):
+    for size in sizes:
+        ids, cids = batch(size)
+        service._send_server_transaction = AsyncMock(return_value=receipt_for(ids, cids))
+        await service.execute_batch_transaction(ids, cids)
+
+
+class TestGasModelInBatchTransactions:
+    @pytest.mark.asyncio
+    async def test_execute_learns_from_receipts_and_prepare_skips_estimate_gas(self, blockchain_service_double, monkeypatch):
+        """Test that server receipts train the model so wallet batches are prepared without estimate_gas."""
+        model = GasModel(min_observations=3, calibrate_every=100, safety_margin=0.2)
+        service, function = make_service(blockchain_service_double, monkeypatch, model)
+
+        await calibrate(service)
+
+        # Each execute estimated once and observed its receipt
+        assert function.estimate_gas.await_count == 3
+        assert model.get_stats()["observations"] == 6
+
+        ids, cids = batch(20)
+        result = await service.prepare_batch_transaction(ids, cids, "0x1234567890123456789012345678901234567890")
+
+        assert result["success"] is True and result["gas_source"] == "model"
+        assert function.estimate_gas.await_count == 3
+        # The predicted limit is still checked for reverts with a dry run
+        function.call.assert_awaited_once()
+        assert result["transaction"]["gas"] == result["gas_limit"] >= true_gas(ids, cids)
+
+    @pytest.mark.asyncio
+    async def test_prepare_dry_run_overlaps_the_nonce_lookup(self, blockchain_service_double, monkeypatch):
+        """Test that the dry run of a predicted prepare is not a round trip of its own."""
+        model = GasModel(min_observations=3, calibrate_every=100, safety_margin=0.2)
+        service, function = make_service(blockchain_service_double, monkeypatch, model)
+        await calibrate(service)
+        dry_run_started = asyncio.Event()
+
+        async def dry_run(params):
+            dry_run_started.set()
+
+        async def nonce(address):
+            await dry_run_started.wait()
+            return 3
+        function.call = AsyncMock(side_effect=dry_run)
+        service.web3.eth.get_transaction_count = AsyncMock(side_effect=nonce)
+
+        ids, cids = batch(20)
+        result = await asyncio.wait_for(
+            service.prepare_batch_transaction(ids, cids, "0x1234567890123456789012345678901234567890"), timeout=1
+        )
+
+        assert result["gas_source"] == "model" and result["transaction"]["nonce"] == 3
+
+    @pytest.mark.asyncio
+    async def test_predicted_batches_that_would_revert_are_not_sent(self, blockchain_service_double, monkeypatch):
+        """Test that the dry run stands in for estimate_gas as the revert check."""
+        model = GasModel(min_observations=3, calibrate_every=100, safety_margin=0.2)
+        service, function = make_service(blockchain_service_double, monkeypatch, model)
+        await calibrate(service)
+        function.call.side_effect = Exception("execution reverted: Not authorized")
+        ids, cids = batch(20)
+        service._send_server_transaction = AsyncMock()
+
+        with pytest.raises(HTTPException):
+            await service.execute_batch_transaction(ids, cids)
+        prepared = await service.prepare_batch_transaction(ids, cids, "0x1234567890123456789012345678901234567890")
+
+        service._send_server_transaction.assert_not_called()
+        assert prepared["success"] is False and "Not authorized" in prepared["error"]
+
+    @pytest.mark.asyncio
+    async def test_reverted_receipts_fail_the_batch(self, blockchain_service_double, monkeypatch):
+        """Test that a mined but reverted batch is reported as a failure and not learned from."""
+        model = GasModel(min_observations=3, calibrate_every=100, safety_margin=0.2)
+        service, _ = make_service(blockchain_service_double, monkeypatch, model)
+        ids, cids = batch(5)
+        service._send_server_transaction = AsyncMock(return_value=receipt_for(ids, cids, status=0))
+
+        with pytest.raises(HTTPException) as error:
+            await service.execute_batch_transaction(ids, cids)
+
+        assert "reverted" in error.value.detail
+        assert model.get_stats()["observations"] == 1  # the live estimate only
+
+
+# Calibration against a local Hardhat node with a deployed FuseVaultRegistry:
+#   npm run node && npm run deploy:local   (in blockchain/)
+#   HARDHAT_RPC_URL=http://127.0.0.1:8545 HARDHAT_CONTRACT_ADDRESS=0x... pytest tests/unit_tests/test_gas_model.py
+HARDHAT_RPC_URL = os.environ.get("HARDHAT_RPC_URL")
+HARDHAT_CONTRACT_ADDRESS = os.environ.get("HARDHAT_CONTRACT_ADDRESS")
+# Hardhat's first default account
+HARDHAT_ACCOUNT = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+HARDHAT_PRIVATE_KEY = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+
+@pytest.mark.skipif(
+    not (HARDHAT_RPC_URL and HARDHAT_CONTRACT_ADDRESS),
+    reason="Set HARDHAT_RPC_URL and HARDHAT_CONTRACT_ADDRESS to run against a local Hardhat node"
+)
+class TestGasModelHardhatCalibration:
+    @pytest.mark.asyncio
+    async def test_predicted_limits_cover_mined_batches(self, monkeypatch):
+        """Test that limits fitted from real receipts cover new and updated batches of other sizes."""
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "alchemy_sepolia_url", HARDHAT_RPC_URL)
+        monkeypatch.setattr(settings, "contract_address", HARDHAT_CONTRACT_ADDRESS)
+        monkeypatch.setattr(settings, "wallet_address", HARDHAT_ACCOUNT)
+        monkeypatch.setattr(settings, "private_key", HARDHAT_PRIVATE_KEY)
+        model = GasModel(min_observations=4, calibrate_every=100, safety_margin=0.2)
+        monkeypatch.setattr(blockchain_module, "gas_model", model)
+
+        service = BlockchainService()
+        await service.start()
+        try:
+            block = await service.get_latest_block_number()
+            for size in (1, 5, 20, 50):
+                ids = [f"calibration-{block}-{size}-{n}" for n in range(size)]
+                await service.execute_batch_transaction(ids, [f"{CID}-{size}"] * size)
+
+            for size, fresh in [(12, True), (5, False)]:
+                prefix = f"check-{block}" if fresh else f"calibration-{block}"
+                ids = [f"{prefix}-{size}-{n}" for n in range(size)]
+                cids = [f"{CID}-v2"] * size
+                limit = model.predict("batchUpdateIPFS", ids, cids)
+                result = await service.execute_batch_transaction(ids, cids)
+                assert limit is not None and result["gas_used"] <= limit, (size, fresh)
+        finally:
+            await service.close()
@@ -231,8 +231,10 @@ class TestTransactionHandlerLogic:
 class TestRetrieveHandlerLogic:
     @pytest.mark.asyncio
     async def test_retrieve_metadata_auto_recovery_decision(self, mock_asset_service, mock_blockchain_service,
-                                                            mock_ipfs_service, mock_transaction_service):
+                                                            mock_ipfs_service, mock_transaction_service, monkeypatch):
         # Setup
+        from app.config import settings
+        monkeypatch.setattr(settings, "blockchain_cid_verification", "contract")
         asset_id = "test-asset-123"
         # Mock asset service
         mock_asset_service.get_asset_with_deleted.return_value = {"assetId": asset_id}
@@ -300,6 +302,76 @@ class TestRetrieveHandlerLogic:
         mock_ipfs_service.retrieve_metadata.assert_not_called()
         mock_asset_service.create_new_version.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_retrieve_metadata_runs_verification_lookups_concurrently(self, monkeypatch):
+        """Test that the chain lookups and CID computation overlap instead of running in sequence."""
+        import asyncio
+        from app.config import settings
+        monkeypatch.setattr(settings, "blockchain_cid_verification", "contract")
+
+        asset_id = "test-asset-123"
+        owner = "0x1234567890123456789012345678901234567890"
+        server_wallet = "0x9876543210987654321098765432109876543210"
+
+        # Each call waits until all three have started, so a sequential pipeline times out
+        started = set()
+        all_started = asyncio.Event()
+
+        def overlapping(name, result):
+            async def call(*args, **kwargs):
+                started.add(name)
+                if len(started) == 3:
+                    all_started.set()
+                await asyncio.wait_for(all_started.wait(), timeout=1)
+                return result
+            return call
+
+        asset_service = MagicMock()
+        asset_service.get_asset_with_deleted = AsyncMock(return_value={"assetId": asset_id})
+        asset_service.get_asset = AsyncMock(return_value={
+            "_id": "doc123",
+            "assetId": asset_id,
+            "versionNumber": 1,
+            "isCurrent": True,
+            "walletAddress": owner,
+            "smartContractTxId": "0xabc123",
+            "ipfsHash": "QmStored123",
+            "criticalMetadata": {"name": "Asset"},
+            "nonCriticalMetadata": {}
+        })
+        asset_service.asset_repository.find_asset = AsyncMock(return_value=None)
+
+        blockchain_service = MagicMock()
+        blockchain_service.get_ipfs_info = AsyncMock()
+        blockchain_service.get_server_wallet_address.return_value = server_wallet
+        blockchain_service.verify_cid_on_chain = overlapping("verify", {
+            "is_valid": True,
+            "actual_version": 1,
+            "is_deleted": False,
+            "message": "CID verified"
+        })
+        blockchain_service.get_transaction_details = overlapping("tx", {
+            "cid": "QmStored123",
+            "tx_sender": server_wallet
+        })
+
+        ipfs_service = MagicMock()
+        ipfs_service.compute_cid = overlapping("compute", "QmStored123")
+
+        handler = RetrieveHandler(
+            asset_service=asset_service,
+            blockchain_service=blockchain_service,
+            ipfs_service=ipfs_service
+        )
+
+        result = await handler.retrieve_metadata(asset_id, initiator_address=owner)
+
+        assert result.verification.verified is True
+        assert result.verification.recovery_needed is False
+        assert result.verification.tx_sender_verified is True
+        # The getIPFSInfo result was only logged, so it is no longer fetched
+        blockchain_service.get_ipfs_info.assert_not_called()
+
 
 # Upload Handler Tests - focusing on file processing and errors not covered elsewhere
 class TestUploadHandlerLogic:
@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.utilities.index_manager import IndexManager, canonical_queries
+
+
+def make_db_client():
+    names = ["assets", "transaction", "sessions", "auth", "users", "delegations", "api_keys"]
+    collections = {name: MagicMock(name=name) for name in names}
+    for collection in collections.values():
+        collection.create_indexes = AsyncMock()
+    db_client = SimpleNamespace(
+        **{f"{name}_collection": collection for name, collection in collections.items()},
+        get_collection=lambda name: collections[name]
+    )
+    return db_client, collections
+
+
+def index_specs(collection):
+    return [model.document for call in collection.create_indexes.await_args_list for model in call.args[0]]
+
+
+class TestIndexManager:
+    @pytest.mark.asyncio
+    async def test_build_declares_hot_query_and_ttl_indexes(self):
+        """Test that build creates indexes for assets, transactions, sessions and auth."""
+        db_client, collections = make_db_client()
+
+        results = await IndexManager(db_client).build()
+
+        assert all(results.values())
+        asset_keys = [list(spec["key"].items()) for spec in index_specs(collections["assets"])]
+        assert [("assetId", 1), ("isCurrent", 1)] in asset_keys
+        assert [("assetId", 1), ("versionNumber", 1), ("_id", 1)] in asset_keys
+        assert [("walletAddressLower", 1), ("isCurrent", 1), ("isDeleted", 1), ("lastUpdated", -1), ("_id", -1)] in asset_keys
+
+        session_specs = {tuple(spec["key"]): spec for spec in index_specs(collections["sessions"])}
+        assert session_specs[("sessionId",)]["unique"] is True
+        assert session_specs[("expiresAt",)]["expireAfterSeconds"] == 0
+
+        transaction_keys = [list(spec["key"]) for spec in index_specs(collections["transaction"])]
+        assert ["walletAddressLower", "timestamp", "_id"] in transaction_keys
+        assert ["performedByLower", "timestamp", "_id"] in transaction_keys
+        assert collections["auth"].create_indexes.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_one_failing_repository_does_not_stop_the_others(self):
+        """Test that an index conflict in one collection is reported without aborting startup."""
+        db_client, collections = make_db_client()
+        collections["assets"].create_indexes.side_effect = Exception("IndexOptionsConflict")
+
+        results = await IndexManager(db_client).build()
+
+        assert results["assets"] is False
+        assert results["transactions"] is True and results["delegations"] is True
+
+    @pytest.mark.asyncio
+    async def test_explain_flags_collection_scans_and_in_memory_sorts(self):
+        """Test that explain reports summarise each canonical query's winning plan."""
+        db_client, collections = make_db_client()
+        plans = {
+            "assets": {"stage": "FETCH", "inputStage": {"stage": "IXSCAN", "indexName": "assetId_1_isCurrent_1"}},
+            "transactions": {"stage": "SORT", "inputStage": {"stage": "FETCH", "inputStage": {
+                "stage": "OR", "inputStages": [{"stage": "IXSCAN", "indexName": "walletAddressLower_1_timestamp_-1"}]
+            }}},
+            "sessions": {"stage": "COLLSCAN"}
+        }
+        for name, collection in collections.items():
+            plan = plans.get("transactions" if name == "transaction" else name, {"stage": "IDHACK"})
+            cursor = MagicMock()
+            cursor.sort.return_value = cursor
+            cursor.explain = AsyncMock(return_value={"queryPlanner": {"winningPlan": plan}})
+            collection.find.return_value = cursor
+
+        reports = await IndexManager(db_client).explain_queries()
+
+        assert len(reports) == sum(len(queries) for queries in canonical_queries().values())
+        by_collection = {report["collection"]: report for report in reports}
+        assert by_collection["sessions"]["collscan"] is True
+        assert by_collection["assets"]["collscan"] is False
+        assert by_collection["assets"]["indexes"] == ["assetId_1_isCurrent_1"]
+        assert by_collection["transactions"]["in_memory_sort"] is True
+        assert by_collection["transactions"]["indexes"] == ["walletAddressLower_1_timestamp_-1"]
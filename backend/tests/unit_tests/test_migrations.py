@@ -0,0 +1,221 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bson import ObjectId
+
+from app.repositories.asset_repo import AssetRepository
+from app.repositories.transaction_repo import TransactionRepository
+from app.services import migration_service as migration_module
+from app.services.asset_service import AssetService
+from app.services.migration_service import (
+    ASSET_CREATED_AT_MIGRATION,
+    ASSET_DOCUMENT_HISTORY_MIGRATION,
+    ASSET_WALLET_ADDRESS_MIGRATION,
+    TRANSACTION_WALLET_ADDRESS_MIGRATION,
+    CreatedAtBackfill,
+    DocumentHistoryBackfill,
+    MigrationService,
+    default_backfills,
+)
+from app.services.transaction_service import TransactionService
+
+OWNER = "0xAbCdEf0123456789aBcDeF0123456789AbCdEf01"
+
+
+class TestWalletAddressBackfill:
+    @pytest.mark.asyncio
+    async def test_backfill_lowercases_addresses_in_batches_and_completes(self, fake_db):
+        """Test that every existing document gets its lowercase address fields."""
+        assets = [{"_id": ObjectId(), "walletAddress": OWNER if n % 2 else OWNER.lower()} for n in range(5)]
+        transactions = [{"_id": ObjectId(), "walletAddress": OWNER, "performedBy": "0xDEF"}]
+        db_client, collections = fake_db(assets, transactions)
+        service = MigrationService(db_client, batch_size=2, batch_pause=0)
+
+        await service.run()
+
+        assert all(d["walletAddressLower"] == OWNER.lower() for d in collections["assets"].documents)
+        assert collections["transactions"].documents[0]["performedByLower"] == "0xdef"
+        assert collections["assets"].batches == 3
+        assert service.is_complete(ASSET_WALLET_ADDRESS_MIGRATION)
+        assert service.is_complete(TRANSACTION_WALLET_ADDRESS_MIGRATION)
+        state = await collections["migrations"].find_one({"_id": ASSET_WALLET_ADDRESS_MIGRATION})
+        assert state["completed"] is True and state["processed"] == 5
+
+    @pytest.mark.asyncio
+    async def test_backfill_resumes_from_its_checkpoint(self, fake_db):
+        """Test that a restarted backfill skips the documents it already processed."""
+        assets = sorted(({"_id": ObjectId(), "walletAddress": OWNER} for _ in range(4)), key=lambda d: d["_id"])
+        db_client, collections = fake_db(assets)
+        await collections["migrations"].update_one(
+            {"_id": ASSET_WALLET_ADDRESS_MIGRATION},
+            {"$set": {"lastId": assets[1]["_id"], "processed": 2, "modified": 2, "completed": False}},
+            upsert=True
+        )
+        service = MigrationService(db_client, backfills=default_backfills()[:1], batch_size=10, batch_pause=0)
+
+        await service.run()
+
+        lowered = [d.get("walletAddressLower") for d in collections["assets"].documents]
+        assert lowered == [None, None, OWNER.lower(), OWNER.lower()]
+        assert service.get_stats()[ASSET_WALLET_ADDRESS_MIGRATION] == {"completed": True, "processed": 4, "modified": 4}
+
+    @pytest.mark.asyncio
+    async def test_completed_migrations_are_not_run_again(self, fake_db):
+        """Test that start only schedules unfinished backfills."""
+        db_client, collections = fake_db()
+        for backfill in default_backfills():
+            await collections["migrations"].update_one({"_id": backfill.name}, {"$set": {"completed": True}}, upsert=True)
+        service = MigrationService(db_client, batch_pause=0)
+
+        await service.start()
+
+        assert service._task is None
+        assert service.is_complete(ASSET_WALLET_ADDRESS_MIGRATION)
+
+
+class TestLowercaseAddressWrites:
+    @pytest.mark.asyncio
+    async def test_inserts_store_lowercase_copies(self, mock_db_client):
+        """Test that new assets and transactions are written already migrated."""
+        mock_db_client.assets_collection.insert_one = AsyncMock(return_value=SimpleNamespace(inserted_id=ObjectId()))
+        mock_db_client.transaction_collection.insert_one = AsyncMock(return_value=SimpleNamespace(inserted_id=ObjectId()))
+
+        asset = {"assetId": "a", "walletAddress": OWNER}
+        transaction = {"assetId": "a", "walletAddress": OWNER, "performedBy": "0xDEF"}
+        await AssetRepository(mock_db_client).insert_asset(asset)
+        await TransactionRepository(mock_db_client).insert_transaction(transaction)
+
+        assert asset["walletAddressLower"] == OWNER.lower()
+        assert transaction["walletAddressLower"] == OWNER.lower() and transaction["performedByLower"] == "0xdef"
+
+    @pytest.mark.asyncio
+    async def test_lookups_switch_to_exact_matches_once_migrated(self, monkeypatch):
+        """Test that wallet queries drop the case-insensitive regex after the backfill."""
+        asset_repo = MagicMock(find_assets=AsyncMock(return_value=[]))
+        transaction_repo = MagicMock(find_transactions=AsyncMock(return_value=[]))
+        assets = AssetService(asset_repo)
+        transactions = TransactionService(transaction_repo)
+
+        await assets.get_user_assets(OWNER)
+        assert "$regex" in str(asset_repo.find_assets.await_args.args[0])
+
+        completed = MagicMock(is_complete=lambda name: True)
+        monkeypatch.setattr(migration_module, "_migration_service", completed)
+        await assets.get_user_assets(OWNER)
+        await transactions.get_wallet_history(OWNER, include_all_versions=True)
+
+        asset_query = asset_repo.find_assets.await_args.args[0]
+        assert asset_query == {"walletAddressLower": OWNER.lower(), "isCurrent": True, "isDeleted": False}
+        transaction_query = transaction_repo.find_transactions.await_args.kwargs["query"]
+        assert transaction_query == {"$or": [{"walletAddressLower": OWNER.lower()}, {"performedByLower": OWNER.lower()}]}
+
+
+class TestCreatedAt:
+    @pytest.mark.asyncio
+    async def test_backfill_copies_the_first_versions_creation_time(self, fake_db):
+        """Test that every version of an old asset gets the time its first version was written."""
+        first, second, other = ObjectId(), ObjectId(), ObjectId()
+        updated = datetime(2025, 1, 2, tzinfo=timezone.utc)
+        assets = [
+            {"_id": first, "assetId": "a", "versionNumber": 1},
+            {"_id": second, "assetId": "a", "versionNumber": 2},
+            # No first version left; lastUpdated is the best available guess
+            {"_id": other, "assetId": "b", "versionNumber": 3, "lastUpdated": updated}
+        ]
+        db_client, collections = fake_db(assets)
+        service = MigrationService(db_client, backfills=[CreatedAtBackfill()], batch_pause=0)
+
+        await service.run()
+
+        created = [d["createdAt"] for d in collections["assets"].documents]
+        assert created == [first.generation_time, first.generation_time, updated]
+        assert service.is_complete(ASSET_CREATED_AT_MIGRATION)
+
+    @pytest.mark.asyncio
+    async def test_user_assets_look_up_missing_creation_times_in_one_query(self, mock_asset_repo):
+        """Test that listing assets costs one extra query at most, and none once createdAt is stored."""
+        created = datetime(2025, 3, 1, tzinfo=timezone.utc)
+        legacy = datetime(2024, 6, 1, tzinfo=timezone.utc)
+        mock_asset_repo.find_assets.return_value = [
+            {"_id": str(ObjectId()), "assetId": f"new-{n}", "createdAt": created} for n in range(3)
+        ] + [{"_id": str(ObjectId()), "assetId": f"old-{n}"} for n in range(2)]
+        mock_asset_repo.find_created_at.return_value = {"old-0": legacy, "old-1": legacy}
+
+        assets = await AssetService(mock_asset_repo).get_user_assets(OWNER)
+
+        mock_asset_repo.find_asset.assert_not_called()
+        mock_asset_repo.find_created_at.assert_awaited_once()
+        assert sorted(mock_asset_repo.find_created_at.await_args.args[0]) == ["old-0", "old-1"]
+        assert [a["createdAt"] for a in assets] == [created.isoformat()] * 3 + [legacy.isoformat()] * 2
+
+    @pytest.mark.asyncio
+    async def test_naive_creation_times_are_returned_as_utc(self, fake_db):
+        """Test that createdAt read back without tzinfo keeps its UTC offset in the API output."""
+        naive = datetime(2025, 3, 1, 12, 30)
+        db_client, _ = fake_db([
+            {"_id": ObjectId(), "assetId": "old", "versionNumber": 1, "createdAt": naive},
+            {"_id": ObjectId(), "assetId": "old", "versionNumber": 2}
+        ])
+        asset_repo = AssetRepository(db_client)
+        asset_repo.find_assets = AsyncMock(return_value=[
+            {"_id": str(ObjectId()), "assetId": "new", "createdAt": naive},
+            {"_id": str(ObjectId()), "assetId": "old"}
+        ])
+
+        service = AssetService(asset_repo)
+        created_at = await service.get_created_at(await asset_repo.find_assets({}))
+        assets = await service.get_user_assets(OWNER)
+
+        assert all(value.tzinfo is timezone.utc for value in created_at.values())
+        assert [a["createdAt"] for a in assets] == ["2025-03-01T12:30:00+00:00"] * 2
+
+    @pytest.mark.asyncio
+    async def test_new_versions_carry_created_at_forward(self, mock_asset_repo):
+        """Test that create_new_version copies createdAt instead of looking up version 1."""
+        created = datetime(2025, 3, 1, tzinfo=timezone.utc)
+        mock_asset_repo.find_asset.return_value = {
+            "_id": str(ObjectId()), "assetId": "a", "versionNumber": 4, "createdAt": created
+        }
+        mock_asset_repo.insert_asset.return_value = "doc"
+
+        await AssetService(mock_asset_repo).create_new_version("a", OWNER, "0xtx", "cid", {})
+
+        assert mock_asset_repo.insert_asset.await_args.args[0]["createdAt"] == created
+        mock_asset_repo.find_created_at.assert_not_called()
+
+
+class TestDocumentHistory:
+    @pytest.mark.asyncio
+    async def test_backfill_strips_document_history(self, fake_db):
+        """Test that the backfill removes documentHistory and only counts documents that had it."""
+        first, second, third = ObjectId(), ObjectId(), ObjectId()
+        assets = [
+            {"_id": first, "assetId": "a", "versionNumber": 1, "documentHistory": []},
+            {"_id": second, "assetId": "a", "versionNumber": 2, "documentHistory": [str(first)]},
+            {"_id": third, "assetId": "a", "versionNumber": 3, "previousVersionId": str(second)}
+        ]
+        db_client, collections = fake_db(assets)
+        service = MigrationService(db_client, backfills=[DocumentHistoryBackfill()], batch_pause=0)
+
+        await service.run()
+
+        assert not any("documentHistory" in d for d in collections["assets"].documents)
+        assert collections["assets"].documents[2]["previousVersionId"] == str(second)
+        assert service.is_complete(ASSET_DOCUMENT_HISTORY_MIGRATION)
+
+    @pytest.mark.asyncio
+    async def test_new_versions_do_not_copy_history(self, mock_asset_repo):
+        """Test that a new version stores one link back instead of every earlier _id."""
+        previous_id = str(ObjectId())
+        mock_asset_repo.find_asset.return_value = {
+            "_id": previous_id, "assetId": "a", "versionNumber": 9, "documentHistory": [str(ObjectId())] * 8
+        }
+        mock_asset_repo.insert_asset.return_value = "doc"
+
+        await AssetService(mock_asset_repo).create_new_version("a", OWNER, "0xtx", "cid", {})
+
+        new_version = mock_asset_repo.insert_asset.await_args.args[0]
+        assert new_version["previousVersionId"] == previous_id and new_version["versionNumber"] == 10
+        assert "documentHistory" not in new_version
@@ -0,0 +1,139 @@
+import pytest
+from web3 import Web3
+
+from app.services import blockchain_service as blockchain_module
+from app.services.blockchain_service import CONTRACT_ABI, BlockchainService
+from app.utilities.delegation_cache import DelegationCache
+from app.utilities.multicall import CallFailed, Multicall
+
+REGISTRY = "0x3333333333333333333333333333333333333333"
+OWNER = "0x1111111111111111111111111111111111111111"
+DELEGATE = "0x2222222222222222222222222222222222222222"
+
+
+class FakeChain:
+    """Answers aggregate3 by decoding each packed call, counting eth_calls."""
+
+    def __init__(self, web3, has_multicall=True):
+        self.web3 = web3
+        self.has_multicall = has_multicall
+        self.registry = web3.eth.contract(address=REGISTRY, abi=CONTRACT_ABI)
+        self.eth_calls = 0
+        self.individual_calls = 0
+
+    def answer(self, function_name, args):
+        """Return value of a registry view; assets named 'bad-*' revert."""
+        if function_name == "assetExists":
+            if args[0].startswith("bad"):
+                return None
+            return ["bool", "bool"], [True, args[0].endswith("deleted")]
+        if function_name == "delegates":
+            return ["bool"], [args[1] == Web3.to_checksum_address(DELEGATE)]
+        if function_name == "getPendingTransfer":
+            return ["address"], [DELEGATE.lower()]
+
+    async def call(self, fn, *args, **kwargs):
+        if fn == self.web3.eth.get_code:
+            return b"\x60\x80" if self.has_multicall else b""
+
+        function = fn.__self__
+        if function.fn_name == "aggregate3":
+            self.eth_calls += 1
+            results = []
+            for _, _, calldata in function.args[0]:
+                decoded_function, decoded_args = self.registry.decode_function_input(calldata)
+                answer = self.answer(decoded_function.fn_name, list(decoded_args.values()))
+                if answer is None:
+                    results.append((False, b""))
+                else:
+                    results.append((True, self.web3.codec.encode(*answer)))
+            return results
+
+        self.individual_calls += 1
+        answer = self.answer(function.fn_name, list(function.args))
+        if answer is None:
+            raise ValueError("execution reverted")
+        values = answer[1]
+        return values[0] if len(values) == 1 else values
+
+
+def make_multicall(has_multicall=True, max_calldata_bytes=64000):
+    web3 = Web3()
+    chain = FakeChain(web3, has_multicall)
+    return Multicall(web3, chain.call, max_calldata_bytes=max_calldata_bytes), chain
+
+
+class TestMulticall:
+    @pytest.mark.asyncio
+    async def test_calls_are_chunked_and_decoded_in_order(self):
+        """Test that calls are split by calldata size and each result is decoded on its own."""
+        multicall, chain = make_multicall(max_calldata_bytes=1000)
+        asset_ids = [f"asset-{n}" for n in range(10)] + ["bad-asset", "asset-deleted"]
+
+        results = await multicall.aggregate([
+            chain.registry.functions.assetExists(asset_id, OWNER) for asset_id in asset_ids
+        ])
+
+        assert results[:10] == [[True, False]] * 10
+        assert isinstance(results[10], CallFailed)
+        assert results[11] == [True, True]
+        assert 1 < chain.eth_calls < len(asset_ids)
+
+        encoded = [
+            (REGISTRY, Web3.to_bytes(hexstr=chain.registry.functions.assetExists(asset_id, OWNER)._encode_transaction_data()))
+            for asset_id in asset_ids
+        ]
+        chunks = multicall.chunk(encoded)
+        assert len(chunks) == chain.eth_calls
+        assert sum(chunks, []) == list(range(len(asset_ids)))
+        for indexes in chunks:
+            assert sum(160 + (len(encoded[i][1]) + 31) // 32 * 32 for i in indexes) <= 1000
+
+    @pytest.mark.asyncio
+    async def test_single_address_outputs_are_unwrapped_and_checksummed(self):
+        """Test that a single output is returned bare, matching ContractFunction.call()."""
+        multicall, chain = make_multicall()
+
+        results = await multicall.aggregate([chain.registry.functions.getPendingTransfer("asset-1", OWNER)])
+
+        assert results == [Web3.to_checksum_address(DELEGATE)]
+        assert chain.eth_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_without_multicall_contract_calls_are_sent_individually(self):
+        """Test that a chain without Multicall3 still gets answers, one eth_call each."""
+        multicall, chain = make_multicall(has_multicall=False)
+
+        results = await multicall.aggregate([
+            chain.registry.functions.assetExists("asset-1", OWNER),
+            chain.registry.functions.assetExists("bad-asset", OWNER)
+        ])
+
+        assert results[0] == [True, False]
+        assert isinstance(results[1], CallFailed)
+        assert chain.eth_calls == 0 and chain.individual_calls == 2
+        assert multicall.get_stats()["available"] is False
+
+
+class TestBulkReads:
+    @pytest.mark.asyncio
+    async def test_bulk_delegation_checks_only_read_uncached_pairs(self, monkeypatch):
+        """Test that two-step delegation checks share one eth_call and skip cached pairs."""
+        monkeypatch.setattr(blockchain_module, "delegation_cache", DelegationCache(ttl=30, negative_ttl=10))
+
+        service = BlockchainService()
+        service.web3 = Web3()
+        service.contract = service.web3.eth.contract(address=REGISTRY, abi=CONTRACT_ABI)
+        chain = FakeChain(service.web3)
+        service.multicall = Multicall(service.web3, chain.call)
+        service.wallet_address = OWNER
+
+        result = await service.check_two_step_delegation(OWNER, DELEGATE)
+        assert result["user_delegated"] is True and result["server_delegated"] is False
+        assert chain.eth_calls == 1
+
+        assert await service.check_delegations_bulk([(OWNER, DELEGATE), (OWNER, OWNER)]) == [True, False]
+        assert chain.eth_calls == 1
+
+        statuses = await service.check_assets_exist_bulk([("asset-1", OWNER), ("bad-asset", OWNER)])
+        assert statuses == [{"exists": True, "is_deleted": False}, None]
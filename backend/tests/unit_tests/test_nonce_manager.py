@@ -0,0 +1,121 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from web3.exceptions import TimeExhausted
+
+from app.config import settings
+from app.utilities.nonce_manager import NonceManager
+
+
+class TestNonceManager:
+    @pytest.mark.asyncio
+    async def test_concurrent_reservations_get_consecutive_nonces(self):
+        """Test that concurrent callers get distinct nonces from a single node read."""
+        fetch = AsyncMock(return_value=7)
+        manager = NonceManager(fetch)
+
+        nonces = await asyncio.gather(*(manager.reserve() for _ in range(5)))
+
+        assert sorted(nonces) == [7, 8, 9, 10, 11]
+        fetch.assert_awaited_once()
+
+        # Once everything has completed the next reservation re-reads the node
+        for nonce in nonces:
+            await manager.complete(nonce)
+        fetch.return_value = 12
+        assert await manager.reserve() == 12
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_released_nonces_are_reused_before_new_ones(self):
+        """Test that a nonce whose transaction was never accepted fills the gap first."""
+        manager = NonceManager(AsyncMock(return_value=0))
+        first, second, third = [await manager.reserve() for _ in range(3)]
+
+        await manager.release(second, RuntimeError("connection reset"))
+        assert await manager.reserve() == second
+
+        # Releasing the newest nonce just rewinds the counter
+        await manager.release(third)
+        assert await manager.reserve() == third
+        assert await manager.reserve() == 3
+
+    @pytest.mark.asyncio
+    async def test_nonce_errors_resync_with_the_node(self):
+        """Test that a nonce collision moves the local count up to the node's."""
+        fetch = AsyncMock(return_value=0)
+        manager = NonceManager(fetch)
+        first = await manager.reserve()
+        stale = await manager.reserve()
+
+        # Another process sent transactions from the same wallet
+        fetch.return_value = 5
+        await manager.release(stale, ValueError("{'code': -32000, 'message': 'nonce too low'}"))
+
+        assert await manager.reserve() == 5
+        assert manager.get_stats()["resyncs"] == 1
+        await manager.complete(first)
+
+
+class TestServerTransactionPipelining:
+    def make_service(self, service):
+        web3 = service.web3
+        web3.eth.get_transaction_count = AsyncMock(return_value=40)
+        web3.eth.account.sign_transaction.side_effect = lambda tx, private_key: SimpleNamespace(
+            raw_transaction=f"{tx['nonce']}:{tx['gasPrice']}".encode()
+        )
+        web3.eth.send_raw_transaction = AsyncMock(side_effect=lambda raw: b"hash-" + raw)
+        service.fee_oracle.chain_id = 11155111
+
+        contract_function = MagicMock()
+        contract_function.build_transaction = AsyncMock(side_effect=lambda params: dict(params))
+        return service, contract_function
+
+    @pytest.mark.asyncio
+    async def test_transactions_are_sent_before_earlier_receipts(self, blockchain_service_double):
+        """Test that concurrent server writes are all pending at once with distinct nonces."""
+        service, contract_function = self.make_service(blockchain_service_double)
+        mined = asyncio.Event()
+
+        async def wait_for_any(tx_hashes, timeout):
+            await mined.wait()
+            return {"transactionHash": tx_hashes[-1]}
+        service.receipt_watcher = SimpleNamespace(wait_for_any=wait_for_any)
+
+        sends = [
+            asyncio.create_task(service._send_server_transaction(contract_function, gas_price=100))
+            for _ in range(3)
+        ]
+        while service.web3.eth.send_raw_transaction.await_count < 3:
+            await asyncio.sleep(0)
+
+        # All three were broadcast while no receipt had arrived
+        assert service.nonce_manager.get_stats()["in_flight"] == 3
+        mined.set()
+        receipts = await asyncio.gather(*sends)
+
+        assert sorted(r["transactionHash"] for r in receipts) == [b"hash-40:100", b"hash-41:100", b"hash-42:100"]
+        assert service.nonce_manager.get_stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stuck_transaction_is_replaced_with_higher_gas_price(self, blockchain_service_double, monkeypatch):
+        """Test that an unmined transaction is re-sent with the same nonce and bumped gas price."""
+        service, contract_function = self.make_service(blockchain_service_double)
+        monkeypatch.setattr(settings, "blockchain_tx_gas_bump_percent", 15)
+        waited_on = []
+
+        async def wait_for_any(tx_hashes, timeout):
+            waited_on.append(list(tx_hashes))
+            if tx_hashes[-1] == b"hash-40:100":
+                raise TimeExhausted("not mined")
+            return {"transactionHash": tx_hashes[-1]}
+        service.receipt_watcher = SimpleNamespace(wait_for_any=wait_for_any)
+
+        receipt = await service._send_server_transaction(contract_function, gas_price=100)
+
+        assert receipt["transactionHash"] == b"hash-40:116"
+        # The original transaction is still watched in case it is mined after all
+        assert waited_on[-1] == [b"hash-40:100", b"hash-40:116"]
+        assert service.nonce_manager.get_stats()["replacements"] == 1
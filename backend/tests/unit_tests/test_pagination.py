@@ -0,0 +1,164 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+from app.config import settings
+from app.handlers.transaction_handler import TransactionHandler
+from app.repositories.asset_repo import AssetRepository
+from app.repositories.transaction_repo import TransactionRepository
+from app.services.asset_service import AssetService
+from app.services.transaction_service import TransactionService
+from app.utilities.pagination import clamp_limit, decode_cursor, encode_cursor, keyset_query
+
+OWNER = "0xabcdef0123456789abcdef0123456789abcdef01"
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_assets(count, same_time=False):
+    return [
+        {
+            "_id": ObjectId(),
+            "assetId": f"asset-{n}",
+            "walletAddressLower": OWNER,
+            "isCurrent": True,
+            "isDeleted": False,
+            "lastUpdated": START if same_time else START + timedelta(minutes=n)
+        }
+        for n in range(count)
+    ]
+
+
+class TestCursors:
+    def test_cursor_round_trips_datetimes_and_object_ids(self):
+        """Test that a cursor decodes to the exact position it was made from."""
+        document_id = ObjectId()
+
+        token = encode_cursor(START, document_id)
+
+        assert decode_cursor(token) == (START, document_id)
+        assert "=" not in token
+
+    @pytest.mark.parametrize("token", ["not-a-cursor", "", "eyJ2IjoxfQ"])
+    def test_malformed_cursors_raise_value_error(self, token):
+        """Test that tampered or truncated cursors are rejected."""
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            decode_cursor(token)
+
+    def test_keyset_query_continues_after_ties(self):
+        """Test that documents sharing a sort value are split on _id."""
+        document_id = ObjectId()
+
+        query = keyset_query({"isCurrent": True}, "lastUpdated", encode_cursor(START, document_id))
+
+        assert query == {"$and": [
+            {"isCurrent": True},
+            {"$or": [{"lastUpdated": {"$lt": START}}, {"lastUpdated": START, "_id": {"$lt": document_id}}]}
+        ]}
+
+    def test_limit_defaults_and_is_capped(self):
+        """Test that page sizes fall back to the default and never exceed the maximum."""
+        assert clamp_limit(None) == settings.pagination_default_limit
+        assert clamp_limit(0) == settings.pagination_default_limit
+        assert clamp_limit(settings.pagination_max_limit * 10) == settings.pagination_max_limit
+
+
+class TestRepositoryPages:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("same_time", [False, True])
+    async def test_pages_cover_every_asset_once(self, fake_db, same_time):
+        """Test that following next_cursor visits every asset exactly once, newest first."""
+        documents = make_assets(7, same_time=same_time)
+        repo = AssetRepository(fake_db(documents)[0])
+        query = {"walletAddressLower": OWNER, "isCurrent": True, "isDeleted": False}
+
+        seen, cursor, pages = [], None, 0
+        while True:
+            assets, cursor = await repo.find_assets_page(query, 3, cursor)
+            seen.extend(asset["_id"] for asset in assets)
+            pages += 1
+            if cursor is None:
+                break
+
+        expected = sorted(documents, key=lambda d: (d["lastUpdated"], d["_id"]), reverse=True)
+        assert seen == [str(d["_id"]) for d in expected]
+        assert pages == 3
+
+    @pytest.mark.asyncio
+    async def test_pages_read_one_document_past_the_limit(self, fake_db):
+        """Test that a page never loads more than limit + 1 documents."""
+        repo = AssetRepository(fake_db(make_assets(3))[0])
+
+        assets, cursor = await repo.find_assets_page({}, 3)
+
+        assert len(assets) == 3 and cursor is None
+
+    @pytest.mark.asyncio
+    async def test_transaction_pages_key_on_timestamp(self, fake_db):
+        """Test that transaction pages continue from the last timestamp."""
+        transactions = [
+            {"_id": ObjectId(), "walletAddressLower": OWNER, "timestamp": START + timedelta(minutes=n)}
+            for n in range(5)
+        ]
+        repo = TransactionRepository(fake_db(transactions=transactions)[0])
+
+        first, cursor = await repo.find_transactions_page({"walletAddressLower": OWNER}, 2)
+        second, _ = await repo.find_transactions_page({"walletAddressLower": OWNER}, 2, cursor)
+
+        assert [tx["timestamp"] for tx in first + second] == [START + timedelta(minutes=n) for n in (4, 3, 2, 1)]
+
+
+class TestServicePages:
+    @pytest.mark.asyncio
+    async def test_user_assets_page_caps_the_limit(self, mock_asset_repo):
+        """Test that the service passes a capped limit and returns the next cursor."""
+        mock_asset_repo.find_assets_page.return_value = ([{"_id": "1", "assetId": "a"}], "next")
+
+        page = await AssetService(mock_asset_repo).get_user_assets_page(OWNER, limit=10 ** 6)
+
+        assert mock_asset_repo.find_assets_page.await_args.args[1] == settings.pagination_max_limit
+        assert page["next_cursor"] == "next"
+        assert page["assets"][0]["assetId"] == "a"
+
+    @pytest.mark.asyncio
+    async def test_wallet_history_page_filters_current_assets_without_loading_them(self, mock_transaction_repo):
+        """Test that current-version history uses asset IDs only, not full asset documents."""
+        asset_service = SimpleNamespace(get_user_asset_ids=AsyncMock(return_value=["a", "b"]))
+        mock_transaction_repo.find_transactions_page.return_value = (
+            [{"_id": "1", "assetId": "a", "timestamp": START, "walletAddressLower": OWNER}], None
+        )
+
+        page = await TransactionService(mock_transaction_repo).get_wallet_history_page(
+            OWNER, asset_service=asset_service, cursor="c"
+        )
+
+        query, limit, cursor = mock_transaction_repo.find_transactions_page.await_args.args
+        assert query["assetId"] == {"$in": ["a", "b"]}
+        assert (limit, cursor) == (settings.pagination_default_limit, "c")
+        assert page["transactions"] == [{"id": "1", "assetId": "a", "timestamp": START.isoformat()}]
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_is_a_bad_request(self, mock_transaction_service, mock_asset_service):
+        """Test that the handler reports a malformed cursor as a 400."""
+        mock_transaction_service.get_wallet_history_page.side_effect = ValueError("Invalid pagination cursor")
+        handler = TransactionHandler(mock_transaction_service, mock_asset_service)
+
+        with pytest.raises(HTTPException) as error:
+            await handler.get_wallet_history(OWNER, cursor="bad")
+
+        assert error.value.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_version_history_pages_in_version_order(self, mock_asset_repo):
+        """Test that version history is read one page at a time from the (assetId, versionNumber) index."""
+        mock_asset_repo.find_assets_page.return_value = ([{"_id": "1", "versionNumber": 1}], "next")
+
+        page = await AssetService(mock_asset_repo).get_version_history("a", limit=1, cursor="c")
+
+        args, kwargs = mock_asset_repo.find_assets_page.await_args
+        assert args == ({"assetId": "a", "isDeleted": False}, 1, "c")
+        assert kwargs == {"sort_field": "versionNumber", "direction": 1}
+        assert page == {"versions": [{"_id": "1", "versionNumber": 1}], "next_cursor": "next"}
@@ -0,0 +1,118 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+from app.services.receipt_watcher_service import ReceiptWatcherService
+
+
+def tx_hash(n):
+    return f"0x{n:064x}"
+
+
+class FakeEth:
+    """Chain with numbered blocks of transaction hashes, counting every RPC call."""
+
+    def __init__(self, block_receipts=True):
+        self.block_number = 100
+        self.blocks = {}
+        self.block_receipts = block_receipts
+        self.calls = {"get_block": 0, "get_block_receipts": 0, "get_transaction_receipt": 0}
+
+    def mine(self, *hashes):
+        self.block_number += 1
+        self.blocks[self.block_number] = list(hashes)
+
+    def _receipt(self, block_number, h):
+        return {"transactionHash": bytes.fromhex(h[2:]), "blockNumber": block_number, "status": 1}
+
+    async def get_block(self, block_number):
+        self.calls["get_block"] += 1
+        return {"transactions": [bytes.fromhex(h[2:]) for h in self.blocks.get(block_number, [])]}
+
+    async def get_block_receipts(self, block_number):
+        self.calls["get_block_receipts"] += 1
+        if not self.block_receipts:
+            raise ValueError("the method eth_getBlockReceipts does not exist")
+        return [self._receipt(block_number, h) for h in self.blocks.get(block_number, [])]
+
+    async def get_transaction_receipt(self, h):
+        self.calls["get_transaction_receipt"] += 1
+        for block_number, hashes in self.blocks.items():
+            if h in hashes:
+                return self._receipt(block_number, h)
+        raise TransactionNotFound(f"Transaction with hash: '{h}' not found.")
+
+
+def make_watcher(service, eth):
+    service.web3 = SimpleNamespace(eth=eth)
+    return ReceiptWatcherService(service, poll_interval=0.01, watch_ttl=60)
+
+
+class TestReceiptWatcher:
+    @pytest.mark.asyncio
+    async def test_waiters_share_lookups_and_blocks_are_read_once(self, blockchain_service_double):
+        """Test that many waiters on a few hashes cost one lookup per hash and one read per block."""
+        eth = FakeEth()
+        watcher = make_watcher(blockchain_service_double, eth)
+        try:
+            waiters = [
+                asyncio.create_task(watcher.wait_for_receipt(tx_hash(n % 3), timeout=5))
+                for n in range(30)
+            ]
+            while watcher.get_stats()["direct_lookups"] < 3 or watcher.get_stats()["last_block"] is None:
+                await asyncio.sleep(0.01)
+
+            eth.mine(tx_hash(0), tx_hash(1), tx_hash(99))
+            eth.mine(tx_hash(2))
+            receipts = await asyncio.gather(*waiters)
+
+            assert [r["blockNumber"] for r in receipts[:3]] == [101, 101, 102]
+            assert eth.calls["get_transaction_receipt"] == 3 + 1  # initial checks, then block 102's single match
+            assert eth.calls["get_block"] == 2
+            assert eth.calls["get_block_receipts"] == 1
+            assert watcher.get_stats()["pending"] == 0
+        finally:
+            await watcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_status_polls_reuse_the_watch(self, blockchain_service_double):
+        """Test that repeated status polls for a pending hash make no further receipt lookups."""
+        eth = FakeEth(block_receipts=False)
+        watcher = make_watcher(blockchain_service_double, eth)
+        try:
+            assert await watcher.get_receipt(tx_hash(5)) is None
+            assert await watcher.get_receipt(tx_hash(6)) is None
+            while watcher.get_stats()["last_block"] is None:
+                await asyncio.sleep(0.01)
+
+            lookups = eth.calls["get_transaction_receipt"]
+            for _ in range(10):
+                assert await watcher.get_receipt(tx_hash(5)) is None
+                assert await watcher.get_receipt(tx_hash(6)) is None
+            assert eth.calls["get_transaction_receipt"] == lookups
+
+            # Both land in one block; without eth_getBlockReceipts they are fetched one by one
+            eth.mine(tx_hash(5), tx_hash(6))
+            assert (await watcher.wait_for_receipt(tx_hash(6), timeout=5))["blockNumber"] == 101
+            assert (await watcher.get_receipt(tx_hash(5)))["blockNumber"] == 101
+            assert eth.calls["get_transaction_receipt"] == lookups + 2
+            assert watcher.get_stats()["block_receipts_supported"] is False
+        finally:
+            await watcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out_without_cancelling_other_waiters(self, blockchain_service_double):
+        """Test that one waiter timing out leaves the shared watch in place."""
+        eth = FakeEth()
+        watcher = make_watcher(blockchain_service_double, eth)
+        try:
+            patient = asyncio.create_task(watcher.wait_for_receipt(tx_hash(7), timeout=5))
+            with pytest.raises(TimeExhausted):
+                await watcher.wait_for_receipt(tx_hash(7), timeout=0.05)
+
+            eth.mine(tx_hash(7))
+            assert (await patient)["blockNumber"] == 101
+        finally:
+            await watcher.stop()
@@ -0,0 +1,130 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+from web3 import Web3
+from web3.exceptions import ContractLogicError, TransactionNotFound
+
+from app.services.blockchain_service import CONTRACT_ABI
+from app.utilities.rpc_batch import RpcBatchTransport
+
+REGISTRY = "0x3333333333333333333333333333333333333333"
+OWNER = "0x1111111111111111111111111111111111111111"
+KNOWN_TX = "0x" + "ab" * 32
+UNKNOWN_TX = "0x" + "cd" * 32
+
+
+class MockRpcServer:
+    """JSON-RPC endpoint recording every HTTP payload, optionally refusing batches."""
+
+    def __init__(self, accept_batches=True):
+        self.accept_batches = accept_batches
+        self.payloads = []
+        self.codec = Web3().codec
+
+    def answer(self, request):
+        method, params = request["method"], request["params"]
+        if method == "eth_blockNumber":
+            result = "0x64"
+        elif method == "eth_getTransactionByHash":
+            if params[0] != KNOWN_TX:
+                result = None
+            else:
+                result = {
+                    "hash": KNOWN_TX, "blockHash": "0x" + "01" * 32, "blockNumber": "0x10",
+                    "transactionIndex": "0x0", "from": OWNER, "to": REGISTRY, "input": "0x1234",
+                    "gas": "0x5208", "gasPrice": "0x1", "nonce": "0x7", "value": "0x0"
+                }
+        elif method == "eth_call":
+            if "6261642d" in params[0]["data"]:  # "bad-" in the encoded asset ID
+                return {"jsonrpc": "2.0", "id": request["id"], "error": {
+                    "code": 3, "message": "execution reverted: Asset not found", "data": "0x"
+                }}
+            result = "0x" + self.codec.encode(["bool", "bool"], [True, False]).hex()
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    async def handle(self, http_request):
+        payload = await http_request.json()
+        self.payloads.append(payload)
+        if isinstance(payload, list):
+            if not self.accept_batches:
+                return web.json_response({"jsonrpc": "2.0", "id": None, "error": {
+                    "code": -32600, "message": "batch requests are not supported"
+                }})
+            # Answer out of order to exercise demultiplexing by id
+            return web.json_response([self.answer(request) for request in reversed(payload)])
+        return web.Response(text=json.dumps(self.answer(payload)), content_type="application/json")
+
+
+@asynccontextmanager
+async def serve(server):
+    app = web.Application()
+    app.router.add_post("/", server.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    transport = RpcBatchTransport(Web3(), f"http://127.0.0.1:{port}/")
+    try:
+        yield transport
+    finally:
+        await transport.close()
+        await runner.cleanup()
+
+
+class TestRpcBatchTransport:
+    @pytest.mark.asyncio
+    async def test_requests_in_the_same_tick_share_one_http_batch(self):
+        """Test that a transaction lookup, a view call and a block number go out as one batch."""
+        server = MockRpcServer()
+        async with serve(server) as transport:
+            contract = transport.web3.eth.contract(address=REGISTRY, abi=CONTRACT_ABI)
+
+            tx, exists, block_number = await asyncio.gather(
+                transport.request("get_transaction", KNOWN_TX),
+                transport.call_function(contract.functions.assetExists("asset-1", OWNER)),
+                transport.request("get_block_number")
+            )
+
+        assert len(server.payloads) == 1 and len(server.payloads[0]) == 3
+        assert tx.blockNumber == 16 and tx["to"] == REGISTRY and tx.nonce == 7
+        assert exists == [True, False]
+        assert block_number == 100
+        assert transport.get_stats()["batches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_falls_back_to_individual_requests(self):
+        """Test that a provider refusing batches still gets every request answered."""
+        server = MockRpcServer(accept_batches=False)
+        async with serve(server) as transport:
+            results = await transport.request_many([
+                ("get_transaction", (KNOWN_TX,)),
+                ("get_block_number", ())
+            ])
+
+        assert results[0].hash.hex() == KNOWN_TX[2:] and results[1] == 100
+        assert len(server.payloads) == 3
+        stats = transport.get_stats()
+        assert stats["batches_rejected"] == 1 and stats["fallback_requests"] == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_stay_with_their_own_request(self):
+        """Test that a missing transaction and a reverted call don't fail the rest of the batch."""
+        server = MockRpcServer()
+        async with serve(server) as transport:
+            contract = transport.web3.eth.contract(address=REGISTRY, abi=CONTRACT_ABI)
+
+            results = await asyncio.gather(
+                transport.request("get_transaction", UNKNOWN_TX),
+                transport.call_function(contract.functions.assetExists("bad-asset", OWNER)),
+                transport.request("get_transaction", KNOWN_TX),
+                return_exceptions=True
+            )
+
+        assert len(server.payloads) == 1
+        assert isinstance(results[0], TransactionNotFound)
+        assert isinstance(results[1], ContractLogicError)
+        assert results[2].blockNumber == 16
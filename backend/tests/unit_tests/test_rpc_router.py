@@ -0,0 +1,130 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+from web3 import AsyncWeb3
+
+from app.utilities.rpc_router import RoutedAsyncHTTPProvider, RpcRouter, is_pinned_request
+
+PRIMARY = "https://primary.example/v2/secret-key"
+FALLBACK = "https://fallback.example"
+
+
+def fake_post(latencies, failing=()):
+    """Post function answering with the URL after a per-URL delay, failing for some URLs."""
+    calls = []
+
+    async def post(url):
+        calls.append(url)
+        await asyncio.sleep(latencies.get(url, 0))
+        if url in failing:
+            raise ConnectionError(f"{url} unavailable")
+        return url
+    return post, calls
+
+
+class TestRpcRouter:
+    @pytest.mark.asyncio
+    async def test_reads_go_to_the_fastest_provider_and_writes_to_the_primary(self):
+        """Test that latency ranking moves reads off a slow primary while writes stay on it."""
+        router = RpcRouter([PRIMARY, FALLBACK])
+        post, calls = fake_post({PRIMARY: 0.03, FALLBACK: 0.0})
+        # Seed one sample per provider
+        await router.send(post)
+        router.primary.samples.append((0.03, True))
+        router.endpoints[1].samples.append((0.0, True))
+
+        calls.clear()
+        for _ in range(3):
+            assert await router.send(post) == FALLBACK
+        assert await router.send(post, write=True) == PRIMARY
+        assert calls == [FALLBACK, FALLBACK, FALLBACK, PRIMARY]
+        # API keys in URLs don't end up in stats
+        assert "secret-key" not in json.dumps(router.get_stats())
+
+    @pytest.mark.asyncio
+    async def test_failing_provider_is_taken_out_and_probed_after_cooldown(self):
+        """Test failover, the circuit opening after repeated failures and a probe closing it."""
+        # No error penalty, so only the circuit breaker keeps the failing primary from going first
+        router = RpcRouter([PRIMARY, FALLBACK], failure_threshold=2, cooldown=0.05, error_penalty=0, default_latency=0)
+        failing = {PRIMARY}
+        post, calls = fake_post({FALLBACK: 0.01}, failing)
+
+        assert [await router.send(post) for _ in range(2)] == [FALLBACK, FALLBACK]
+        stats = router.get_stats()
+        assert stats["failovers"] == 2 and stats["circuits_opened"] == 1
+        assert stats["providers"]["0:primary.example"]["circuit"] == "open"
+
+        calls.clear()
+        await router.send(post)
+        assert calls == [FALLBACK]
+
+        await asyncio.sleep(0.06)
+        failing.clear()
+        calls.clear()
+        assert await router.send(post) == PRIMARY
+        assert calls == [PRIMARY]
+        assert router.get_stats()["providers"]["0:primary.example"]["circuit"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_provider_spills_over(self):
+        """Test that a provider out of its per-second budget hands reads to the next one."""
+        router = RpcRouter([PRIMARY, FALLBACK], rate_limits=[2, 0])
+        post, _ = fake_post({FALLBACK: 0.01})
+
+        results = [await router.send(post) for _ in range(4)]
+
+        assert results == [PRIMARY, PRIMARY, FALLBACK, FALLBACK]
+        assert router.get_stats()["providers"]["0:primary.example"]["rate_limited"] == 2
+
+    def test_writes_and_pending_nonces_are_pinned(self):
+        """Test which requests must stay on the primary provider."""
+        assert is_pinned_request("eth_sendRawTransaction", ["0x00"])
+        assert is_pinned_request("eth_getTransactionCount", ["0xabc", "pending"])
+        assert not is_pinned_request("eth_getTransactionCount", ["0xabc", "latest"])
+        assert not is_pinned_request("eth_call", [{}, "latest"])
+
+
+@asynccontextmanager
+async def rpc_server(status=200):
+    methods = []
+
+    async def handle(request):
+        payload = await request.json()
+        methods.append(payload["method"])
+        if status != 200:
+            return web.Response(status=status, text="rate limited")
+        result = "0x" + "ab" * 32 if payload["method"] == "eth_sendRawTransaction" else "0x64"
+        return web.json_response({"jsonrpc": "2.0", "id": payload["id"], "result": result})
+
+    app = web.Application()
+    app.router.add_post("/", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}/", methods
+    finally:
+        await runner.cleanup()
+
+
+class TestRoutedProvider:
+    @pytest.mark.asyncio
+    async def test_web3_reads_fail_over_and_transactions_use_the_primary(self):
+        """Test that a throttling provider's reads are served elsewhere through AsyncWeb3."""
+        async with rpc_server(status=429) as (primary_url, primary_methods), rpc_server() as (fallback_url, fallback_methods):
+            router = RpcRouter([primary_url, fallback_url], failure_threshold=1)
+            web3 = AsyncWeb3(RoutedAsyncHTTPProvider(router))
+
+            assert await web3.eth.block_number == 100
+            assert await web3.eth.block_number == 100
+            with pytest.raises(Exception):
+                await web3.eth.send_raw_transaction(b"\x01")
+            await web3.provider.disconnect()
+
+        assert primary_methods == ["eth_blockNumber", "eth_sendRawTransaction"]
+        assert fallback_methods == ["eth_blockNumber", "eth_blockNumber"]
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 from datetime import datetime, timezone
@@ -52,9 +53,9 @@ class TestAssetServiceLogic:
         # Verify the version number was incremented to 4
         assert result["version_number"] == 4
         
-        # Verify the document history includes the previous version
+        # Verify the new version links to the previous one without copying its history
         insert_call_args = mock_asset_repo.insert_asset.call_args[0][0]
-        assert valid_id in insert_call_args["documentHistory"]
+        assert "documentHistory" not in insert_call_args
         assert insert_call_args["previousVersionId"] == valid_id
     
     @pytest.mark.asyncio
@@ -583,15 +584,97 @@ class TestBlockchainServiceLogic:
             assert exc_info.value.status_code == 500
             assert "Failed to retrieve CID from blockchain transaction" in str(exc_info.value.detail)
 
+    def test_get_blockchain_service_returns_shared_instance(self, monkeypatch):
+        """Test that route dependencies share one BlockchainService per process."""
+        from app.services import blockchain_service as blockchain_module
+        monkeypatch.setattr(blockchain_module, "_blockchain_service", None)
+
+        first = blockchain_module.get_blockchain_service()
+        second = blockchain_module.get_blockchain_service()
+
+        assert first is second
+        assert first.contract_abi is blockchain_module.CONTRACT_ABI
+
+        # An unreachable provider is reported without rebuilding the service
+        first.connected = False
+        with pytest.raises(HTTPException) as exc_info:
+            blockchain_module.get_blockchain_service()
+        assert exc_info.value.status_code == 500
+
+    @pytest.mark.asyncio
+    async def test_check_connection_records_health(self):
+        """Test that the health check records provider state instead of raising."""
+        service = BlockchainService()
+        service.web3 = MagicMock()
+        service.web3.is_connected.return_value = True
+
+        assert await service.check_connection() is True
+        assert service.connected is True
+        assert service.last_health_check is not None
+
+        service.web3.is_connected.side_effect = Exception("connection refused")
+        assert await service.check_connection() is False
+
+        stats = service.get_connection_stats()
+        assert stats["connected"] is False
+        assert stats["provider_requests"] == 0
+        assert stats["connection_reuse_ratio"] == 0.0
+
+    def test_web3_backend_follows_setting(self, monkeypatch):
+        """Test that AsyncWeb3 is the default backend and the sync provider stays selectable."""
+        from web3 import AsyncWeb3, Web3
+        from app.config import settings
+
+        assert isinstance(BlockchainService().web3, AsyncWeb3)
+
+        monkeypatch.setattr(settings, "blockchain_async_web3", False)
+        service = BlockchainService()
+        assert isinstance(service.web3, Web3)
+        assert service.get_connection_stats()["web3_backend"] == "sync"
+
+    @pytest.mark.asyncio
+    async def test_send_server_transaction_signs_off_event_loop(self, monkeypatch):
+        """Test that server-signed writes sign in a worker thread and return the receipt."""
+        import threading
+        from app.config import settings
+        monkeypatch.setattr(settings, "blockchain_async_web3", False)
+
+        service = BlockchainService()
+        service.web3 = MagicMock()
+        service.web3.eth.get_transaction_count.return_value = 7
+        service.web3.eth.gas_price = 100
+        # A node without eth_feeHistory, so the fee oracle serves eth_gasPrice
+        service.web3.eth.fee_history.side_effect = ValueError("the method eth_feeHistory does not exist")
+        service.web3.eth.send_raw_transaction.return_value = b"tx-hash"
+        service.web3.eth.block_number = 12
+        service.web3.eth.get_transaction_receipt.return_value = {"status": 1}
+
+        contract_function = MagicMock()
+        contract_function.build_transaction.return_value = {"nonce": 7}
+
+        sign_threads = []
+
+        def fake_sign(tx):
+            sign_threads.append(threading.get_ident())
+            return b"raw-tx"
+
+        monkeypatch.setattr(service, "_sign_transaction", fake_sign)
+
+        receipt = await service._send_server_transaction(contract_function)
+
+        assert receipt == {"status": 1}
+        build_params = contract_function.build_transaction.call_args[0][0]
+        assert build_params["nonce"] == 7
+        assert build_params["gasPrice"] == 100
+        assert sign_threads and sign_threads[0] != threading.get_ident()
+        service.web3.eth.send_raw_transaction.assert_called_once_with(b"raw-tx")
+
 
 # IPFS Service Tests - only testing business logic
 class TestIPFSServiceLogic:
     @pytest.mark.asyncio
     async def test_retrieve_metadata_fallback_to_gateways(self, monkeypatch):
         """Test that retrieve_metadata tries alternate gateways if storage service fails."""
-        # Create a partial mock of IPFSService
-        service = IPFSService()
-        
         # Mock responses for different gateways
         class MockResponse:
             def __init__(self, json_data=None, status_code=200, raise_error=False, text=""):
@@ -599,6 +682,7 @@ class TestIPFSServiceLogic:
                 self.status_code = status_code
                 self.raise_error = raise_error
                 self.text = text
+                self.content = text.encode("utf-8")
                 
             def raise_for_status(self):
                 if self.raise_error:
@@ -626,20 +710,12 @@ class TestIPFSServiceLogic:
             
         mock_client.get = AsyncMock(side_effect=mock_get)
         
+        # Create a partial mock of IPFSService
+        service = IPFSService(client=mock_client)
+        
         # Mock storage service URL
         service.storage_service_url = "http://storage_service"
         
-        # Create test context
-        class AsyncContextManager:
-            async def __aenter__(self):
-                return mock_client
-                
-            async def __aexit__(self, exc_type, exc_val, exc_tb):
-                pass
-        
-        # Mock httpx.AsyncClient
-        monkeypatch.setattr("httpx.AsyncClient", lambda **kwargs: AsyncContextManager())
-        
         # Call method with a CID
         cid = "QmTest123"
         result = await service.retrieve_metadata(cid)
@@ -650,6 +726,225 @@ class TestIPFSServiceLogic:
         # Verify both endpoints were tried
         assert mock_client.get.call_count == 2
     
+    @pytest.mark.asyncio
+    async def test_compute_cid_local_and_remote(self, monkeypatch):
+        """Test that compute_cid encodes single-chunk metadata in-process and uses /calculate-cid otherwise."""
+        from app.config import settings
+        from app.utilities.format import format_json
+        from app.utilities.unixfs import CHUNK_SIZE, compute_file_cid
+
+        metadata = {
+            "asset_id": "test-asset-123",
+            "wallet_address": "0x1234567890123456789012345678901234567890",
+            "critical_metadata": {"name": "Test Asset"}
+        }
+
+        mock_client = AsyncMock()
+        response = MagicMock()
+        response.json.return_value = {"computed_cid": "bafkreiremote"}
+        mock_client.post = AsyncMock(return_value=response)
+        service = IPFSService(client=mock_client)
+
+        # Local encoding never reaches the storage service
+        assert await service.compute_cid(metadata) == compute_file_cid(format_json(metadata))
+        mock_client.post.assert_not_called()
+
+        # Chunked layouts are always computed by the IPFS Node service
+        large = {**metadata, "non_critical_metadata": {"blob": "x" * (CHUNK_SIZE + 1)}}
+        assert await service.compute_cid(large) == "bafkreiremote"
+        assert mock_client.post.call_args[0][0].endswith("/calculate-cid")
+
+        monkeypatch.setattr(settings, "ipfs_local_cid", False)
+        assert await service.compute_cid(metadata) == "bafkreiremote"
+        assert mock_client.post.call_args[0][0].endswith("/calculate-cid")
+
+    @pytest.mark.asyncio
+    async def test_stored_metadata_is_served_from_cid_cache(self, monkeypatch):
+        """Test that store_metadata warms the CID cache so retrieving the same CID makes no request."""
+        from app.services import ipfs_service
+        from app.utilities.cid_cache import CIDCache
+        from app.utilities.format import format_json, get_ipfs_metadata
+        from app.utilities.unixfs import compute_file_cid
+
+        metadata = {
+            "asset_id": "test-asset-123",
+            "wallet_address": "0x1234567890123456789012345678901234567890",
+            "critical_metadata": {"name": "Test Asset"}
+        }
+        cid = compute_file_cid(format_json(get_ipfs_metadata(metadata)))
+
+        monkeypatch.setattr(ipfs_service, "cid_cache", CIDCache(max_bytes=1024 * 1024))
+        mock_client = AsyncMock()
+        response = MagicMock()
+        response.json.return_value = {"cids": [{"cid": {"/": cid}}]}
+        mock_client.post = AsyncMock(return_value=response)
+        service = IPFSService(client=mock_client)
+
+        assert await service.store_metadata(metadata) == cid
+        assert await service.retrieve_metadata(cid) == get_ipfs_metadata(metadata)
+        mock_client.get.assert_not_called()
+        assert ipfs_service.cid_cache.get_stats()["memory_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_retrieve_metadata_hedges_slow_storage_service(self, monkeypatch):
+        """Test that a slow storage service is raced against a stub gateway and the loser cancelled."""
+        import httpx
+        from app.config import settings
+        from app.services import ipfs_service
+        from app.utilities.cid_cache import CIDCache
+        from app.utilities.gateway_scoreboard import GatewayScoreboard
+
+        scoreboard = GatewayScoreboard()
+        monkeypatch.setattr(ipfs_service, "gateway_scoreboard", scoreboard)
+        monkeypatch.setattr(ipfs_service, "cid_cache", CIDCache(max_bytes=1024))
+        monkeypatch.setattr(settings, "ipfs_gateways", "http://stub-gateway/ipfs/{cid}")
+        monkeypatch.setattr(settings, "ipfs_hedge_delay_ms", 20)
+
+        # Local stub: the storage service hangs, the gateway answers at once
+        async def handler(request):
+            if request.url.host == "stub-gateway":
+                return httpx.Response(200, json={"name": "Test Asset"})
+            await asyncio.sleep(5)
+            return httpx.Response(200, json={"name": "Too Late"})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            service = IPFSService(client=client)
+            service.storage_service_url = "http://storage-service"
+            result = await asyncio.wait_for(service.retrieve_metadata("bafkreitest"), timeout=2)
+
+        assert result == {"name": "Test Asset"}
+        stats = scoreboard.get_stats()
+        assert stats["storage"]["cancelled"] == 1
+        assert stats["http://stub-gateway/ipfs/{cid}"]["errors"] == 0
+
+    def test_gateway_scoreboard_ranks_by_latency_and_errors(self, monkeypatch):
+        """Test that sources are ranked by rolling latency and error rate with a clamped p95 hedge delay."""
+        from app.config import settings
+        from app.utilities.gateway_scoreboard import GatewayScoreboard
+
+        monkeypatch.setattr(settings, "ipfs_hedge_max_delay_ms", 300)
+        scoreboard = GatewayScoreboard(error_penalty=5.0)
+
+        # Unseen sources keep the configured order
+        assert scoreboard.rank(["storage", "w3s", "dweb"]) == ["storage", "w3s", "dweb"]
+
+        for _ in range(5):
+            scoreboard.record("storage", 0.4, "ok")
+            scoreboard.record("w3s", 0.2, "ok")
+            scoreboard.record("dweb", 0.05, "ok")
+        scoreboard.record("dweb", 0.01, "error")
+
+        assert scoreboard.rank(["storage", "w3s", "dweb"]) == ["w3s", "storage", "dweb"]
+        assert scoreboard.hedge_delay("w3s") == pytest.approx(0.2)
+        assert scoreboard.hedge_delay("storage") == pytest.approx(0.3)
+
+    def test_gateway_scoreboard_ignores_cancelled_latencies(self):
+        """Test that a source only ever cancelled after a faster winner does not outrank it."""
+        from app.utilities.gateway_scoreboard import GatewayScoreboard
+
+        scoreboard = GatewayScoreboard()
+        for _ in range(10):
+            scoreboard.record("storage", 1.0, "ok")
+            scoreboard.record("gateway", 0.25, "cancelled")
+
+        assert scoreboard.rank(["gateway", "storage"]) == ["storage", "gateway"]
+        assert scoreboard.score("storage") == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_store_metadata_batch_sends_multi_file_uploads(self, monkeypatch):
+        """Test that a batch is sent as grouped multi-file uploads with per-file CIDs and errors."""
+        import httpx
+        from app.services import ipfs_service
+        from app.utilities.cid_cache import CIDCache
+
+        monkeypatch.setattr(ipfs_service, "cid_cache", CIDCache(max_bytes=1024 * 1024))
+        requests = []
+
+        # Stub storage service: one CID per uploaded file, failing the file named metadata-3.json
+        async def handler(request):
+            body = request.content.decode("utf-8", errors="replace")
+            filenames = [part.split('"')[0] for part in body.split('filename="')[1:]]
+            requests.append(filenames)
+            return httpx.Response(200, json={"cids": [
+                {"filename": name, "cid": None, "error": "upload failed"} if name == "metadata-3.json"
+                else {"filename": name, "cid": {"/": f"bafkrei{name.split('-')[1].split('.')[0]}"}}
+                for name in filenames
+            ]})
+
+        assets = [
+            {"asset_id": f"asset-{i}", "wallet_address": "0x123", "critical_metadata": {"index": i}}
+            for i in range(5)
+        ]
+        progress = []
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            service = IPFSService(client=client)
+            results = await service.store_metadata_batch(
+                assets,
+                progress_callback=lambda asset_id, value, status: progress.append((asset_id, status)),
+                files_per_request=2
+            )
+
+        assert sorted(requests) == [
+            ["metadata-0.json", "metadata-1.json"],
+            ["metadata-2.json", "metadata-3.json"],
+            ["metadata-4.json"]
+        ]
+        assert [r["asset_id"] for r in results] == [f"asset-{i}" for i in range(5)]
+        assert [r["cid"] for r in results] == ["bafkrei0", "bafkrei1", "bafkrei2", None, "bafkrei4"]
+        assert results[3]["status"] == "error" and results[3]["error"] == "upload failed"
+        assert ("asset-3", "error") in progress and ("asset-4", "completed") in progress
+
+    @pytest.mark.asyncio
+    async def test_store_metadata_batch_times_out_per_wave_and_survives_null_entries(self, monkeypatch):
+        """Test that the upload timeout follows Node's waves and a null result only fails its own file."""
+        from app.config import settings
+        from app.services import ipfs_service
+        from app.utilities.cid_cache import CIDCache
+
+        monkeypatch.setattr(ipfs_service, "cid_cache", CIDCache(max_bytes=1024 * 1024))
+        monkeypatch.setattr(settings, "ipfs_upload_timeout", 90)
+        monkeypatch.setattr(settings, "ipfs_upload_concurrency", 8)
+        mock_client = AsyncMock()
+        response = MagicMock()
+        response.json.return_value = {"cids": [None] + [{"cid": f"bafkrei{i}"} for i in range(1, 25)]}
+        mock_client.post = AsyncMock(return_value=response)
+        service = IPFSService(client=mock_client)
+
+        assets = [{"asset_id": f"asset-{i}", "wallet_address": "0x123", "critical_metadata": {"index": i}} for i in range(25)]
+        results = await service.store_metadata_batch(assets, files_per_request=25)
+
+        assert mock_client.post.await_args.kwargs["timeout"] == 120
+        assert results[0]["status"] == "error" and results[0]["cid"] is None
+        assert [r["cid"] for r in results[1:]] == [f"bafkrei{i}" for i in range(1, 25)]
+
+    @pytest.mark.asyncio
+    async def test_services_share_one_pooled_http_client(self, monkeypatch):
+        """Test that IPFSService instances reuse one pooled client that the lifespan can close."""
+        from app.config import settings
+        from app.services import ipfs_service
+
+        monkeypatch.setattr(settings, "ipfs_http_pool_size", 7)
+        await ipfs_service.close_ipfs_http_client()
+
+        client = IPFSService().client
+        assert IPFSService().client is client
+
+        stats = ipfs_service.get_ipfs_pool_stats()
+        assert stats["pool_size"] == 7
+        assert stats["connections"] == 0 and stats["saturation"] == 0.0
+
+        # A transport without httpcore's private pool degrades the figures instead of failing
+        monkeypatch.setattr(client, "_transport", object())
+        stats = ipfs_service.get_ipfs_pool_stats()
+        assert stats["connections"] is None and stats["saturation"] is None
+        assert stats["pool_size"] == 7
+        monkeypatch.undo()
+
+        await ipfs_service.close_ipfs_http_client()
+        assert client.is_closed
+        assert IPFSService().client is not client
+        await ipfs_service.close_ipfs_http_client()
+
     @pytest.mark.asyncio
     async def test_verify_cid_computed_vs_provided(self, monkeypatch):
         """Test that verify_cid compares computed CID with provided CID."""
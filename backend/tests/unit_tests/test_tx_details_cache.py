@@ -0,0 +1,96 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from web3 import Web3
+
+from app.services import blockchain_service as blockchain_module
+from app.services.blockchain_service import CONTRACT_ABI, BlockchainService
+from app.utilities.tx_details_cache import TxDetailsCache
+
+REGISTRY = "0x3333333333333333333333333333333333333333"
+OWNER = "0x1111111111111111111111111111111111111111"
+TX_HASH = "0x" + "ab" * 32
+
+
+class FakeRepository:
+    """In-memory stand-in for TxDetailsRepository."""
+
+    def __init__(self):
+        self.documents = {}
+
+    async def get(self, tx_hash):
+        document = self.documents.get(tx_hash)
+        return {"_id": tx_hash, **document} if document else None
+
+    async def insert(self, tx_hash, details):
+        self.documents.setdefault(tx_hash, dict(details))
+
+
+def make_service(monkeypatch, asset_ids, cids, block_number=12, receipt_status=1):
+    cache = TxDetailsCache(max_entries=10)
+    monkeypatch.setattr(blockchain_module, "tx_details_cache", cache)
+
+    service = BlockchainService()
+    service.contract_address = REGISTRY
+    service.contract = Web3().eth.contract(address=REGISTRY, abi=CONTRACT_ABI)
+    service.get_transaction = AsyncMock(return_value={
+        "to": REGISTRY,
+        "from": OWNER,
+        "blockNumber": block_number,
+        "input": service.contract.functions.batchUpdateIPFS(asset_ids, cids)._encode_transaction_data()
+    })
+    service.get_transaction_receipt = AsyncMock(return_value={"status": receipt_status})
+    return service, cache
+
+
+class TestTxDetailsCache:
+    @pytest.mark.asyncio
+    async def test_assets_of_a_batch_transaction_share_one_decode(self, monkeypatch):
+        """Test that every asset of a batch transaction is answered from one fetch and decode."""
+        asset_ids = [f"asset-{n}" for n in range(50)]
+        cids = [f"bafy-{n}" for n in range(50)]
+        service, cache = make_service(monkeypatch, asset_ids, cids)
+
+        first = await service.get_transaction_details(TX_HASH, "asset-7")
+        second = await service.get_transaction_details(TX_HASH.upper().replace("0X", "0x"), "asset-42")
+        whole = await service.get_transaction_details(TX_HASH)
+
+        assert (first["asset_id"], first["cid"]) == ("asset-7", "bafy-7")
+        assert (second["asset_id"], second["cid"]) == ("asset-42", "bafy-42")
+        assert "cid" not in whole and whole["asset_ids"] == asset_ids
+        assert first["function"] == "batchUpdateIPFS" and first["tx_sender"] == OWNER
+        assert "asset_cids" not in first
+        service.get_transaction.assert_awaited_once()
+        assert cache.get_stats()["memory_hits"] == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("block_number, receipt_status", [(None, None), (12, 0)])
+    async def test_pending_and_reverted_transactions_are_not_cached(self, monkeypatch, block_number, receipt_status):
+        """Test that only mined, successful transactions are treated as immutable."""
+        service, cache = make_service(monkeypatch, ["a", "b"], ["c1", "c2"], block_number, receipt_status)
+        repository = FakeRepository()
+        cache.attach(repository)
+
+        first = await service.get_transaction_details(TX_HASH, "b")
+        await service.get_transaction_details(TX_HASH, "b")
+
+        assert (first["asset_id"], first["cid"]) == ("b", "c2")
+        assert service.get_transaction.await_count == 2
+        assert repository.documents == {} and cache.get_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_entries_survive_in_the_repository(self):
+        """Test that details dropped from memory are reloaded from the repository with their map."""
+        repository = FakeRepository()
+        cache = TxDetailsCache(max_entries=1)
+        cache.attach(repository)
+
+        await cache.put(TX_HASH, {"function": "batchUpdateIPFS", "asset_ids": ["a", "b", "a"], "cids": ["c1", "c2", "c3"]})
+        await cache.put("0x" + "cd" * 32, {"function": "updateIPFS", "asset_id": "x", "cid": "c4"})
+        assert cache.get_stats()["evictions"] == 1
+
+        entry = await cache.get(TX_HASH)
+        assert entry["asset_cids"] == {"a": "c1", "b": "c2"}
+        assert "_id" not in entry
+        assert cache.get_stats()["db_hits"] == 1
+        assert await cache.get("0x" + "ef" * 32) is None
@@ -0,0 +1,58 @@
+import base64
+import json
+from pathlib import Path
+
+import pytest
+
+from app.utilities.format import format_json, get_ipfs_metadata
+from app.utilities.unixfs import (
+    CHUNK_SIZE,
+    DAG_PB_CODEC,
+    cid_bytes,
+    cid_to_string,
+    compute_file_cid,
+)
+
+CORPUS = json.loads((Path(__file__).parent / "cid_corpus.json").read_text(encoding="utf-8"))["entries"]
+
+
+def corpus_payload(entry):
+    """Rebuild the payload bytes of a corpus entry the same way cid-corpus.js does."""
+    if "payload_b64" in entry:
+        return base64.b64decode(entry["payload_b64"])
+    pattern = entry["pattern"].encode("utf-8")
+    return (pattern * (entry["length"] // len(pattern) + 1))[:entry["length"]]
+
+
+# Cross-check against CIDs produced by @web3-storage/upload-client
+class TestUnixFSCorpus:
+    @pytest.mark.parametrize("entry", CORPUS, ids=[entry["name"] for entry in CORPUS])
+    def test_cid_matches_upload_client(self, entry):
+        """Test that the local encoder reproduces the upload-client CID for each corpus entry."""
+        assert compute_file_cid(corpus_payload(entry)) == entry["cid"]
+
+    @pytest.mark.parametrize(
+        "entry",
+        [entry for entry in CORPUS if "metadata" in entry],
+        ids=[entry["name"] for entry in CORPUS if "metadata" in entry]
+    )
+    def test_corpus_payloads_match_format_json(self, entry):
+        """Test that metadata corpus payloads are exactly what format_json sends to IPFS."""
+        assert format_json(get_ipfs_metadata(entry["metadata"])) == corpus_payload(entry)
+
+
+class TestUnixFSEncoding:
+    def test_dag_pb_blocks_match_known_cids(self):
+        """Test block hashing and base32 output against the well-known empty UnixFS CIDs."""
+        # Empty directory (QmUNLLsPACCz1vLxQVkXqqLX5R1X345qqfHbsf67hvA3Nn)
+        assert cid_to_string(cid_bytes(DAG_PB_CODEC, bytes.fromhex("0a020801"))) == \
+            "bafybeiczsscdsbs7ffqz55asqdf3smv6klcw3gofszvwlyarci47bgf354"
+        # Empty file (QmbFMke1KXqnYyBBWxB74N4c5SBnJMVAiMNRcGu6x1AwQH)
+        assert cid_to_string(cid_bytes(DAG_PB_CODEC, bytes.fromhex("0a0408021800"))) == \
+            "bafybeif7ztnhq65lumvvtr4ekcwd2ifwgm3awq4zfr3srh462rwyinlb4y"
+
+    def test_only_single_chunk_files_are_encoded(self):
+        """Test that files up to one chunk are raw blocks and larger files are refused."""
+        assert compute_file_cid(b"x" * CHUNK_SIZE).startswith("bafkrei")
+        with pytest.raises(ValueError):
+            compute_file_cid(b"x" * (CHUNK_SIZE + 1))
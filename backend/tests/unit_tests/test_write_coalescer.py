@@ -0,0 +1,105 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import HTTPException
+
+from app.utilities.write_coalescer import WriteCoalescer
+
+OWNER = "0x1111111111111111111111111111111111111111"
+
+
+class TestWriteCoalescer:
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_a_batch_per_key(self):
+        """Test that writes for one key within the window are flushed together."""
+        flushed = []
+
+        async def flush(key, items):
+            flushed.append((key, list(items)))
+            return [f"{key}:{item}" for item in items]
+
+        coalescer = WriteCoalescer(flush, window=0.05, max_size=10)
+        results = await asyncio.gather(
+            coalescer.submit("a", 1), coalescer.submit("b", 2), coalescer.submit("a", 3)
+        )
+
+        assert results == ["a:1", "b:2", "a:3"]
+        assert sorted(flushed) == [("a", [1, 3]), ("b", [2])]
+        stats = coalescer.get_stats()
+        assert stats["batches"] == 2 and stats["flushed_by_window"] == 2
+        assert stats["added_latency_max_ms"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_full_batches_and_duplicate_ids_flush_early(self):
+        """Test that a full batch is flushed without waiting and duplicate IDs start a new batch."""
+        flushed = []
+
+        async def flush(key, items):
+            flushed.append(list(items))
+            return items
+
+        coalescer = WriteCoalescer(flush, window=60, max_size=2)
+        assert await asyncio.gather(coalescer.submit("a", 1), coalescer.submit("a", 2)) == [1, 2]
+
+        coalescer.window = 0.01
+        await asyncio.gather(
+            coalescer.submit("a", "v1", item_id="asset-1"), coalescer.submit("a", "v2", item_id="asset-1")
+        )
+
+        assert flushed == [[1, 2], ["v1"], ["v2"]]
+        assert coalescer.stats["flushed_by_size"] == 1
+        assert coalescer.stats["flushed_by_duplicate"] == 1
+
+
+class TestCoalescedStoreHashFor:
+    def make_service(self, service):
+        # As built by BlockchainService with BLOCKCHAIN_COALESCE_WRITES on and a 20 ms window
+        service.store_hash_coalescer = WriteCoalescer(service._flush_store_hash_batch, window=0.02, max_size=50)
+        service.web3.eth.gas_price = 100
+        return service
+
+    @pytest.mark.asyncio
+    async def test_store_hash_for_calls_share_one_transaction(self, blockchain_service_double):
+        """Test that concurrent API-key writes for one owner become one batchUpdateIPFSFor."""
+        service = self.make_service(blockchain_service_double)
+        service.contract.functions.batchUpdateIPFSFor.return_value.estimate_gas = AsyncMock(return_value=100000)
+        service._send_server_transaction = AsyncMock(return_value=SimpleNamespace(
+            status=1, transactionHash=SimpleNamespace(hex=lambda: "batch-tx")
+        ))
+        service._store_hash_for_signed = AsyncMock()
+
+        results = await asyncio.gather(*(
+            service.store_hash_for(f"bafy-{n}", f"asset-{n}", OWNER, {"auth_method": "api_key"})
+            for n in range(3)
+        ))
+
+        assert results == [{"tx_hash": "batch-tx", "batch_size": 3}] * 3
+        args = service.contract.functions.batchUpdateIPFSFor.call_args[0]
+        assert args[1:] == (["asset-0", "asset-1", "asset-2"], ["bafy-0", "bafy-1", "bafy-2"])
+        assert service._send_server_transaction.await_args.kwargs["gas"] == 120000
+        service._store_hash_for_signed.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_batch_that_would_revert_is_sent_individually(self, blockchain_service_double):
+        """Test that one invalid write doesn't fail the other writes in its batch."""
+        service = self.make_service(blockchain_service_double)
+        service.contract.functions.batchUpdateIPFSFor.return_value.estimate_gas = AsyncMock(
+            side_effect=ValueError("execution reverted: CID cannot be empty")
+        )
+
+        async def store_single(cid, asset_id, owner_address):
+            if not cid:
+                raise HTTPException(status_code=500, detail="Blockchain transaction failed: CID cannot be empty")
+            return {"tx_hash": f"tx-{asset_id}"}
+        service._store_hash_for_signed = AsyncMock(side_effect=store_single)
+
+        results = await asyncio.gather(
+            service.store_hash_for("bafy-0", "asset-0", OWNER),
+            service.store_hash_for("", "asset-1", OWNER),
+            return_exceptions=True
+        )
+
+        assert results[0] == {"tx_hash": "tx-asset-0"}
+        assert isinstance(results[1], HTTPException)
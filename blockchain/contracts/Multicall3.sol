@@ -0,0 +1,45 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.21;
+
+/**
+ * @title Multicall3
+ * @dev Aggregates view calls into a single eth_call for the backend's bulk reads.
+ * Implements the aggregate3 subset of the canonical Multicall3 interface
+ * (0xcA11bde05977b3631167028862bE2a173976CA11) so the backend works unchanged
+ * against the canonical deployment on Sepolia and this one on a local node.
+ */
+contract Multicall3 {
+    struct Call3 {
+        address target;
+        bool allowFailure;
+        bytes callData;
+    }
+
+    struct Result {
+        bool success;
+        bytes returnData;
+    }
+
+    /**
+     * @dev Run calls in order, reverting only if a call that doesn't allow failure reverts
+     * @param calls Target, allowFailure flag and calldata of each call
+     * @return returnData Success flag and return data of each call
+     */
+    function aggregate3(Call3[] calldata calls) public payable returns (Result[] memory returnData) {
+        uint256 length = calls.length;
+        returnData = new Result[](length);
+        for (uint256 i = 0; i < length; i++) {
+            Call3 calldata call = calls[i];
+            Result memory result = returnData[i];
+            (result.success, result.returnData) = call.target.call(call.callData);
+            require(call.allowFailure || result.success, "Multicall3: call failed");
+        }
+    }
+
+    /**
+     * @dev Block number the aggregated calls were executed against
+     */
+    function getBlockNumber() public view returns (uint256 blockNumber) {
+        blockNumber = block.number;
+    }
+}
@@ -0,0 +1,20 @@
+const { ethers } = require("hardhat");
+
+// Sepolia and mainnet already have Multicall3 at the canonical address; this is for local nodes
+async function main() {
+  const ContractFactory = await ethers.getContractFactory("Multicall3");
+  const contract = await ContractFactory.deploy(); // Start deployment
+
+  // Wait for full deployment
+  const deployedContract = await contract.waitForDeployment();
+
+  // Get the actual deployed address
+  const address = await deployedContract.getAddress();
+  console.log("Multicall3 deployed to:", address);
+  console.log("Set MULTICALL3_ADDRESS in the backend .env to this address");
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exitCode = 1;
+});
@@ -88,4 +88,26 @@ apiClient.interceptors.response.use(
   }
 );
 
+/**
+ * Load every page of a cursor-paginated list endpoint.
+ * This still loads the full list into the browser because the dashboards
+ * expect it. Paging the UI itself is follow-up work.
+ * @param {string} url - Endpoint URL
+ * @param {string} key - Response field holding the page's items
+ * @returns {Promise<Object>} The last page's response with all items under `key`
+ */
+export const fetchAllPages = async (url, key) => {
+  const items = [];
+  let cursor = null;
+  let data;
+  do {
+    ({ data } = await apiClient.get(url, {
+      params: { limit: 500, ...(cursor && { cursor }) }
+    }));
+    items.push(...(data[key] || []));
+    cursor = data.nextCursor ?? data.next_cursor;
+  } while (cursor);
+  return { ...data, [key]: items };
+};
+
 export default apiClient;
\ No newline at end of file
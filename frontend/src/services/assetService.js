@@ -1,4 +1,4 @@
-import apiClient from './apiClient';
+import apiClient, { fetchAllPages } from './apiClient';
 
 export const assetService = {
   // Upload metadata
@@ -177,8 +177,8 @@ export const assetService = {
   // Get user's assets (this endpoint might need to be added to the backend)
   getUserAssets: async (walletAddress) => {
     try {
-      const { data } = await apiClient.get(`/assets/user/${walletAddress}`);
-      console.log('User assets fetched:', data);
+      const data = await fetchAllPages(`/assets/user/${walletAddress}`, 'assets');
+      console.log('User assets fetched:', data.assets.length);
       return data;
     } catch (error) {
       console.error('Error fetching user assets:', error);
@@ -1,4 +1,4 @@
-import apiClient from './apiClient';
+import apiClient, { fetchAllPages } from './apiClient';
 import { ethers } from 'ethers';
 
 const DELEGATION_BASE_URL = '/delegation';
@@ -228,8 +228,8 @@ const delegationService = {
    */
   getDelegatedAssets: async (ownerAddress) => {
     try {
-      const response = await apiClient.get(`${DELEGATION_BASE_URL}/users/${ownerAddress}/assets`);
-      return response.data;
+      const data = await fetchAllPages(`${DELEGATION_BASE_URL}/users/${ownerAddress}/assets`, 'assets');
+      return { ...data, total_assets: data.assets.length };
     } catch (error) {
       console.error('Error getting delegated assets:', error);
       throw error;
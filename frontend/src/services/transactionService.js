@@ -1,4 +1,4 @@
-import apiClient from './apiClient';
+import apiClient, { fetchAllPages } from './apiClient';
 
 export const transactionService = {
   // Get asset history
@@ -43,9 +43,9 @@ export const transactionService = {
   // Get all transactions for a user
   getAllTransactions: async (walletAddress) => {
     try {
-      const { data } = await apiClient.get(`/transactions/all/${walletAddress}`);
-      console.log('All transactions fetched:', data);
-      return data;
+      const data = await fetchAllPages(`/transactions/all/${walletAddress}`, 'transactions');
+      console.log('All transactions fetched:', data.transactions.length);
+      return { ...data, count: data.transactions.length };
     } catch (error) {
       console.error('Error fetching all transactions:', error);
       // Return empty data structure on error to prevent crashes
@@ -73,6 +73,24 @@ async function initializeClient() {
   }
 }
 
+// In-flight initialization, shared so concurrent uploads don't each create a client
+let clientInitPromise = null;
+
+/**
+ * Get the initialized client, waiting on an initialization already in progress
+ */
+function getClient() {
+  if (clientInstance) {
+    return Promise.resolve(clientInstance);
+  }
+  if (!clientInitPromise) {
+    clientInitPromise = initializeClient().finally(() => {
+      clientInitPromise = null;
+    });
+  }
+  return clientInitPromise;
+}
+
 /**
  * Parse a base64 identity CID proof using w3up-client
  */
@@ -96,7 +114,7 @@ export async function uploadFile(filePath, retries = 3) {
     try {
       console.log(`Upload attempt ${attempt}/${retries} for ${filePath}`);
       
-      const client = await initializeClient();
+      const client = await getClient();
       const files = await filesFromPaths([filePath]);
       const fileCid = await client.uploadFile(files[0]);
 
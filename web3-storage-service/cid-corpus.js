@@ -0,0 +1,39 @@
+import fs from 'fs';
+import { computeCIDFromBuffer } from './utilities.js';
+
+/**
+ * Fills in the expected CIDs of the backend's CID cross-check corpus using
+ * Web3.Storage's own UnixFS encoder, so the Python encoder can be checked against it.
+ *
+ * Usage: node cid-corpus.js [path/to/cid_corpus.json]
+ */
+const corpusPath = process.argv[2] || '../backend/tests/unit_tests/cid_corpus.json';
+
+/**
+ * Rebuilds the payload bytes of a corpus entry.
+ * Entries carry either base64 contents or a pattern repeated to a given length.
+ */
+function payloadFor(entry) {
+  if (entry.payload_b64 !== undefined) {
+    return Buffer.from(entry.payload_b64, 'base64');
+  }
+  const pattern = Buffer.from(entry.pattern, 'utf8');
+  const payload = Buffer.alloc(entry.length);
+  for (let i = 0; i < entry.length; i++) {
+    payload[i] = pattern[i % pattern.length];
+  }
+  return payload;
+}
+
+const corpus = JSON.parse(await fs.promises.readFile(corpusPath, 'utf8'));
+
+for (const entry of corpus.entries) {
+  const cid = await computeCIDFromBuffer(payloadFor(entry));
+  if (entry.cid && entry.cid !== cid) {
+    console.warn(`${entry.name}: corpus had ${entry.cid}, upload-client gives ${cid}`);
+  }
+  entry.cid = cid;
+  console.log(`${entry.name}: ${cid}`);
+}
+
+await fs.promises.writeFile(corpusPath, JSON.stringify(corpus, null, 2) + '\n');
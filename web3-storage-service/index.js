@@ -3,11 +3,20 @@ import multer from 'multer';
 import fs from 'fs';
 import { randomUUID } from 'crypto';
 import { uploadFile, getFileUrl, displayFileContents } from './backend.js';
-import { computeCID } from './utilities.js';
+import { computeCID, mapWithConcurrency } from './utilities.js';
 
 const app = express();
 const PORT = process.env.PORT || 8080;
 const UPLOAD_DIR = 'upload_queue';
+// Maximum number of files from one /upload request sent to Web3.Storage at once
+const DEFAULT_UPLOAD_CONCURRENCY = 8;
+const configuredConcurrency = parseInt(process.env.UPLOAD_CONCURRENCY || `${DEFAULT_UPLOAD_CONCURRENCY}`, 10);
+const UPLOAD_CONCURRENCY = Number.isInteger(configuredConcurrency) && configuredConcurrency >= 1
+  ? configuredConcurrency
+  : DEFAULT_UPLOAD_CONCURRENCY;
+if (UPLOAD_CONCURRENCY !== configuredConcurrency) {
+  console.warn(`Invalid UPLOAD_CONCURRENCY "${process.env.UPLOAD_CONCURRENCY}", using ${DEFAULT_UPLOAD_CONCURRENCY}`);
+}
 
 // Determine host binding based on environment
 // Railway requires IPv6 (::) for private networking, localhost uses IPv4 (0.0.0.0)
@@ -33,7 +42,7 @@ const storage = multer.diskStorage({
 const upload = multer({ storage });
 
 // Dynamic timeouts are set per endpoint:
-// - /upload: 30 seconds per file (minimum 60s)
+// - /upload: 30 seconds per wave of concurrent uploads (minimum 60s)
 // - /file/:cid/contents: 60 seconds for IPFS fetching
 // - /calculate-cid: 30 seconds for single file processing
 
@@ -48,7 +57,9 @@ app.use((req, res, next) => {
 /**
  * POST /upload
  * Accept multiple files, each stored in 'upload_queue/'.
- * Then upload them all to Web3.Storage, delete them locally, and return an array of CIDs.
+ * Then upload them to Web3.Storage concurrently, delete them locally, and return
+ * an array of CIDs in the same order as the files. A file that fails to upload
+ * gets an `error` instead of a CID; the request only fails if every file fails.
  */
 app.post('/upload', upload.array('files'), async (req, res) => {
   try {
@@ -56,27 +67,30 @@ app.post('/upload', upload.array('files'), async (req, res) => {
       return res.status(400).json({ error: 'No file(s) uploaded' });
     }
 
-    // Set dynamic timeout: minimum 60 seconds, or 30 seconds per file
-    const dynamicTimeout = Math.max(60000, req.files.length * 30000);
+    // Set dynamic timeout: minimum 60 seconds, or 30 seconds per wave of concurrent uploads
+    const waves = Math.ceil(req.files.length / UPLOAD_CONCURRENCY);
+    const dynamicTimeout = Math.max(60000, waves * 30000);
     req.setTimeout(dynamicTimeout);
     res.setTimeout(dynamicTimeout);
     console.log(`Set timeout to ${dynamicTimeout/1000} seconds for ${req.files.length} files`);
 
-    // Array to store { filename, cid } for each uploaded file
-    const cids = [];
-
-    for (const file of req.files) {
+    // Array of { filename, cid } (or { filename, cid: null, error }) in upload order
+    const cids = await mapWithConcurrency(req.files, UPLOAD_CONCURRENCY, async (file) => {
       const filePath = file.path;
       try {
         // Upload file to Web3.Storage and get returned CID
         const fileCid = await uploadFile(filePath);
-        cids.push({
+        return {
           filename: file.originalname,
           cid: fileCid
-        });
+        };
       } catch (error) {
         console.error('Error uploading file:', file.originalname, error);
-        throw error;
+        return {
+          filename: file.originalname,
+          cid: null,
+          error: error.message
+        };
       } finally {
         // Remove the file from local disk whether upload succeeds or fails
         try {
@@ -85,6 +99,14 @@ app.post('/upload', upload.array('files'), async (req, res) => {
           console.error('Error deleting local file:', file.originalname, err);
         }
       }
+    });
+
+    const failed = cids.filter((entry) => entry.error);
+    if (failed.length === cids.length) {
+      return res.status(500).json({ error: failed[0].error, cids });
+    }
+    if (failed.length > 0) {
+      console.error(`${failed.length}/${cids.length} files failed to upload`);
     }
 
     // Return an array of cids so the client knows what got uploaded
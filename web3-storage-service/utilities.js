@@ -13,21 +13,58 @@ export async function computeCID(filePath) {
     // Read the file
     const buffer = await fs.promises.readFile(filePath);
     
-    // Create a blob-like object with a stream method
-    const file = {
-      stream: () => new ReadableStream({
-        start(controller) {
-          controller.enqueue(buffer);
-          controller.close();
-        }
-      })
-    };
-    
-    // Use Web3.Storage's own UnixFS encoding to compute the CID
-    const { cid } = await UnixFS.encodeFile(file);
-    
-    return cid.toString();
+    return await computeCIDFromBuffer(buffer);
   } catch (error) {
     throw new Error(`Error computing CID: ${error.message}`);
   }
 }
+
+/**
+ * Computes the CID for in-memory file contents using Web3.Storage's UnixFS encoder.
+ * 
+ * @param {Buffer|Uint8Array} buffer - The file contents.
+ * @returns {Promise<string>} - The computed CID (CIDv1 in base32).
+ */
+export async function computeCIDFromBuffer(buffer) {
+  // Create a blob-like object with a stream method
+  const file = {
+    stream: () => new ReadableStream({
+      start(controller) {
+        controller.enqueue(buffer);
+        controller.close();
+      }
+    })
+  };
+  
+  // Use Web3.Storage's own UnixFS encoding to compute the CID
+  const { cid } = await UnixFS.encodeFile(file);
+  
+  return cid.toString();
+}
+
+/**
+ * Maps items through an async function with at most `limit` calls in flight.
+ * Results keep the order of the input items.
+ * 
+ * @param {Array} items - The items to process.
+ * @param {number} limit - Maximum number of concurrent calls.
+ * @param {Function} fn - Async function called with (item, index).
+ * @returns {Promise<Array>} - The results in input order.
+ */
+export async function mapWithConcurrency(items, limit, fn) {
+  const results = new Array(items.length);
+  let next = 0;
+  
+  async function worker() {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await fn(items[index], index);
+    }
+  }
+  
+  // A missing or non-numeric limit still runs one worker rather than none
+  const workerCount = Number.isInteger(limit) && limit > 1 ? Math.min(limit, items.length) : 1;
+  const workers = Array.from({ length: workerCount }, worker);
+  await Promise.all(workers);
+  return results;
+}